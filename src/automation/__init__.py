@@ -23,6 +23,7 @@ from src.automation.health import (
     CHECK_REPOSITORY_HEALTH,
     HealthCheckResult,
     HealthMonitor,
+    eteda_loop_latency_check,
 )
 from src.automation.alerts import AlertChannel, LogOnlyAlertChannel
 
@@ -41,4 +42,5 @@ __all__ = [
     "CHECK_REPOSITORY_HEALTH",
     "CHECK_BROKER_HEARTBEAT",
     "CHECK_ETEDA_LOOP_LATENCY",
+    "eteda_loop_latency_check",
 ]
@@ -99,3 +99,51 @@ class HealthMonitor:
             if not r.ok and self._alert_channel is not None and hasattr(self._alert_channel, "send_critical"):
                 self._alert_channel.send_critical(f"[{r.name}] {r.message}")
         return results
+
+
+# ----- ETEDA loop latency -----
+
+
+def eteda_loop_latency_check(
+    snapshot_fn: Callable[[], Dict[str, Any]],
+    budget_ms: Optional[float] = None,
+    percentile: str = "p95",
+) -> Callable[[], HealthCheckResult]:
+    """
+    Build CHECK_ETEDA_LOOP_LATENCY check from a latency snapshot callable.
+
+    snapshot_fn: returns ETEDA latency snapshot
+        ({"cycle": {"p95": ms, ...}, "stages": {stage: {...}}, "budget_ms": ms, "last_trace_id": ...}),
+        e.g. ETEDATracer.latency_snapshot (주입; 런타임 직접 import 없음).
+    budget_ms: 예산 (None이면 snapshot의 budget_ms 사용).
+    percentile: 판정 기준 분위수 키 (p50/p95/p99/max).
+    """
+
+    def check() -> HealthCheckResult:
+        snap = snapshot_fn()
+        budget = budget_ms if budget_ms is not None else snap.get("budget_ms")
+        cycle = snap.get("cycle") or {}
+        if not cycle.get("count"):
+            return HealthCheckResult(ok=True, name=CHECK_ETEDA_LOOP_LATENCY, message="no cycles yet")
+
+        observed = float(cycle.get(percentile, 0.0))
+        stages = {stage: data.get(percentile, 0.0) for stage, data in (snap.get("stages") or {}).items()}
+        slowest = max(stages, key=stages.get) if stages else None
+        ok = not budget or observed <= float(budget)
+        message = f"{percentile}={observed:.1f}ms budget={budget}ms"
+        if not ok and slowest:
+            message += f" slowest_stage={slowest}({stages[slowest]:.1f}ms)"
+        return HealthCheckResult(
+            ok=ok,
+            name=CHECK_ETEDA_LOOP_LATENCY,
+            message=message,
+            latency_ms=observed,
+            meta={
+                "stages_ms": stages,
+                "cycles": snap.get("cycles"),
+                "breaches": snap.get("breaches"),
+                "last_trace_id": snap.get("last_trace_id"),
+            },
+        )
+
+    return check
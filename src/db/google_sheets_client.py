@@ -3,18 +3,36 @@ Google Sheets API 클라이언트 모듈
 
 QTS 시스템의 데이터 영속성 계층으로서 Google Sheets와의 통신을 담당합니다.
 서비스 계정 인증, API 호출, 에러 처리, 재시도 로직을 포함합니다.
+
+동기식 googleapiclient 호출(`execute()`)은 bounded ThreadPoolExecutor에서 실행되어
+이벤트 루프(ETEDA 루프, Observer, 스케줄러)를 막지 않습니다.
+`batch_get` / `batch_update`는 여러 range 읽기/쓰기를 단일 HTTP 요청으로 묶습니다.
+모든 API 호출은 전송 전 읽기/쓰기 토큰 버킷(GOOGLE_SHEETS_API_QUOTA, 분당)을 거쳐 429 이전에 속도를 맞춥니다.
 """
 
 import os
+import time
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Deque, Dict, List, Optional
 from datetime import datetime, timedelta
 import gspread
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from src.provider.rate_limit import (
+    SHEETS_READ,
+    SHEETS_WRITE,
+    RateLimitScheduler,
+    register_sheets_families,
+)
+
 
 class GoogleSheetsError(Exception):
     """Google Sheets 관련 기본 에러"""
@@ -47,20 +65,60 @@ class ValidationError(GoogleSheetsError):
         self.field = field
 
 
+@dataclass
+class SheetsCallStats:
+    """API 호출 종류(op)별 누적 지연/에러 통계."""
+
+    calls: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def record(self, elapsed_ms: float, ok: bool) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        if not ok:
+            self.errors += 1
+
+
 class GoogleSheetsClient:
     """
     Google Sheets API v4 클라이언트
     
     QTS 시스템의 데이터 레이어로서 Google Sheets와의 통신을 관리합니다.
+
+    - max_workers > 0 (기본): 블로킹 호출을 전용 스레드 풀에서 실행 (async-native 모드)
+    - max_workers == 0: 이벤트 루프에서 직접 실행 (레거시 동작)
+    - get_metrics(): MetricsCollector.register_engine_collector 호환 dict 반환
     """
+
+    QUOTA_WINDOW_SEC = 60.0
+    READ_OPS = frozenset({"get", "batch_get"})
     
-    def __init__(self, credentials_path: str = None, spreadsheet_id: str = None):
+    def __init__(
+        self,
+        credentials_path: str = None,
+        spreadsheet_id: str = None,
+        max_workers: Optional[int] = None,
+        rate_limiter: Optional[RateLimitScheduler] = None,
+    ):
         """
         GoogleSheetsClient 초기화
         
         Args:
             credentials_path: 서비스 계정 인증 파일 경로
             spreadsheet_id: Google 스프레드시트 ID
+            max_workers: I/O 스레드 풀 크기 (None이면 GOOGLE_SHEETS_MAX_WORKERS, 기본 4; 0이면 인라인 실행)
+            rate_limiter: 공유 속도 제한 스케줄러 (None이면 전용 생성; sheets.read/sheets.write 미등록 시 api_quota로 등록)
         """
         from dotenv import load_dotenv
         load_dotenv()
@@ -87,6 +145,19 @@ class GoogleSheetsClient:
         self.max_retries = 3
         self.base_delay = 1.0
         self.max_delay = 60.0
+        self.rate_limiter = rate_limiter or RateLimitScheduler()
+        if SHEETS_READ not in self.rate_limiter.families():
+            register_sheets_families(self.rate_limiter, self.api_quota)
+
+        # I/O 실행기 (lazy 생성) 및 호출 지표
+        if max_workers is None:
+            max_workers = int(os.getenv('GOOGLE_SHEETS_MAX_WORKERS', '4'))
+        self.max_workers = max(0, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread_local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._call_stats: Dict[str, SheetsCallStats] = {}
+        self._request_times: Deque[float] = deque()
 
         self.logger.info(f"GoogleSheetsClient initialized with spreadsheet_id: {self.spreadsheet_id}, disabled={self.disabled}")
     
@@ -101,27 +172,7 @@ class GoogleSheetsClient:
             AuthenticationError: 인증 실패 시
         """
         try:
-            # 서비스 계정 인증 범위 설정
-            scopes = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            
-            # 서비스 계정 인증 정보 로드
-            self.credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path,
-                scopes=scopes
-            )
-            
-            # Google Sheets API 서비스 생성
-            self.service = build('sheets', 'v4', credentials=self.credentials)
-            
-            # gspread 클라이언트 생성
-            self.gspread_client = gspread.authorize(self.credentials)
-            
-            # 스프레드시트 접속
-            self.spreadsheet = self.gspread_client.open_by_key(self.spreadsheet_id)
-            
+            await self._run_blocking(self._authenticate_sync)
             self.logger.info("Google Sheets authentication successful")
             return True
             
@@ -129,6 +180,161 @@ class GoogleSheetsClient:
             self.logger.error(f"Google Sheets authentication failed: {str(e)}")
             raise AuthenticationError(f"Authentication failed: {str(e)}")
     
+    def _authenticate_sync(self) -> None:
+        """인증 및 서비스 생성 (블로킹, 실행기에서 호출)."""
+        # 서비스 계정 인증 범위 설정
+        scopes = [
+            'https://www.googleapis.com/auth/spreadsheets',
+            'https://www.googleapis.com/auth/drive'
+        ]
+        
+        # 서비스 계정 인증 정보 로드
+        self.credentials = service_account.Credentials.from_service_account_file(
+            self.credentials_path,
+            scopes=scopes
+        )
+        
+        # Google Sheets API 서비스 생성
+        self.service = build('sheets', 'v4', credentials=self.credentials)
+        
+        # gspread 클라이언트 생성
+        self.gspread_client = gspread.authorize(self.credentials)
+        
+        # 스프레드시트 접속
+        self.spreadsheet = self.gspread_client.open_by_key(self.spreadsheet_id)
+
+    # ------------------------------------------------------------------
+    # 실행기 / 지표
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> Optional[ThreadPoolExecutor]:
+        if self.max_workers == 0:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="gsheets-io",
+            )
+        return self._executor
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """블로킹 함수를 I/O 실행기에서 실행 (max_workers == 0이면 인라인)."""
+        executor = self._get_executor()
+        if executor is None:
+            return fn(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+
+    def _thread_http(self):
+        """
+        워커 스레드 전용 AuthorizedHttp.
+
+        httplib2.Http는 스레드 안전하지 않으므로 스레드마다 별도 인스턴스를 사용합니다.
+        인증 정보가 없으면(None) 서비스 기본 http를 사용합니다.
+        """
+        credentials = getattr(self, 'credentials', None)
+        if credentials is None or self.max_workers == 0:
+            return None
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            import httplib2
+            import google_auth_httplib2
+            http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
+    def _execute_request(self, request) -> Dict[str, Any]:
+        http = self._thread_http()
+        if http is None:
+            return request.execute()
+        return request.execute(http=http)
+
+    async def _execute(self, op: str, request) -> Dict[str, Any]:
+        """
+        googleapiclient 요청을 실행기에서 실행하고 op별 지연/쿼터 지표를 기록.
+
+        전송 전 읽기/쓰기 토큰 버킷 대기 (대기 시간은 호출 지연에 포함하지 않음).
+        """
+        await self.rate_limiter.acquire(SHEETS_READ if op in self.READ_OPS else SHEETS_WRITE)
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = await self._run_blocking(self._execute_request, request)
+            ok = True
+            return result
+        except HttpError as e:
+            if e.resp.status == 429:
+                self._record_rate_limited(op)
+            raise
+        finally:
+            self._record_call(op, (time.perf_counter() - start) * 1000.0, ok)
+
+    def _record_call(self, op: str, elapsed_ms: float, ok: bool) -> None:
+        now = time.monotonic()
+        with self._stats_lock:
+            stats = self._call_stats.get(op)
+            if stats is None:
+                stats = self._call_stats[op] = SheetsCallStats()
+            stats.record(elapsed_ms, ok)
+            self._request_times.append(now)
+            self._prune_request_times(now)
+
+    def _record_rate_limited(self, op: str) -> None:
+        with self._stats_lock:
+            stats = self._call_stats.get(op)
+            if stats is None:
+                stats = self._call_stats[op] = SheetsCallStats()
+            stats.rate_limited += 1
+
+    def _prune_request_times(self, now: float) -> None:
+        cutoff = now - self.QUOTA_WINDOW_SEC
+        while self._request_times and self._request_times[0] < cutoff:
+            self._request_times.popleft()
+
+    def get_call_stats(self) -> Dict[str, SheetsCallStats]:
+        """op(get, update, append, clear, batch_get, batch_update 등)별 통계 복사본."""
+        with self._stats_lock:
+            return {
+                op: SheetsCallStats(**vars(stats))
+                for op, stats in self._call_stats.items()
+            }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        호출 지연/쿼터 지표.
+
+        MetricsCollector.register_engine_collector(client.get_metrics)로 연결 가능한
+        {"counters": {...}, "gauges": {...}} 형태를 반환합니다.
+        """
+        counters: Dict[str, int] = {}
+        gauges: Dict[str, float] = {}
+        with self._stats_lock:
+            self._prune_request_times(time.monotonic())
+            used = len(self._request_times)
+            for op, stats in self._call_stats.items():
+                prefix = f"sheets.{op}"
+                counters[f"{prefix}.calls"] = stats.calls
+                counters[f"{prefix}.errors"] = stats.errors
+                counters[f"{prefix}.rate_limited"] = stats.rate_limited
+                gauges[f"{prefix}.avg_ms"] = stats.avg_ms
+                gauges[f"{prefix}.max_ms"] = stats.max_ms
+                gauges[f"{prefix}.last_ms"] = stats.last_ms
+        counters["sheets.quota.requests_last_minute"] = used
+        gauges["sheets.quota.limit_per_minute"] = float(self.api_quota)
+        gauges["sheets.quota.utilization"] = used / self.api_quota if self.api_quota else 0.0
+        limiter = self.rate_limiter.get_metrics()
+        for kind, values in (("counters", counters), ("gauges", gauges)):
+            for key, value in limiter[kind].items():
+                if key.startswith("ratelimit.sheets."):
+                    values[key] = value
+        return {"counters": counters, "gauges": gauges}
+
+    async def close(self) -> None:
+        """I/O 실행기 종료."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     async def get_spreadsheet_info(self) -> Dict[str, Any]:
         """
         스프레드시트 정보 조회
@@ -140,7 +346,7 @@ class GoogleSheetsClient:
             await self.authenticate()
         
         try:
-            worksheets = self.spreadsheet.worksheets()
+            worksheets = await self._run_blocking(self.spreadsheet.worksheets)
             
             return {
                 'title': self.spreadsheet.title,
@@ -181,18 +387,79 @@ class GoogleSheetsClient:
         if not self.service:
             await self.authenticate()
         
+        result = await self._execute_read(
+            "get",
+            lambda: self.service.spreadsheets().values().get(
+                spreadsheetId=self.spreadsheet_id,
+                range=range_name
+            ),
+            range_name,
+            max_retries,
+        )
+        
+        values = result.get('values', [])
+        self.logger.info(f"Retrieved {len(values)} rows from range '{range_name}'")
+        return values
+    
+    async def batch_get(
+        self,
+        ranges: List[str],
+        max_retries: int = None
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        여러 범위를 단일 요청(values.batchGet)으로 조회
+        
+        Args:
+            ranges: 조회 범위 목록 (예: ["Position!A:Z", "T_Ledger!A1:Z1"])
+            max_retries: 최대 재시도 횟수
+            
+        Returns:
+            Dict[str, List[List[Any]]]: 요청한 range 문자열 → 시트 데이터 (입력 순서 유지)
+            
+        Raises:
+            APIError: API 호출 실패 시
+            RateLimitError: API 제한 초과 시
+        """
+        if not ranges:
+            return {}
+        
+        if not self.service:
+            await self.authenticate()
+        
+        ranges = list(ranges)
+        result = await self._execute_read(
+            "batch_get",
+            lambda: self.service.spreadsheets().values().batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=ranges
+            ),
+            ",".join(ranges),
+            max_retries,
+        )
+        
+        # valueRanges는 요청 순서대로 반환되며, 응답 range는 정규화(A1 확장)될 수 있으므로 요청 키로 매핑
+        value_ranges = result.get('valueRanges', [])
+        data: Dict[str, List[List[Any]]] = {}
+        for i, range_name in enumerate(ranges):
+            vr = value_ranges[i] if i < len(value_ranges) else {}
+            data[range_name] = vr.get('values', [])
+        
+        self.logger.info(f"Batch retrieved {len(ranges)} ranges in one request")
+        return data
+    
+    async def _execute_read(
+        self,
+        op: str,
+        build_request: Callable[[], Any],
+        range_label: str,
+        max_retries: int = None
+    ) -> Dict[str, Any]:
+        """읽기 요청 실행 (429/일시 오류 시 지수 백오프 재시도)."""
         max_retries = max_retries or self.max_retries
         
         for attempt in range(max_retries + 1):
             try:
-                result = self.service.spreadsheets().values().get(
-                    spreadsheetId=self.spreadsheet_id,
-                    range=range_name
-                ).execute()
-                
-                values = result.get('values', [])
-                self.logger.info(f"Retrieved {len(values)} rows from range '{range_name}'")
-                return values
+                return await self._execute(op, build_request())
                 
             except HttpError as e:
                 status_code = e.resp.status
@@ -216,8 +483,8 @@ class GoogleSheetsClient:
                     raise APIError("Access forbidden", status_code)
                 
                 elif status_code == 404:  # Not found
-                    self.logger.error(f"Range '{range_name}' not found")
-                    raise APIError(f"Range '{range_name}' not found", status_code)
+                    self.logger.error(f"Range '{range_label}' not found")
+                    raise APIError(f"Range '{range_label}' not found", status_code)
                 
                 else:  # Other API errors
                     if attempt == max_retries:
@@ -269,12 +536,12 @@ class GoogleSheetsClient:
                 'values': values
             }
             
-            result = self.service.spreadsheets().values().update(
+            result = await self._execute("update", self.service.spreadsheets().values().update(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name,
                 valueInputOption=value_input_option,
                 body=body
-            ).execute()
+            ))
             
             updated_rows = result.get('updatedRows', 0)
             updated_columns = result.get('updatedColumns', 0)
@@ -323,13 +590,13 @@ class GoogleSheetsClient:
                 'values': values
             }
             
-            result = self.service.spreadsheets().values().append(
+            result = await self._execute("append", self.service.spreadsheets().values().append(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name,
                 valueInputOption=value_input_option,
                 insertDataOption="INSERT_ROWS",
                 body=body
-            ).execute()
+            ))
             
             updated_rows = result.get('updates', {}).get('updatedRows', 0)
             updated_columns = result.get('updates', {}).get('updatedColumns', 0)
@@ -350,6 +617,67 @@ class GoogleSheetsClient:
             self.logger.error(error_msg)
             raise APIError(error_msg)
     
+    async def batch_update(
+        self,
+        ranges_values: Dict[str, List[List[Any]]],
+        value_input_option: str = "USER_ENTERED"
+    ) -> Dict[str, Any]:
+        """
+        여러 범위를 단일 요청(values.batchUpdate)으로 업데이트
+        
+        Args:
+            ranges_values: range 문자열 → 업데이트할 데이터
+            value_input_option: 값 입력 옵션 ("USER_ENTERED" 또는 "RAW")
+            
+        Returns:
+            Dict[str, Any]: 업데이트 결과 (totalUpdatedCells 등)
+            
+        Raises:
+            APIError: API 호출 실패 시
+            ValidationError: 데이터 유효성 검사 실패 시
+        """
+        if not self.service:
+            await self.authenticate()
+        
+        if not ranges_values:
+            raise ValidationError("No data to update")
+        
+        for range_name, values in ranges_values.items():
+            if not values:
+                raise ValidationError(f"No data to update for range '{range_name}'", field=range_name)
+        
+        try:
+            body = {
+                'valueInputOption': value_input_option,
+                'data': [
+                    {'range': range_name, 'values': values}
+                    for range_name, values in ranges_values.items()
+                ]
+            }
+            
+            result = await self._execute("batch_update", self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body=body
+            ))
+            
+            updated_rows = result.get('totalUpdatedRows', 0)
+            updated_cells = result.get('totalUpdatedCells', 0)
+            
+            self.logger.info(f"Batch updated {len(ranges_values)} ranges ({updated_rows} rows, {updated_cells} cells) in one request")
+            
+            return result
+            
+        except HttpError as e:
+            status_code = e.resp.status
+            error_msg = f"Failed to batch update {len(ranges_values)} ranges: {str(e)}"
+            self.logger.error(error_msg)
+            raise APIError(error_msg, status_code)
+        
+        except Exception as e:
+            error_msg = f"Unexpected error batch updating {len(ranges_values)} ranges: {str(e)}"
+            self.logger.error(error_msg)
+            raise APIError(error_msg)
+    
     async def clear_sheet_data(self, range_name: str) -> Dict[str, Any]:
         """
         시트 데이터 삭제
@@ -364,10 +692,10 @@ class GoogleSheetsClient:
             await self.authenticate()
         
         try:
-            result = self.service.spreadsheets().values().clear(
+            result = await self._execute("clear", self.service.spreadsheets().values().clear(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name
-            ).execute()
+            ))
             
             cleared_rows = result.get('clearedRows', 0)
             cleared_columns = result.get('clearedColumns', 0)
@@ -402,7 +730,7 @@ class GoogleSheetsClient:
             await self.authenticate()
         
         try:
-            return self.spreadsheet.worksheet(title)
+            return await self._run_blocking(self.spreadsheet.worksheet, title)
         except gspread.exceptions.WorksheetNotFound:
             raise APIError(f"Worksheet '{title}' not found")
         except Exception as e:
@@ -463,4 +791,6 @@ async def get_google_sheets_client() -> GoogleSheetsClient:
 async def close_google_sheets_client():
     """Google Sheets 클라이언트 리소스 정리"""
     global _client_instance
+    if _client_instance is not None:
+        await _client_instance.close()
     _client_instance = None
@@ -31,3 +31,13 @@ class MockSheetsClient:
         """Mock data persistence."""
         self._logger.debug(f"Mocking write_sheet_data to range: {range_name}")
         return True
+
+    async def batch_get(self, ranges: List[str]) -> Dict[str, List[List[Any]]]:
+        """Mock batched retrieval (range별 빈 데이터)."""
+        self._logger.debug(f"Mocking batch_get for {len(ranges)} ranges")
+        return {range_name: [] for range_name in ranges}
+
+    async def batch_update(self, ranges_values: Dict[str, List[List[Any]]]) -> Dict[str, Any]:
+        """Mock batched persistence."""
+        self._logger.debug(f"Mocking batch_update for {len(ranges_values)} ranges")
+        return {"totalUpdatedRows": sum(len(v) for v in ranges_values.values())}
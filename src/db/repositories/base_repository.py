@@ -3,15 +3,21 @@
 
 QTS 시스템의 모든 시트 리포지토리가 상속받는 추상 기본 클래스입니다.
 CRUD 인터페이스와 공통 유틸리티 메서드를 제공합니다.
+
+데이터 영역은 SheetRowCache(read-through, TTL)로 캐시되어 get_by_id/_find_row_by_id가
+시트 전체 재다운로드 없이 id 해시 인덱스로 조회됩니다. coalesce_writes() 블록 안의
+행 쓰기는 버퍼링되었다가 단일 요청으로 반영됩니다.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 import logging
-from datetime import datetime
 
 from ..google_sheets_client import GoogleSheetsClient
 from ...shared.timezone_utils import now_kst
+from .sheet_cache import SheetRowCache
 
 
 class BaseSheetRepository(ABC):
@@ -21,6 +27,9 @@ class BaseSheetRepository(ABC):
     모든 시트 리포지토리가 상속받아야 하는 추상 클래스입니다.
     기본 CRUD 인터페이스와 공통 기능을 제공합니다.
     """
+
+    # 데이터 영역 캐시 TTL (초). 0 이하이면 매 조회마다 시트에서 재적재.
+    CACHE_TTL_SEC: float = 5.0
     
     def __init__(
         self, 
@@ -48,6 +57,9 @@ class BaseSheetRepository(ABC):
         # 캐싱
         self._headers_cache = None
         self._last_cache_update = None
+        self._row_cache = SheetRowCache(self.CACHE_TTL_SEC, header_row + 1)
+        self._row_cache_lock: Optional[asyncio.Lock] = None
+        self._pending_writes: Optional[Dict[int, List[Any]]] = None
         
         self.logger.info(f"Initialized {self.__class__.__name__} for sheet '{sheet_name}'")
     
@@ -141,16 +153,12 @@ class BaseSheetRepository(ABC):
                 header_data = await self.client.get_sheet_data(header_range)
                 
                 if header_data and len(header_data) > 0:
-                    self._headers_cache = [str(cell).strip() for cell in header_data[0] if cell.strip()]
-                else:
-                    self._headers_cache = []
-                
+                    self._headers_cache = [str(cell).strip() for cell in header_data[0] if str(cell).strip()]
                 else:
                     self._headers_cache = []
                 
                 self._last_cache_update = now_kst()
                 self.logger.debug(f"Retrieved headers: {self._headers_cache}")
-                self.logger.debug(f"Retrieved headers: {self._headers_cache}")
                 
             except Exception as e:
                 self.logger.error(f"Failed to get headers: {str(e)}")
@@ -159,10 +167,188 @@ class BaseSheetRepository(ABC):
         return self._headers_cache
     
     async def clear_cache(self):
-        """헤더 캐시 초기화"""
+        """헤더 캐시 및 데이터 행 캐시 초기화"""
         self._headers_cache = None
         self._last_cache_update = None
-        self.logger.debug("Headers cache cleared")
+        self._row_cache.invalidate()
+        self.logger.debug("Headers and row cache cleared")
+    
+    # ------------------------------------------------------------------
+    # 데이터 행 캐시 (read-through, TTL, id 인덱스)
+    # ------------------------------------------------------------------
+    
+    def configure_cache(self, ttl_sec: float) -> None:
+        """데이터 행 캐시 TTL 설정 (0 이하이면 캐시 비활성)."""
+        self._row_cache.ttl_sec = ttl_sec
+        self._row_cache.invalidate()
+    
+    def invalidate_cache(self) -> None:
+        """데이터 행 캐시 명시적 무효화 (외부에서 시트가 변경된 경우 등)."""
+        self._row_cache.invalidate()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """캐시 hit/miss/load 통계."""
+        return {
+            "sheet_name": self.sheet_name,
+            **self._row_cache.stats(),
+            "pending_writes": len(self._pending_writes or {}),
+        }
+    
+    async def _ensure_row_cache(self) -> SheetRowCache:
+        """
+        데이터 영역 캐시 확보 (read-through).
+        
+        만료 시 한 번만 재적재하도록 직렬화하며, 버퍼링 중인 쓰기는 재적재 후 다시 반영합니다.
+        """
+        cache = self._row_cache
+        if cache.is_fresh():
+            cache.hits += 1
+            return cache
+        
+        if self._row_cache_lock is None:
+            self._row_cache_lock = asyncio.Lock()
+        
+        async with self._row_cache_lock:
+            if cache.is_fresh():
+                cache.hits += 1
+                return cache
+            
+            cache.misses += 1
+            headers = await self.get_headers()
+            if not headers:
+                cache.load([], lambda row: {})
+                return cache
+            
+            range_name = f"{self.sheet_name}!A{self.header_row + 1}:Z"
+            raw_data = await self.client.get_sheet_data(range_name)
+            cache.load(raw_data or [], lambda row: self._row_to_dict(row, headers))
+            
+            for row_number, row in (self._pending_writes or {}).items():
+                self._apply_row_to_cache(row_number, row)
+        
+        return cache
+    
+    async def _get_data_rows(self) -> List[List[Any]]:
+        """
+        데이터 영역 원본 행 조회 (캐시 경유)
+        
+        Returns:
+            List[List[Any]]: 헤더 다음 행부터의 원본 행 (빈 행 포함)
+        """
+        cache = await self._ensure_row_cache()
+        return cache.rows
+    
+    async def _get_record_by_id(
+        self,
+        record_id: str,
+        id_column: str,
+        ignore_case: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        id 인덱스로 레코드 조회
+        
+        Args:
+            record_id: 레코드 ID
+            id_column: ID 컬럼 이름
+            ignore_case: 대소문자 무시 여부
+            
+        Returns:
+            Optional[Dict[str, Any]]: 레코드 사본 또는 None
+        """
+        cache = await self._ensure_row_cache()
+        position = cache.find(record_id, id_column, ignore_case)
+        if position is None:
+            return None
+        record = cache.record_at(position)
+        return dict(record) if record is not None else None
+    
+    def _apply_row_to_cache(self, row_number: int, row: List[Any]) -> None:
+        headers = self._headers_cache or []
+        self._row_cache.apply_row(row_number, row, lambda r: self._row_to_dict(r, headers))
+    
+    async def _write_row(self, row_number: int, row_data: List[Any]) -> None:
+        """
+        단일 행 쓰기 (write-through)
+        
+        coalesce_writes() 블록 안에서는 버퍼링되어 블록 종료 시 일괄 반영됩니다.
+        
+        Args:
+            row_number: 시트 행 번호 (1-based)
+            row_data: 행 데이터
+        """
+        if self._pending_writes is not None:
+            self._pending_writes[row_number] = row_data
+            self._apply_row_to_cache(row_number, row_data)
+            return
+        
+        range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
+        await self.client.update_sheet_data(range_name, [row_data])
+        self._apply_row_to_cache(row_number, row_data)
+    
+    @asynccontextmanager
+    async def coalesce_writes(self) -> AsyncIterator["BaseSheetRepository"]:
+        """
+        Write-back 블록
+        
+        블록 안의 update/delete 행 쓰기를 행 번호별로 병합(같은 행은 마지막 값)하고,
+        블록 종료 시 연속 행은 하나의 range로 묶어 단일 요청으로 반영합니다.
+        블록 안에서 예외가 발생하면 버퍼를 폐기하고 캐시를 무효화합니다.
+        
+        Example:
+            async with repo.coalesce_writes():
+                await repo.update("A", {...})
+                await repo.update("B", {...})
+        """
+        if self._pending_writes is not None:
+            # 중첩 블록은 바깥 블록에서 flush
+            yield self
+            return
+        
+        self._pending_writes = {}
+        try:
+            yield self
+        except BaseException:
+            self._pending_writes = None
+            self._row_cache.invalidate()
+            raise
+        
+        pending, self._pending_writes = self._pending_writes, None
+        if pending:
+            try:
+                await self._flush_writes(pending)
+            except Exception:
+                self._row_cache.invalidate()
+                raise
+    
+    def _group_row_writes(self, writes: Dict[int, List[Any]]) -> Dict[str, List[List[Any]]]:
+        """행 번호별 쓰기를 연속 구간 range로 묶음."""
+        ranges: Dict[str, List[List[Any]]] = {}
+        run: List[Tuple[int, List[Any]]] = []
+        
+        def _close_run() -> None:
+            if run:
+                start, end = run[0][0], run[-1][0]
+                ranges[f"{self.sheet_name}!A{start}:Z{end}"] = [row for _, row in run]
+        
+        for row_number in sorted(writes):
+            if run and row_number != run[-1][0] + 1:
+                _close_run()
+                run = []
+            run.append((row_number, writes[row_number]))
+        _close_run()
+        return ranges
+    
+    async def _flush_writes(self, writes: Dict[int, List[Any]]) -> None:
+        ranges = self._group_row_writes(writes)
+        if len(ranges) == 1:
+            range_name, values = next(iter(ranges.items()))
+            await self.client.update_sheet_data(range_name, values)
+        elif hasattr(self.client, "batch_update"):
+            await self.client.batch_update(ranges)
+        else:
+            for range_name, values in ranges.items():
+                await self.client.update_sheet_data(range_name, values)
+        self.logger.debug(f"Flushed {len(writes)} coalesced row writes as {len(ranges)} range(s)")
     
     def _row_to_dict(self, row: List[Any], headers: List[str]) -> Dict[str, Any]:
         """
@@ -226,26 +412,21 @@ class BaseSheetRepository(ABC):
     
     async def _find_row_by_id(self, record_id: str, id_column: str = "id") -> Optional[int]:
         """
-        ID로 행 번호 찾기
+        ID로 행 번호 찾기 (캐시 id 인덱스 사용)
         
         Args:
             record_id: 레코드 ID
             id_column: ID 컬럼 이름
             
         Returns:
-            Optional[int]: 행 번호 (헤더 행 제외) 또는 None
+            Optional[int]: 시트 행 번호 (1-based) 또는 None
         """
         try:
-            # 모든 데이터 조회
-            all_data = await self.get_all()
-            
-            # ID로 행 찾기
-            for i, record in enumerate(all_data):
-                if str(record.get(id_column, "")) == str(record_id):
-                    # 헤더 행 다음부터 시작하므로 +2 (헤더 행 + 1-based index)
-                    return i + self.header_row + 1
-            
-            return None
+            cache = await self._ensure_row_cache()
+            position = cache.find(record_id, id_column)
+            if position is None:
+                return None
+            return cache.row_number(position)
             
         except Exception as e:
             self.logger.error(f"Failed to find row by ID '{record_id}': {str(e)}")
@@ -259,15 +440,9 @@ class BaseSheetRepository(ABC):
             int: 다음 빈 행 번호
         """
         try:
-            # 모든 데이터 조회
-            all_data = await self.get_all()
-            
-            # 마지막 데이터 행 다음 번호 반환
-            if all_data:
-                return len(all_data) + self.header_row + 1
-            else:
-                # 데이터가 없으면 헤더 다음 행
-                return self.header_row + 1
+            # 마지막 데이터 행 다음 번호 반환 (데이터가 없으면 헤더 다음 행)
+            cache = await self._ensure_row_cache()
+            return cache.next_row_number
                 
         except Exception as e:
             self.logger.error(f"Failed to get next empty row: {str(e)}")
@@ -46,8 +46,7 @@ class ConfigSwingRepository(BaseSheetRepository):
                 return []
             
             # 헤더 다음 행부터 모든 데이터 조회
-            range_name = f"{self.sheet_name}!A{self.header_row + 1}:Z"
-            raw_data = await self.client.get_sheet_data(range_name)
+            raw_data = await self._get_data_rows()
             
             result = []
             for row in raw_data:
@@ -73,13 +72,7 @@ class ConfigSwingRepository(BaseSheetRepository):
             Optional[Dict[str, Any]]: 설정 정보 또는 None
         """
         try:
-            all_configs = await self.get_all()
-            
-            for config in all_configs:
-                if config.get('KEY', '').upper() == record_id.upper():
-                    return config
-            
-            return None
+            return await self._get_record_by_id(record_id, 'KEY', ignore_case=True)
             
         except Exception as e:
             self.logger.error(f"Failed to get swing config by ID '{record_id}': {str(e)}")
@@ -145,6 +138,7 @@ class ConfigSwingRepository(BaseSheetRepository):
             
             range_name = f"{self.sheet_name}!A:Z"
             await self.client.append_sheet_data(range_name, [row_data])
+            self.invalidate_cache()
             
             self.logger.info(f"Created new swing config: {sanitized_data.get('KEY')}")
             return sanitized_data
@@ -185,8 +179,7 @@ class ConfigSwingRepository(BaseSheetRepository):
             headers = await self.get_headers()
             row_data = self._dict_to_row(sanitized_data, headers)
             
-            range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
-            await self.client.update_sheet_data(range_name, [row_data])
+            await self._write_row(row_number, row_data)
             
             self.logger.info(f"Updated swing config: {record_id}")
             return sanitized_data
@@ -247,8 +240,7 @@ class ConfigSwingRepository(BaseSheetRepository):
             headers = await self.get_headers()
             empty_row = [''] * len(headers)
             
-            range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
-            await self.client.update_sheet_data(range_name, [empty_row])
+            await self._write_row(row_number, empty_row)
             
             self.logger.info(f"Deleted swing config: {record_id}")
             return True
@@ -44,8 +44,7 @@ class DividendRepository(BaseSheetRepository):
                 return []
             
             # 헤더 다음 행부터 모든 데이터 조회
-            range_name = f"{self.sheet_name}!A{self.header_row + 1}:Z"
-            raw_data = await self.client.get_sheet_data(range_name)
+            raw_data = await self._get_data_rows()
             
             result = []
             for row in raw_data:
@@ -71,13 +70,7 @@ class DividendRepository(BaseSheetRepository):
             Optional[Dict[str, Any]]: 배당금 데이터 또는 None
         """
         try:
-            all_dividends = await self.get_all()
-            
-            for dividend in all_dividends:
-                if str(dividend.get('Year', '')) == str(record_id):
-                    return dividend
-            
-            return None
+            return await self._get_record_by_id(record_id, 'Year')
             
         except Exception as e:
             self.logger.error(f"Failed to get dividend data by ID '{record_id}': {str(e)}")
@@ -146,6 +139,7 @@ class DividendRepository(BaseSheetRepository):
             
             range_name = f"{self.sheet_name}!A:Z"
             await self.client.append_sheet_data(range_name, [row_data])
+            self.invalidate_cache()
             
             self.logger.info(f"Created new dividend record: {sanitized_data.get('Year')}")
             return sanitized_data
@@ -186,8 +180,7 @@ class DividendRepository(BaseSheetRepository):
             headers = await self.get_headers()
             row_data = self._dict_to_row(sanitized_data, headers)
             
-            range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
-            await self.client.update_sheet_data(range_name, [row_data])
+            await self._write_row(row_number, row_data)
             
             self.logger.info(f"Updated dividend record: {record_id}")
             return sanitized_data
@@ -239,8 +232,7 @@ class DividendRepository(BaseSheetRepository):
             headers = await self.get_headers()
             empty_row = [''] * len(headers)
             
-            range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
-            await self.client.update_sheet_data(range_name, [empty_row])
+            await self._write_row(row_number, empty_row)
             
             self.logger.info(f"Deleted dividend record: {record_id}")
             return True
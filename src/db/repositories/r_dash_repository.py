@@ -44,8 +44,7 @@ class R_DashRepository(BaseSheetRepository):
                 return []
             
             # 헤더 다음 행부터 모든 데이터 조회
-            range_name = f"{self.sheet_name}!A{self.header_row + 1}:Z"
-            raw_data = await self.client.get_sheet_data(range_name)
+            raw_data = await self._get_data_rows()
             
             result = []
             for row in raw_data:
@@ -71,15 +70,12 @@ class R_DashRepository(BaseSheetRepository):
             Optional[Dict[str, Any]]: 대시보드 데이터 또는 None
         """
         try:
-            all_data = await self.get_all()
-            
-            for record in all_data:
-                # 첫 번째 컬럼(ID)로 조회
-                first_col_value = list(record.values())[0] if record else ''
-                if str(first_col_value) == str(record_id):
-                    return record
+            headers = await self.get_headers()
+            if not headers:
+                return None
             
-            return None
+            # 첫 번째 컬럼(ID)로 조회
+            return await self._get_record_by_id(record_id, headers[0])
             
         except Exception as e:
             self.logger.error(f"Failed to get dashboard data by ID '{record_id}': {str(e)}")
@@ -180,6 +176,7 @@ class R_DashRepository(BaseSheetRepository):
             
             range_name = f"{self.sheet_name}!A:Z"
             await self.client.append_sheet_data(range_name, [row_data])
+            self.invalidate_cache()
             
             self.logger.info(f"Created new dashboard record")
             return sanitized_data
@@ -220,8 +217,7 @@ class R_DashRepository(BaseSheetRepository):
             headers = await self.get_headers()
             row_data = self._dict_to_row(sanitized_data, headers)
             
-            range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
-            await self.client.update_sheet_data(range_name, [row_data])
+            await self._write_row(row_number, row_data)
             
             self.logger.info(f"Updated dashboard record: {record_id}")
             return sanitized_data
@@ -277,8 +273,7 @@ class R_DashRepository(BaseSheetRepository):
             headers = await self.get_headers()
             empty_row = [''] * len(headers)
             
-            range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
-            await self.client.update_sheet_data(range_name, [empty_row])
+            await self._write_row(row_number, empty_row)
             
             self.logger.info(f"Deleted dashboard record: {record_id}")
             return True
@@ -0,0 +1,149 @@
+"""
+시트 행 캐시 (Read-through, TTL)
+
+BaseSheetRepository가 사용하는 시트 데이터 영역의 materialized row table입니다.
+
+- rows: 데이터 영역 원본 행 (헤더 다음 행부터, 빈 행 포함 — 위치 = 시트 행 번호 오프셋)
+- records: 행별 dict (빈 행은 None)
+- id 인덱스: (id_column, ignore_case)별 id → 행 위치 해시 인덱스 (lazy 생성, 첫 매칭 우선)
+- TTL 만료 또는 invalidate() 시 다음 조회에서 재적재
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+IndexKey = Tuple[str, bool]
+
+
+def is_blank_row(row: List[Any]) -> bool:
+    """모든 셀이 비어 있는 행 여부."""
+    return not row or not any(str(cell).strip() for cell in row)
+
+
+class SheetRowCache:
+    """
+    시트 데이터 영역의 행 테이블 + id 해시 인덱스.
+
+    ttl_sec <= 0 이면 항상 만료 상태로 간주합니다 (캐시 비활성).
+    """
+
+    def __init__(self, ttl_sec: float, first_data_row: int):
+        self.ttl_sec = ttl_sec
+        self.first_data_row = first_data_row
+        self._rows: Optional[List[List[Any]]] = None
+        self._records: List[Optional[Dict[str, Any]]] = []
+        self._indexes: Dict[IndexKey, Dict[str, int]] = {}
+        self._loaded_at: Optional[float] = None
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._rows is not None
+
+    def is_fresh(self) -> bool:
+        if self._rows is None or self._loaded_at is None or self.ttl_sec <= 0:
+            return False
+        return (time.monotonic() - self._loaded_at) < self.ttl_sec
+
+    def load(
+        self,
+        rows: List[List[Any]],
+        to_record: Callable[[List[Any]], Dict[str, Any]],
+    ) -> None:
+        """원본 행을 적재하고 record/인덱스를 재구성."""
+        self._rows = [list(row) for row in rows]
+        self._records = [None if is_blank_row(row) else to_record(row) for row in self._rows]
+        self._indexes = {}
+        self._loaded_at = time.monotonic()
+        self.loads += 1
+
+    def invalidate(self) -> None:
+        self._rows = None
+        self._records = []
+        self._indexes = {}
+        self._loaded_at = None
+
+    @property
+    def rows(self) -> List[List[Any]]:
+        return self._rows or []
+
+    @property
+    def next_row_number(self) -> int:
+        """마지막 데이터 행 다음 시트 행 번호."""
+        return self.first_data_row + len(self.rows)
+
+    def row_number(self, position: int) -> int:
+        return self.first_data_row + position
+
+    def _build_index(self, id_column: str, ignore_case: bool) -> Dict[str, int]:
+        index: Dict[str, int] = {}
+        for position, record in enumerate(self._records):
+            if record is None:
+                continue
+            key = _index_value(record.get(id_column, ""), ignore_case)
+            index.setdefault(key, position)
+        self._indexes[(id_column, ignore_case)] = index
+        return index
+
+    def find(self, record_id: Any, id_column: str, ignore_case: bool = False) -> Optional[int]:
+        """id로 행 위치(0-based) 조회. O(1) (인덱스 최초 생성 시 O(n))."""
+        index = self._indexes.get((id_column, ignore_case))
+        if index is None:
+            index = self._build_index(id_column, ignore_case)
+        return index.get(_index_value(record_id, ignore_case))
+
+    def record_at(self, position: int) -> Optional[Dict[str, Any]]:
+        if 0 <= position < len(self._records):
+            return self._records[position]
+        return None
+
+    def apply_row(
+        self,
+        row_number: int,
+        row: List[Any],
+        to_record: Callable[[List[Any]], Dict[str, Any]],
+    ) -> None:
+        """쓰기 결과를 캐시에 반영 (write-through). 범위 밖 행이면 캐시 무효화."""
+        if self._rows is None:
+            return
+        position = row_number - self.first_data_row
+        if position < 0 or position > len(self._rows):
+            self.invalidate()
+            return
+        new_record = None if is_blank_row(row) else to_record(row)
+        if position == len(self._rows):
+            self._rows.append(list(row))
+            self._records.append(new_record)
+            self._indexes = {}
+            return
+
+        old_record = self._records[position]
+        self._rows[position] = list(row)
+        self._records[position] = new_record
+
+        # id 값이 바뀐 인덱스만 폐기 (다음 조회 시 재생성)
+        for (id_column, ignore_case) in list(self._indexes):
+            old_key = None if old_record is None else _index_value(old_record.get(id_column, ""), ignore_case)
+            new_key = None if new_record is None else _index_value(new_record.get(id_column, ""), ignore_case)
+            if old_key != new_key:
+                del self._indexes[(id_column, ignore_case)]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "rows": len(self.rows),
+            "ttl_sec": self.ttl_sec,
+        }
+
+
+def _index_value(value: Any, ignore_case: bool) -> str:
+    key = "" if value is None else str(value)
+    return key.upper() if ignore_case else key
@@ -46,8 +46,7 @@ class StrategyPerformanceRepository(BaseSheetRepository):
                 return []
             
             # 헤더 다음 행부터 모든 데이터 조회
-            range_name = f"{self.sheet_name}!A{self.header_row + 1}:Z"
-            raw_data = await self.client.get_sheet_data(range_name)
+            raw_data = await self._get_data_rows()
             
             result = []
             for row in raw_data:
@@ -73,13 +72,7 @@ class StrategyPerformanceRepository(BaseSheetRepository):
             Optional[Dict[str, Any]]: 전략 성과 정보 또는 None
         """
         try:
-            all_strategies = await self.get_all()
-            
-            for strategy in all_strategies:
-                if strategy.get('Strategy', '').upper() == record_id.upper():
-                    return strategy
-            
-            return None
+            return await self._get_record_by_id(record_id, 'Strategy', ignore_case=True)
             
         except Exception as e:
             self.logger.error(f"Failed to get strategy performance by ID '{record_id}': {str(e)}")
@@ -120,6 +113,7 @@ class StrategyPerformanceRepository(BaseSheetRepository):
             
             range_name = f"{self.sheet_name}!A:Z"
             await self.client.append_sheet_data(range_name, [row_data])
+            self.invalidate_cache()
             
             self.logger.info(f"Created new strategy performance record: {sanitized_data.get('Strategy')}")
             return sanitized_data
@@ -160,8 +154,7 @@ class StrategyPerformanceRepository(BaseSheetRepository):
             headers = await self.get_headers()
             row_data = self._dict_to_row(sanitized_data, headers)
             
-            range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
-            await self.client.update_sheet_data(range_name, [row_data])
+            await self._write_row(row_number, row_data)
             
             self.logger.info(f"Updated strategy performance: {record_id}")
             return sanitized_data
@@ -240,8 +233,7 @@ class StrategyPerformanceRepository(BaseSheetRepository):
             headers = await self.get_headers()
             empty_row = [''] * len(headers)
             
-            range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
-            await self.client.update_sheet_data(range_name, [empty_row])
+            await self._write_row(row_number, empty_row)
             
             self.logger.info(f"Deleted strategy performance: {record_id}")
             return True
@@ -30,8 +30,7 @@ class StrategyRepository(BaseSheetRepository):
             headers = await self.get_headers()
             if not headers:
                 return []
-            range_name = f"{self.sheet_name}!A{self.header_row + 1}:Z"
-            raw_data = await self.client.get_sheet_data(range_name)
+            raw_data = await self._get_data_rows()
             result = []
             for row in raw_data:
                 if row and any(str(cell).strip() for cell in row):
@@ -46,11 +45,7 @@ class StrategyRepository(BaseSheetRepository):
 
     async def get_by_id(self, record_id: str) -> Optional[Dict[str, Any]]:
         try:
-            all_data = await self.get_all()
-            for record in all_data:
-                if str(record.get("param_name", "")) == str(record_id):
-                    return record
-            return None
+            return await self._get_record_by_id(record_id, "param_name")
         except Exception as e:
             self.logger.error(f"Failed to get Strategy by param_name '{record_id}': {str(e)}")
             raise
@@ -68,6 +63,7 @@ class StrategyRepository(BaseSheetRepository):
             row_data = self._dict_to_row(sanitized, headers)
             range_name = f"{self.sheet_name}!A:Z"
             await self.client.append_sheet_data(range_name, [row_data])
+            self.invalidate_cache()
             self.logger.info(f"Created Strategy record: {sanitized.get('param_name')}")
             return sanitized
         except Exception as e:
@@ -86,8 +82,7 @@ class StrategyRepository(BaseSheetRepository):
                 raise ValueError(f"Row not found for param_name '{record_id}'")
             headers = await self.get_headers()
             row_data = self._dict_to_row(sanitized, headers)
-            range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
-            await self.client.update_sheet_data(range_name, [row_data])
+            await self._write_row(row_number, row_data)
             self.logger.info(f"Updated Strategy record: {record_id}")
             return sanitized
         except Exception as e:
@@ -101,8 +96,7 @@ class StrategyRepository(BaseSheetRepository):
                 return False
             headers = await self.get_headers()
             empty_row = [""] * len(headers)
-            range_name = f"{self.sheet_name}!A{row_number}:Z{row_number}"
-            await self.client.update_sheet_data(range_name, [empty_row])
+            await self._write_row(row_number, empty_row)
             self.logger.info(f"Deleted Strategy record: {record_id}")
             return True
         except Exception as e:
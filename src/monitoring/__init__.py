@@ -2,7 +2,7 @@
 Runtime monitoring — central logging and metrics (Phase 9 — Logging & Monitoring Core).
 
 - Central logging: get_logger, configure_central_logging, LOG_*, get_*_logger
-- Metrics: MetricsCollector, MetricsSnapshot
+- Metrics: MetricsCollector, MetricsSnapshot, LatencyHistogram
 """
 
 from .central_logger import (
@@ -17,6 +17,7 @@ from .central_logger import (
     get_logger,
     get_monitoring_logger,
 )
+from .latency_histogram import LatencyHistogram
 from .metrics_collector import (
     MetricsCollector,
     MetricsSnapshot,
@@ -33,6 +34,7 @@ __all__ = [
     "get_eteda_logger",
     "get_logger",
     "get_monitoring_logger",
+    "LatencyHistogram",
     "MetricsCollector",
     "MetricsSnapshot",
 ]
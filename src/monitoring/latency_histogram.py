@@ -0,0 +1,123 @@
+"""
+Latency Histogram (Phase 9 — Logging & Monitoring Core).
+
+- 고정 버킷 로그 스케일(HDR 유사) 히스토그램: record O(1), 메모리 고정
+- 버킷 경계: min_value × 2^(i / buckets_per_octave) → 상대 오차 약 2^(1/bpo) - 1 (기본 8 → ~9%)
+- percentile은 해당 버킷 상한을 관측 min/max로 보정해 반환
+- 단위 무관 (호출 측에서 초/밀리초 중 하나로 일관되게 기록)
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket log-scale latency histogram.
+
+    - record(value): O(1)
+    - percentile(q): O(buckets) (버킷 수 고정)
+    - snapshot(): count/mean/p50/p95/p99/max dict
+    """
+
+    __slots__ = (
+        "min_value", "max_value", "buckets_per_octave",
+        "_counts", "_log_min", "_scale",
+        "count", "total", "min", "max",
+    )
+
+    def __init__(
+        self,
+        min_value: float = 1e-6,
+        max_value: float = 100.0,
+        buckets_per_octave: int = 8,
+    ) -> None:
+        if min_value <= 0 or max_value <= min_value:
+            raise ValueError("require 0 < min_value < max_value")
+        self.min_value = min_value
+        self.max_value = max_value
+        self.buckets_per_octave = buckets_per_octave
+        self._log_min = math.log2(min_value)
+        self._scale = float(buckets_per_octave)
+        n_buckets = int(math.ceil(math.log2(max_value / min_value) * buckets_per_octave)) + 2
+        self._counts: List[int] = [0] * n_buckets
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def _index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        idx = 1 + int((math.log2(value) - self._log_min) * self._scale)
+        last = len(self._counts) - 1
+        return idx if idx < last else last
+
+    def _upper_bound(self, index: int) -> float:
+        if index == 0:
+            return self.min_value
+        return self.min_value * 2.0 ** (index / self._scale)
+
+    def record(self, value: float) -> None:
+        value = float(value)
+        if value < 0 or math.isnan(value):
+            return
+        self._counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """q: 0~100. 관측 없음이면 0.0."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(math.ceil(self.count * min(max(q, 0.0), 100.0) / 100.0)))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index == len(self._counts) - 1:
+                    return self.max or 0.0  # 상한 초과 버킷
+                value = self._upper_bound(index)
+                return min(max(value, self.min or 0.0), self.max or value)
+        return self.max or 0.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """동일 버킷 구성의 히스토그램 합산."""
+        if len(other._counts) != len(self._counts) or other.min_value != self.min_value:
+            raise ValueError("histogram bucket layout mismatch")
+        for index, bucket_count in enumerate(other._counts):
+            self._counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def reset(self) -> None:
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def snapshot(self, scale: float = 1.0) -> Dict[str, Any]:
+        """요약 dict. scale: 출력 단위 환산 (예: 초 → ms는 1000.0)."""
+        return {
+            "count": self.count,
+            "mean": self.mean * scale,
+            "p50": self.percentile(50) * scale,
+            "p95": self.percentile(95) * scale,
+            "p99": self.percentile(99) * scale,
+            "max": (self.max or 0.0) * scale,
+        }
@@ -40,6 +40,7 @@ class MetricsCollector:
     - set_gauge(name, value): set gauge
     - snapshot(): return MetricsSnapshot
     - Optional: register_engine_collector(callable) etc. for pull-based metrics
+    - register_collector(name, callable): 이름별 다중 수집기 (엔진별/ETEDA 등), 같은 이름은 교체
     """
 
     def __init__(self) -> None:
@@ -48,6 +49,7 @@ class MetricsCollector:
         self._engine_collector: Optional[Callable[[], Dict[str, Any]]] = None
         self._system_collector: Optional[Callable[[], Dict[str, Any]]] = None
         self._business_collector: Optional[Callable[[], Dict[str, Any]]] = None
+        self._collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
 
     def inc(self, name: str, delta: int = 1) -> None:
         self._counters[name] = self._counters.get(name, 0) + delta
@@ -87,6 +89,16 @@ class MetricsCollector:
             except Exception as e:
                 _log.warning("Business metrics collector failed: %s", e)
 
+        for name, fn in list(self._collectors.items()):
+            try:
+                data = fn()
+                if isinstance(data.get("counters"), dict):
+                    counters.update(data["counters"])
+                if isinstance(data.get("gauges"), dict):
+                    gauges.update(data["gauges"])
+            except Exception as e:
+                _log.warning("Metrics collector %s failed: %s", name, e)
+
         return MetricsSnapshot(counters=counters, gauges=gauges)
 
     def register_engine_collector(self, fn: Callable[[], Dict[str, Any]]) -> None:
@@ -100,3 +112,10 @@ class MetricsCollector:
     def register_business_collector(self, fn: Callable[[], Dict[str, Any]]) -> None:
         """Register callable for business metrics (e.g. pnl, volume)."""
         self._business_collector = fn
+
+    def register_collector(self, name: str, fn: Callable[[], Dict[str, Any]]) -> None:
+        """Register named callable returning dict with optional 'counters' and 'gauges' (replaces same name)."""
+        self._collectors[name] = fn
+
+    def unregister_collector(self, name: str) -> None:
+        self._collectors.pop(name, None)
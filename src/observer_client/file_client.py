@@ -3,17 +3,25 @@ File Observer Client
 
 Observer가 생성한 JSONL 파일을 읽어 스트리밍하는 클라이언트입니다.
 로컬 테스트 및 백테스팅 용도로 사용됩니다.
+
+- 대용량 청크/mmap 읽기 + 배치 디코딩(orjson, stdlib fallback)은 jsonl_reader.JsonlBatchReader
+- 파일 I/O·디코딩·스냅샷 변환은 워커 스레드에서 수행 (이벤트 루프 블로킹 없음)
+- 파일별 바이트 오프셋 추적 (get_offsets) → offsets 인자로 재시작 시 이어 읽기
+- follow=True: tail 모드 (새 줄/새 파일/회전 감지, inotify 또는 지수 백오프 polling)
+- checkpoint_path: 파일별 {inode, offset} 체크포인트 저장/복원 → 재시작 시 재스캔 없이 이어 읽기
 """
 
 import asyncio
 import glob
-import json
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional
 
 from src.shared.timezone_utils import get_kst_now
+from src.observer_client.jsonl_reader import DEFAULT_CHUNK_SIZE, JSON_BACKEND, JsonlBatchReader
+from src.observer_client.file_watch import OffsetCheckpoint, create_watcher
 
 logger = logging.getLogger("src.observer_client.file")
 
@@ -26,18 +34,54 @@ class FileObserverClient:
     ETEDA 파이프라인에 공급할 스냅샷 형태로 변환합니다.
     """
 
-    def __init__(self, assets_dir: str, scope: str = "scalp"):
+    def __init__(
+        self,
+        assets_dir: str,
+        scope: str = "scalp",
+        batch_size: int = 1000,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_mmap: bool = True,
+        offsets: Optional[Dict[str, int]] = None,
+        follow: bool = False,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: float = 1.0,
+        poll_interval: float = 0.05,
+        max_poll_interval: float = 2.0,
+        use_inotify: bool = True,
+    ):
         """
         Args:
             assets_dir: Observer 데이터 디렉토리 경로
             scope: 모니터링할 전략 범위 (scalp, swing)
+            batch_size: 워커 스레드 1회 호출당 디코딩할 최대 레코드 수
+            chunk_size: 파일 읽기 청크 크기 (bytes)
+            use_mmap: mmap 사용 여부 (False면 버퍼 청크 읽기)
+            offsets: 파일 경로별 재개 바이트 오프셋 (get_offsets() 결과, 체크포인트보다 우선)
+            follow: True면 EOF 후에도 종료하지 않고 새 데이터/새 파일/회전을 계속 추적
+            checkpoint_path: 오프셋 체크포인트 파일 경로 (None이면 비활성)
+            checkpoint_interval: 체크포인트 최소 저장 간격 (초, disconnect 시 항상 저장)
+            poll_interval: follow 모드 polling 최초 대기 간격 (초, 유휴 시 2배씩 증가)
+            max_poll_interval: polling 최대 대기 간격 / inotify 안전망 재스캔 주기 (초)
+            use_inotify: Linux에서 inotify 사용 (불가 시 polling)
         """
         self.assets_dir = Path(assets_dir)
         self.scope = scope
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.use_mmap = use_mmap
+        self._offsets: Dict[str, int] = dict(offsets or {})
+        self._inodes: Dict[str, int] = {}
+        self.follow = follow
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.use_inotify = use_inotify
+        self.checkpoint_interval = checkpoint_interval
+        self._checkpoint = OffsetCheckpoint(checkpoint_path) if checkpoint_path else None
+        self._last_checkpoint = 0.0
         self._connected = False
         self._generator: Optional[AsyncIterator[Dict[str, Any]]] = None
         
-        logger.info(f"FileObserverClient initialized: {assets_dir} (scope={scope})")
+        logger.info(f"FileObserverClient initialized: {assets_dir} (scope={scope}, json={JSON_BACKEND})")
 
     async def connect(self) -> bool:
         """연결 (파일 확인)"""
@@ -45,6 +89,9 @@ class FileObserverClient:
             logger.error(f"Assets directory not found: {self.assets_dir}")
             return False
             
+        if self._checkpoint is not None:
+            self._restore_checkpoint(await asyncio.to_thread(self._checkpoint.load))
+
         self._connected = True
         # 제너레이터 초기화
         self._generator = self._create_snapshot_generator()
@@ -53,7 +100,10 @@ class FileObserverClient:
 
     async def disconnect(self) -> None:
         self._connected = False
-        self._generator = None
+        generator, self._generator = self._generator, None
+        if generator is not None:
+            await generator.aclose()
+        await self._maybe_checkpoint(force=True)
         logger.info("FileObserverClient disconnected")
 
     async def get_next_snapshot(self) -> Dict[str, Any]:
@@ -75,137 +125,321 @@ class FileObserverClient:
             await asyncio.sleep(1) # 과도한 루프 방지
             raise StopAsyncIteration
 
-    async def _create_snapshot_generator(self) -> AsyncIterator[Dict[str, Any]]:
-        """JSONL 파일을 읽어 스냅샷을 생성하는 제너레이터"""
+    def get_offsets(self) -> Dict[str, int]:
+        """파일 경로별 소비 완료 바이트 오프셋 (다음 레코드 시작 위치)."""
+        return dict(self._offsets)
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+
+    def _restore_checkpoint(self, entries: Dict[str, Dict[str, int]]) -> None:
+        """체크포인트 복원. 명시적 offsets 인자가 있는 파일은 인자를 우선합니다."""
+        for path, entry in entries.items():
+            if path in self._offsets:
+                continue
+            self._offsets[path] = entry["offset"]
+            if entry.get("inode"):
+                self._inodes[path] = entry["inode"]
+        if entries:
+            logger.info(f"Restored offsets for {len(entries)} files from {self._checkpoint.path}")
+
+    async def _maybe_checkpoint(self, force: bool = False) -> None:
+        """checkpoint_interval 경과 시(또는 force) 오프셋 체크포인트 저장 (워커 스레드)."""
+        if self._checkpoint is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < self.checkpoint_interval:
+            return
+        self._last_checkpoint = now
+        files = {
+            path: {"inode": self._inodes.get(path, 0), "offset": offset}
+            for path, offset in self._offsets.items()
+        }
+        try:
+            await asyncio.to_thread(self._checkpoint.save, files)
+        except OSError as e:
+            logger.error(f"Failed to write checkpoint {self._checkpoint.path}: {e}")
+
+    async def _wait_for_files(self) -> List[str]:
+        """*.jsonl 파일이 생길 때까지 대기 후 정렬된 목록 반환."""
         target_dir = self.assets_dir / self.scope
         pattern = str(target_dir / "*.jsonl")
         
         # 파일 목록 대기 (테스트 환경에서 파일 생성 시간 고려)
         # 파일 목록 대기 (무한 대기)
-        files = []
         while True:
             files = glob.glob(pattern)
             if files:
-                break
-            # 10초마다 로그 출력
+                return sorted(files)
             await asyncio.sleep(5)
             logger.info(f"Waiting for .jsonl files in {target_dir}...")
-            
-        if not files:
-            # 이론상 도달하지 않음
+
+    def _open_reader(self, file_path: str) -> JsonlBatchReader:
+        """
+        파일 리더 생성. 저장된 오프셋은 inode가 같고 파일 크기 이내일 때만 사용
+        (다른 파일로 교체되었거나 truncate된 경우 처음부터).
+        """
+        reader = JsonlBatchReader(
+            file_path,
+            chunk_size=self.chunk_size,
+            use_mmap=self.use_mmap,
+            transform=self._map_to_snapshot,
+        )
+        try:
+            inode = reader.inode
+            offset = self._offsets.get(file_path, 0)
+            expected = self._inodes.get(file_path)
+            if offset and ((expected is not None and expected != inode) or offset > reader.size()):
+                logger.info(f"Saved offset for {file_path} no longer valid (rotated/truncated); reading from start")
+                offset = 0
+        except OSError:
+            reader.close()
+            raise
+        reader.offset = offset
+        self._offsets[file_path] = offset
+        self._inodes[file_path] = inode
+        return reader
+
+    def _forget_file(self, file_path: str) -> None:
+        self._offsets.pop(file_path, None)
+        self._inodes.pop(file_path, None)
+
+    async def _iter_file_batches(self) -> AsyncIterator[Any]:
+        """(file_path, JsonlBatch) 스트림. 읽기·디코딩·변환은 워커 스레드에서 수행."""
+        if self.follow:
+            async for item in self._follow_file_batches():
+                yield item
             return
 
+        files = await self._wait_for_files()
         logger.info(f"Found {len(files)} files. Starting processing.")
-        
-        # 간단하게 첫 번째 파일부터 순차 처리 (혹은 최신 파일)
-        # 테스트 데이터는 보통 하나 또는 소수
-        for file_path in sorted(files):
+
+        for file_path in files:
             logger.info(f"Processing file: {file_path}")
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        try:
-                            data = json.loads(line)
-                            snapshot = self._map_to_snapshot(data)
-                            if snapshot:
-                                yield snapshot
-                            # 너무 빠른 처리를 방지하기 위해 약간의 딜레이 (선택사항)
-                            # await asyncio.sleep(0.01) 
-                        except json.JSONDecodeError:
-                            logger.warning(f"Invalid JSON in {file_path}: {line[:50]}...")
+                reader = self._open_reader(file_path)
+            except OSError as e:
+                logger.error(f"Error reading {file_path}: {e}")
+                continue
+            try:
+                while True:
+                    batch = await asyncio.to_thread(reader.read_batch, self.batch_size, True)
+                    yield file_path, batch
+                    if batch.eof:
+                        break
             except Exception as e:
                 logger.error(f"Error reading {file_path}: {e}")
+            finally:
+                reader.close()
 
-    def _map_to_snapshot(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def _drain(self, file_path: str, reader: JsonlBatchReader) -> AsyncIterator[Any]:
+        """회전/삭제된 파일의 남은 줄을 열린 핸들로 끝까지 읽음 (완결 파일로 취급)."""
+        while True:
+            start = reader.offset
+            batch = await asyncio.to_thread(reader.read_batch, self.batch_size, True)
+            if batch.end_offset != start:
+                yield file_path, batch
+            if batch.eof:
+                return
+
+    async def _follow_file_batches(self) -> AsyncIterator[Any]:
         """
-        Observer 데이터를 ETEDA Snapshot 구조로 변환
-
-        Observer Data Format (nested objects from real observer):
-        {
-            "symbol": "005930",
-            "price": {"current": 71000, "open": 70500, "high": 71200, "low": 70300, "change_rate": 0.5},
-            "volume": {"accumulated": 100000, "trade_value": 7100000000},
-            "timestamp": "2024-01-01T09:00:00"
-        }
+        tail 모드 스트림.
 
-        Also supports flat format:
-        {
-            "symbol": "005930",
-            "price": 70000,
-            "volume": 100,
-            "timestamp": "2024-01-01T09:00:00"
-        }
+        매 스캔마다 glob으로 새 파일을 찾고, 크기/inode 변화가 있는 파일만 워커 스레드에서 읽습니다.
+        - 개행 없는 마지막 줄은 완성될 때까지 보류 (final=False)
+        - 경로의 inode 변경(rename 회전): 기존 핸들을 끝까지 읽은 뒤 새 파일을 처음부터
+        - 크기 감소 또는 첫 레코드 변경(copytruncate 후 재기록): 처음부터 다시 읽기
+        - 파일 삭제: 남은 줄을 읽고 추적 종료
+        새 데이터가 없으면 watcher 대기 (inotify 이벤트 또는 지수 백오프 polling).
+        """
+        target_dir = self.assets_dir / self.scope
+        pattern = str(target_dir / "*.jsonl")
+        while not target_dir.is_dir():
+            await asyncio.sleep(self.max_poll_interval)
+
+        watcher = create_watcher(target_dir, self.use_inotify, self.poll_interval, self.max_poll_interval)
+        logger.info(f"Following {pattern} ({watcher.kind})")
+        readers: Dict[str, JsonlBatchReader] = {}
+        mtimes: Dict[str, int] = {}
+        try:
+            while True:
+                progressed = False
+                for file_path in sorted(glob.glob(pattern)):
+                    reader = readers.get(file_path)
+                    try:
+                        st = os.stat(file_path)
+                        if reader is None:
+                            reader = readers[file_path] = self._open_reader(file_path)
+                            logger.info(f"Following file: {file_path} (offset={reader.offset})")
+                        elif st.st_ino != self._inodes.get(file_path):
+                            logger.info(f"Rotation detected: {file_path}")
+                            async for item in self._drain(file_path, reader):
+                                yield item
+                            reader.close()
+                            self._forget_file(file_path)
+                            reader = readers[file_path] = self._open_reader(file_path)
+                            progressed = True
+                    except OSError as e:
+                        logger.debug(f"Skipping {file_path}: {e}")
+                        continue
+
+                    if st.st_size == reader.offset and st.st_mtime_ns == mtimes.get(file_path):
+                        continue
+                    mtimes[file_path] = st.st_mtime_ns
+                    try:
+                        rewritten = await asyncio.to_thread(reader.rewritten, st.st_size)
+                    except OSError as e:
+                        logger.debug(f"Skipping {file_path}: {e}")
+                        continue
+                    if rewritten:
+                        logger.info(f"Truncation detected: {file_path}; reading from start")
+                        reader.reset(0)
+                    elif st.st_size == reader.offset:
+                        continue
 
-        Target Snapshot:
-        {
+                    while True:
+                        start = reader.offset
+                        batch = await asyncio.to_thread(reader.read_batch, self.batch_size, False)
+                        if batch.end_offset != start:
+                            progressed = True
+                            yield file_path, batch
+                        if batch.eof:
+                            break
+
+                for file_path in [p for p in readers if not os.path.exists(p)]:
+                    reader = readers.pop(file_path)
+                    mtimes.pop(file_path, None)
+                    async for item in self._drain(file_path, reader):
+                        yield item
+                    reader.close()
+                    self._forget_file(file_path)
+
+                await self._maybe_checkpoint()
+                if progressed:
+                    watcher.reset()
+                else:
+                    await watcher.wait()
+        finally:
+            for reader in readers.values():
+                reader.close()
+            watcher.close()
+
+    async def iter_batches(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        스냅샷 배치 스트림 (파일 이름 순, 최대 batch_size개씩).
+
+        배치를 내보내는 시점에 해당 파일 오프셋이 배치 끝으로 갱신됩니다.
+        """
+        async for file_path, batch in self._iter_file_batches():
+            self._offsets[file_path] = batch.end_offset
+            if batch.items:
+                yield batch.items
+            await self._maybe_checkpoint()
+
+    async def _create_snapshot_generator(self) -> AsyncIterator[Dict[str, Any]]:
+        """JSONL 파일을 읽어 스냅샷을 생성하는 제너레이터 (배치 단위 읽기, 1건씩 반환·오프셋 갱신)"""
+        async for file_path, batch in self._iter_file_batches():
+            for snapshot, offset in zip(batch.items, batch.offsets):
+                self._offsets[file_path] = offset
+                yield snapshot
+            self._offsets[file_path] = batch.end_offset
+            await self._maybe_checkpoint()
+
+    def _map_to_snapshot(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Observer 레코드 → ETEDA Snapshot (observer_record_to_snapshot 참조)."""
+        return observer_record_to_snapshot(data)
+
+
+def observer_record_to_snapshot(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Observer 데이터를 ETEDA Snapshot 구조로 변환
+
+    Observer Data Format (nested objects from real observer):
+    {
+        "symbol": "005930",
+        "price": {"current": 71000, "open": 70500, "high": 71200, "low": 70300, "change_rate": 0.5},
+        "volume": {"accumulated": 100000, "trade_value": 7100000000},
+        "timestamp": "2024-01-01T09:00:00"
+    }
+
+    Also supports flat format:
+    {
+        "symbol": "005930",
+        "price": 70000,
+        "volume": 100,
+        "timestamp": "2024-01-01T09:00:00"
+    }
+
+    Target Snapshot:
+    {
+        "trigger": "observer_file",
+        "observation": {
+             "inputs": { "price": ..., "volume": ..., "open": ..., "high": ..., "low": ... }
+        },
+        "context": { "symbol": ... },
+        "meta": { "timestamp_ms": ... }
+    }
+    """
+    try:
+        symbol = data.get("symbol") or data.get("code")
+
+        if not symbol:
+            return None
+
+        # Handle nested price object (from real observer)
+        price_data = data.get("price")
+        if isinstance(price_data, dict):
+            price = price_data.get("current") or price_data.get("close")
+            open_price = price_data.get("open")
+            high_price = price_data.get("high")
+            low_price = price_data.get("low")
+            change_rate = price_data.get("change_rate", 0)
+        else:
+            # Flat format
+            price = price_data or data.get("trade_price") or data.get("current_price") or data.get("close")
+            open_price = data.get("open")
+            high_price = data.get("high")
+            low_price = data.get("low")
+            change_rate = data.get("change_rate", 0)
+
+        if price is None:
+            return None
+
+        # Handle nested volume object
+        volume_data = data.get("volume")
+        if isinstance(volume_data, dict):
+            volume = volume_data.get("accumulated") or volume_data.get("trade_volume", 0)
+            trade_value = volume_data.get("trade_value", 0)
+        else:
+            volume = volume_data or data.get("trade_volume", 0) or 0
+            trade_value = data.get("trade_value", 0)
+
+        return {
             "trigger": "observer_file",
             "observation": {
-                 "inputs": { "price": ..., "volume": ..., "open": ..., "high": ..., "low": ... }
-            },
-            "context": { "symbol": ... },
-            "meta": { "timestamp_ms": ... }
-        }
-        """
-        try:
-            symbol = data.get("symbol") or data.get("code")
-
-            if not symbol:
-                return None
-
-            # Handle nested price object (from real observer)
-            price_data = data.get("price")
-            if isinstance(price_data, dict):
-                price = price_data.get("current") or price_data.get("close")
-                open_price = price_data.get("open")
-                high_price = price_data.get("high")
-                low_price = price_data.get("low")
-                change_rate = price_data.get("change_rate", 0)
-            else:
-                # Flat format
-                price = price_data or data.get("trade_price") or data.get("current_price") or data.get("close")
-                open_price = data.get("open")
-                high_price = data.get("high")
-                low_price = data.get("low")
-                change_rate = data.get("change_rate", 0)
-
-            if price is None:
-                return None
-
-            # Handle nested volume object
-            volume_data = data.get("volume")
-            if isinstance(volume_data, dict):
-                volume = volume_data.get("accumulated") or volume_data.get("trade_volume", 0)
-                trade_value = volume_data.get("trade_value", 0)
-            else:
-                volume = volume_data or data.get("trade_volume", 0) or 0
-                trade_value = data.get("trade_value", 0)
-
-            return {
-                "trigger": "observer_file",
-                "observation": {
-                    "inputs": {
-                        "price": float(price),
-                        "volume": float(volume),
-                        "open": float(open_price) if open_price else float(price),
-                        "high": float(high_price) if high_price else float(price),
-                        "low": float(low_price) if low_price else float(price),
-                        "change_rate": float(change_rate),
-                        "trade_value": float(trade_value),
-                    }
-                },
-                "context": {
-                    "symbol": symbol
-                },
-                "meta": {
-                    "timestamp": data.get("timestamp"),
-                    "execution_time": data.get("execution_time"),
-                    "source": data.get("source"),
-                    "session_id": data.get("session_id"),
-                    "timestamp_ms": 0
+                "inputs": {
+                    "price": float(price),
+                    "volume": float(volume),
+                    "open": float(open_price) if open_price else float(price),
+                    "high": float(high_price) if high_price else float(price),
+                    "low": float(low_price) if low_price else float(price),
+                    "change_rate": float(change_rate),
+                    "trade_value": float(trade_value),
                 }
+            },
+            "context": {
+                "symbol": symbol
+            },
+            "meta": {
+                "timestamp": data.get("timestamp"),
+                "execution_time": data.get("execution_time"),
+                "source": data.get("source"),
+                "session_id": data.get("session_id"),
+                "timestamp_ms": 0
             }
-        except Exception as e:
-            logger.warning(f"Mapping error: {e}")
-            return None
+        }
+    except Exception as e:
+        logger.warning(f"Mapping error: {e}")
+        return None
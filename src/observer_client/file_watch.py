@@ -0,0 +1,175 @@
+"""
+File Watch / Offset Checkpoint
+
+FileObserverClient follow(tail) 모드 보조 모듈입니다.
+
+- PollingWatcher: 변화 없을 때 대기 간격 지수 백오프 (base → max), 데이터 발생 시 reset
+- InotifyWatcher: Linux inotify(ctypes)로 디렉토리 변경 이벤트 대기 (없으면 create_watcher가 polling으로 대체)
+- OffsetCheckpoint: 파일별 {inode, offset} JSON 체크포인트 (tmp 파일 + os.replace 원자적 저장)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("src.observer_client.file_watch")
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+
+class PollingWatcher:
+    """변경 감지 없이 백오프 간격으로 대기 (모든 플랫폼)."""
+
+    kind = "polling"
+
+    def __init__(self, poll_interval: float = 0.05, max_poll_interval: float = 2.0):
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max(poll_interval, max_poll_interval)
+        self._current = poll_interval
+
+    def reset(self) -> None:
+        """새 데이터 수신 → 대기 간격 초기화."""
+        self._current = self.poll_interval
+
+    async def wait(self) -> None:
+        await asyncio.sleep(self._current)
+        self._current = min(self._current * 2, self.max_poll_interval)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """
+    Linux inotify 기반 디렉토리 감시.
+
+    wait()는 이벤트 도착 또는 max_wait(안전망 재스캔 주기) 경과 시 반환합니다.
+    """
+
+    kind = "inotify"
+
+    def __init__(self, directory: Path, max_wait: float = 2.0):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = self._libc.inotify_add_watch(self._fd, str(directory).encode(), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed: {directory}")
+        self.max_wait = max_wait
+        self._event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _on_readable(self) -> None:
+        self._drain()
+        if self._event is not None:
+            self._event.set()
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                if not os.read(self._fd, 65536):
+                    return
+            except BlockingIOError:
+                return
+            except OSError:
+                return
+
+    def reset(self) -> None:
+        pass
+
+    async def wait(self) -> None:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._event = asyncio.Event()
+            self._loop.add_reader(self._fd, self._on_readable)
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=self.max_wait)
+        except asyncio.TimeoutError:
+            pass
+        self._event.clear()
+
+    def close(self) -> None:
+        if self._fd < 0:
+            return
+        if self._loop is not None and not self._loop.is_closed():
+            try:
+                self._loop.remove_reader(self._fd)
+            except Exception:
+                pass
+        os.close(self._fd)
+        self._fd = -1
+
+
+def create_watcher(
+    directory: Path,
+    use_inotify: bool = True,
+    poll_interval: float = 0.05,
+    max_poll_interval: float = 2.0,
+) -> Any:
+    """inotify 사용 가능하면 InotifyWatcher, 아니면 PollingWatcher."""
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory, max_wait=max_poll_interval)
+        except (OSError, AttributeError) as e:
+            logger.info(f"inotify unavailable ({e}); falling back to polling")
+    return PollingWatcher(poll_interval, max_poll_interval)
+
+
+class OffsetCheckpoint:
+    """
+    파일별 읽기 오프셋 체크포인트.
+
+    형식: {"version": 1, "files": {"<path>": {"inode": int, "offset": int}}}
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def load(self) -> Dict[str, Dict[str, int]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.path}: {e}")
+            return {}
+        files = data.get("files") if isinstance(data, dict) else None
+        if not isinstance(files, dict):
+            return {}
+        return {
+            str(p): {"inode": int(v.get("inode", 0)), "offset": int(v.get("offset", 0))}
+            for p, v in files.items()
+            if isinstance(v, dict)
+        }
+
+    def save(self, files: Dict[str, Dict[str, int]]) -> None:
+        """tmp 파일에 기록 후 os.replace (중간 크래시에도 이전 체크포인트 유지)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        payload = json.dumps({"version": self.VERSION, "files": files}, sort_keys=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
@@ -0,0 +1,274 @@
+"""
+JSONL Batch Reader
+
+Observer JSONL 파일을 대용량 청크 단위로 읽어 배치 디코딩하는 리더입니다.
+FileObserverClient가 워커 스레드에서 호출합니다 (이벤트 루프 블로킹 방지).
+
+- mmap(기본) 또는 버퍼 청크 읽기, 완결된 줄(개행 종료)만 디코딩
+- orjson 사용 가능 시 orjson, 없으면 stdlib json
+- 레코드별 종료 바이트 오프셋 반환 → 재시작 시 해당 오프셋부터 재개
+- 첫 레코드(head) 바이트를 보관해 같은 inode의 truncate 후 재기록을 감지 (rewritten)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+logger = logging.getLogger("src.observer_client.jsonl_reader")
+
+JSON_BACKEND = "orjson" if _orjson is not None else "json"
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+HEAD_SIZE = 256  # 첫 레코드 식별에 쓰는 최대 바이트 수
+
+
+def loads(data: bytes) -> Any:
+    """JSON 1건 디코딩 (orjson 우선, stdlib fallback)."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+_DECODE_ERRORS = (ValueError,) if _orjson is None else (ValueError, _orjson.JSONDecodeError)
+
+
+@dataclass
+class JsonlBatch:
+    """
+    배치 디코딩 결과.
+
+    items[i]의 다음 레코드 시작 오프셋 = offsets[i].
+    end_offset: 이번 배치에서 소비한 마지막 바이트 다음 위치 (다음 읽기 시작점).
+    """
+
+    items: List[Any] = field(default_factory=list)
+    offsets: List[int] = field(default_factory=list)
+    end_offset: int = 0
+    invalid: int = 0
+    eof: bool = False
+
+
+class JsonlBatchReader:
+    """
+    단일 JSONL 파일 배치 리더.
+
+    read_batch()는 blocking 호출이며, 호출 간 파일이 커지면 이어서 읽습니다.
+    개행으로 끝나지 않은 마지막 줄은 final=True일 때만 레코드로 취급합니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        offset: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_mmap: bool = True,
+        transform: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.path = str(path)
+        self.offset = offset
+        self.chunk_size = max(1024, chunk_size)
+        self.use_mmap = use_mmap
+        self.transform = transform
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+        self._buf = b""
+        self._buf_start = 0
+        self._last_size = 0
+        self._head: Optional[bytes] = None
+
+    def __enter__(self) -> "JsonlBatchReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._drop_buffers()
+        self._head = None
+
+    def size(self) -> int:
+        """열린 핸들 기준 크기 (rename 회전 후에도 기존 파일을 끝까지 읽기 위함)."""
+        if self._file is not None:
+            return os.fstat(self._file.fileno()).st_size
+        return os.stat(self.path).st_size
+
+    @property
+    def inode(self) -> int:
+        """읽고 있는 파일의 inode (회전 감지용). 필요 시 파일을 엽니다."""
+        self._ensure_open()
+        return os.fstat(self._file.fileno()).st_ino
+
+    def reset(self, offset: int = 0) -> None:
+        """오프셋 재설정 (copytruncate 회전 등). 버퍼/매핑/head는 폐기."""
+        self._drop_buffers()
+        self._head = None
+        self.offset = offset
+
+    def _drop_buffers(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._mapped_size = 0
+        self._buf = b""
+        self._buf_start = 0
+        self._last_size = 0
+
+    def _read_head(self) -> bytes:
+        """파일 첫 줄(최대 HEAD_SIZE 바이트, 개행 포함)."""
+        self._ensure_open()
+        data = os.pread(self._file.fileno(), HEAD_SIZE, 0)
+        nl = data.find(b"\n")
+        return data[:nl + 1] if nl >= 0 else data
+
+    def rewritten(self, file_size: Optional[int] = None) -> bool:
+        """
+        같은 inode가 truncate 후 다시 기록되었는지 여부.
+
+        크기가 오프셋보다 작거나, 첫 레코드 바이트가 읽기 시작 때 본 것과 다르면 True
+        (truncate 후 이전 오프셋보다 커진 경우도 감지). 둘 중 짧은 길이만큼 비교 (첫 줄이 미완성일 수 있음).
+        """
+        if file_size is None:
+            file_size = self.size()
+        if file_size < self.offset:
+            return True
+        if self._head is None:
+            return False
+        current = self._read_head()
+        n = min(len(current), len(self._head))
+        return current[:n] != self._head[:n]
+
+    def _ensure_open(self) -> None:
+        if self._file is None:
+            self._file = open(self.path, "rb")
+
+    def _read_region(self, start: int, end: int, file_size: int) -> bytes:
+        """[start, min(end, file_size)) 바이트 읽기. mmap은 크기가 바뀌었을 때 재매핑 (축소 후 EOF 밖 접근 방지)."""
+        self._ensure_open()
+        end = min(end, file_size)
+        if end <= start:
+            return b""
+        if self.use_mmap and file_size > 0:
+            if self._mmap is None or self._mapped_size != file_size:
+                if self._mmap is not None:
+                    self._mmap.close()
+                try:
+                    self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._mapped_size = len(self._mmap)
+                except (ValueError, OSError):
+                    self._mmap = None
+                    self.use_mmap = False
+            if self._mmap is not None:
+                return self._mmap[start:min(end, self._mapped_size)]
+        self._file.seek(start)
+        return self._file.read(end - start)
+
+    def _fill(self, position: int, file_size: int) -> None:
+        """position부터 최소 1줄(또는 EOF까지)을 담도록 버퍼 재적재."""
+        window = self.chunk_size
+        while True:
+            data = self._read_region(position, position + window, file_size)
+            if b"\n" in data or position + len(data) >= file_size:
+                break
+            window *= 2  # 청크보다 긴 줄
+        self._buf = data
+        self._buf_start = position
+
+    def read_batch(self, max_records: int = 1000, final: bool = True) -> JsonlBatch:
+        """
+        현재 오프셋부터 최대 max_records개 레코드 디코딩 (blocking).
+
+        Args:
+            max_records: 배치 최대 레코드 수
+            final: True면 개행 없는 마지막 줄도 레코드로 처리 (파일 완결 가정)
+        """
+        batch = JsonlBatch(end_offset=self.offset)
+        file_size = self.size()
+        if file_size < self.offset:
+            # truncate/rotation 감지: 호출 측에서 처리하도록 그대로 반환
+            batch.eof = True
+            return batch
+        if file_size < self._last_size:
+            self._drop_buffers()  # 축소된 파일의 이전 버퍼/매핑은 무효
+        self._last_size = file_size
+        if file_size and (self._head is None or (len(self._head) < HEAD_SIZE and not self._head.endswith(b"\n"))):
+            self._head = self._read_head()
+
+        lines: List[bytes] = []
+        ends: List[int] = []
+        position = self.offset
+        while len(lines) < max_records:
+            if position >= file_size:
+                batch.eof = True
+                break
+            buf, rel = self._buf, position - self._buf_start
+            if rel < 0 or rel >= len(buf):
+                self._fill(position, file_size)
+                buf, rel = self._buf, 0
+            nl = buf.find(b"\n", rel)
+            if nl < 0:
+                if self._buf_start + len(buf) < file_size:
+                    self._fill(position, file_size)
+                    continue
+                # EOF의 개행 없는 줄: 완결 파일이면 레코드, 아니면 다음 호출로 보류
+                if not final:
+                    batch.eof = True
+                    break
+                line, next_position = buf[rel:], self._buf_start + len(buf)
+            else:
+                line, next_position = buf[rel:nl], self._buf_start + nl + 1
+            position = next_position
+            if line.strip():
+                lines.append(line)
+                ends.append(position)
+
+        self._decode_into(batch, lines, ends)
+        batch.end_offset = position
+        self.offset = position
+        return batch
+
+    def _decode_into(self, batch: JsonlBatch, lines: List[bytes], ends: List[int]) -> None:
+        """
+        줄 목록을 한 번에 디코딩 ('[l1,l2,...]' 단일 호출). 실패 시 줄 단위로 재시도해 불량 줄만 건너뜀.
+        """
+        if not lines:
+            return
+        try:
+            items = loads(b"[" + b",".join(lines) + b"]")
+            if len(items) != len(lines):
+                raise ValueError("line/record count mismatch")
+        except _DECODE_ERRORS:
+            items = []
+            for line, end in zip(lines, ends):
+                try:
+                    items.append(loads(line))
+                except _DECODE_ERRORS:
+                    batch.invalid += 1
+                    items.append(None)
+                    logger.warning(f"Invalid JSON in {self.path} before byte {end}: {line[:50]!r}...")
+        transform = self.transform
+        for item, end in zip(items, ends):
+            if item is None:
+                continue
+            if transform is not None:
+                item = transform(item)
+                if item is None:
+                    continue
+            batch.items.append(item)
+            batch.offsets.append(end)
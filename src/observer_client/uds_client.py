@@ -2,14 +2,35 @@
 UDS Observer Client
 
 Unix Domain Socket 기반 Observer Client 구현입니다.
-향후 Observer와 UDS 통신이 필요할 때 이 클래스를 완성합니다.
+
+- 길이 접두 바이너리 프레임 (uds_protocol)
+- 요청/응답은 correlation_id로 매칭 (동시 요청 가능)
+- 구독 종목의 PUSH 스냅샷은 asyncio.Queue[MarketSnapshot] (snapshots)로 전달
+  - 큐가 가득 차면 가장 오래된 스냅샷을 버림 (지연 < 완전성, dropped 카운트)
+- 연결 끊김 시 지수 백오프 재연결 후 기존 구독 자동 재요청
 """
 
 import asyncio
+import itertools
 import logging
-from typing import Optional, List
+from typing import Dict, Optional, List, Set
 
 from .interfaces import ObserverClient, MarketSnapshot
+from .uds_protocol import (
+    MSG_ERROR,
+    MSG_PUSH_SNAPSHOT,
+    MSG_RESPONSE,
+    MSG_SNAPSHOT,
+    MSG_SUBSCRIBE,
+    MSG_UNSUBSCRIBE,
+    ProtocolError,
+    decode_json,
+    decode_optional_snapshot,
+    decode_snapshot,
+    encode_frame,
+    encode_json,
+    read_frame,
+)
 
 
 logger = logging.getLogger("src.observer_client.uds")
@@ -18,15 +39,43 @@ logger = logging.getLogger("src.observer_client.uds")
 class UDSObserverClient:
     """Unix Domain Socket 기반 Observer 클라이언트"""
 
-    def __init__(self, socket_path: str = "/var/run/observer.sock"):
+    def __init__(
+        self,
+        socket_path: str = "/var/run/observer.sock",
+        queue_maxsize: int = 10000,
+        request_timeout: float = 2.0,
+        reconnect: bool = True,
+        reconnect_initial_delay: float = 0.05,
+        reconnect_max_delay: float = 2.0,
+    ):
         """
         Args:
             socket_path: UDS 소켓 경로
+            queue_maxsize: PUSH 스냅샷 큐 최대 크기 (0이면 무제한)
+            request_timeout: 요청 응답 대기 시간 (초)
+            reconnect: 연결 끊김 시 자동 재연결 여부
+            reconnect_initial_delay: 재연결 최초 대기 (초, 실패 시 2배씩 증가)
+            reconnect_max_delay: 재연결 최대 대기 (초)
         """
         self._socket_path = socket_path
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
         self._connected = False
+        self._closing = False
+
+        self.request_timeout = request_timeout
+        self.reconnect = reconnect
+        self.reconnect_initial_delay = reconnect_initial_delay
+        self.reconnect_max_delay = reconnect_max_delay
+
+        self.snapshots: "asyncio.Queue[MarketSnapshot]" = asyncio.Queue(maxsize=queue_maxsize)
+        self.dropped = 0
+        self.reconnects = 0
+        self._subscriptions: Set[str] = set()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._read_task: Optional[asyncio.Task] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
 
         logger.info(f"UDSObserverClient initialized with socket={socket_path}")
 
@@ -37,12 +86,10 @@ class UDSObserverClient:
         Returns:
             bool: 연결 성공 여부
         """
+        self._closing = False
         try:
             logger.info(f"Connecting to Observer via UDS: {self._socket_path}")
-            self._reader, self._writer = await asyncio.open_unix_connection(
-                self._socket_path
-            )
-            self._connected = True
+            await self._open()
             logger.info("Connected to Observer via UDS")
             return True
         except Exception as e:
@@ -50,18 +97,140 @@ class UDSObserverClient:
             self._connected = False
             return False
 
+    async def _open(self) -> None:
+        self._reader, self._writer = await asyncio.open_unix_connection(self._socket_path)
+        self._connected = True
+        self._read_task = asyncio.create_task(self._read_loop(self._reader))
+
     async def disconnect(self) -> None:
         """Observer 연결 해제"""
+        self._closing = True
+        for name in ("_reconnect_task", "_read_task"):  # 재연결 태스크가 새 read 태스크를 만들 수 있으므로 순서 유지
+            task = getattr(self, name)
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._reconnect_task = None
+        self._read_task = None
         if self._writer:
             logger.info("Disconnecting from Observer via UDS")
-            self._writer.close()
-            await self._writer.wait_closed()
-            self._connected = False
+            await self._close_writer()
             logger.info("Disconnected from Observer via UDS")
+        self._connected = False
+        self._fail_pending(ConnectionError("UDS client disconnected"))
+
+    async def _close_writer(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+    # ------------------------------------------------------------------
+    # 수신 / 재연결
+    # ------------------------------------------------------------------
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                msg_type, correlation_id, payload = await read_frame(reader)
+                if msg_type == MSG_PUSH_SNAPSHOT:
+                    self._enqueue(decode_snapshot(payload))
+                elif msg_type in (MSG_RESPONSE, MSG_ERROR):
+                    future = self._pending.pop(correlation_id, None)
+                    if future is not None and not future.done():
+                        future.set_result((msg_type, payload))
+                else:
+                    logger.warning(f"Unknown UDS message type: {msg_type:#x}")
+        except asyncio.CancelledError:
+            raise
+        except (asyncio.IncompleteReadError, ConnectionError, OSError) as e:
+            logger.warning(f"UDS connection lost: {e!r}")
+        except ProtocolError as e:
+            logger.error(f"UDS protocol error: {e}")
+        self._connected = False
+        self._fail_pending(ConnectionError("UDS connection lost"))
+        if self.reconnect and not self._closing:
+            self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+
+    def _enqueue(self, snapshot: MarketSnapshot) -> None:
+        try:
+            self.snapshots.put_nowait(snapshot)
+        except asyncio.QueueFull:
+            self.snapshots.get_nowait()
+            self.snapshots.put_nowait(snapshot)
+            self.dropped += 1
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def _reconnect_loop(self) -> None:
+        await self._close_writer()
+        delay = self.reconnect_initial_delay
+        while not self._closing:
+            await asyncio.sleep(delay)
+            try:
+                await self._open()
+            except (ConnectionError, OSError) as e:
+                logger.debug(f"UDS reconnect failed: {e}")
+                delay = min(delay * 2, self.reconnect_max_delay)
+                continue
+            self.reconnects += 1
+            logger.info(f"Reconnected to Observer via UDS (attempt delay={delay:.3f}s)")
+            if self._subscriptions:
+                try:
+                    await self._request(MSG_SUBSCRIBE, {"symbols": sorted(self._subscriptions)})
+                except (ConnectionError, asyncio.TimeoutError, ProtocolError) as e:
+                    logger.warning(f"UDS resubscribe failed: {e}")
+            return
+
+    # ------------------------------------------------------------------
+    # 요청 / 응답
+    # ------------------------------------------------------------------
+
+    def _next_id(self) -> int:
+        correlation_id = next(self._ids) & 0xFFFFFFFF
+        if correlation_id == 0:  # 0은 PUSH 전용
+            correlation_id = next(self._ids) & 0xFFFFFFFF
+        return correlation_id
+
+    async def _request(self, msg_type: int, body) -> bytes:
+        """
+        요청 전송 후 같은 correlation_id의 응답 payload 반환.
+
+        Raises:
+            ConnectionError: 미연결/연결 끊김
+            asyncio.TimeoutError: request_timeout 초과
+            ProtocolError: 서버 ERROR 응답
+        """
+        if not self._connected or self._writer is None:
+            raise ConnectionError("Not connected to Observer")
+        payload = body if isinstance(body, bytes) else encode_json(body)
+        correlation_id = self._next_id()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
+        try:
+            self._writer.write(encode_frame(msg_type, correlation_id, payload))
+            await self._writer.drain()
+            reply_type, reply = await asyncio.wait_for(future, self.request_timeout)
+        finally:
+            self._pending.pop(correlation_id, None)
+        if reply_type == MSG_ERROR:
+            raise ProtocolError(decode_json(reply).get("error", "unknown error"))
+        return reply
 
     async def subscribe(self, symbols: List[str]) -> bool:
         """
-        종목 구독 (UDS 프로토콜 구현 필요)
+        종목 구독 (PUSH 스냅샷은 snapshots 큐로 수신, 재연결 시 자동 재구독)
 
         Args:
             symbols: 구독할 종목 코드 리스트
@@ -73,13 +242,21 @@ class UDSObserverClient:
             logger.error("Not connected to Observer")
             return False
 
-        # TODO: UDS 프로토콜에 맞게 구독 요청 전송
-        logger.warning("UDS subscribe() not implemented yet")
-        return False
+        try:
+            reply = decode_json(await self._request(MSG_SUBSCRIBE, {"symbols": list(symbols)}))
+        except (ConnectionError, asyncio.TimeoutError, ProtocolError) as e:
+            logger.error(f"UDS subscribe failed: {e!r}")
+            return False
+        # 서버가 수락한 경우에만 기록 (거부된 종목을 재연결 때마다 재구독하지 않음)
+        if not (isinstance(reply, dict) and reply.get("ok")):
+            logger.error(f"UDS subscribe rejected: {reply!r}")
+            return False
+        self._subscriptions.update(symbols)
+        return True
 
     async def unsubscribe(self, symbols: List[str]) -> bool:
         """
-        종목 구독 해제 (UDS 프로토콜 구현 필요)
+        종목 구독 해제
 
         Args:
             symbols: 구독 해제할 종목 코드 리스트
@@ -91,13 +268,17 @@ class UDSObserverClient:
             logger.error("Not connected to Observer")
             return False
 
-        # TODO: UDS 프로토콜에 맞게 구독 해제 요청 전송
-        logger.warning("UDS unsubscribe() not implemented yet")
-        return False
+        self._subscriptions.difference_update(symbols)
+        try:
+            reply = decode_json(await self._request(MSG_UNSUBSCRIBE, {"symbols": list(symbols)}))
+        except (ConnectionError, asyncio.TimeoutError, ProtocolError) as e:
+            logger.error(f"UDS unsubscribe failed: {e!r}")
+            return False
+        return isinstance(reply, dict) and bool(reply.get("ok"))
 
     async def get_snapshot(self, symbol: str) -> Optional[MarketSnapshot]:
         """
-        특정 종목의 스냅샷 조회 (UDS 프로토콜 구현 필요)
+        특정 종목의 스냅샷 조회 (요청/응답)
 
         Args:
             symbol: 종목 코드
@@ -109,9 +290,21 @@ class UDSObserverClient:
             logger.error("Not connected to Observer")
             return None
 
-        # TODO: UDS 프로토콜에 맞게 스냅샷 요청/응답 처리
-        logger.warning("UDS get_snapshot() not implemented yet")
-        return None
+        try:
+            return decode_optional_snapshot(await self._request(MSG_SNAPSHOT, symbol.encode("utf-8")))
+        except (ConnectionError, asyncio.TimeoutError, ProtocolError) as e:
+            logger.error(f"UDS get_snapshot({symbol}) failed: {e!r}")
+            return None
+
+    async def next_snapshot(self, timeout: Optional[float] = None) -> MarketSnapshot:
+        """구독 PUSH 스냅샷 1건 대기 (timeout 초과 시 asyncio.TimeoutError)."""
+        if timeout is None:
+            return await self.snapshots.get()
+        return await asyncio.wait_for(self.snapshots.get(), timeout)
+
+    def subscriptions(self) -> List[str]:
+        """현재 구독(재연결 시 재요청 대상) 종목."""
+        return sorted(self._subscriptions)
 
     async def is_connected(self) -> bool:
         """
@@ -0,0 +1,125 @@
+"""
+UDS Observer Protocol
+
+Observer ↔ QTS Unix Domain Socket 바이너리 프레이밍입니다.
+
+프레임 = 헤더(9 bytes, network order) + payload
+    length(uint32, payload 길이) | type(uint8) | correlation_id(uint32)
+
+- 요청(SUBSCRIBE/UNSUBSCRIBE/SNAPSHOT)은 클라이언트가 발급한 correlation_id를 응답(RESPONSE/ERROR)에 그대로 반환
+- PUSH_SNAPSHOT은 서버 발신 (correlation_id = 0)
+- 제어 메시지 payload는 JSON(orjson 우선), 시세 스냅샷은 struct 고정 레이아웃 (파싱 비용 최소화)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import struct
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from src.shared.timezone_utils import KST
+from src.observer_client.interfaces import MarketSnapshot
+from src.observer_client.jsonl_reader import loads
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+# 메시지 타입
+MSG_SUBSCRIBE = 0x01
+MSG_UNSUBSCRIBE = 0x02
+MSG_SNAPSHOT = 0x03
+MSG_RESPONSE = 0x10
+MSG_ERROR = 0x11
+MSG_PUSH_SNAPSHOT = 0x20
+
+HEADER = struct.Struct("!IBI")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+# symbol(uint8 길이 + utf-8) 뒤에 고정 필드:
+# price(f64) volume(i64) timestamp_ms(i64) bid(f64) ask(f64) bid_volume(i64) ask_volume(i64)
+# None은 float NaN / int -1로 인코딩
+_SNAPSHOT_BODY = struct.Struct("!dqqddqq")
+
+
+class ProtocolError(Exception):
+    """프레임/페이로드 형식 오류"""
+
+
+def encode_frame(msg_type: int, correlation_id: int, payload: bytes = b"") -> bytes:
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {len(payload)} bytes")
+    return HEADER.pack(len(payload), msg_type, correlation_id) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[int, int, bytes]:
+    """
+    프레임 1개 읽기.
+
+    Raises:
+        asyncio.IncompleteReadError: 연결 종료
+        ProtocolError: 길이 상한 초과
+    """
+    header = await reader.readexactly(HEADER.size)
+    length, msg_type, correlation_id = HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {length} bytes")
+    payload = await reader.readexactly(length) if length else b""
+    return msg_type, correlation_id, payload
+
+
+def encode_json(obj: Any) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(payload: bytes) -> Any:
+    try:
+        return loads(payload) if payload else {}
+    except ValueError as e:
+        raise ProtocolError(f"Invalid JSON payload: {e}") from e
+
+
+def encode_snapshot(snapshot: MarketSnapshot) -> bytes:
+    symbol = snapshot.symbol.encode("utf-8")
+    if len(symbol) > 255:
+        raise ProtocolError(f"Symbol too long: {snapshot.symbol!r}")
+    return bytes((len(symbol),)) + symbol + _SNAPSHOT_BODY.pack(
+        float(snapshot.price),
+        int(snapshot.volume),
+        int(snapshot.timestamp.timestamp() * 1000),
+        math.nan if snapshot.bid_price is None else float(snapshot.bid_price),
+        math.nan if snapshot.ask_price is None else float(snapshot.ask_price),
+        -1 if snapshot.bid_volume is None else int(snapshot.bid_volume),
+        -1 if snapshot.ask_volume is None else int(snapshot.ask_volume),
+    )
+
+
+def decode_snapshot(payload: bytes) -> MarketSnapshot:
+    if not payload:
+        raise ProtocolError("Empty snapshot payload")
+    n = payload[0]
+    if len(payload) != 1 + n + _SNAPSHOT_BODY.size:
+        raise ProtocolError(f"Invalid snapshot payload length: {len(payload)}")
+    symbol = payload[1:1 + n].decode("utf-8")
+    price, volume, ts_ms, bid, ask, bid_volume, ask_volume = _SNAPSHOT_BODY.unpack_from(payload, 1 + n)
+    return MarketSnapshot(
+        symbol=symbol,
+        price=price,
+        volume=volume,
+        timestamp=datetime.fromtimestamp(ts_ms / 1000.0, tz=KST),
+        bid_price=None if math.isnan(bid) else bid,
+        ask_price=None if math.isnan(ask) else ask,
+        bid_volume=None if bid_volume < 0 else bid_volume,
+        ask_volume=None if ask_volume < 0 else ask_volume,
+    )
+
+
+def decode_optional_snapshot(payload: bytes) -> Optional[MarketSnapshot]:
+    """SNAPSHOT 응답 payload (빈 payload = 스냅샷 없음)."""
+    return decode_snapshot(payload) if payload else None
@@ -0,0 +1,142 @@
+"""
+Local UDS Observer Server
+
+UDSObserverClient 로컬 개발/테스트용 Observer 대역 서버입니다 (uds_protocol 구현).
+
+- SUBSCRIBE / UNSUBSCRIBE: 연결별 구독 종목 관리, {"ok": true, "symbols": [...]} 응답
+- SNAPSHOT: 최신 스냅샷 응답 (없으면 빈 payload)
+- publish(): 최신 스냅샷 갱신 + 해당 종목 구독 연결로 PUSH
+- drop_connections(): 모든 연결 강제 종료 (재연결/재구독 테스트)
+"""
+
+import asyncio
+import logging
+import os
+from typing import Dict, List, Optional, Set
+
+from .interfaces import MarketSnapshot
+from .uds_protocol import (
+    MSG_ERROR,
+    MSG_PUSH_SNAPSHOT,
+    MSG_RESPONSE,
+    MSG_SNAPSHOT,
+    MSG_SUBSCRIBE,
+    MSG_UNSUBSCRIBE,
+    ProtocolError,
+    decode_json,
+    encode_frame,
+    encode_json,
+    encode_snapshot,
+    read_frame,
+)
+
+
+logger = logging.getLogger("src.observer_client.uds_server")
+
+
+class LocalObserverServer:
+    """UDS Observer 대역 서버"""
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._subscriptions: Dict[asyncio.StreamWriter, Set[str]] = {}
+        self._latest: Dict[str, MarketSnapshot] = {}
+
+    async def start(self) -> None:
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        logger.info(f"LocalObserverServer listening on {self.socket_path}")
+
+    async def stop(self) -> None:
+        await self.drop_connections()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def __aenter__(self) -> "LocalObserverServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    @property
+    def connection_count(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribers(self, symbol: str) -> int:
+        return sum(1 for symbols in self._subscriptions.values() if symbol in symbols)
+
+    async def drop_connections(self) -> None:
+        writers = list(self._subscriptions)
+        self._subscriptions.clear()
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def publish(self, snapshot: MarketSnapshot) -> int:
+        """최신 스냅샷 갱신 후 구독 연결로 PUSH. 전송한 연결 수 반환."""
+        self._latest[snapshot.symbol] = snapshot
+        frame = encode_frame(MSG_PUSH_SNAPSHOT, 0, encode_snapshot(snapshot))
+        sent = 0
+        for writer, symbols in list(self._subscriptions.items()):
+            if snapshot.symbol in symbols and not writer.is_closing():
+                writer.write(frame)
+                sent += 1
+        for writer in list(self._subscriptions):
+            try:
+                await writer.drain()
+            except (ConnectionError, OSError):
+                self._subscriptions.pop(writer, None)
+        return sent
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        symbols: Set[str] = set()
+        self._subscriptions[writer] = symbols
+        try:
+            while True:
+                msg_type, correlation_id, payload = await read_frame(reader)
+                try:
+                    reply = self._dispatch(symbols, msg_type, payload)
+                    frame = encode_frame(MSG_RESPONSE, correlation_id, reply)
+                except ProtocolError as e:
+                    frame = encode_frame(MSG_ERROR, correlation_id, encode_json({"error": str(e)}))
+                writer.write(frame)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, OSError, ProtocolError):
+            pass
+        finally:
+            self._subscriptions.pop(writer, None)
+            writer.close()
+
+    def _dispatch(self, symbols: Set[str], msg_type: int, payload: bytes) -> bytes:
+        if msg_type == MSG_SUBSCRIBE:
+            symbols.update(self._request_symbols(payload))
+            return encode_json({"ok": True, "symbols": sorted(symbols)})
+        if msg_type == MSG_UNSUBSCRIBE:
+            symbols.difference_update(self._request_symbols(payload))
+            return encode_json({"ok": True, "symbols": sorted(symbols)})
+        if msg_type == MSG_SNAPSHOT:
+            snapshot = self._latest.get(payload.decode("utf-8"))
+            return encode_snapshot(snapshot) if snapshot is not None else b""
+        raise ProtocolError(f"Unsupported request type: {msg_type:#x}")
+
+    @staticmethod
+    def _request_symbols(payload: bytes) -> List[str]:
+        """SUBSCRIBE/UNSUBSCRIBE 본문 {"symbols": [str, ...]} 검증."""
+        body = decode_json(payload)
+        if not isinstance(body, dict):
+            raise ProtocolError(f"Request payload must be a JSON object, got {type(body).__name__}")
+        requested = body.get("symbols", [])
+        if not isinstance(requested, list) or not all(isinstance(x, str) for x in requested):
+            raise ProtocolError("'symbols' must be a list of strings")
+        return requested
@@ -4,14 +4,23 @@ import logging
 import os
 import uuid
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from ..qts.core.config.config_models import UnifiedConfig
 from .safety_hook import PipelineSafetyHook
-from ..qts.core.config.execution_mode import ExecutionMode, decide_execution_mode
+from .tracing import ETEDATracer
+from ..qts.core.config.execution_mode import ExecutionMode, LiveGateDecision, decide_execution_mode
 from ..provider.interfaces.broker import BrokerEngine
 from ..provider.models.intent import ExecutionIntent
 from ..provider.models.response import ExecutionResponse
+from ..runtime.cache import CacheManager
+from ..runtime.data import (
+    DataSourceAdapter,
+    LocalHistoryRepository,
+    LocalLedgerRepository,
+    LocalPositionRepository,
+)
+from ..runtime.risk.shadow import ShadowPublisher
 from ..strategy.engines.portfolio_engine import PortfolioEngine
 from ..strategy.engines.performance_engine import PerformanceEngine
 from ..strategy.engines.strategy_engine import StrategyEngine
@@ -42,6 +51,20 @@ class ETEDARunner:
     - project_root: optional. If None, resolved via paths.project_root() or cwd.
     - broker: optional BrokerEngine. If provided, Act 단계에서 ExecutionIntent → submit_intent → ExecutionResponse Contract 사용.
     - safety_hook: optional PipelineSafetyHook. If provided, run_once 시작 시 should_run() 확인, Act 단계 Broker Fail-Safe 시 record_fail_safe() 호출.
+    - tracer: optional ETEDATracer. If None, created from config (ETEDA_LATENCY_BUDGET_MS, ETEDA_PROFILE_MODE,
+      ETEDA_PROFILE_SAMPLE_RATE). 사이클별 trace_id + 단계별 span(ms) 기록, 예산 초과 시 프로파일 캡처.
+    - position_shadow: optional ShadowPublisher (NG-2). 포지션 조회 시 PositionShadow를 발행하고
+      Extract 시세로 현재가를 갱신 → MicroRiskLoop이 별도 스레드에서 잠금 없이 읽음.
+    - cache: optional CacheManager (NG-4). PortfolioEngine 포지션 조회(pos:__all__, 1s TTL)에 사용.
+      브로커가 주문을 접수하면 포지션 캐시를 무효화. Act 게이트 안전 플래그(Kill Switch 등)는 캐시하지 않고 매번 읽음.
+    - data_adapter: optional DataSourceAdapter (NG-3). 주면 Position / T_Ledger / History 리포지토리를
+      로컬 저장소(SQLite / 컬럼 저장소) 기반으로 교체해 사이클 중 Sheets 호출을 없앰.
+      대시보드 반영은 HybridAdapter의 Sheets 미러가 비동기로 수행.
+
+    Modes:
+    - run_once(snapshot): 단일 심볼 1 사이클.
+    - run_batch(snapshots): 다심볼 1 사이클. 포지션 1회 조회·심볼 인덱싱, 전 심볼 평가 후
+      Intent를 BrokerEngine.submit_batch로 일괄 제출. 심볼별 결과 + 단계별 소요시간(ms) 반환.
     """
 
     def __init__(
@@ -52,6 +75,10 @@ class ETEDARunner:
         project_root: Optional[Path] = None,
         broker: Optional[BrokerEngine] = None,
         safety_hook: Optional[PipelineSafetyHook] = None,
+        tracer: Optional[ETEDATracer] = None,
+        position_shadow: Optional[ShadowPublisher] = None,
+        cache: Optional[CacheManager] = None,
+        data_adapter: Optional[DataSourceAdapter] = None,
     ) -> None:
         self._log = logging.getLogger("ETEDARunner")
         self._config = config
@@ -76,10 +103,16 @@ class ETEDARunner:
         sid = self._sheets_client.spreadsheet_id
 
         # Repositories: spreadsheet_id from client; sheet names from repo classes (single responsibility)
-        self._position_repo = PositionRepository(self._sheets_client, sid)
+        self._data_adapter = data_adapter
+        if data_adapter is not None:
+            self._position_repo = LocalPositionRepository(data_adapter)
+            self._t_ledger_repo = LocalLedgerRepository(data_adapter)
+            self._history_repo = LocalHistoryRepository(data_adapter)
+        else:
+            self._position_repo = PositionRepository(self._sheets_client, sid)
+            self._t_ledger_repo = T_LedgerRepository(self._sheets_client, sid)
+            self._history_repo = HistoryRepository(self._sheets_client, sid)
         self._portfolio_repo = EnhancedPortfolioRepository(self._sheets_client, sid, self._project_root)
-        self._t_ledger_repo = T_LedgerRepository(self._sheets_client, sid)
-        self._history_repo = HistoryRepository(self._sheets_client, sid)
         self._performance_repo = EnhancedPerformanceRepository(self._sheets_client, sid, self._project_root)
         
         # 엔진 초기화 (리포지토리 주입)
@@ -97,6 +130,46 @@ class ETEDARunner:
         self._strategy_engine = StrategyEngine(config=config)
         self._broker = broker
         self._safety_hook = safety_hook
+        self._tracer = tracer if tracer is not None else self._build_tracer(config)
+        self._position_shadow = position_shadow
+        self._cache = cache
+        if cache is not None:
+            self._portfolio_engine.attach_cache(cache)
+        self._config_keys: Dict[str, str] = {}  # _config_value: 요청 키 → config_map 실제 키
+
+    @staticmethod
+    def _build_tracer(config: UnifiedConfig) -> ETEDATracer:
+        """Config 키로 ETEDATracer 생성 (미설정 시 예산 100ms, 프로파일링 off)."""
+        def _float(key: str, default: float) -> float:
+            try:
+                value = config.get_flat(key)
+                return float(value) if value not in (None, "") else default
+            except (TypeError, ValueError):
+                return default
+
+        profile_mode = str(config.get_flat("ETEDA_PROFILE_MODE") or "").strip().lower() or None
+        if profile_mode not in (None, "cprofile", "tracemalloc"):
+            profile_mode = None
+        return ETEDATracer(
+            budget_ms=_float("ETEDA_LATENCY_BUDGET_MS", 100.0),
+            profile_mode=profile_mode,
+            profile_sample_rate=_float("ETEDA_PROFILE_SAMPLE_RATE", 0.0),
+            arm_on_breach=profile_mode is not None,
+        )
+
+    @property
+    def tracer(self) -> ETEDATracer:
+        return self._tracer
+
+    def register_metrics(self, collector: Any) -> None:
+        """MetricsCollector에 ETEDA 단계 지연 + 엔진 실행 지표 수집기 등록."""
+        self._tracer.register_metrics(collector)
+        if self._cache is not None:
+            self._cache.register_metrics(collector)
+        for engine in (self._portfolio_engine, self._performance_engine, self._strategy_engine):
+            register = getattr(engine, "register_metrics", None)
+            if callable(register):
+                register(collector)
 
     async def run_once(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -116,32 +189,36 @@ class ETEDARunner:
                     "reason": "safety",
                     "pipeline_state": self._safety_hook.pipeline_state(),
                 }
-            # 1. Extract
-            market_data = self._extract(snapshot)
-            if not market_data:
-                return {"status": "skipped", "reason": "no_market_data"}
-                
-            # 2. Transform
-            # Fetch position data for context
-            symbol = market_data.get("symbol")
+            trace = self._tracer.start_cycle("once")
             try:
-                positions = await self._portfolio_engine.get_positions()
-                # Find position for this symbol (simple match for now)
-                position_data = next((p for p in positions if p.symbol == symbol), None)
-            except Exception as e:
-                self._log.warning(f"Failed to fetch position data for {symbol}: {e}")
-                position_data = None
+                # 1. Extract
+                with trace.span("extract"):
+                    market_data = self._extract(snapshot)
+                if not market_data:
+                    return {"status": "skipped", "reason": "no_market_data", "trace_id": trace.trace_id}
+                self._publish_shadow_prices([market_data])
 
-            transformed_data = self._transform(market_data, position_data)
+                # 2. Transform
+                # Fetch position data for context
+                symbol = market_data.get("symbol")
+                with trace.span("transform"):
+                    positions_by_symbol = await self._fetch_positions_by_symbol()
+                    position_data = positions_by_symbol.get(symbol)
+                    transformed_data = self._transform(market_data, position_data)
 
-            # 3. Evaluate
-            signal = self._evaluate(transformed_data)
+                # 3. Evaluate
+                with trace.span("evaluate"):
+                    signal = self._evaluate(transformed_data)
 
-            # 4. Decide
-            decision = self._decide(signal)
+                # 4. Decide
+                with trace.span("decide"):
+                    decision = self._decide(signal)
 
-            # 5. Act
-            act_result = await self._act(decision)
+                # 5. Act
+                with trace.span("act"):
+                    act_result = await self._act(decision)
+            finally:
+                self._tracer.finish(trace)
 
             # Log/Emit result
             result = {
@@ -149,7 +226,9 @@ class ETEDARunner:
                 "symbol": symbol,
                 "signal": signal,
                 "decision": decision,
-                "act_result": act_result
+                "act_result": act_result,
+                "trace_id": trace.trace_id,
+                "timings_ms": trace.timings_ms(),
             }
             if self._safety_hook is not None:
                 result["pipeline_state"] = self._safety_hook.pipeline_state()
@@ -160,6 +239,148 @@ class ETEDARunner:
             self._log.error(f"Pipeline execution failed: {str(e)}")
             return {"status": "error", "error": str(e)}
 
+    async def run_batch(self, snapshots: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run one multi-symbol cycle over a batch of snapshots.
+
+        - Extract: 스냅샷별 시장 데이터 추출 (데이터 없는 스냅샷은 skipped)
+        - Transform: 포지션 1회 조회 후 symbol → Position 인덱스로 조회
+        - Evaluate / Decide: 전 심볼 일괄 평가
+        - Act: 승인된 Intent를 BrokerEngine.submit_batch로 한 번에 제출
+
+        Args:
+            snapshots: Observer snapshots (심볼별 1개 권장)
+
+        Returns:
+            Dict[str, Any]: {"status", "results": [심볼별 결과, 입력 순서], "timings_ms": 단계별 소요시간, ...}
+        """
+        trace = None
+        try:
+            if self._safety_hook is not None and not self._safety_hook.should_run():
+                return {
+                    "status": "skipped",
+                    "reason": "safety",
+                    "pipeline_state": self._safety_hook.pipeline_state(),
+                    "results": [],
+                    "timings_ms": {},
+                }
+
+            trace = self._tracer.start_cycle("batch")
+
+            # 1. Extract
+            results: List[Dict[str, Any]] = []
+            market_items: List[Tuple[int, Dict[str, Any]]] = []
+            with trace.span("extract"):
+                for snapshot in snapshots:
+                    market_data = self._extract(snapshot)
+                    if not market_data:
+                        results.append({
+                            "status": "skipped",
+                            "reason": "no_market_data",
+                            "symbol": snapshot.get("context", {}).get("symbol"),
+                        })
+                        continue
+                    results.append({
+                        "timestamp": snapshot.get("meta", {}).get("timestamp"),
+                        "symbol": market_data.get("symbol"),
+                    })
+                    market_items.append((len(results) - 1, market_data))
+                self._publish_shadow_prices([market_data for _, market_data in market_items])
+
+            # 2. Transform (포지션 1회 조회 + 심볼 인덱스)
+            with trace.span("transform"):
+                positions_by_symbol = await self._fetch_positions_by_symbol() if market_items else {}
+                transformed = [
+                    (idx, self._transform(market_data, positions_by_symbol.get(market_data.get("symbol"))))
+                    for idx, market_data in market_items
+                ]
+
+            # 3. Evaluate
+            signals: List[Tuple[int, Dict[str, Any]]] = []
+            with trace.span("evaluate"):
+                for idx, data in transformed:
+                    try:
+                        signals.append((idx, self._evaluate(data)))
+                    except Exception as e:
+                        self._log.error(f"Evaluate failed for {results[idx]['symbol']}: {e}")
+                        results[idx].update({"status": "error", "error": str(e)})
+
+            # 4. Decide
+            decisions: List[Tuple[int, Dict[str, Any]]] = []
+            with trace.span("decide"):
+                for idx, signal in signals:
+                    decision = self._decide(signal)
+                    results[idx]["signal"] = signal
+                    results[idx]["decision"] = decision
+                    decisions.append((idx, decision))
+
+            # 5. Act (일괄 제출)
+            with trace.span("act"):
+                act_results = await self._act_batch([decision for _, decision in decisions])
+                for (idx, _), act_result in zip(decisions, act_results):
+                    results[idx]["act_result"] = act_result
+
+            self._tracer.finish(trace)
+            timings = trace.timings_ms()
+            submitted = sum(1 for r in act_results if "intent_id" in r)
+            out: Dict[str, Any] = {
+                "status": "ok",
+                "results": results,
+                "symbols": len(market_items),
+                "submitted": submitted,
+                "timings_ms": timings,
+                "trace_id": trace.trace_id,
+            }
+            if self._safety_hook is not None:
+                out["pipeline_state"] = self._safety_hook.pipeline_state()
+            self._log.info(
+                f"Batch cycle: trace_id={trace.trace_id} symbols={len(market_items)} submitted={submitted} "
+                f"total={timings['total']:.1f}ms"
+            )
+            return out
+
+        except Exception as e:
+            self._log.error(f"Batch pipeline execution failed: {str(e)}")
+            if trace is None:
+                return {"status": "error", "error": str(e), "results": [], "timings_ms": {}}
+            self._tracer.finish(trace)
+            return {
+                "status": "error",
+                "error": str(e),
+                "results": [],
+                "timings_ms": trace.timings_ms(),
+                "trace_id": trace.trace_id,
+            }
+
+    async def _fetch_positions_by_symbol(self) -> Dict[str, Any]:
+        """포지션 1회 조회 후 symbol → Position 인덱스 생성 (실패 시 빈 인덱스)."""
+        try:
+            positions = await self._portfolio_engine.get_positions()
+        except Exception as e:
+            self._log.warning(f"Failed to fetch position data: {e}")
+            return {}
+        if self._position_shadow is not None:
+            self._position_shadow.publish_positions(positions)
+        index: Dict[str, Any] = {}
+        for position in positions:
+            index.setdefault(position.symbol, position)
+        return index
+
+    def _publish_shadow_prices(self, market_items: Sequence[Dict[str, Any]]) -> None:
+        """Extract 시세로 PositionShadow 현재가 갱신 (보유 심볼만 반영)."""
+        if self._position_shadow is None or not market_items:
+            return
+        prices = {}
+        for market_data in market_items:
+            price = market_data.get("price")
+            if isinstance(price, dict):
+                price = price.get("close")
+            try:
+                prices[market_data["symbol"]] = float(price)
+            except (KeyError, TypeError, ValueError):
+                continue
+        self._position_shadow.update_prices(prices)
+
     def _extract(self, snapshot: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Extract relevant data from snapshot"""
         # Snapshot structure matches observation.inputs
@@ -210,67 +431,171 @@ class ETEDARunner:
         
         return decision
 
-    async def _act(self, decision: Dict[str, Any]) -> Dict[str, Any]:
+    def _config_value(self, key: str) -> Any:
         """
-        Execute the decision. Act Input = decision (action, symbol, qty/final_qty, approved).
-        Act Output = ExecutionResponse Contract as dict (status, intent_id, accepted, broker, message).
-        broker 주입 시 ExecutionIntent → BrokerEngine.submit_intent() → ExecutionResponse 반환.
+        Config 단일 키 조회 (값은 항상 config_map에서 직접 읽음 → Kill Switch/일시정지 즉시 반영).
+
+        UnifiedConfig.get_flat의 접미사 탐색 비용을 줄이기 위해 찾은 실제 키 이름만 기억하고,
+        그 키가 없어졌거나 아직 못 찾은 키는 get_flat으로 다시 탐색합니다.
+        """
+        config_map = self._config.config_map
+        resolved = self._config_keys.get(key)
+        if resolved is not None and resolved in config_map:
+            return config_map[resolved]
+        if key in config_map:
+            self._config_keys[key] = key
+            return config_map[key]
+        suffix = "." + key
+        for name in config_map:
+            if name.endswith(suffix):
+                self._config_keys[key] = name
+                return config_map[name]
+        return None
+
+    def _act_gate(self, decision: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[LiveGateDecision]]:
+        """
+        Act 사전 검사. (skip 결과, None) 또는 (None, 실행 게이트) 반환.
         """
         action = decision.get("action", "HOLD")
 
         if action == "HOLD" or not decision.get("approved"):
-            return {"status": "skipped", "action": "HOLD"}
+            return {"status": "skipped", "action": "HOLD"}, None
 
         # Guard/Fail-Safe 연계: Config로 Act 비활성화 시 run_once 없이 skip
-        if self._config.get_flat("trading_enabled") in ("0", "false", "False"):
-            return {"status": "skipped", "reason": "trading_enabled=False"}
-        if self._config.get_flat("KILLSWITCH_STATUS") in ("ON", "ACTIVE", "1", "true"):
-            return {"status": "skipped", "reason": "kill_switch"}
-        if self._config.get_flat("PIPELINE_PAUSED") in ("1", "true", "True"):
-            return {"status": "skipped", "reason": "pipeline_paused"}
-        if self._config.get_flat("safe_mode") in ("1", "true", "True"):
-            return {"status": "skipped", "reason": "safe_mode"}
+        if self._config_value("trading_enabled") in ("0", "false", "False"):
+            return {"status": "skipped", "reason": "trading_enabled=False"}, None
+        if self._config_value("KILLSWITCH_STATUS") in ("ON", "ACTIVE", "1", "true"):
+            return {"status": "skipped", "reason": "kill_switch"}, None
+        if self._config_value("PIPELINE_PAUSED") in ("1", "true", "True"):
+            return {"status": "skipped", "reason": "pipeline_paused"}, None
+        if self._config_value("safe_mode") in ("1", "true", "True"):
+            return {"status": "skipped", "reason": "safe_mode"}, None
 
         gate = decide_execution_mode(
-            sheet_execution_mode=self._config.get_flat("RUN_MODE"),
-            sheet_live_enabled=self._config.get_flat("LIVE_ENABLED"),
+            sheet_execution_mode=self._config_value("RUN_MODE"),
+            sheet_live_enabled=self._config_value("LIVE_ENABLED"),
             env_live_ack=os.environ.get("QTS_LIVE_ACK"),
         )
 
         if gate.mode != ExecutionMode.PAPER and not (gate.mode == ExecutionMode.LIVE and gate.live_allowed):
-            return {"status": "skipped", "reason": gate.reason}
+            return {"status": "skipped", "reason": gate.reason}, None
+
+        return None, gate
+
+    def _build_intent(self, decision: Dict[str, Any], gate: LiveGateDecision) -> ExecutionIntent:
+        action = decision.get("action", "HOLD")
+        return ExecutionIntent(
+            intent_id=str(uuid.uuid4()),
+            symbol=str(decision.get("symbol", "")),
+            side=str(action).upper(),
+            quantity=float(decision.get("qty") or decision.get("final_qty") or 0),
+            intent_type="MARKET",
+            metadata={"decision": decision, "mode": gate.mode.value},
+        )
+
+    def _act_response(self, resp: ExecutionResponse, gate: LiveGateDecision) -> Dict[str, Any]:
+        """ExecutionResponse → Act Output dict (Fail-Safe 기록 포함)."""
+        # Phase 7: Broker Fail-Safe(ConsecutiveFailureGuard) 시 Safety Layer 기록
+        if not resp.accepted and resp.broker == "failsafe" and self._safety_hook is not None:
+            self._safety_hook.record_fail_safe("FS040", resp.message or "blocked: consecutive failures exceeded", "Act")
+        ts = getattr(resp.timestamp, "isoformat", lambda: str(resp.timestamp))()
+        out = {
+            "status": "executed" if resp.accepted else "rejected",
+            "intent_id": resp.intent_id,
+            "accepted": resp.accepted,
+            "broker": resp.broker,
+            "message": resp.message,
+            "timestamp": ts,
+            "mode": gate.mode.value,
+        }
+        self._log.info(f"[{gate.mode.value}] Act result: {out}")
+        return out
+
+    async def _invalidate_positions(self) -> None:
+        """주문 접수 후 포지션 캐시 무효화. 실패해도 접수 결과는 그대로 반환되도록 로그만 남김."""
+        try:
+            await self._portfolio_engine.invalidate_positions()
+        except Exception as e:
+            self._log.warning("Position cache invalidation failed: %s", e)
+
+    async def _act(self, decision: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the decision. Act Input = decision (action, symbol, qty/final_qty, approved).
+        Act Output = ExecutionResponse Contract as dict (status, intent_id, accepted, broker, message).
+        broker 주입 시 ExecutionIntent → BrokerEngine.submit_intent_async() → ExecutionResponse 반환
+        (submit_intent_async 미구현 broker는 submit_intent).
+        """
+        skipped, gate = self._act_gate(decision)
+        if skipped is not None:
+            return skipped
 
         # Broker 주입 시 ExecutionIntent → submit_intent → ExecutionResponse Contract 사용
         if self._broker is not None:
             try:
-                intent = ExecutionIntent(
-                    intent_id=str(uuid.uuid4()),
-                    symbol=str(decision.get("symbol", "")),
-                    side=str(action).upper(),
-                    quantity=float(decision.get("qty") or decision.get("final_qty") or 0),
-                    intent_type="MARKET",
-                    metadata={"decision": decision, "mode": gate.mode.value},
-                )
-                resp = self._broker.submit_intent(intent)
-                # Phase 7: Broker Fail-Safe(ConsecutiveFailureGuard) 시 Safety Layer 기록
-                if not resp.accepted and resp.broker == "failsafe" and self._safety_hook is not None:
-                    self._safety_hook.record_fail_safe("FS040", resp.message or "blocked: consecutive failures exceeded", "Act")
-                ts = getattr(resp.timestamp, "isoformat", lambda: str(resp.timestamp))()
-                out = {
-                    "status": "executed" if resp.accepted else "rejected",
-                    "intent_id": resp.intent_id,
-                    "accepted": resp.accepted,
-                    "broker": resp.broker,
-                    "message": resp.message,
-                    "timestamp": ts,
-                    "mode": gate.mode.value,
-                }
-                self._log.info(f"[{gate.mode.value}] Act result: {out}")
-                return out
+                intent = self._build_intent(decision, gate)
+                submit_async = getattr(self._broker, "submit_intent_async", None)
+                if submit_async is not None:
+                    resp = await submit_async(intent)
+                else:
+                    resp = self._broker.submit_intent(intent)
+                if resp.accepted:
+                    await self._invalidate_positions()
+                return self._act_response(resp, gate)
             except Exception as e:
                 self._log.exception("Act submit_intent failed: %s", e)
                 return {"status": "error", "error": str(e), "mode": gate.mode.value}
 
         # broker 미주입: 기존 동작(로그만, Contract 없음)
-        self._log.info(f"[{gate.mode.value}] Action: {action}, Symbol: {decision.get('symbol')}")
+        self._log.info(f"[{gate.mode.value}] Action: {decision.get('action', 'HOLD')}, Symbol: {decision.get('symbol')}")
         return {"status": "executed", "mode": gate.mode.value, "details": decision}
+
+    async def _act_batch(self, decisions: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        여러 decision을 Act. 게이트를 통과한 Intent는 BrokerEngine.submit_batch_async로 한 번에 제출
+        (브로커 TPS 한도 내 동시 전송, submit_batch_async 미구현 broker는 submit_batch).
+        반환은 decisions와 길이·순서가 같음. 브로커 응답이 Intent 수보다 적으면 빠진 자리는 error 결과.
+        """
+        out: List[Dict[str, Any]] = [{}] * len(decisions)
+        pending: List[Tuple[int, ExecutionIntent, LiveGateDecision]] = []
+
+        for i, decision in enumerate(decisions):
+            skipped, gate = self._act_gate(decision)
+            if skipped is not None:
+                out[i] = skipped
+            elif self._broker is None:
+                self._log.info(f"[{gate.mode.value}] Action: {decision.get('action', 'HOLD')}, Symbol: {decision.get('symbol')}")
+                out[i] = {"status": "executed", "mode": gate.mode.value, "details": decision}
+            else:
+                pending.append((i, self._build_intent(decision, gate), gate))
+
+        if pending:
+            try:
+                intents = [intent for _, intent, _ in pending]
+                submit_batch_async = getattr(self._broker, "submit_batch_async", None)
+                if submit_batch_async is not None:
+                    responses = await submit_batch_async(intents)
+                else:
+                    responses = self._broker.submit_batch(intents)
+                responses = list(responses)
+                if len(responses) != len(pending):
+                    self._log.error(
+                        "Act submit_batch returned %d responses for %d intents", len(responses), len(pending)
+                    )
+                if any(resp.accepted for resp in responses):
+                    await self._invalidate_positions()
+                for n, (i, intent, gate) in enumerate(pending):
+                    if n < len(responses):
+                        out[i] = self._act_response(responses[n], gate)
+                    else:
+                        out[i] = {
+                            "status": "error",
+                            "intent_id": intent.intent_id,
+                            "error": "missing broker response",
+                            "mode": gate.mode.value,
+                        }
+            except Exception as e:
+                self._log.exception("Act submit_batch failed: %s", e)
+                for i, _, gate in pending:
+                    out[i] = {"status": "error", "error": str(e), "mode": gate.mode.value}
+
+        return out
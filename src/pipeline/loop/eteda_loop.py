@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Dict, Optional, Protocol, Union
 
 
@@ -47,6 +48,14 @@ async def _get_snapshot(source: SnapshotSource) -> Dict[str, Any]:
     return out
 
 
+@dataclass
+class ETEDALoopResult:
+    """루프 종료 요약."""
+    cycles: int = 0  # 정상 완료한 run_once 수
+    errors: int = 0  # run_once 예외 누적 수
+    aborted: bool = False  # 연속 예외가 ERROR_BACKOFF_MAX_RETRIES를 넘어 중단됨
+
+
 async def run_eteda_loop(
     runner: ETEDARunnerLike,
     config: UnifiedConfig,
@@ -54,7 +63,8 @@ async def run_eteda_loop(
     policy: Optional[ETEDALoopPolicy] = None,
     should_stop: Optional[ETEDALoopShouldStop] = None,
     snapshot_source: Optional[SnapshotSource] = None,
-) -> None:
+    sleep: Optional[Callable[[float], Awaitable[Any]]] = None,
+) -> ETEDALoopResult:
     """
     ETEDA 반복 실행. run_once만 호출하며, Extract/Transform/Evaluate/Decide/Act 로직은 Runner에 위임.
 
@@ -64,11 +74,17 @@ async def run_eteda_loop(
         policy: 없으면 Config로부터 생성.
         should_stop: 없으면 Config의 PIPELINE_PAUSED로 생성.
         snapshot_source: 없으면 interval 전용 최소 스냅샷 사용.
+        sleep: 주기/백오프 대기 함수 (기본 asyncio.sleep). 리플레이는 SimulatedClock.sleep으로 실제 대기 없이 진행.
+
+    Returns:
+        ETEDALoopResult: 완료 사이클/예외 수, 연속 예외로 중단되었는지
     """
     policy = policy or ETEDALoopPolicy.from_config(config)
     stop_fn = should_stop or default_should_stop_from_config(config)
     snapshot_fn = snapshot_source or _default_snapshot
+    sleep_fn = sleep or asyncio.sleep
     consecutive_errors = 0
+    summary = ETEDALoopResult()
 
     while True:
         if stop_fn():
@@ -79,6 +95,7 @@ async def run_eteda_loop(
             snapshot = await _get_snapshot(snapshot_fn)
             result = await runner.run_once(snapshot)
             consecutive_errors = 0
+            summary.cycles += 1
             status = result.get("status")
             if status == "error":
                 _log.warning("run_once returned error: %s", result.get("error"))
@@ -89,14 +106,18 @@ async def run_eteda_loop(
             break
         except Exception as e:
             consecutive_errors += 1
+            summary.errors += 1
             _log.exception("ETEDA run_once failed (consecutive=%s): %s", consecutive_errors, e)
             if consecutive_errors > policy.error_backoff_max_retries:
                 _log.error("ETEDA loop stopping after max consecutive errors")
+                summary.aborted = True
                 break
-            await asyncio.sleep(policy.error_backoff_ms / 1000.0)
+            await sleep_fn(policy.error_backoff_ms / 1000.0)
 
         if stop_fn():
             _log.info("ETEDA loop stopped (should_stop=True)")
             break
 
-        await asyncio.sleep(policy.interval_ms / 1000.0)
+        await sleep_fn(policy.interval_ms / 1000.0)
+
+    return summary
@@ -0,0 +1,30 @@
+"""
+Event-sourced replay of recorded Observer data through ETEDARunner.
+"""
+
+from .broker import DEFAULT_SLIPPAGE_RATE, ReplayBroker, ReplayFill
+from .clock import SimulatedClock
+from .dataset import SnapshotDataset
+from .engine import DayResult, ReplayEngine, ReplayReport, build_replay_runner
+from .source import ReplayTickSource, timestamp_ms
+from .sweep import ParameterGrid, SweepResult, SweepRow, evaluate_candidate, load_scalp_parameters, run_sweep
+
+__all__ = [
+    "DEFAULT_SLIPPAGE_RATE",
+    "DayResult",
+    "ParameterGrid",
+    "ReplayBroker",
+    "ReplayEngine",
+    "ReplayFill",
+    "ReplayReport",
+    "ReplayTickSource",
+    "SimulatedClock",
+    "SnapshotDataset",
+    "SweepResult",
+    "SweepRow",
+    "build_replay_runner",
+    "evaluate_candidate",
+    "load_scalp_parameters",
+    "run_sweep",
+    "timestamp_ms",
+]
@@ -0,0 +1,193 @@
+"""
+Replay Broker
+
+리플레이 시세로 Intent를 즉시 체결하는 BrokerEngine.
+
+체결 모델은 SimExecutor(decision_pipeline.execution_stub)와 동일:
+- 기준가 = 해당 심볼의 마지막 재생 틱 가격
+- BUY는 기준가 × (1 + slippage_rate), SELL은 기준가 × (1 - slippage_rate)
+- max_fill_qty 초과분은 부분 체결 (PARTIAL)
+추가로 현금/포지션/실현손익을 장부로 관리하고, 공매도는 보유 수량까지만 체결합니다.
+BUY는 현금(수수료 포함) 한도까지만 체결하며 (정수 수량 주문은 정수 주로 절삭), 1주도 살 수 없으면 거부합니다.
+
+positions_store를 주면 체결 후 포지션을 positions 테이블에 기록해
+ETEDARunner(data_adapter=...)의 Transform 단계가 재생 중 포지션을 그대로 조회합니다.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from src.provider.interfaces.broker import BrokerEngine
+from src.provider.models.intent import ExecutionIntent
+from src.provider.models.response import ExecutionResponse
+from src.runtime.data import DataSourceAdapter
+
+from .clock import SimulatedClock
+
+
+# SimExecutor.DEFAULT_SLIPPAGE_RATE
+DEFAULT_SLIPPAGE_RATE = 0.0002
+
+
+@dataclass(frozen=True)
+class ReplayFill:
+    intent_id: str
+    symbol: str
+    side: str
+    requested_qty: float
+    qty: float
+    reference_price: float
+    price: float
+    fee: float
+    timestamp_ms: int
+    result: str  # FILLED / PARTIAL
+
+
+class ReplayBroker(BrokerEngine):
+    NAME = "replay-sim"
+
+    def __init__(
+        self,
+        clock: Optional[SimulatedClock] = None,
+        *,
+        initial_cash: float = 10_000_000.0,
+        slippage_rate: float = DEFAULT_SLIPPAGE_RATE,
+        fee_rate: float = 0.0,
+        max_fill_qty: Optional[float] = None,
+        positions_store: Optional[DataSourceAdapter] = None,
+    ) -> None:
+        """
+        Args:
+            clock: 체결 시각 기록용 SimulatedClock
+            initial_cash: 시작 현금
+            slippage_rate: 기준가 대비 불리한 체결 비율 (SimExecutor 기본값)
+            fee_rate: 체결 금액 대비 수수료율
+            max_fill_qty: 1회 최대 체결 수량 (None이면 전량)
+            positions_store: 체결 후 positions 테이블을 갱신할 저장소
+        """
+        self.clock = clock or SimulatedClock()
+        self.initial_cash = float(initial_cash)
+        self.cash = float(initial_cash)
+        self.slippage_rate = slippage_rate
+        self.fee_rate = fee_rate
+        self.max_fill_qty = max_fill_qty
+        self.positions_store = positions_store
+        self.prices: Dict[str, float] = {}
+        self.positions: Dict[str, List[float]] = {}  # symbol → [qty, avg_price]
+        self.fills: List[ReplayFill] = []
+        self.realized_pnl = 0.0
+        self.fees = 0.0
+
+    # ------------------------------------------------------------------
+    # 시세
+    # ------------------------------------------------------------------
+
+    def on_tick(self, snapshot: Dict[str, Any]) -> None:
+        """ReplayTickSource on_tick 콜백: 심볼 기준가 갱신."""
+        symbol = snapshot.get("context", {}).get("symbol")
+        price = snapshot.get("observation", {}).get("inputs", {}).get("price")
+        if isinstance(price, dict):
+            price = price.get("close")
+        if symbol and isinstance(price, (int, float)):
+            self.mark(symbol, price)
+
+    def mark(self, symbol: str, price: float) -> None:
+        """심볼 기준가(마지막 체결가) 갱신."""
+        if price > 0:
+            self.prices[symbol] = float(price)
+
+    # ------------------------------------------------------------------
+    # BrokerEngine
+    # ------------------------------------------------------------------
+
+    def _reject(self, intent: ExecutionIntent, message: str) -> ExecutionResponse:
+        return ExecutionResponse(
+            intent_id=intent.intent_id, accepted=False, broker=self.NAME, message=message,
+            timestamp=self.clock.now(),
+        )
+
+    def submit_intent(self, intent: ExecutionIntent) -> ExecutionResponse:
+        side = str(intent.side).upper()
+        if side not in ("BUY", "SELL") or intent.quantity <= 0:
+            return self._reject(intent, "Invalid side or quantity")
+        ref_price = self.prices.get(intent.symbol)
+        if ref_price is None:
+            return self._reject(intent, "no reference price")
+
+        qty = float(intent.quantity)
+        if self.max_fill_qty is not None:
+            qty = min(qty, float(self.max_fill_qty))
+        held, avg = self.positions.get(intent.symbol, (0.0, 0.0))
+        if side == "SELL":
+            qty = min(qty, held)
+            if qty <= 0:
+                return self._reject(intent, "no position to sell")
+            price = ref_price * (1 - self.slippage_rate)
+        else:
+            price = ref_price * (1 + self.slippage_rate)
+            affordable = max(self.cash, 0.0) / (price * (1 + self.fee_rate))
+            if float(intent.quantity).is_integer():
+                affordable = math.floor(affordable)
+            qty = min(qty, affordable)
+            if qty <= 0:
+                return self._reject(intent, "insufficient cash")
+
+        fee = qty * price * self.fee_rate
+        if side == "BUY":
+            new_qty = held + qty
+            self.positions[intent.symbol] = [new_qty, (held * avg + qty * price) / new_qty]
+            self.cash -= qty * price + fee
+        else:
+            self.realized_pnl += (price - avg) * qty
+            remaining = held - qty
+            if remaining > 0:
+                self.positions[intent.symbol] = [remaining, avg]
+            else:
+                self.positions.pop(intent.symbol, None)
+            self.cash += qty * price - fee
+        self.realized_pnl -= fee
+        self.fees += fee
+
+        result = "PARTIAL" if qty < intent.quantity else "FILLED"
+        self.fills.append(ReplayFill(
+            intent_id=intent.intent_id, symbol=intent.symbol, side=side, requested_qty=float(intent.quantity),
+            qty=qty, reference_price=ref_price, price=price, fee=fee, timestamp_ms=self.clock.now_ms, result=result,
+        ))
+        self._store_position(intent.symbol)
+        return ExecutionResponse(
+            intent_id=intent.intent_id, accepted=True, broker=self.NAME,
+            message=f"sim {result.lower()} {qty:g}@{price:.4f}", timestamp=self.clock.now(),
+        )
+
+    def _store_position(self, symbol: str) -> None:
+        if self.positions_store is None:
+            return
+        position = self.positions.get(symbol)
+        if position is None:
+            self.positions_store.delete("positions", {"symbol": symbol})
+            return
+        self.positions_store.write("positions", {
+            "symbol": symbol,
+            "qty": position[0],
+            "avg_price": position[1],
+            "current_price": self.prices.get(symbol),
+            "updated_at": self.clock.now(),
+        })
+
+    # ------------------------------------------------------------------
+    # 평가
+    # ------------------------------------------------------------------
+
+    def unrealized_pnl(self) -> float:
+        return sum(
+            (self.prices.get(symbol, avg) - avg) * qty for symbol, (qty, avg) in self.positions.items()
+        )
+
+    def equity(self) -> float:
+        return self.cash + sum(self.prices.get(symbol, avg) * qty for symbol, (qty, avg) in self.positions.items())
+
+    def pnl(self) -> float:
+        return self.equity() - self.initial_cash
@@ -0,0 +1,40 @@
+"""
+Simulated Clock (Replay)
+
+리플레이용 이벤트 구동 시계. 현재 시각은 재생 중인 틱의 타임스탬프이며,
+run_eteda_loop의 주기/백오프 대기는 실제로 잠들지 않고 이벤트 루프에 양보만 합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+from src.shared.timezone_utils import KST
+
+
+class SimulatedClock:
+    def __init__(self, start_ms: int = 0) -> None:
+        self._now_ms = int(start_ms)
+        self.skipped_sleep_s = 0.0  # 실시간이었다면 대기했을 누적 시간
+
+    @property
+    def now_ms(self) -> int:
+        return self._now_ms
+
+    def time(self) -> float:
+        """epoch 초 (time.time() 대용)."""
+        return self._now_ms / 1000.0
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self.time(), KST)
+
+    def advance_to(self, ts_ms: int) -> None:
+        """틱 시각으로 이동 (시계는 뒤로 가지 않음)."""
+        if ts_ms > self._now_ms:
+            self._now_ms = int(ts_ms)
+
+    async def sleep(self, seconds: float) -> None:
+        """asyncio.sleep 대용: 대기 없이 양보만 (다음 틱 시각은 스트림이 결정)."""
+        self.skipped_sleep_s += max(0.0, seconds)
+        await asyncio.sleep(0)
@@ -0,0 +1,87 @@
+"""
+Snapshot Dataset (Replay / Sweep)
+
+기록된 Observer 스냅샷을 시간순 컬럼 배열로 1회 디코딩한 데이터셋.
+
+- from_jsonl: ReplayTickSource(힙 병합)로 디코딩 → timestamp_ms / symbol_idx / price / volume 배열
+- save → 디렉터리에 컬럼별 .npy + symbols.json
+- open(mmap=True) → np.load(mmap_mode="r") 읽기 전용 매핑. 여러 프로세스가 같은 파일을 열면
+  OS 페이지 캐시를 공유하므로 후보 수·워커 수와 무관하게 디코딩/메모리는 1벌
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from .source import ReplayTickSource
+
+
+_COLUMNS = ("timestamp_ms", "symbol_idx", "price", "volume")
+
+
+@dataclass(frozen=True)
+class SnapshotDataset:
+    symbols: Tuple[str, ...]
+    timestamp_ms: np.ndarray  # int64, 오름차순
+    symbol_idx: np.ndarray  # int32, symbols 인덱스
+    price: np.ndarray  # float64
+    volume: np.ndarray  # float64
+
+    def __len__(self) -> int:
+        return int(self.timestamp_ms.shape[0])
+
+    @classmethod
+    def from_jsonl(cls, paths: Sequence[Union[str, Path]]) -> "SnapshotDataset":
+        symbols: Dict[str, int] = {}
+        ts: List[int] = []
+        idx: List[int] = []
+        price: List[float] = []
+        volume: List[float] = []
+        for snapshot in ReplayTickSource(paths):
+            inputs = snapshot["observation"]["inputs"]
+            symbol = snapshot["context"]["symbol"]
+            ts.append(snapshot["meta"]["timestamp_ms"])
+            idx.append(symbols.setdefault(symbol, len(symbols)))
+            price.append(inputs["price"])
+            volume.append(inputs.get("volume") or 0.0)
+        return cls(
+            symbols=tuple(symbols),
+            timestamp_ms=np.asarray(ts, dtype=np.int64),
+            symbol_idx=np.asarray(idx, dtype=np.int32),
+            price=np.asarray(price, dtype=np.float64),
+            volume=np.asarray(volume, dtype=np.float64),
+        )
+
+    def save(self, directory: Union[str, Path]) -> Path:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in _COLUMNS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+        (directory / "symbols.json").write_text(json.dumps(list(self.symbols)), encoding="utf-8")
+        return directory
+
+    @classmethod
+    def open(cls, directory: Union[str, Path], mmap: bool = True) -> "SnapshotDataset":
+        """save()로 저장한 데이터셋 열기 (mmap=True면 읽기 전용 메모리 매핑)."""
+        directory = Path(directory)
+        symbols = tuple(json.loads((directory / "symbols.json").read_text(encoding="utf-8")))
+        columns = {
+            name: np.load(directory / f"{name}.npy", mmap_mode="r" if mmap else None) for name in _COLUMNS
+        }
+        return cls(symbols=symbols, **columns)
+
+    def ticks(self, chunk: int = 65_536) -> Iterator[Tuple[int, str, float]]:
+        """(timestamp_ms, symbol, price) 순회. 청크 단위로 Python 스칼라 일괄 변환 (mmap 전체 복사 없음)."""
+        symbols = self.symbols
+        for start in range(0, len(self), chunk):
+            end = start + chunk
+            yield from zip(
+                self.timestamp_ms[start:end].tolist(),
+                (symbols[i] for i in self.symbol_idx[start:end].tolist()),
+                self.price[start:end].tolist(),
+            )
@@ -0,0 +1,207 @@
+"""
+Replay Engine
+
+기록된 Observer JSONL로 ETEDARunner를 구동하는 이벤트 소싱 백테스트/리플레이.
+
+- 하루 = 독립 세션: SimulatedClock + ReplayTickSource(심볼별 파일 힙 병합) + ReplayBroker + 메모리 SQLite 포지션
+- 실제 루프(run_eteda_loop)를 그대로 사용하되 sleep을 SimulatedClock.sleep으로 교체 → 대기 없이 틱 속도로 진행
+- run_days: 서로 독립인 날짜를 ProcessPoolExecutor로 병렬 재생 후 일별 PnL 집계
+
+사용 예:
+    engine = ReplayEngine(project_root)
+    report = engine.run_days({"2026-01-05": [".../005930.jsonl", ".../000660.jsonl"], ...}, max_workers=4)
+    report.total_pnl, report.by_day()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+from src.pipeline.loop.eteda_loop import run_eteda_loop
+from src.pipeline.loop.eteda_loop_policy import ETEDALoopPolicy
+from src.qts.core.config.config_models import UnifiedConfig
+from src.runtime.data import DataSourceAdapter, SQLiteAdapter
+
+from .broker import DEFAULT_SLIPPAGE_RATE, ReplayBroker
+from .clock import SimulatedClock
+from .source import ReplayTickSource
+
+
+_log = logging.getLogger(__name__)
+
+RunnerFactory = Callable[[UnifiedConfig, Path, ReplayBroker, DataSourceAdapter], Any]
+
+DEFAULT_REPLAY_CONFIG: Dict[str, Any] = {"RUN_MODE": "PAPER", "KILLSWITCH_STATUS": "OFF"}
+
+
+def build_replay_runner(
+    config: UnifiedConfig,
+    project_root: Path,
+    broker: ReplayBroker,
+    data_adapter: DataSourceAdapter,
+) -> Any:
+    """기본 Runner: ETEDARunner + Mock Sheets/Safety (--local-only와 동일 구성) + 리플레이 브로커/저장소."""
+    from src.db.mock_sheets_client import MockSheetsClient
+    from src.pipeline.eteda_runner import ETEDARunner
+    from src.pipeline.mock_safety_hook import MockSafetyHook
+
+    return ETEDARunner(
+        config=config,
+        sheets_client=MockSheetsClient(),
+        project_root=project_root,
+        broker=broker,
+        safety_hook=MockSafetyHook(initial_state="NORMAL"),
+        data_adapter=data_adapter,
+    )
+
+
+@dataclass(frozen=True)
+class DayResult:
+    day: str
+    ticks: int
+    fills: int
+    realized_pnl: float
+    unrealized_pnl: float
+    fees: float
+    pnl: float
+    ending_equity: float
+    replayed_s: float  # 재생한 시장 시간(첫 틱~마지막 틱)
+    elapsed_s: float  # 실제 소요 시간
+    errors: int = 0  # run_once 예외 수
+    aborted: bool = False  # 연속 예외 한도(error_backoff_max_retries) 초과로 재생 중단 → 일부 틱만 반영
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    days: Tuple[DayResult, ...] = field(default_factory=tuple)
+    elapsed_s: float = 0.0
+
+    @property
+    def total_pnl(self) -> float:
+        return sum(d.pnl for d in self.days)
+
+    @property
+    def total_fills(self) -> int:
+        return sum(d.fills for d in self.days)
+
+    @property
+    def total_ticks(self) -> int:
+        return sum(d.ticks for d in self.days)
+
+    @property
+    def aborted_days(self) -> Tuple[str, ...]:
+        return tuple(d.day for d in self.days if d.aborted)
+
+    def by_day(self) -> Dict[str, float]:
+        return {d.day: d.pnl for d in self.days}
+
+
+class ReplayEngine:
+    def __init__(
+        self,
+        project_root: Union[str, Path],
+        *,
+        config_map: Optional[Mapping[str, Any]] = None,
+        runner_factory: RunnerFactory = build_replay_runner,
+        initial_cash: float = 10_000_000.0,
+        slippage_rate: float = DEFAULT_SLIPPAGE_RATE,
+        fee_rate: float = 0.0,
+        max_fill_qty: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            project_root: ETEDARunner project_root
+            config_map: Runner Config (기본 PAPER 모드)
+            runner_factory: (config, project_root, broker, data_adapter) → run_once를 갖는 Runner.
+                run_days 병렬 실행 시 프로세스로 전달되므로 모듈 수준 함수여야 함
+            initial_cash / slippage_rate / fee_rate / max_fill_qty: ReplayBroker 설정 (일자별 동일)
+        """
+        self.project_root = Path(project_root)
+        self.config_map = dict(DEFAULT_REPLAY_CONFIG if config_map is None else config_map)
+        self.runner_factory = runner_factory
+        self.initial_cash = initial_cash
+        self.slippage_rate = slippage_rate
+        self.fee_rate = fee_rate
+        self.max_fill_qty = max_fill_qty
+
+    async def run_day(self, day: str, paths: Sequence[Union[str, Path]]) -> DayResult:
+        """하루치 파일을 새 Runner/브로커/포지션 저장소로 재생."""
+        started = time.perf_counter()
+        clock = SimulatedClock()
+        store = SQLiteAdapter()
+        broker = ReplayBroker(
+            clock,
+            initial_cash=self.initial_cash,
+            slippage_rate=self.slippage_rate,
+            fee_rate=self.fee_rate,
+            max_fill_qty=self.max_fill_qty,
+            positions_store=store,
+        )
+        source = ReplayTickSource(paths, clock=clock, on_tick=broker.on_tick)
+        config = UnifiedConfig(config_map=dict(self.config_map), metadata={"source": "replay", "day": day})
+        runner = self.runner_factory(config, self.project_root, broker, store)
+        try:
+            loop_result = await run_eteda_loop(
+                runner,
+                config,
+                policy=ETEDALoopPolicy(interval_ms=0, error_backoff_ms=0, error_backoff_max_retries=20),
+                should_stop=lambda: False,
+                snapshot_source=source,
+                sleep=clock.sleep,
+            )
+        finally:
+            store.close()
+
+        result = DayResult(
+            day=day,
+            ticks=source.ticks,
+            fills=len(broker.fills),
+            realized_pnl=broker.realized_pnl,
+            unrealized_pnl=broker.unrealized_pnl(),
+            fees=broker.fees,
+            pnl=broker.pnl(),
+            ending_equity=broker.equity(),
+            replayed_s=0.0 if source.first_ms is None else (source.last_ms - source.first_ms) / 1000.0,
+            elapsed_s=time.perf_counter() - started,
+            errors=loop_result.errors,
+            aborted=loop_result.aborted,
+        )
+        _log.info(
+            f"Replay {day}: ticks={result.ticks} fills={result.fills} pnl={result.pnl:.2f} "
+            f"replayed={result.replayed_s:.0f}s elapsed={result.elapsed_s:.2f}s"
+        )
+        if result.aborted:
+            _log.error(f"Replay {day} aborted after {result.errors} errors; result covers {result.ticks} ticks only")
+        return result
+
+    def run_days(
+        self,
+        days: Mapping[str, Sequence[Union[str, Path]]],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> ReplayReport:
+        """
+        날짜별 재생 후 일별 PnL 집계 (날짜 순 정렬).
+
+        max_workers == 1 또는 날짜 1개면 현재 프로세스에서 순차 실행 (이벤트 루프 밖에서 호출).
+        """
+        started = time.perf_counter()
+        ordered = sorted(days.items())
+        if max_workers == 1 or len(ordered) <= 1:
+            results = [_replay_day(self, day, paths) for day, paths in ordered]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(_replay_day, self, day, list(paths)) for day, paths in ordered]
+                results = [f.result() for f in futures]
+        return ReplayReport(days=tuple(results), elapsed_s=time.perf_counter() - started)
+
+
+def _replay_day(engine: ReplayEngine, day: str, paths: Sequence[Union[str, Path]]) -> DayResult:
+    """프로세스 풀 작업 단위 (일자별 독립 이벤트 루프)."""
+    return asyncio.run(engine.run_day(day, paths))
@@ -0,0 +1,113 @@
+"""
+Replay Tick Source
+
+심볼별 Observer JSONL 파일(파일마다 시간순 기록)을 타임스탬프 순으로 병합해 스냅샷을 공급합니다.
+
+- 파일별 JsonlBatchReader 배치 디코딩 → 스냅샷 변환 (observer_record_to_snapshot)
+- heapq.merge로 k-way 병합 (힙 크기 = 파일 수, 전체 정렬 없음). 같은 시각은 파일 순서 유지
+- meta.timestamp(ISO 문자열 또는 epoch)를 meta.timestamp_ms로 채우고 SimulatedClock을 해당 시각으로 이동
+- run_eteda_loop의 snapshot_source로 사용: 소진 시 StopAsyncIteration → 루프 종료
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Union
+
+from src.observer_client.file_client import observer_record_to_snapshot
+from src.observer_client.jsonl_reader import JsonlBatchReader
+from src.shared.timezone_utils import to_kst
+
+from .clock import SimulatedClock
+
+
+_log = logging.getLogger(__name__)
+
+
+def timestamp_ms(value: Any) -> Optional[int]:
+    """Observer timestamp → epoch ms. 문자열은 ISO-8601(naive는 KST), 숫자는 초 또는 ms."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value if value > 1e11 else value * 1000)
+    try:
+        return int(to_kst(datetime.fromisoformat(str(value))).timestamp() * 1000)
+    except ValueError:
+        return None
+
+
+def _with_timestamp(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    snapshot = observer_record_to_snapshot(record)
+    if snapshot is None:
+        return None
+    ts = timestamp_ms(snapshot["meta"].get("timestamp"))
+    if ts is None:
+        return None  # 시각 없는 레코드는 병합 순서를 정할 수 없음
+    snapshot["meta"]["timestamp_ms"] = ts
+    return snapshot
+
+
+class ReplayTickSource:
+    def __init__(
+        self,
+        paths: Sequence[Union[str, Path]],
+        *,
+        clock: Optional[SimulatedClock] = None,
+        on_tick: Optional[Callable[[Dict[str, Any]], None]] = None,
+        batch_size: int = 5000,
+    ) -> None:
+        """
+        Args:
+            paths: JSONL 파일 목록 (보통 심볼별 1개, 각 파일은 시간순)
+            clock: 틱마다 시각을 이동할 SimulatedClock
+            on_tick: 스냅샷 공급 직전 콜백 (예: ReplayBroker.on_tick으로 체결 기준가 갱신)
+            batch_size: 파일별 1회 디코딩 레코드 수
+        """
+        self.paths = [str(p) for p in paths]
+        self.clock = clock
+        self.on_tick = on_tick
+        self.batch_size = batch_size
+        self.ticks = 0
+        self.first_ms: Optional[int] = None
+        self.last_ms: Optional[int] = None
+        self._merged: Optional[Iterator[Dict[str, Any]]] = None
+
+    def _iter_file(self, path: str) -> Iterator[Dict[str, Any]]:
+        with JsonlBatchReader(path, transform=_with_timestamp) as reader:
+            while True:
+                batch = reader.read_batch(self.batch_size, True)
+                if batch.invalid:
+                    _log.warning(f"Skipped {batch.invalid} invalid lines in {path}")
+                yield from batch.items
+                if batch.eof:
+                    return
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        streams = [self._iter_file(path) for path in self.paths]
+        for snapshot in heapq.merge(*streams, key=lambda s: s["meta"]["timestamp_ms"]):
+            ts = snapshot["meta"]["timestamp_ms"]
+            self.ticks += 1
+            if self.first_ms is None:
+                self.first_ms = ts
+            self.last_ms = ts
+            if self.clock is not None:
+                self.clock.advance_to(ts)
+            if self.on_tick is not None:
+                self.on_tick(snapshot)
+            yield snapshot
+
+    async def __call__(self) -> Dict[str, Any]:
+        """run_eteda_loop snapshot_source 호환 (소진 시 StopAsyncIteration)."""
+        if self._merged is None:
+            self._merged = iter(self)
+        try:
+            return next(self._merged)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    @property
+    def iteration_count(self) -> int:
+        return self.ticks
@@ -0,0 +1,234 @@
+"""
+Parameter Sweep (Replay)
+
+Config_Scalp 파라미터 그리드를 기록된 스냅샷 데이터셋으로 오프라인 평가해 후보별 PerformanceMetrics 순위표를 만듭니다.
+
+- ParameterGrid: "CATEGORY.KEY" → 후보 값 목록의 데카르트 곱. 기준값은 ConfigScalpRepository
+  get_*_parameters 결과(load_scalp_parameters) 또는 DEFAULT_SCALP_PARAMETERS
+- 데이터셋은 부모 프로세스에서 1회 디코딩 후 .npy로 저장, 워커는 initializer에서 1회 읽기 전용 mmap
+  (후보마다 재디코딩/피클 전송 없음)
+- 후보 평가: Strategy.generate_intents + ReplayBroker(SimExecutor 체결 모델)로 틱 재생,
+  버킷(기본 KST 일자) 종료 시 평가금액 → 수익률 → compute_return_metrics
+- ProcessPoolExecutor로 후보 분산, rank_by 지표 기준 정렬
+
+사용 예:
+    grid = ParameterGrid({"RSI.scalp_rsi_oversold": [20, 25, 30], "GOLDEN_CROSS.scalp_gc_long_period": [20, 60]},
+                         base=await load_scalp_parameters(config_scalp_repo))
+    result = run_sweep(grid, SnapshotDataset.from_jsonl(paths), max_workers=4)
+    result.table()[:5]
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from src.provider.models.intent import ExecutionIntent
+from src.strategy.engines.performance_engine import PerformanceMetrics
+from src.strategy.engines.performance_metrics import compute_return_metrics
+from src.strategy.interfaces.strategy import ExecutionContext, MarketContext, Strategy
+from src.strategy.scalp_strategy import DEFAULT_SCALP_PARAMETERS, ScalpParameterStrategy, merge_scalp_parameters
+
+from .broker import DEFAULT_SLIPPAGE_RATE, ReplayBroker
+from .clock import SimulatedClock
+from .dataset import SnapshotDataset
+
+
+StrategyFactory = Callable[[Mapping[str, Mapping[str, Any]]], Strategy]
+
+_KST_OFFSET_MS = 9 * 3600 * 1000
+_DAY_MS = 86_400_000
+
+
+async def load_scalp_parameters(repo: Any) -> Dict[str, Dict[str, Any]]:
+    """ConfigScalpRepository의 현재 시트 값으로 카테고리별 기준 파라미터 구성."""
+    return merge_scalp_parameters({
+        "GOLDEN_CROSS": await repo.get_golden_cross_parameters(),
+        "RSI": await repo.get_rsi_parameters(),
+        "BOLLINGER_BANDS": await repo.get_bollinger_bands_parameters(),
+        "EXECUTION": await repo.get_execution_settings(),
+    })
+
+
+class ParameterGrid:
+    def __init__(
+        self,
+        grid: Mapping[str, Sequence[Any]],
+        base: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    ) -> None:
+        """
+        Args:
+            grid: "CATEGORY.KEY" → 후보 값 목록 (예: {"RSI.scalp_rsi_oversold": [20, 30]})
+            base: 카테고리별 기준 파라미터 (기본 DEFAULT_SCALP_PARAMETERS)
+        """
+        for name in grid:
+            if "." not in name:
+                raise ValueError(f"grid key must be 'CATEGORY.KEY': {name}")
+        self.grid = {name: list(values) for name, values in grid.items()}
+        self.base = merge_scalp_parameters(base if base is not None else DEFAULT_SCALP_PARAMETERS)
+
+    def __len__(self) -> int:
+        return math.prod(len(values) for values in self.grid.values())
+
+    def overrides(self) -> Iterator[Dict[str, Any]]:
+        """후보별 변경 값 {"CATEGORY.KEY": value} (그리드 선언 순서의 데카르트 곱)."""
+        names = list(self.grid)
+        for combo in itertools.product(*(self.grid[name] for name in names)):
+            yield dict(zip(names, combo))
+
+    def apply(self, override: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+        params = {category: dict(values) for category, values in self.base.items()}
+        for name, value in override.items():
+            category, key = name.split(".", 1)
+            params.setdefault(category, {})[key] = value
+        return params
+
+    def __iter__(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        for override in self.overrides():
+            yield self.apply(override)
+
+
+@dataclass(frozen=True)
+class SweepRow:
+    rank: int
+    params: Dict[str, Any]  # 그리드 변경 값 ("CATEGORY.KEY" → value)
+    metrics: PerformanceMetrics
+    trades: int
+    final_equity: float
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    rows: Tuple[SweepRow, ...]
+    rank_by: str
+    elapsed_s: float
+
+    @property
+    def best(self) -> Optional[SweepRow]:
+        return self.rows[0] if self.rows else None
+
+    def table(self) -> List[Dict[str, Any]]:
+        """순위표 (행마다 rank, 변경 파라미터, 지표 필드, trades, final_equity)."""
+        return [
+            {"rank": row.rank, **row.params, **asdict(row.metrics), "trades": row.trades,
+             "final_equity": row.final_equity}
+            for row in self.rows
+        ]
+
+
+def evaluate_candidate(
+    dataset: SnapshotDataset,
+    params: Mapping[str, Mapping[str, Any]],
+    *,
+    strategy_factory: StrategyFactory = ScalpParameterStrategy,
+    initial_cash: float = 10_000_000.0,
+    slippage_rate: float = DEFAULT_SLIPPAGE_RATE,
+    fee_rate: float = 0.0,
+    bucket_ms: Optional[int] = None,
+    risk_free_rate: float = 0.02,
+    trading_days: int = 252,
+) -> Tuple[PerformanceMetrics, int, float]:
+    """
+    후보 1개 재생. 반환: (PerformanceMetrics, 체결 수, 최종 평가금액).
+
+    bucket_ms가 없으면 KST 일자별 평가금액으로 일별 수익률 계산 (PerformanceEngine과 동일 기준).
+    """
+    strategy = strategy_factory(params)
+    clock = SimulatedClock()
+    broker = ReplayBroker(clock, initial_cash=initial_cash, slippage_rate=slippage_rate, fee_rate=fee_rate)
+    equity_marks: List[float] = [initial_cash]
+    bucket = None
+    seq = 0
+    for ts, symbol, price in dataset.ticks():
+        current = (ts + _KST_OFFSET_MS) // _DAY_MS if bucket_ms is None else ts // bucket_ms
+        if bucket is not None and current != bucket:
+            equity_marks.append(broker.equity())
+        bucket = current
+        clock.advance_to(ts)
+        broker.mark(symbol, price)
+        position = broker.positions.get(symbol)
+        held = int(position[0]) if position else 0
+        for intent in strategy.generate_intents(
+            MarketContext(symbol=symbol, price=price), ExecutionContext(position_qty=held, cash=broker.cash)
+        ):
+            seq += 1
+            broker.submit_intent(ExecutionIntent(
+                intent_id=str(seq), symbol=intent.symbol, side=intent.side, quantity=intent.qty,
+                intent_type="MARKET", metadata={"reason": intent.reason},
+            ))
+    if bucket is not None:
+        equity_marks.append(broker.equity())
+
+    returns = [b / a - 1.0 for a, b in zip(equity_marks, equity_marks[1:]) if a]
+    metrics = PerformanceMetrics(**compute_return_metrics(returns, risk_free_rate, trading_days))
+    return metrics, len(broker.fills), equity_marks[-1]
+
+
+# 워커 프로세스 전역: initializer에서 1회 mmap
+_WORKER_DATASET: Optional[SnapshotDataset] = None
+
+
+def _init_worker(dataset_dir: str) -> None:
+    global _WORKER_DATASET
+    _WORKER_DATASET = SnapshotDataset.open(dataset_dir, mmap=True)
+
+
+def _evaluate_in_worker(params: Mapping[str, Mapping[str, Any]], options: Mapping[str, Any]):
+    return evaluate_candidate(_WORKER_DATASET, params, **options)
+
+
+def run_sweep(
+    grid: ParameterGrid,
+    dataset: SnapshotDataset,
+    *,
+    max_workers: Optional[int] = None,
+    rank_by: str = "sharpe_ratio",
+    ascending: bool = False,
+    strategy_factory: StrategyFactory = ScalpParameterStrategy,
+    **options: Any,
+) -> SweepResult:
+    """
+    그리드 전체 후보 평가 후 rank_by 지표로 정렬한 순위표 반환.
+
+    Args:
+        grid: ParameterGrid
+        dataset: SnapshotDataset (from_jsonl 또는 open)
+        max_workers: 프로세스 수 (1이면 현재 프로세스에서 순차 실행)
+        rank_by: PerformanceMetrics 필드명 (예: sharpe_ratio, total_return, mdd)
+        ascending: True면 작은 값 우선 (mdd 등)
+        strategy_factory: params → Strategy (병렬 실행 시 모듈 수준 callable)
+        options: evaluate_candidate 옵션 (initial_cash, slippage_rate, fee_rate, bucket_ms, ...)
+    """
+    if rank_by not in PerformanceMetrics.__dataclass_fields__:
+        raise ValueError(f"unknown metric: {rank_by}")
+    started = time.perf_counter()
+    overrides = list(grid.overrides())
+    candidates = [grid.apply(override) for override in overrides]
+    options = dict(options, strategy_factory=strategy_factory)
+
+    if max_workers == 1 or len(candidates) <= 1:
+        outcomes = [evaluate_candidate(dataset, params, **options) for params in candidates]
+    else:
+        with tempfile.TemporaryDirectory(prefix="qts-sweep-") as tmp:
+            dataset.save(tmp)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(tmp,)) as pool:
+                futures = [pool.submit(_evaluate_in_worker, params, options) for params in candidates]
+                outcomes = [f.result() for f in futures]
+
+    def sort_key(item):
+        value = getattr(item[1][0], rank_by)
+        if isinstance(value, float) and math.isnan(value):
+            return math.inf
+        return value if ascending else -value
+
+    ranked = sorted(zip(overrides, outcomes), key=sort_key)
+    rows = tuple(
+        SweepRow(rank=i + 1, params=override, metrics=metrics, trades=trades, final_equity=equity)
+        for i, (override, (metrics, trades, equity)) in enumerate(ranked)
+    )
+    return SweepResult(rows=rows, rank_by=rank_by, elapsed_s=time.perf_counter() - started)
@@ -0,0 +1,270 @@
+"""
+ETEDA Cycle Tracing
+
+ETEDA 사이클 단위 추적/프로파일링 훅.
+
+- 사이클마다 trace_id 발급, 단계(extract/transform/evaluate/decide/act)별 monotonic span 기록
+- 단계별·사이클 지연 히스토그램 (p50/p95/p99/max) → MetricsCollector 수집기 형식(get_metrics)
+- 예산(budget_ms) 초과 사이클 집계 + 선택적 cProfile/tracemalloc 캡처
+  - profile_sample_rate: 사이클별 프로파일링 확률 (캡처는 예산 초과 사이클만 보관)
+  - arm_on_breach: 예산 초과 직후 다음 사이클은 반드시 프로파일링
+- latency_snapshot(): automation.health의 ETEDA loop latency 체크 입력
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import random
+import time
+import tracemalloc
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from ..monitoring.latency_histogram import LatencyHistogram
+
+STAGES = ("extract", "transform", "evaluate", "decide", "act")
+
+PROFILE_CPROFILE = "cprofile"
+PROFILE_TRACEMALLOC = "tracemalloc"
+
+_log = logging.getLogger("ETEDATracer")
+
+
+@dataclass
+class CycleTrace:
+    """사이클 1회 추적 정보 (ms 단위)."""
+
+    trace_id: str
+    mode: str
+    started_at: float
+    spans: Dict[str, float] = field(default_factory=dict)
+    total_ms: Optional[float] = None
+    breached: bool = False
+    profile: Optional[Dict[str, Any]] = None
+    _profiler: Any = field(default=None, repr=False)
+    _profile_kind: Optional[str] = field(default=None, repr=False)
+    _tracemalloc_started: bool = field(default=False, repr=False)
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """단계 구간 측정 (같은 단계 재진입 시 누적)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[stage] = self.spans.get(stage, 0.0) + (time.perf_counter() - started) * 1000.0
+
+    def timings_ms(self) -> Dict[str, float]:
+        out = dict(self.spans)
+        if self.total_ms is not None:
+            out["total"] = self.total_ms
+        return out
+
+
+class ETEDATracer:
+    """
+    ETEDA 사이클 추적기.
+
+    start_cycle() → CycleTrace.span(stage) → finish(trace).
+    """
+
+    def __init__(
+        self,
+        budget_ms: float = 100.0,
+        *,
+        profile_mode: Optional[str] = None,
+        profile_sample_rate: float = 0.0,
+        arm_on_breach: bool = False,
+        profile_top_n: int = 25,
+        max_profiles: int = 16,
+        recent_size: int = 256,
+    ) -> None:
+        if profile_mode not in (None, PROFILE_CPROFILE, PROFILE_TRACEMALLOC):
+            raise ValueError(f"Unknown profile_mode: {profile_mode}")
+        self.budget_ms = budget_ms
+        self.profile_mode = profile_mode
+        self.profile_sample_rate = profile_sample_rate
+        self.arm_on_breach = arm_on_breach
+        self.profile_top_n = profile_top_n
+
+        self._stage_latency: Dict[str, LatencyHistogram] = {}
+        self._cycle_latency = LatencyHistogram(min_value=1e-3, max_value=1e6)
+        self._recent: Deque[CycleTrace] = deque(maxlen=recent_size)
+        self._profiles: Deque[Dict[str, Any]] = deque(maxlen=max_profiles)
+        self._armed = False
+        self._profiling_active = False
+
+        self.cycles = 0
+        self.breaches = 0
+        self.last_trace: Optional[CycleTrace] = None
+
+    # ------------------------------------------------------------------
+    # 사이클
+    # ------------------------------------------------------------------
+
+    def start_cycle(self, mode: str = "once") -> CycleTrace:
+        trace = CycleTrace(trace_id=uuid.uuid4().hex[:16], mode=mode, started_at=time.perf_counter())
+        if self._should_profile():
+            self._start_profile(trace)
+        return trace
+
+    def finish(self, trace: CycleTrace) -> CycleTrace:
+        """사이클 종료: 총 소요시간 확정, 히스토그램 기록, 예산 초과 판정/캡처."""
+        if trace.total_ms is not None:
+            return trace
+        trace.total_ms = (time.perf_counter() - trace.started_at) * 1000.0
+        breached = bool(self.budget_ms) and trace.total_ms > self.budget_ms
+        profile = self._stop_profile(trace, keep=breached)
+
+        self.cycles += 1
+        self._cycle_latency.record(trace.total_ms)
+        for stage, ms in trace.spans.items():
+            hist = self._stage_latency.get(stage)
+            if hist is None:
+                hist = self._stage_latency[stage] = LatencyHistogram(min_value=1e-3, max_value=1e6)
+            hist.record(ms)
+
+        if breached:
+            trace.breached = True
+            self.breaches += 1
+            if profile is not None:
+                trace.profile = profile
+                self._profiles.append(profile)
+            self._armed = self.arm_on_breach and self.profile_mode is not None
+            _log.warning(
+                f"ETEDA cycle over budget: trace_id={trace.trace_id} mode={trace.mode} "
+                f"total={trace.total_ms:.1f}ms budget={self.budget_ms:.1f}ms "
+                f"stages={ {k: round(v, 1) for k, v in trace.spans.items()} }"
+            )
+
+        self._recent.append(trace)
+        self.last_trace = trace
+        return trace
+
+    # ------------------------------------------------------------------
+    # 프로파일링
+    # ------------------------------------------------------------------
+
+    def _should_profile(self) -> bool:
+        if self.profile_mode is None or self._profiling_active:
+            return False
+        if self._armed:
+            self._armed = False
+            return True
+        return self.profile_sample_rate > 0 and random.random() < self.profile_sample_rate
+
+    def _start_profile(self, trace: CycleTrace) -> None:
+        self._profiling_active = True
+        trace._profile_kind = self.profile_mode
+        if self.profile_mode == PROFILE_CPROFILE:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            trace._profiler = profiler
+        else:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                trace._tracemalloc_started = True
+            tracemalloc.reset_peak()
+
+    def _stop_profile(self, trace: CycleTrace, keep: bool) -> Optional[Dict[str, Any]]:
+        """프로파일러 정지. keep=False면 리포트 생성 없이 폐기."""
+        kind = trace._profile_kind
+        if kind is None:
+            return None
+        self._profiling_active = False
+        trace._profile_kind = None
+        report: Any
+        try:
+            if kind == PROFILE_CPROFILE:
+                profiler = trace._profiler
+                trace._profiler = None
+                profiler.disable()
+                if not keep:
+                    return None
+                stream = io.StringIO()
+                pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(self.profile_top_n)
+                report = stream.getvalue()
+            else:
+                if not keep:
+                    if trace._tracemalloc_started:
+                        tracemalloc.stop()
+                    return None
+                current, peak = tracemalloc.get_traced_memory()
+                stats = tracemalloc.take_snapshot().statistics("lineno")[: self.profile_top_n]
+                report = {
+                    "current_bytes": current,
+                    "peak_bytes": peak,
+                    "top": [str(stat) for stat in stats],
+                }
+                if trace._tracemalloc_started:
+                    tracemalloc.stop()
+        except Exception as e:
+            _log.warning(f"ETEDA profile capture failed: {e}")
+            return None
+        return {
+            "trace_id": trace.trace_id,
+            "kind": kind,
+            "total_ms": trace.total_ms,
+            "spans": dict(trace.spans),
+            "report": report,
+        }
+
+    def get_profiles(self) -> List[Dict[str, Any]]:
+        """예산 초과 사이클의 프로파일 캡처 (오래된 순)."""
+        return list(self._profiles)
+
+    # ------------------------------------------------------------------
+    # 조회 / 지표
+    # ------------------------------------------------------------------
+
+    def recent_traces(self, limit: Optional[int] = None) -> List[CycleTrace]:
+        traces = list(self._recent)
+        return traces[-limit:] if limit else traces
+
+    def latency_snapshot(self) -> Dict[str, Any]:
+        """
+        사이클/단계 지연 요약 (ms).
+
+        Returns:
+            Dict[str, Any]: {cycles, breaches, budget_ms, last_trace_id, last_total_ms,
+            cycle: {count, mean, p50, p95, p99, max}, stages: {stage: {...}}}
+        """
+        last = self.last_trace
+        return {
+            "cycles": self.cycles,
+            "breaches": self.breaches,
+            "budget_ms": self.budget_ms,
+            "last_trace_id": last.trace_id if last else None,
+            "last_total_ms": last.total_ms if last else None,
+            "cycle": self._cycle_latency.snapshot(),
+            "stages": {stage: hist.snapshot() for stage, hist in self._stage_latency.items()},
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """MetricsCollector 수집기 형식 ({'counters': ..., 'gauges': ...})."""
+        counters = {
+            "eteda.cycles": self.cycles,
+            "eteda.budget_breaches": self.breaches,
+            "eteda.profiles_captured": len(self._profiles),
+        }
+        gauges: Dict[str, float] = {"eteda.budget_ms": float(self.budget_ms)}
+        if self.last_trace is not None and self.last_trace.total_ms is not None:
+            gauges["eteda.last_cycle_ms"] = self.last_trace.total_ms
+        for k, v in self._cycle_latency.snapshot().items():
+            if k != "count":
+                gauges[f"eteda.cycle.{k}_ms"] = v
+        for stage, hist in self._stage_latency.items():
+            for k, v in hist.snapshot().items():
+                if k != "count":
+                    gauges[f"eteda.stage.{stage}.{k}_ms"] = v
+        return {"counters": counters, "gauges": gauges}
+
+    def register_metrics(self, collector: Any) -> None:
+        """MetricsCollector에 'eteda' 수집기 등록."""
+        collector.register_collector("eteda", self.get_metrics)
@@ -3,19 +3,25 @@ OrderAdapter → BrokerEngine Adapter
 
 BaseBrokerAdapter (OrderRequest/OrderResponse)를
 BrokerEngine (ExecutionIntent/ExecutionResponse) 인터페이스로 변환합니다.
+
+비동기 전송(submit_intent_async / submit_batch*)은 브로커 주문 TPS 토큰 버킷을 거칩니다.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
+from typing import List, Optional, Sequence
 
+from src.provider.brokers.batch import DEFAULT_BATCH_CONCURRENCY, run_sync, submit_concurrently
 from src.provider.clients.broker.adapters.base_adapter import BaseBrokerAdapter
 from src.provider.interfaces.broker import BrokerEngine
 from src.provider.models.intent import ExecutionIntent
 from src.provider.models.response import ExecutionResponse
 from src.provider.models.order_request import OrderRequest, OrderSide, OrderType
 from src.provider.models.order_response import OrderStatus
+from src.provider.rate_limit import TokenBucket, order_tps_for
 
 
 _log = logging.getLogger(__name__)
@@ -29,14 +35,27 @@ class OrderAdapterToBrokerEngineAdapter(BrokerEngine):
     OrderResponse → ExecutionResponse 변환
     """
 
-    def __init__(self, order_adapter: BaseBrokerAdapter):
+    def __init__(
+        self,
+        order_adapter: BaseBrokerAdapter,
+        *,
+        tps: Optional[float] = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ):
         """
         OrderAdapterToBrokerEngineAdapter 초기화
 
         Args:
             order_adapter: BaseBrokerAdapter 인스턴스 (KiwoomOrderAdapter 등)
+            tps: 초당 주문 상한 (미지정 시 rate_limit.order_tps_for(broker_id, trading_mode))
+            max_concurrency: submit_batch 동시 전송 상한
         """
         self._adapter = order_adapter
+        if tps is None:
+            trading_mode = getattr(getattr(order_adapter, "_client", None), "trading_mode", None)
+            tps = order_tps_for(order_adapter.broker_id, trading_mode)
+        self.limiter = TokenBucket(tps)
+        self.max_concurrency = max_concurrency
         _log.info(f"OrderAdapterToBrokerEngineAdapter initialized (broker={self._adapter.broker_id})")
 
     def submit_intent(self, intent: ExecutionIntent) -> ExecutionResponse:
@@ -64,14 +83,48 @@ class OrderAdapterToBrokerEngineAdapter(BrokerEngine):
             return execution_response
 
         except Exception as e:
-            _log.error(f"Failed to submit intent: {e}")
-            return ExecutionResponse(
-                intent_id=intent.intent_id,
-                accepted=False,
-                broker=self._adapter.broker_id,
-                message=f"Error: {str(e)}",
-                timestamp=datetime.now(),
-            )
+            return self._error_response(intent, e)
+
+    async def submit_intent_async(self, intent: ExecutionIntent) -> ExecutionResponse:
+        """
+        submit_intent 비동기 버전: OrderAdapter.place_order_async() await
+        (비동기 client 어댑터는 커넥션 풀로 직접 전송, 그 외는 워커 스레드).
+        전송 전 TPS 토큰 버킷 대기.
+        """
+        try:
+            order_request = self._intent_to_order_request(intent)
+            await self.limiter.acquire()
+            place_async = getattr(self._adapter, "place_order_async", None)
+            if place_async is not None:
+                order_response = await place_async(order_request)
+            else:
+                order_response = await asyncio.to_thread(self._adapter.place_order, order_request)
+            return self._order_response_to_execution_response(order_response, intent)
+        except Exception as e:
+            return self._error_response(intent, e)
+
+    async def submit_batch_async(self, intents: Sequence[ExecutionIntent]) -> List[ExecutionResponse]:
+        """일괄 동시 전송 (TPS 한도·max_concurrency 내). 응답은 입력 순서, 실패는 intent별 거부 응답."""
+        return await submit_concurrently(
+            intents,
+            self.submit_intent_async,
+            on_error=self._error_response,
+            max_concurrency=self.max_concurrency,
+        )
+
+    def submit_batch(self, intents: Sequence[ExecutionIntent]) -> List[ExecutionResponse]:
+        """submit_batch_async 동기 버전. 실행 중인 이벤트 루프 안에서 호출하면 RuntimeError."""
+        return run_sync(lambda: self.submit_batch_async(intents))
+
+    def _error_response(self, intent: ExecutionIntent, e: Exception) -> ExecutionResponse:
+        _log.error(f"Failed to submit intent: {e}")
+        return ExecutionResponse(
+            intent_id=intent.intent_id,
+            accepted=False,
+            broker=self._adapter.broker_id,
+            message=f"Error: {str(e)}",
+            timestamp=datetime.now(),
+        )
 
     def _intent_to_order_request(self, intent: ExecutionIntent) -> OrderRequest:
         """
@@ -103,12 +156,18 @@ class OrderAdapterToBrokerEngineAdapter(BrokerEngine):
             side=side,
             qty=int(intent.quantity),
             order_type=order_type,
-            limit_price=intent.price if intent.price else None,
+            limit_price=self._limit_price(intent),
             dry_run=False,  # Production에서는 실제 주문
         )
 
         return order_request
 
+    @staticmethod
+    def _limit_price(intent: ExecutionIntent):
+        """ExecutionIntent에는 가격 필드가 없으므로 metadata['limit_price'] 사용 (intent_to_order_bridge와 동일)."""
+        limit_price = intent.metadata.get("limit_price")
+        return float(limit_price) if limit_price else None
+
     def _order_response_to_execution_response(
         self, order_response, intent: ExecutionIntent
     ) -> ExecutionResponse:
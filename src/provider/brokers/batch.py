@@ -0,0 +1,59 @@
+"""
+Batch submission helpers
+
+BrokerEngine.submit_batch 구현 공용 헬퍼입니다.
+
+- submit_concurrently(): 동시 전송 (세마포어로 동시 요청 상한), 응답은 입력 순서, 예외는 intent별 거부 응답으로 변환
+- run_sync(): 동기 submit_batch에서 비동기 일괄 전송 실행 (실행 중인 루프 안에서 호출하면 RuntimeError)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Coroutine, List, Sequence, TypeVar
+
+from src.provider.models.intent import ExecutionIntent
+from src.provider.models.response import ExecutionResponse
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
+async def submit_concurrently(
+    intents: Sequence[ExecutionIntent],
+    submit: Callable[[ExecutionIntent], Awaitable[ExecutionResponse]],
+    *,
+    on_error: Callable[[ExecutionIntent, Exception], ExecutionResponse],
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> List[ExecutionResponse]:
+    """
+    intents를 동시에 submit하고 입력 순서대로 응답 반환.
+
+    한 intent의 실패(예외)는 on_error 응답으로 바뀌며 나머지 전송에 영향을 주지 않습니다.
+    속도 제한은 submit 쪽(OrderAdapter 브릿지의 TokenBucket)이 담당합니다.
+    """
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def one(intent: ExecutionIntent) -> ExecutionResponse:
+        async with sem:
+            try:
+                return await submit(intent)
+            except Exception as e:
+                return on_error(intent, e)
+
+    return list(await asyncio.gather(*(one(intent) for intent in intents)))
+
+
+def run_sync(factory: Callable[[], Coroutine[None, None, T]]) -> T:
+    """
+    코루틴을 동기 실행 (새 이벤트 루프).
+
+    현재 스레드에서 루프가 돌고 있으면 배치가 끝날 때까지 그 루프 전체가 멈추므로 RuntimeError.
+    이벤트 루프 안에서는 submit_batch_async를 await 하세요.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(factory())
+    raise RuntimeError("submit_batch() called from a running event loop; await submit_batch_async() instead")
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+from typing import List, Sequence
+
+from src.provider.brokers.batch import DEFAULT_BATCH_CONCURRENCY, run_sync, submit_concurrently
 from src.provider.interfaces.broker import BrokerEngine
 from src.provider.models.intent import ExecutionIntent
 from src.provider.models.response import ExecutionResponse
@@ -16,6 +20,7 @@ class LiveBroker(BrokerEngine):
 
     - Adapter is injected
     - Fail-safe based on consecutive failures
+      (submit_batch: 동시 전송 중에도 intent마다 세마포어 획득 후 전송 직전 guard 확인, 결과마다 기록)
     - ExecutionResponse contract is strictly preserved
     """
 
@@ -24,27 +29,72 @@ class LiveBroker(BrokerEngine):
         *,
         adapter,
         max_consecutive_failures: int = 3,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
     ) -> None:
         self._adapter = adapter
+        self.max_concurrency = max_concurrency
         self._guard = ConsecutiveFailureGuard(
             ConsecutiveFailurePolicy(max_failures=max_consecutive_failures)
         )
 
-    def submit_intent(self, intent: ExecutionIntent) -> ExecutionResponse:
-        if self._guard.blocked:
-            resp = ExecutionResponse(
-                intent_id=intent.intent_id,
-                accepted=False,
-                broker="failsafe",
-                message="blocked: consecutive failures exceeded",
-            )
-            return resp
-
-        resp = self._adapter.submit_intent(intent)
+    def _blocked_response(self, intent: ExecutionIntent) -> ExecutionResponse:
+        return ExecutionResponse(
+            intent_id=intent.intent_id,
+            accepted=False,
+            broker="failsafe",
+            message="blocked: consecutive failures exceeded",
+        )
 
+    def _record(self, resp: ExecutionResponse) -> ExecutionResponse:
         if resp.accepted:
             self._guard.on_success()
         else:
             self._guard.on_failure()
-
         return resp
+
+    def submit_intent(self, intent: ExecutionIntent) -> ExecutionResponse:
+        if self._guard.blocked:
+            return self._blocked_response(intent)
+
+        return self._record(self._adapter.submit_intent(intent))
+
+    async def submit_intent_async(self, intent: ExecutionIntent) -> ExecutionResponse:
+        if self._guard.blocked:
+            return self._blocked_response(intent)
+
+        submit_async = getattr(self._adapter, "submit_intent_async", None)
+        if submit_async is not None:
+            resp = await submit_async(intent)
+        else:
+            resp = await asyncio.to_thread(self._adapter.submit_intent, intent)
+        return self._record(resp)
+
+    def _error_response(self, intent: ExecutionIntent, e: Exception) -> ExecutionResponse:
+        return self._record(ExecutionResponse(
+            intent_id=intent.intent_id,
+            accepted=False,
+            broker="live",
+            message=f"Error: {e}",
+        ))
+
+    async def submit_batch_async(self, intents: Sequence[ExecutionIntent]) -> List[ExecutionResponse]:
+        """
+        일괄 동시 전송. 응답은 입력 순서.
+
+        속도 제한은 어댑터(OrderAdapter 브릿지 TokenBucket)가 담당합니다. guard는 intent마다
+        세마포어를 얻은 뒤 전송 직전에 다시 확인하므로, 배치 도중 차단되면 아직 전송되지 않은
+        intent는 blocked 응답을 받습니다. 단, 이미 확인을 통과해 전송 중인 요청은 취소할 수 없어
+        차단 시점 이후에도 최대 max_concurrency건까지 더 전송될 수 있습니다.
+        """
+        # submit_intent_async는 submit_concurrently의 세마포어 안에서 호출되고 첫 줄에서 guard를 확인:
+        # 세마포어 대기 중 쌓인 실패가 전송 직전에 반영됨
+        return await submit_concurrently(
+            intents,
+            self.submit_intent_async,
+            on_error=self._error_response,
+            max_concurrency=self.max_concurrency,
+        )
+
+    def submit_batch(self, intents: Sequence[ExecutionIntent]) -> List[ExecutionResponse]:
+        """submit_batch_async 동기 버전. 실행 중인 이벤트 루프 안에서 호출하면 RuntimeError."""
+        return run_sync(lambda: self.submit_batch_async(intents))
@@ -1,3 +1,4 @@
 from .token_cache import TokenCache, TokenState
+from .token_manager import SharedTokenStore, TokenManager
 
-__all__ = ["TokenCache", "TokenState"]
+__all__ = ["TokenCache", "TokenState", "SharedTokenStore", "TokenManager"]
@@ -0,0 +1,381 @@
+"""
+Broker Token Manager
+
+백그라운드 선제 토큰 갱신 + 프로세스 간 토큰 공유입니다.
+
+- SharedTokenStore: 토큰 JSON 파일 (flock 잠금 + tmp/os.replace 원자적 쓰기)
+  - 다른 프로세스가 발급한 토큰을 그대로 채택, 발급 구간은 파일 잠금으로 직렬화 → 프로세스 전체에서 1회 발급
+  - 발급 간격 제한(KIS 1분당 1회)용 마지막 발급 시각 기록
+- TokenManager: TokenCache(refresh_skew_seconds = refresh_ahead) 기반으로 만료 전에 백그라운드 태스크가 갱신
+  - current_token(): 주문 경로용, 논블로킹 (메모리 → 공유 파일 순)
+  - 발급 대기(rate limit)·재시도는 백그라운드 태스크에서만 수행 → 주문은 토큰 발급을 기다리지 않음
+
+HTTP 요청은 수행하지 않습니다. 발급은 브로커 클라이언트가 넘겨주는 issuer 콜백이 담당합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Mapping, Optional
+
+from src.provider.clients.auth.token_cache import TokenCache, TokenState
+from src.shared.timezone_utils import KST, now_kst
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+
+_log = logging.getLogger(__name__)
+
+# issuer 반환: TokenState (expires_at은 timezone-aware)
+TokenIssuer = Callable[[], Awaitable[TokenState]]
+
+
+class SharedTokenStore:
+    """
+    프로세스 간 공유 토큰 파일.
+
+    파일 형식: {"token", "token_type", "expires_at"(epoch), **extra}
+    extra 항목(예: base_url)이 일치하지 않는 파일은 무시합니다.
+    """
+
+    def __init__(self, path: Path | str, *, extra: Optional[Mapping[str, Any]] = None) -> None:
+        self.path = Path(path)
+        self.extra: Dict[str, Any] = dict(extra or {})
+        self._lock_path = self.path.with_suffix(".lock")
+        self._issue_path = self.path.with_suffix(".last_request")
+
+    def load(self) -> Optional[TokenState]:
+        """저장된 토큰 (없거나 손상·불일치 시 None). 만료 여부는 호출자가 판단."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if any(data.get(k) != v for k, v in self.extra.items()):
+                return None
+            token = data.get("token")
+            expires_at = data.get("expires_at")
+            if not token or expires_at is None:
+                return None
+            return TokenState(
+                access_token=token,
+                token_type=data.get("token_type") or "Bearer",
+                expires_at=datetime.fromtimestamp(float(expires_at), tz=KST),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            _log.debug("Token store read failed (%s): %s", self.path, e)
+            return None
+
+    def save(self, state: TokenState) -> None:
+        """원자적 저장 (tmp + os.replace) → 읽는 쪽은 잠금 없이도 부분 기록을 보지 않음."""
+        data = {
+            "token": state.access_token,
+            "token_type": state.token_type,
+            "expires_at": state.expires_at.timestamp(),
+            **self.extra,
+        }
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            _log.debug("Token store write failed (%s): %s", self.path, e)
+
+    def issue_wait(self, min_interval: float) -> float:
+        """발급 간격 제한: 마지막 발급 기준 대기 시간(초). 발급 예정 시각을 기록."""
+        wait = 0.0
+        try:
+            last = float(self._issue_path.read_text(encoding="utf-8").strip())
+            elapsed = time.time() - last
+            if elapsed < min_interval:
+                wait = min_interval - elapsed
+        except (OSError, ValueError):
+            pass
+        try:
+            self._issue_path.write_text(str(time.time() + wait), encoding="utf-8")
+        except OSError:
+            pass
+        return wait
+
+    @asynccontextmanager
+    async def issue_lock(self, poll_interval: float = 0.05) -> AsyncIterator[None]:
+        """
+        발급 구간 프로세스 간 배타 잠금.
+
+        논블로킹 flock을 폴링하므로 대기 중 취소되어도 잠금이 남지 않습니다.
+        """
+        if fcntl is None:
+            yield
+            return
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(poll_interval)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+class TokenManager:
+    """
+    백그라운드 선제 토큰 갱신기.
+
+    사용:
+        manager = client.create_token_manager()
+        await manager.start()        # 최초 토큰 확보 후 반환
+        ...                          # 주문 경로는 manager.current_token()만 사용
+        await manager.stop()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        issuer: TokenIssuer,
+        *,
+        store: Optional[SharedTokenStore] = None,
+        refresh_ahead: int = 600,
+        expiry_margin: int = 60,
+        min_issue_interval: float = 0.0,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+        max_check_interval: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            name: 로그/메트릭용 이름 (예: "kis")
+            issuer: 토큰 발급 코루틴 함수 (브로커 클라이언트 제공)
+            store: 프로세스 간 공유 파일 (None이면 프로세스 내 메모리만)
+            refresh_ahead: 만료 몇 초 전부터 갱신할지 (TokenCache.refresh_skew_seconds)
+            expiry_margin: 만료 몇 초 전까지 current_token()이 토큰을 반환할지
+            min_issue_interval: 발급 최소 간격 (초, KIS 60)
+            retry_delay: 발급 실패 시 초기 재시도 간격 (지수 백오프)
+            max_retry_delay: 재시도 간격 상한
+            max_check_interval: 공유 파일 재확인 주기 상한 (다른 프로세스의 갱신 채택)
+        """
+        if refresh_ahead <= expiry_margin:
+            raise ValueError("refresh_ahead must be greater than expiry_margin")
+        self.name = name
+        self.cache = TokenCache(refresh_skew_seconds=refresh_ahead)
+        self.store = store
+        self.expiry_margin = expiry_margin
+        self.min_issue_interval = min_issue_interval
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_check_interval = max_check_interval
+        self._issuer = issuer
+
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._stopping = False
+
+        self.issued = 0
+        self.adopted = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # 주문 경로 (논블로킹)
+    # ------------------------------------------------------------------
+
+    def _usable(self, state: Optional[TokenState]) -> bool:
+        return state is not None and not state.will_expire_within(self.expiry_margin)
+
+    def current_token(self) -> Optional[str]:
+        """사용 가능한 토큰 (없으면 None, 발급하지 않음). 메모리 → 공유 파일 순."""
+        state = self.cache.get_state()
+        if self._usable(state):
+            return state.access_token
+        if self._adopt_from_store():
+            return self.cache.get_state().access_token
+        return None
+
+    def request_refresh(self) -> None:
+        """백그라운드 태스크에 즉시 갱신 요청 (임의 스레드에서 호출 가능)."""
+        if self._loop is None or self._wakeup is None or self._loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def _adopt_from_store(self) -> bool:
+        """공유 파일의 토큰이 메모리보다 새롭고 사용 가능하면 채택."""
+        if self.store is None:
+            return False
+        stored = self.store.load()
+        if not self._usable(stored):
+            return False
+        current = self.cache.get_state()
+        if current is not None and stored.expires_at <= current.expires_at:
+            return False
+        self.cache.update(
+            access_token=stored.access_token,
+            token_type=stored.token_type,
+            expires_at=stored.expires_at,
+        )
+        self.adopted += 1
+        _log.debug("%s token adopted from shared store", self.name)
+        return True
+
+    async def refresh(self, force: bool = False) -> TokenState:
+        """
+        토큰 갱신 (프로세스 내·간 1회 발급).
+
+        잠금 획득 후 공유 파일을 다시 확인해, 다른 프로세스가 이미 갱신했으면 발급하지 않습니다.
+        """
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if not force and not self.cache.needs_refresh():
+                return self.cache.get_state()
+            if self.store is None:
+                return await self._issue()
+            async with self.store.issue_lock():
+                self._adopt_from_store()
+                if not force and not self.cache.needs_refresh():
+                    return self.cache.get_state()
+                wait = self.store.issue_wait(self.min_issue_interval)
+                if wait > 0:
+                    _log.debug("%s token issue rate limit: waiting %.1fs", self.name, wait)
+                    await asyncio.sleep(wait)
+                state = await self._issue()
+                self.store.save(state)
+                return state
+
+    async def _issue(self) -> TokenState:
+        state = await self._issuer()
+        self.cache.update(
+            access_token=state.access_token,
+            token_type=state.token_type,
+            expires_at=state.expires_at,
+            scope=state.scope,
+        )
+        self.issued += 1
+        self.last_error = None
+        _log.info("%s access token refreshed (expires_at=%s)", self.name, state.expires_at.isoformat())
+        return state
+
+    def _next_check_delay(self) -> float:
+        state = self.cache.get_state()
+        if state is None:
+            return 0.0
+        until_refresh = (state.expires_at - now_kst()).total_seconds() - self.cache.refresh_skew_seconds
+        # 수명이 refresh_ahead보다 짧은 토큰이어도 재발급 루프가 돌지 않도록 하한 적용
+        return max(self.retry_delay, min(until_refresh, self.max_check_interval))
+
+    # ------------------------------------------------------------------
+    # 백그라운드 태스크
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self, wait_ready: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        백그라운드 갱신 태스크 시작.
+
+        Args:
+            wait_ready: 최초 토큰 확보까지 대기
+            timeout: wait_ready 대기 상한 (초)
+
+        Returns:
+            bool: 사용 가능한 토큰 확보 여부
+        """
+        if not self.running:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._ready = asyncio.Event()
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name=f"token-refresher-{self.name}")
+        if wait_ready:
+            return await self.wait_ready(timeout)
+        return self.current_token() is not None
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        if self.current_token() is not None:
+            return True
+        if self._ready is None:
+            return False
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.current_token() is not None
+
+    async def stop(self) -> None:
+        self._stopping = True
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        retry = self.retry_delay
+        while not self._stopping:
+            self._adopt_from_store()
+            try:
+                if self.cache.needs_refresh():
+                    await self.refresh()
+                retry = self.retry_delay
+                delay = self._next_check_delay()
+                self._ready.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                self.last_error = str(e)
+                _log.warning("%s token refresh failed (retry in %.1fs): %s", self.name, retry, e)
+                delay, retry = retry, min(retry * 2, self.max_retry_delay)
+                if self.current_token() is not None:
+                    self._ready.set()
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        state = self.cache.get_state()
+        return {
+            "issued": self.issued,
+            "adopted": self.adopted,
+            "failures": self.failures,
+            "expires_in": (state.expires_at - now_kst()).total_seconds() if state else None,
+            "last_error": self.last_error,
+        }
@@ -19,7 +19,7 @@ from src.provider.clients.broker.adapters.registry import (
 )
 from src.provider.clients.broker.adapters.kis_adapter import KISOrderAdapter
 from src.provider.clients.broker.adapters.kiwoom_adapter import KiwoomOrderAdapter
-from src.provider.clients.broker.adapters.protocols import OrderClientProtocol
+from src.provider.clients.broker.adapters.protocols import AsyncOrderClientProtocol, OrderClientProtocol
 from src.provider.clients.broker.config import BrokerConfig
 from src.provider.clients.broker.order_base import OrderAdapter
 
@@ -34,6 +34,7 @@ def get_broker_for_config(config: BrokerConfig) -> OrderAdapter:
 
 
 __all__ = [
+    "AsyncOrderClientProtocol",
     "BaseBrokerAdapter",
     "BrokerConfig",
     "KISOrderAdapter",
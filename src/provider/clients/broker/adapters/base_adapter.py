@@ -5,10 +5,13 @@ Arch: docs/arch/08_Broker_Integration_Architecture.md §2.3, §3, §10.1.
 - 표준화된 Broker Interface: OrderAdapter 계약 + broker_id.
 - 모든 브로커 어댑터는 BaseBrokerAdapter를 상속하여 동일 계약 준수.
 - dry_run / client 미설정 시 공통 스텁 응답 헬퍼 제공.
+- 비동기 경로(*_async): 기본은 동기 메서드를 워커 스레드에서 실행 (이벤트 루프 비블로킹),
+  비동기 client를 가진 어댑터는 재정의하여 직접 await.
 """
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from src.provider.clients.broker.order_base import OrderAdapter, OrderQuery
@@ -74,3 +77,12 @@ class BaseBrokerAdapter(OrderAdapter, ABC):
     @abstractmethod
     def cancel_order(self, query: OrderQuery) -> OrderResponse:
         ...
+
+    async def place_order_async(self, req: OrderRequest) -> OrderResponse:
+        return await asyncio.to_thread(self.place_order, req)
+
+    async def get_order_async(self, query: OrderQuery) -> OrderResponse:
+        return await asyncio.to_thread(self.get_order, query)
+
+    async def cancel_order_async(self, query: OrderQuery) -> OrderResponse:
+        return await asyncio.to_thread(self.cancel_order, query)
@@ -7,18 +7,30 @@ Protocol-Driven: KISClient 주입으로 실제 API 호출부 분리 → 테스
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import logging
+from typing import Dict, List, Optional, Sequence
 
 from src.provider.clients.broker.adapters.base_adapter import BaseBrokerAdapter
 from src.provider.clients.broker.adapters.protocols import OrderClientProtocol
 from src.provider.clients.broker.kis.payload_mapping import (
+    build_kis_daily_ccld_params,
     build_kis_order_payload,
+    kis_daily_ccld_next,
+    kis_daily_orders_to_responses,
+    order_id_key,
     parse_kis_place_response,
     raw_to_order_response,
 )
 from src.provider.clients.broker.order_base import OrderQuery
 from src.provider.models.order_request import OrderRequest
 from src.provider.models.order_response import OrderResponse, OrderStatus
+from src.shared.timezone_utils import now_kst
+
+_log = logging.getLogger(__name__)
+
+# get_orders_async 연속 조회 최대 페이지 수 (페이지당 100건)
+MAX_DAILY_ORDER_PAGES = 10
 
 
 class KISOrderAdapter(BaseBrokerAdapter):
@@ -56,13 +68,7 @@ class KISOrderAdapter(BaseBrokerAdapter):
     def name(self) -> str:
         return "KIS"
 
-    def place_order(self, req: OrderRequest) -> OrderResponse:
-        """주문 전송"""
-        if req.dry_run:
-            return self._dry_run_response("KIS-VIRTUAL")
-        if self._client is None:
-            return self._stub_rejected()
-
+    def _build_payload(self, req: OrderRequest) -> dict:
         # OrderRequest → KIS Payload 변환
         payload = build_kis_order_payload(
             req,
@@ -72,24 +78,13 @@ class KISOrderAdapter(BaseBrokerAdapter):
         )
 
         # DEBUG: Log payload
-        import logging
-        _log = logging.getLogger(__name__)
         _log.info(f"KIS Order Payload: {payload}")
+        return payload
 
-        # KIS API 호출
-        resp = self._client.place_order(payload)
-
+    @staticmethod
+    def _place_response(resp: dict) -> OrderResponse:
         # 응답 파싱
         status, broker_order_id, message = parse_kis_place_response(resp)
-
-        if status == OrderStatus.REJECTED:
-            return OrderResponse(
-                status=status,
-                broker_order_id=broker_order_id,
-                message=message,
-                raw=resp,
-            )
-
         return OrderResponse(
             status=status,
             broker_order_id=broker_order_id,
@@ -97,19 +92,8 @@ class KISOrderAdapter(BaseBrokerAdapter):
             raw=resp,
         )
 
-    def get_order(self, query: OrderQuery) -> OrderResponse:
-        """주문 조회"""
-        if self._client is None:
-            return self._stub_unknown(query)
-        resp = self._client.get_order({"order_id": query.broker_order_id})
-        return raw_to_order_response(resp, default_broker_order_id=query.broker_order_id)
-
-    def cancel_order(self, query: OrderQuery) -> OrderResponse:
-        """주문 취소"""
-        if self._client is None:
-            return self._stub_unknown(query)
-        resp = self._client.cancel_order({"order_id": query.broker_order_id})
-
+    @staticmethod
+    def _cancel_response(query: OrderQuery, resp: dict) -> OrderResponse:
         # 응답 코드 확인
         rt_cd = resp.get("rt_cd", -1)
         if isinstance(rt_cd, str) and rt_cd.isdigit():
@@ -123,3 +107,87 @@ class KISOrderAdapter(BaseBrokerAdapter):
             message=resp.get("msg1") or resp.get("message"),
             raw=resp,
         )
+
+    def place_order(self, req: OrderRequest) -> OrderResponse:
+        """주문 전송"""
+        if req.dry_run:
+            return self._dry_run_response("KIS-VIRTUAL")
+        if self._client is None:
+            return self._stub_rejected()
+
+        # KIS API 호출
+        resp = self._client.place_order(self._build_payload(req))
+        return self._place_response(resp)
+
+    async def place_order_async(self, req: OrderRequest) -> OrderResponse:
+        """주문 전송 (비동기 client면 직접 await, 아니면 워커 스레드)"""
+        if req.dry_run:
+            return self._dry_run_response("KIS-VIRTUAL")
+        if self._client is None:
+            return self._stub_rejected()
+        place_async = getattr(self._client, "place_order_async", None)
+        if place_async is None:
+            return await super().place_order_async(req)
+        return self._place_response(await place_async(self._build_payload(req)))
+
+    def get_order(self, query: OrderQuery) -> OrderResponse:
+        """주문 조회"""
+        if self._client is None:
+            return self._stub_unknown(query)
+        resp = self._client.get_order({"order_id": query.broker_order_id})
+        return raw_to_order_response(resp, default_broker_order_id=query.broker_order_id)
+
+    async def get_order_async(self, query: OrderQuery) -> OrderResponse:
+        """주문 조회 (비동기)"""
+        get_async = getattr(self._client, "get_order_async", None)
+        if get_async is None:
+            return await super().get_order_async(query)
+        resp = await get_async({"order_id": query.broker_order_id})
+        return raw_to_order_response(resp, default_broker_order_id=query.broker_order_id)
+
+    async def get_orders_async(self, queries: Sequence[OrderQuery]) -> List[Optional[OrderResponse]]:
+        """
+        주문 일괄 조회 (OrderFillPoller용).
+
+        당일 주문체결 목록(inquire-daily-ccld)을 1회 조회해 broker_order_id로 매칭합니다.
+        조회 대상이 모두 나오거나 연속 조회 키가 없을 때까지만 다음 페이지를 읽습니다.
+        목록에 없는 주문은 None. client가 목록 조회를 지원하지 않으면 주문별 조회.
+        """
+        if self._client is None:
+            return [self._stub_unknown(q) for q in queries]
+        list_async = getattr(self._client, "get_daily_orders_async", None)
+        list_sync = getattr(self._client, "get_daily_orders", None)
+        if list_async is None and list_sync is None:
+            return list(await asyncio.gather(*(self.get_order_async(q) for q in queries)))
+
+        wanted = {order_id_key(q.broker_order_id) for q in queries if q.broker_order_id}
+        found: Dict[str, OrderResponse] = {}
+        today = now_kst().strftime("%Y%m%d")
+        ctx = ("", "")
+        for _ in range(MAX_DAILY_ORDER_PAGES):
+            params = build_kis_daily_ccld_params(
+                cano=self._acnt_no, acnt_prdt_cd=self._acnt_prdt_cd, date=today, ctx_fk=ctx[0], ctx_nk=ctx[1]
+            )
+            raw = await list_async(params) if list_async is not None else await asyncio.to_thread(list_sync, params)
+            page = kis_daily_orders_to_responses(raw)
+            found.update(page)
+            nxt = kis_daily_ccld_next(raw)
+            if not page or wanted <= found.keys() or nxt is None or nxt == ctx:
+                break
+            ctx = nxt
+        return [found.get(order_id_key(q.broker_order_id)) if q.broker_order_id else None for q in queries]
+
+    def cancel_order(self, query: OrderQuery) -> OrderResponse:
+        """주문 취소"""
+        if self._client is None:
+            return self._stub_unknown(query)
+        resp = self._client.cancel_order({"order_id": query.broker_order_id})
+        return self._cancel_response(query, resp)
+
+    async def cancel_order_async(self, query: OrderQuery) -> OrderResponse:
+        """주문 취소 (비동기)"""
+        cancel_async = getattr(self._client, "cancel_order_async", None)
+        if cancel_async is None:
+            return await super().cancel_order_async(query)
+        resp = await cancel_async({"order_id": query.broker_order_id})
+        return self._cancel_response(query, resp)
@@ -7,18 +7,23 @@ Protocol-Driven: OrderClientProtocol 주입으로 실제 API 호출부 분리 
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+from typing import Any, List, Optional, Sequence
 
 from src.provider.clients.broker.adapters.base_adapter import BaseBrokerAdapter
 from src.provider.clients.broker.adapters.protocols import OrderClientProtocol
 from src.provider.clients.broker.kiwoom.payload_mapping import (
+    build_kiwoom_order_list_body,
     build_kiwoom_order_payload,
+    kiwoom_order_list_to_responses,
+    order_id_key,
     parse_kiwoom_place_response,
     raw_to_order_response,
 )
 from src.provider.clients.broker.order_base import OrderQuery
 from src.provider.models.order_request import OrderRequest
 from src.provider.models.order_response import OrderResponse, OrderStatus
+from src.shared.timezone_utils import now_kst
 
 
 class KiwoomOrderAdapter(BaseBrokerAdapter):
@@ -48,6 +53,29 @@ class KiwoomOrderAdapter(BaseBrokerAdapter):
     def name(self) -> str:
         return "Kiwoom"
 
+    @staticmethod
+    def _place_response(resp: dict) -> OrderResponse:
+        status, broker_order_id, message = parse_kiwoom_place_response(resp)
+        return OrderResponse(
+            status=status,
+            broker_order_id=broker_order_id,
+            message=message,
+            raw=resp,
+        )
+
+    @staticmethod
+    def _cancel_response(query: OrderQuery, resp: dict) -> OrderResponse:
+        return_code = resp.get("return_code", -1)
+        if isinstance(return_code, str) and return_code.isdigit():
+            return_code = int(return_code)
+        ok = return_code == 0
+        return OrderResponse(
+            status=OrderStatus.CANCELED if ok else OrderStatus.UNKNOWN,
+            broker_order_id=query.broker_order_id,
+            message=resp.get("return_msg") or resp.get("message"),
+            raw=resp,
+        )
+
     def place_order(self, req: OrderRequest) -> OrderResponse:
         if req.dry_run:
             return self._dry_run_response("KIWOOM-VIRTUAL")
@@ -56,21 +84,20 @@ class KiwoomOrderAdapter(BaseBrokerAdapter):
         payload = build_kiwoom_order_payload(
             req, acnt_no=self._acnt_no, market=self._market
         )
-        resp = self._client.place_order(payload)
-        status, broker_order_id, message = parse_kiwoom_place_response(resp)
-        if status == OrderStatus.REJECTED:
-            return OrderResponse(
-                status=status,
-                broker_order_id=broker_order_id,
-                message=message,
-                raw=resp,
-            )
-        return OrderResponse(
-            status=status,
-            broker_order_id=broker_order_id,
-            message=message,
-            raw=resp,
+        return self._place_response(self._client.place_order(payload))
+
+    async def place_order_async(self, req: OrderRequest) -> OrderResponse:
+        if req.dry_run:
+            return self._dry_run_response("KIWOOM-VIRTUAL")
+        if self._client is None:
+            return self._stub_rejected()
+        place_async = getattr(self._client, "place_order_async", None)
+        if place_async is None:
+            return await super().place_order_async(req)
+        payload = build_kiwoom_order_payload(
+            req, acnt_no=self._acnt_no, market=self._market
         )
+        return self._place_response(await place_async(payload))
 
     def get_order(self, query: OrderQuery) -> OrderResponse:
         if self._client is None:
@@ -78,17 +105,39 @@ class KiwoomOrderAdapter(BaseBrokerAdapter):
         resp = self._client.get_order({"order_id": query.broker_order_id})
         return raw_to_order_response(resp, default_broker_order_id=query.broker_order_id)
 
+    async def get_order_async(self, query: OrderQuery) -> OrderResponse:
+        get_async = getattr(self._client, "get_order_async", None)
+        if get_async is None:
+            return await super().get_order_async(query)
+        resp = await get_async({"order_id": query.broker_order_id})
+        return raw_to_order_response(resp, default_broker_order_id=query.broker_order_id)
+
+    async def get_orders_async(self, queries: Sequence[OrderQuery]) -> List[Optional[OrderResponse]]:
+        """
+        주문 일괄 조회 (OrderFillPoller용): 당일 주문체결 내역(kt00007) 1회 조회 후 broker_order_id로 매칭.
+        목록에 없는 주문은 None. client가 목록 조회를 지원하지 않으면 주문별 조회.
+        """
+        if self._client is None:
+            return [self._stub_unknown(q) for q in queries]
+        list_async = getattr(self._client, "get_daily_orders_async", None)
+        list_sync = getattr(self._client, "get_daily_orders", None)
+        if list_async is None and list_sync is None:
+            return list(await asyncio.gather(*(self.get_order_async(q) for q in queries)))
+
+        body = build_kiwoom_order_list_body(date=now_kst().strftime("%Y%m%d"))
+        raw = await list_async(body) if list_async is not None else await asyncio.to_thread(list_sync, body)
+        found = kiwoom_order_list_to_responses(raw)
+        return [found.get(order_id_key(q.broker_order_id)) if q.broker_order_id else None for q in queries]
+
     def cancel_order(self, query: OrderQuery) -> OrderResponse:
         if self._client is None:
             return self._stub_unknown(query)
         resp = self._client.cancel_order({"order_id": query.broker_order_id})
-        return_code = resp.get("return_code", -1)
-        if isinstance(return_code, str) and return_code.isdigit():
-            return_code = int(return_code)
-        ok = return_code == 0
-        return OrderResponse(
-            status=OrderStatus.CANCELED if ok else OrderStatus.UNKNOWN,
-            broker_order_id=query.broker_order_id,
-            message=resp.get("return_msg") or resp.get("message"),
-            raw=resp,
-        )
+        return self._cancel_response(query, resp)
+
+    async def cancel_order_async(self, query: OrderQuery) -> OrderResponse:
+        cancel_async = getattr(self._client, "cancel_order_async", None)
+        if cancel_async is None:
+            return await super().cancel_order_async(query)
+        resp = await cancel_async({"order_id": query.broker_order_id})
+        return self._cancel_response(query, resp)
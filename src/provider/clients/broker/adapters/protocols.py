@@ -29,3 +29,21 @@ class OrderClientProtocol(Protocol):
     def cancel_order(self, params: dict[str, Any]) -> dict[str, Any]:
         """주문 취소. params: order_id. raw dict 반환."""
         ...
+
+
+class AsyncOrderClientProtocol(OrderClientProtocol, Protocol):
+    """
+    비동기 주문 API 계약 (KISClient/KiwoomClient의 *_async 메서드).
+
+    어댑터는 client가 이 메서드를 제공하면 이벤트 루프에서 직접 await하고,
+    없으면 동기 메서드를 워커 스레드에서 호출합니다.
+    """
+
+    async def place_order_async(self, payload: dict[str, Any]) -> dict[str, Any]:
+        ...
+
+    async def get_order_async(self, params: dict[str, Any]) -> dict[str, Any]:
+        ...
+
+    async def cancel_order_async(self, params: dict[str, Any]) -> dict[str, Any]:
+        ...
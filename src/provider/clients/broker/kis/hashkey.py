@@ -0,0 +1,121 @@
+"""
+KIS Hashkey Strategy
+
+KIS POST 요청 hashkey 발급 전략입니다.
+
+- remote: /uapi/hashkey 발급 (기존 동작). 발급 결과는 직렬화된 body 바이트 기준 LRU 메모이즈
+  → 동일 payload 재전송·취소/정정 템플릿은 왕복 없이 재사용, prefetch로 사전 발급 가능
+- omit: hashkey 헤더 생략. KIS open-trading-api 기준 주문 API의 hashkey는 선택 항목이므로
+  계정/환경이 허용하면 주문당 왕복을 완전히 제거 (hashkey 알고리즘은 비공개라 로컬 계산은 불가)
+
+hashkey는 토큰과 무관(appkey/appsecret만 사용)하므로 비동기 경로에서는 토큰 확인과 병렬로 발급합니다
+(KISClient.pipeline_hashkey).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+
+_log = logging.getLogger(__name__)
+
+HASHKEY_REMOTE = "remote"
+HASHKEY_OMIT = "omit"
+HASHKEY_MODES = (HASHKEY_REMOTE, HASHKEY_OMIT)
+
+
+def hashkey_mode_from_env(default: str = HASHKEY_REMOTE) -> str:
+    """KIS_HASHKEY_MODE 환경 변수 (remote | omit)."""
+    mode = (os.getenv("KIS_HASHKEY_MODE") or default).strip().lower()
+    if mode not in HASHKEY_MODES:
+        _log.warning(f"Unknown KIS_HASHKEY_MODE={mode!r}; using {default}")
+        return default
+    return mode
+
+
+class HashkeyProvider:
+    """
+    hashkey 발급 + 메모이즈.
+
+    키는 전송할 body 문자열 그대로(KISClient가 sort_keys=True로 정규화)이며,
+    hashkey는 body와 appkey에 대해 결정적이므로 만료 없이 LRU로만 제거합니다.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], str],
+        fetch_async: Optional[Callable[[str], Awaitable[str]]] = None,
+        *,
+        mode: str = HASHKEY_REMOTE,
+        cache_size: int = 1024,
+    ) -> None:
+        if mode not in HASHKEY_MODES:
+            raise ValueError(f"Unknown hashkey mode: {mode}")
+        self.mode = mode
+        self.cache_size = cache_size
+        self._fetch = fetch
+        self._fetch_async = fetch_async
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.omitted = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != HASHKEY_OMIT
+
+    def _lookup(self, body_json: str) -> Optional[str]:
+        hashkey = self._cache.get(body_json)
+        if hashkey is not None:
+            self._cache.move_to_end(body_json)
+            self.hits += 1
+        return hashkey
+
+    def _store(self, body_json: str, hashkey: str) -> str:
+        if self.cache_size > 0:
+            self._cache[body_json] = hashkey
+            self._cache.move_to_end(body_json)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return hashkey
+
+    def get(self, body_json: str) -> Optional[str]:
+        """hashkey 반환 (omit 모드면 None)."""
+        if not self.enabled:
+            self.omitted += 1
+            return None
+        cached = self._lookup(body_json)
+        if cached is not None:
+            return cached
+        self.misses += 1
+        return self._store(body_json, self._fetch(body_json))
+
+    async def get_async(self, body_json: str) -> Optional[str]:
+        """get 비동기 버전."""
+        if not self.enabled:
+            self.omitted += 1
+            return None
+        cached = self._lookup(body_json)
+        if cached is not None:
+            return cached
+        if self._fetch_async is None:
+            raise RuntimeError("async hashkey fetch not configured")
+        self.misses += 1
+        return self._store(body_json, await self._fetch_async(body_json))
+
+    def is_cached(self, body_json: str) -> bool:
+        return body_json in self._cache
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "omitted": self.omitted,
+            "cached": len(self._cache),
+        }
@@ -6,13 +6,25 @@ KIS REST API Client
 
 KIS API 특징:
 - OAuth2.0 토큰 인증 (1분당 1회 발급 제한: GitHub open-trading-api README)
-- 토큰은 파일 캐시로 프로세스 간 재사용 (공식 kis_auth 패턴)
+- 토큰은 파일 캐시로 프로세스 간 재사용 (공식 kis_auth 패턴, auth.SharedTokenStore)
+- create_token_manager(): 백그라운드 선제 갱신 → 주문 경로에서 토큰 발급/대기 없음
 - Hashkey 생성 (POST 요청 시 필수)
 - tr_id 헤더 (거래 ID)
+
+전송:
+- 동기 경로: keep-alive requests.Session (요청마다 TCP/TLS 핸드셰이크 방지)
+- 비동기 경로(*_async): AsyncBrokerTransport (aiohttp 커넥션 풀, 이벤트 루프 비블로킹)
+- 요청 구성(_build_*)·응답 처리(_handle_*)는 두 경로가 공유
+
+Hashkey: kis/hashkey.HashkeyProvider (remote 발급 + body 기준 메모이즈 | omit),
+비동기 경로는 토큰 확인과 hashkey 발급을 병렬 수행 (pipeline_hashkey).
+요청 단계별 지연(prepare=토큰+hashkey, queue=속도 제한 대기, http, total)은 latency_snapshot()/get_metrics()로 노출.
+속도 제한: rate_limiter(RateLimitScheduler) 주입 시 "kis" family(앱키 TPS) — 주문(POST)이 조회보다 우선.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import json
@@ -20,12 +32,26 @@ import logging
 import os
 import re
 import time
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
 
+from src.provider.clients.auth.token_cache import TokenState
+from src.provider.clients.auth.token_manager import SharedTokenStore, TokenManager
+from src.provider.clients.broker.transport import (
+    AsyncBrokerTransport,
+    TransportError,
+    create_session,
+)
+from src.provider.clients.broker.kis.hashkey import HashkeyProvider, hashkey_mode_from_env
+from src.monitoring.latency_histogram import LatencyHistogram
+from src.provider.rate_limit import Priority, RateLimitScheduler, order_tps_for
+from src.shared.timezone_utils import KST
+
 
 _log = logging.getLogger(__name__)
 
@@ -62,6 +88,8 @@ class KISClient:
     TR_ID_BUY_REAL = "TTTC0012U"  # 실전투자 매수
     TR_ID_SELL_REAL = "TTTC0011U"  # 실전투자 매도
 
+    RATE_LIMIT_FAMILY = "kis"
+
     def __init__(
         self,
         app_key: str,
@@ -71,6 +99,13 @@ class KISClient:
         acnt_prdt_cd: str = "01",
         trading_mode: str = "VTS",
         timeout: int = 10,
+        *,
+        session: Optional[requests.Session] = None,
+        transport: Optional[AsyncBrokerTransport] = None,
+        hashkey_mode: Optional[str] = None,
+        hashkey_cache_size: int = 1024,
+        pipeline_hashkey: bool = True,
+        rate_limiter: Optional[RateLimitScheduler] = None,
     ):
         """
         KISClient 초기화
@@ -83,6 +118,12 @@ class KISClient:
             acnt_prdt_cd: 계좌상품코드 (기본: "01")
             trading_mode: "VTS" 또는 "REAL"
             timeout: HTTP 타임아웃 (초)
+            session: 동기 경로 requests.Session (미지정 시 전용 keep-alive 세션 생성)
+            transport: 비동기 경로 전송 계층 (미지정 시 첫 비동기 호출에서 생성, 브로커 간 공유 가능)
+            hashkey_mode: "remote" | "omit" (미지정 시 KIS_HASHKEY_MODE, 기본 remote)
+            hashkey_cache_size: hashkey 메모이즈 LRU 크기 (0이면 비활성)
+            pipeline_hashkey: 비동기 경로에서 토큰 확인과 hashkey 발급 병렬 수행
+            rate_limiter: 요청 속도 제한 스케줄러 ("kis" family 미등록 시 trading_mode TPS로 등록)
         """
         self.app_key = app_key
         self.app_secret = app_secret
@@ -90,52 +131,127 @@ class KISClient:
         self.account_no = account_no
         self.acnt_prdt_cd = acnt_prdt_cd
         self.trading_mode = trading_mode.upper()
+        self.pipeline_hashkey = pipeline_hashkey
+        self.hashkey = HashkeyProvider(
+            self._get_hashkey,
+            self._get_hashkey_async,
+            mode=hashkey_mode or hashkey_mode_from_env(),
+            cache_size=hashkey_cache_size,
+        )
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self.rate_limiter = rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.ensure(self.RATE_LIMIT_FAMILY, order_tps_for("kis", self.trading_mode))
         self.timeout = timeout
 
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[float] = None
 
+        self._session = session or create_session()
+        self._transport = transport
+        self._owns_transport = transport is None
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._token_store = SharedTokenStore(
+            _kis_token_cache_path(self.base_url), extra={"base_url": self.base_url}
+        )
+        self.token_manager: Optional[TokenManager] = None
+
         _log.info(
             f"KISClient initialized (mode={self.trading_mode}, "
-            f"base_url={self.base_url}, account={self.account_no})"
+            f"base_url={self.base_url}, account={self.account_no}, hashkey={self.hashkey.mode})"
         )
 
     def _read_token_cache(self) -> Optional[str]:
         """파일 캐시에서 유효한 토큰 읽기 (만료 1분 전까지 재사용)."""
-        path = _kis_token_cache_path(self.base_url)
-        if not path.exists():
+        state = self._token_store.load()
+        if state is None:
             return None
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if data.get("base_url") != self.base_url:
-                return None
-            expires_at = data.get("expires_at")
-            if expires_at is None or time.time() >= expires_at - 60:
-                return None
-            token = data.get("token")
-            if not token:
-                return None
-            self._access_token = token
-            self._token_expires_at = float(expires_at)
-            _log.debug("KIS token loaded from cache")
-            return token
-        except (OSError, json.JSONDecodeError, TypeError) as e:
-            _log.debug("KIS token cache read failed: %s", e)
+        expires_at = state.expires_at.timestamp()
+        if time.time() >= expires_at - 60:
             return None
+        self._access_token = state.access_token
+        self._token_expires_at = expires_at
+        _log.debug("KIS token loaded from cache")
+        return state.access_token
 
     def _write_token_cache(self, token: str, expires_at: float) -> None:
         """발급받은 토큰을 파일 캐시에 저장 (프로세스 간 재사용)."""
-        path = _kis_token_cache_path(self.base_url)
-        try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(
-                    {"token": token, "expires_at": expires_at, "base_url": self.base_url},
-                    f,
-                )
-        except OSError as e:
-            _log.debug("KIS token cache write failed: %s", e)
+        self._token_store.save(
+            TokenState(
+                access_token=token,
+                token_type="Bearer",
+                expires_at=datetime.fromtimestamp(expires_at, tz=KST),
+            )
+        )
+
+    @property
+    def transport(self) -> AsyncBrokerTransport:
+        """비동기 경로 전송 계층 (지연 생성)."""
+        if self._transport is None:
+            self._transport = AsyncBrokerTransport(timeout=self.timeout)
+        return self._transport
+
+    async def aclose(self) -> None:
+        """비동기 전송 계층 종료 (직접 생성한 경우만)."""
+        if self._owns_transport and self._transport is not None:
+            await self._transport.close()
+
+    def _cached_token(self) -> Optional[str]:
+        """메모리·파일 캐시의 유효 토큰 (KIS 1분당 1회 발급 제한 준수)."""
+        # 0) 백그라운드 갱신기가 있으면 그 토큰 우선 (공유 파일 포함)
+        if self.token_manager is not None:
+            token = self.token_manager.current_token()
+            if token:
+                return token
+
+        # 1) 메모리 캐시 유효하면 재사용
+        if self._access_token and self._token_expires_at:
+            if time.time() < self._token_expires_at - 60:
+                return self._access_token
+
+        # 2) 파일 캐시에서 유효한 토큰 있으면 재사용 (다른 프로세스가 발급한 토큰)
+        return self._read_token_cache()
+
+    def _token_not_ready(self) -> KISAuthError:
+        """갱신기 사용 시 토큰이 없으면 주문을 막지 않고 즉시 실패 + 갱신 요청."""
+        self.token_manager.request_refresh()
+        return KISAuthError("KIS access token not ready (background refresh pending)")
+
+    def _token_issue_wait(self) -> float:
+        """1분당 1회 제한: 마지막 발급 시각 파일 기준 대기 시간(초). 발급 시각을 지금으로 기록."""
+        wait = self._token_store.issue_wait(_KIS_TOKEN_MIN_INTERVAL_SEC)
+        if wait > 0:
+            _log.debug("KIS token rate limit: waiting %.1fs", wait)
+        return wait
+
+    def _build_token_request(self) -> Tuple[str, Dict[str, Any]]:
+        url = urljoin(self.base_url, "/oauth2/tokenP")
+        payload = {
+            "grant_type": "client_credentials",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret,
+        }
+        return url, payload
+
+    @staticmethod
+    def _parse_token_response(data: Dict[str, Any]) -> TokenState:
+        if "access_token" not in data:
+            raise KISAuthError(f"Token response missing access_token: {data}")
+        expires_in = data.get("expires_in", 86400)
+        return TokenState(
+            access_token=data["access_token"],
+            token_type="Bearer",
+            expires_at=datetime.fromtimestamp(time.time() + min(expires_in, 82800), tz=KST),
+        )
+
+    def _apply_token_response(self, data: Dict[str, Any]) -> str:
+        state = self._parse_token_response(data)
+        self._access_token = state.access_token
+        self._token_expires_at = state.expires_at.timestamp()
+
+        self._write_token_cache(self._access_token, self._token_expires_at)
+        _log.info("KIS access token acquired")
+        return self._access_token
 
     def _get_access_token(self) -> str:
         """
@@ -143,6 +259,7 @@ class KISClient:
 
         - 메모리·파일 캐시 유효 시 재사용 (KIS 1분당 1회 발급 제한 준수).
         - 공식 kis_auth 패턴: 토큰 파일 저장 후 재사용.
+        - token_manager 사용 시 발급하지 않음 (토큰 없으면 즉시 KISAuthError).
 
         Returns:
             str: Access Token
@@ -150,62 +267,91 @@ class KISClient:
         Raises:
             KISAuthError: 인증 실패
         """
-        # 1) 메모리 캐시 유효하면 재사용
-        if self._access_token and self._token_expires_at:
-            if time.time() < self._token_expires_at - 60:
-                return self._access_token
-
-        # 2) 파일 캐시에서 유효한 토큰 있으면 재사용 (다른 프로세스가 발급한 토큰)
-        cached = self._read_token_cache()
+        cached = self._cached_token()
         if cached:
             return cached
+        if self.token_manager is not None:
+            raise self._token_not_ready()
 
-        # 3) 1분당 1회 제한: 마지막 발급 시각 파일 확인 후 필요 시 대기
-        cache_path = _kis_token_cache_path(self.base_url)
-        path_ts = cache_path.with_suffix(".last_request")
-        if path_ts.exists():
-            try:
-                last = float(path_ts.read_text(encoding="utf-8").strip())
-                elapsed = time.time() - last
-                if elapsed < _KIS_TOKEN_MIN_INTERVAL_SEC:
-                    wait = _KIS_TOKEN_MIN_INTERVAL_SEC - elapsed
-                    _log.debug("KIS token rate limit: waiting %.1fs", wait)
-                    time.sleep(wait)
-            except (OSError, ValueError):
-                pass
-
-        # 4) 토큰 발급
-        url = urljoin(self.base_url, "/oauth2/tokenP")
-        payload = {
-            "grant_type": "client_credentials",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-        }
+        wait = self._token_issue_wait()
+        if wait > 0:
+            time.sleep(wait)
 
+        url, payload = self._build_token_request()
         try:
-            try:
-                path_ts.write_text(str(time.time()), encoding="utf-8")
-            except OSError:
-                pass
-            resp = requests.post(url, json=payload, timeout=self.timeout)
+            resp = self._session.post(url, json=payload, timeout=self.timeout)
             resp.raise_for_status()
-            data = resp.json()
-
-            if "access_token" not in data:
-                raise KISAuthError(f"Token response missing access_token: {data}")
-
-            self._access_token = data["access_token"]
-            expires_in = data.get("expires_in", 86400)
-            self._token_expires_at = time.time() + min(expires_in, 82800)
-
-            self._write_token_cache(self._access_token, self._token_expires_at)
-            _log.info("KIS access token acquired")
-            return self._access_token
+            return self._apply_token_response(resp.json())
 
         except requests.RequestException as e:
             _log.error(f"Failed to get KIS access token: {e}")
             raise KISAuthError(f"Token acquisition failed: {e}") from e
 
+    async def _fetch_token_async(self) -> Dict[str, Any]:
+        url, payload = self._build_token_request()
+        try:
+            resp = await self.transport.request("POST", url, json_body=payload)
+        except TransportError as e:
+            _log.error(f"Failed to get KIS access token: {e}")
+            raise KISAuthError(f"Token acquisition failed: {e}") from e
+        if resp.status >= 400:
+            raise KISAuthError(f"Token acquisition failed: HTTP {resp.status}: {resp.text}")
+        return resp.json()
+
+    async def _get_access_token_async(self) -> str:
+        """_get_access_token 비동기 버전 (동시 호출 시 발급 1회)."""
+        cached = self._cached_token()
+        if cached:
+            return cached
+        if self.token_manager is not None:
+            raise self._token_not_ready()
+
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            cached = self._cached_token()
+            if cached:
+                return cached
+
+            wait = self._token_issue_wait()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            return self._apply_token_response(await self._fetch_token_async())
+
+    async def _issue_token_async(self) -> TokenState:
+        """TokenManager issuer: 발급만 수행 (캐시 기록·발급 간격은 TokenManager/SharedTokenStore 담당)."""
+        return self._parse_token_response(await self._fetch_token_async())
+
+    def create_token_manager(self, **kwargs: Any) -> TokenManager:
+        """
+        백그라운드 토큰 갱신기 생성·연결.
+
+        토큰은 기존 파일 캐시(~/.qts_kis_token_*.json)를 잠금과 함께 공유하므로
+        여러 프로세스가 각자 갱신기를 띄워도 발급은 1회입니다.
+
+        Args:
+            **kwargs: TokenManager 옵션 (refresh_ahead, retry_delay 등)
+        """
+        kwargs.setdefault("min_issue_interval", _KIS_TOKEN_MIN_INTERVAL_SEC)
+        self.token_manager = TokenManager("kis", self._issue_token_async, store=self._token_store, **kwargs)
+        return self.token_manager
+
+    def _build_hashkey_request(self, body_json: str) -> Tuple[str, Dict[str, str], bytes]:
+        url = urljoin(self.base_url, "/uapi/hashkey")
+        headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret,
+        }
+        return url, headers, body_json.encode("utf-8")
+
+    @staticmethod
+    def _parse_hashkey(data: Dict[str, Any]) -> str:
+        if "HASH" not in data:
+            raise KISAPIError(f"Hashkey response missing HASH: {data}")
+        return data["HASH"]
+
     def _get_hashkey(self, body_json: str) -> str:
         """
         KIS API Hashkey 생성 (POST 요청 시 필수).
@@ -219,28 +365,123 @@ class KISClient:
         Returns:
             str: Hashkey
         """
-        url = urljoin(self.base_url, "/uapi/hashkey")
+        url, headers, data = self._build_hashkey_request(body_json)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire_blocking(self.RATE_LIMIT_FAMILY, Priority.ORDER)
+
+        try:
+            resp = self._session.post(url, data=data, headers=headers, timeout=self.timeout)
+            resp.raise_for_status()
+            return self._parse_hashkey(resp.json())
+
+        except requests.RequestException as e:
+            _log.error(f"Failed to get KIS hashkey: {e}")
+            raise KISAPIError(f"Hashkey generation failed: {e}") from e
+
+    async def _get_hashkey_async(self, body_json: str) -> str:
+        """_get_hashkey 비동기 버전."""
+        url, headers, data = self._build_hashkey_request(body_json)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(self.RATE_LIMIT_FAMILY, Priority.ORDER)
+        try:
+            resp = await self.transport.request("POST", url, headers=headers, data=data)
+        except TransportError as e:
+            _log.error(f"Failed to get KIS hashkey: {e}")
+            raise KISAPIError(f"Hashkey generation failed: {e}") from e
+        if resp.status >= 400:
+            raise KISAPIError(f"Hashkey generation failed: HTTP {resp.status}: {resp.text}")
+        return self._parse_hashkey(resp.json())
+
+    @staticmethod
+    def _serialize_body(method: str, body: Optional[Dict[str, Any]]) -> Optional[str]:
+        """POST body 정규 직렬화. Hashkey와 전송 body에 동일 문자열 사용 (IGW00002 방지)."""
+        if method.upper() == "POST" and body:
+            return json.dumps(body, sort_keys=True, ensure_ascii=False)
+        return None
+
+    def _build_headers(self, tr_id: str, token: str, hashkey: Optional[str]) -> Dict[str, str]:
         headers = {
             "Content-Type": "application/json; charset=utf-8",
+            "authorization": f"Bearer {token}",
             "appkey": self.app_key,
             "appsecret": self.app_secret,
+            "tr_id": tr_id,
+            "custtype": "P",  # 개인 "P", 제휴사 "B" (open-trading-api kis_auth.py)
         }
+        if hashkey:
+            headers["hashkey"] = hashkey
+        return headers
+
+    # ------------------------------------------------------------------
+    # 요청 지연 계측
+    # ------------------------------------------------------------------
 
+    @contextmanager
+    def _timed(self, kind: str, phase: str) -> Iterator[None]:
+        started = time.perf_counter()
         try:
-            resp = requests.post(
-                url, data=body_json.encode("utf-8"), headers=headers, timeout=self.timeout
+            yield
+        finally:
+            key = f"{kind}.{phase}"
+            hist = self._latency.get(key)
+            if hist is None:
+                hist = self._latency[key] = LatencyHistogram()
+            hist.record(time.perf_counter() - started)
+
+    def latency_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        요청 단계별 지연 요약 (ms).
+
+        키: "{order|query}.{prepare|queue|http|total}" — prepare = 토큰 확인 + hashkey, queue = 속도 제한 대기
+        """
+        return {key: hist.snapshot(scale=1000.0) for key, hist in self._latency.items()}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """MetricsCollector 수집기 형식 ({'counters': ..., 'gauges': ...})."""
+        counters = {f"broker.kis.hashkey.{k}": v for k, v in self.hashkey.stats().items()}
+        gauges: Dict[str, float] = {}
+        for key, hist in self._latency.items():
+            counters[f"broker.kis.{key}.count"] = hist.count
+            for stat, value in hist.snapshot(scale=1000.0).items():
+                if stat != "count":
+                    gauges[f"broker.kis.{key}.{stat}_ms"] = value
+        return {"counters": counters, "gauges": gauges}
+
+    def register_metrics(self, collector: Any) -> None:
+        """MetricsCollector에 'broker.kis' 수집기 등록."""
+        collector.register_collector("broker.kis", self.get_metrics)
+
+    async def prefetch_hashkey_async(self, body: Dict[str, Any]) -> Optional[str]:
+        """POST body의 hashkey를 미리 발급·메모이즈 (취소/정정 템플릿, 재전송 대비)."""
+        body_str = self._serialize_body("POST", body)
+        return await self.hashkey.get_async(body_str) if body_str else None
+
+    def _handle_response(
+        self, method: str, path: str, tr_id: str, status: int, text: str, data_fn
+    ) -> Dict[str, Any]:
+        # HTTP 상태 코드 확인
+        if status >= 400:
+            _log.error(
+                f"KIS API error: {method} {path} (tr_id={tr_id}) -> "
+                f"{status} {text}"
             )
-            resp.raise_for_status()
-            data = resp.json()
+            raise KISAPIError(f"HTTP {status}: {text}")
 
-            if "HASH" not in data:
-                raise KISAPIError(f"Hashkey response missing HASH: {data}")
+        data = data_fn()
 
-            return data["HASH"]
+        # API 응답 코드 확인
+        rt_cd = data.get("rt_cd")
+        if rt_cd and str(rt_cd) != "0":
+            msg1 = data.get("msg1", "Unknown error")
+            _log.warning(f"KIS API returned non-zero code: {rt_cd} - {msg1}")
+            # 에러지만 응답은 반환 (caller에서 처리)
 
-        except requests.RequestException as e:
-            _log.error(f"Failed to get KIS hashkey: {e}")
-            raise KISAPIError(f"Hashkey generation failed: {e}") from e
+        return data
+
+    @staticmethod
+    def _priority(kind: str) -> Priority:
+        """주문/취소(POST)는 잔고·포지션 조회보다 먼저 전송."""
+        return Priority.ORDER if kind == "order" else Priority.QUERY
 
     def _request(
         self,
@@ -266,26 +507,35 @@ class KISClient:
         Raises:
             KISAPIError: API 호출 실패
         """
+        kind = "order" if method.upper() == "POST" else "query"
         url = urljoin(self.base_url, path)
-        headers = {
-            "Content-Type": "application/json; charset=utf-8",
-            "authorization": f"Bearer {self._get_access_token()}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": "P",  # 개인 "P", 제휴사 "B" (open-trading-api kis_auth.py)
-        }
-
-        # Hashkey 및 POST body: 동일 직렬화 사용 (IGW00002 방지)
-        body_bytes: Optional[bytes] = None
-        if method.upper() == "POST" and body:
-            body_str = json.dumps(body, sort_keys=True, ensure_ascii=False)
-            body_bytes = body_str.encode("utf-8")
-            hashkey = self._get_hashkey(body_str)
-            headers["hashkey"] = hashkey
-
+        body_str = self._serialize_body(method, body)
+        with self._timed(kind, "total"):
+            with self._timed(kind, "prepare"):
+                token = self._get_access_token()
+                hashkey = self.hashkey.get(body_str) if body_str is not None else None
+            headers = self._build_headers(tr_id, token, hashkey)
+            body_bytes = body_str.encode("utf-8") if body_str is not None else None
+            if self.rate_limiter is not None:
+                with self._timed(kind, "queue"):
+                    self.rate_limiter.acquire_blocking(self.RATE_LIMIT_FAMILY, self._priority(kind))
+            with self._timed(kind, "http"):
+                return self._send(method, path, tr_id, url, headers, body, body_bytes, params)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        tr_id: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[Dict[str, Any]],
+        body_bytes: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """HTTP 전송 + 응답 처리 (동기)."""
         try:
-            resp = requests.request(
+            resp = self._session.request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -294,40 +544,76 @@ class KISClient:
                 params=params if params else None,
                 timeout=self.timeout,
             )
-
-            # HTTP 상태 코드 확인
-            if resp.status_code >= 400:
-                _log.error(
-                    f"KIS API error: {method} {path} (tr_id={tr_id}) -> "
-                    f"{resp.status_code} {resp.text}"
-                )
-                raise KISAPIError(f"HTTP {resp.status_code}: {resp.text}")
-
-            data = resp.json()
-
-            # API 응답 코드 확인
-            rt_cd = data.get("rt_cd")
-            if rt_cd and str(rt_cd) != "0":
-                msg1 = data.get("msg1", "Unknown error")
-                _log.warning(f"KIS API returned non-zero code: {rt_cd} - {msg1}")
-                # 에러지만 응답은 반환 (caller에서 처리)
-
-            return data
+            return self._handle_response(method, path, tr_id, resp.status_code, resp.text, resp.json)
 
         except requests.RequestException as e:
             _log.error(f"KIS API request failed: {method} {path} -> {e}")
             raise KISAPIError(f"Request failed: {e}") from e
 
+    async def _request_async(
+        self,
+        method: str,
+        path: str,
+        tr_id: str,
+        body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """_request 비동기 버전 (AsyncBrokerTransport 커넥션 풀 사용)."""
+        kind = "order" if method.upper() == "POST" else "query"
+        url = urljoin(self.base_url, path)
+        body_str = self._serialize_body(method, body)
+        with self._timed(kind, "total"):
+            with self._timed(kind, "prepare"):
+                if body_str is not None and self.pipeline_hashkey:
+                    # hashkey는 토큰과 무관 → 토큰 확인/발급과 병렬
+                    token, hashkey = await asyncio.gather(
+                        self._get_access_token_async(), self.hashkey.get_async(body_str)
+                    )
+                else:
+                    token = await self._get_access_token_async()
+                    hashkey = await self.hashkey.get_async(body_str) if body_str is not None else None
+            headers = self._build_headers(tr_id, token, hashkey)
+            body_bytes = body_str.encode("utf-8") if body_str is not None else None
+            if self.rate_limiter is not None:
+                with self._timed(kind, "queue"):
+                    await self.rate_limiter.acquire(self.RATE_LIMIT_FAMILY, self._priority(kind))
+            with self._timed(kind, "http"):
+                return await self._send_async(method, path, tr_id, url, headers, body, body_bytes, params)
+
+    async def _send_async(
+        self,
+        method: str,
+        path: str,
+        tr_id: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[Dict[str, Any]],
+        body_bytes: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """HTTP 전송 + 응답 처리 (비동기)."""
+        try:
+            resp = await self.transport.request(
+                method,
+                url,
+                headers=headers,
+                data=body_bytes,
+                json_body=None if body_bytes is not None else (body if body else None),
+                params=params if params else None,
+            )
+        except TransportError as e:
+            _log.error(f"KIS API request failed: {method} {path} -> {e}")
+            raise KISAPIError(f"Request failed: {e}") from e
+        return self._handle_response(method, path, tr_id, resp.status, resp.text, resp.json)
+
     # KIS order-cash Body 키 (공식 샘플: 대문자만 전송)
     _ORDER_BODY_KEYS = frozenset({
         "CANO", "ACNT_PRDT_CD", "PDNO", "ORD_DVSN", "ORD_QTY", "ORD_UNPR",
         "EXCG_ID_DVSN_CD", "SLL_TYPE", "CNDT_PRIC",
     })
 
-    def place_order(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        주문 전송. open-trading-api order_cash: tr_id 0011/0012, Body 대문자 키만.
-        """
+    def _place_order_call(self, payload: Dict[str, Any]) -> Tuple[str, str, str, Dict[str, Any]]:
+        """open-trading-api order_cash: tr_id 0011/0012, Body 대문자 키만."""
         side = (payload.get("side") or "BUY")
         if hasattr(side, "value"):
             side = side.value
@@ -342,7 +628,27 @@ class KISClient:
 
         body = {k: v for k, v in payload.items() if k in self._ORDER_BODY_KEYS}
         _log.info("Placing KIS order: %s %s (tr_id=%s)", side, symbol, tr_id)
-        return self._request("POST", "/uapi/domestic-stock/v1/trading/order-cash", tr_id, body=body)
+        return "POST", "/uapi/domestic-stock/v1/trading/order-cash", tr_id, body
+
+    def place_order(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        주문 전송. open-trading-api order_cash: tr_id 0011/0012, Body 대문자 키만.
+        """
+        method, path, tr_id, body = self._place_order_call(payload)
+        return self._request(method, path, tr_id, body=body)
+
+    async def place_order_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """place_order 비동기 버전."""
+        method, path, tr_id, body = self._place_order_call(payload)
+        return await self._request_async(method, path, tr_id, body=body)
+
+    def _get_order_call(self, params: Dict[str, Any]) -> Tuple[str, str, str]:
+        order_id = params.get("order_id")
+        _log.info(f"Getting KIS order: {order_id}")
+
+        # 주문 조회 tr_id (VTS/REAL 공통)
+        tr_id = "VTTC8001R" if self.trading_mode == "VTS" else "TTTC8001R"
+        return "GET", "/uapi/domestic-stock/v1/trading/inquire-daily-ccld", tr_id
 
     def get_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -354,24 +660,37 @@ class KISClient:
         Returns:
             Dict[str, Any]: API 응답
         """
-        order_id = params.get("order_id")
-        _log.info(f"Getting KIS order: {order_id}")
+        method, path, tr_id = self._get_order_call(params)
+        return self._request(method, path, tr_id, params=params)
 
-        # 주문 조회 tr_id (VTS/REAL 공통)
-        tr_id = "VTTC8001R" if self.trading_mode == "VTS" else "TTTC8001R"
+    async def get_order_async(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """get_order 비동기 버전."""
+        method, path, tr_id = self._get_order_call(params)
+        return await self._request_async(method, path, tr_id, params=params)
 
-        return self._request("GET", "/uapi/domestic-stock/v1/trading/inquire-daily-ccld", tr_id, params=params)
+    def _daily_orders_call(self) -> Tuple[str, str, str]:
+        tr_id = "VTTC8001R" if self.trading_mode == "VTS" else "TTTC8001R"
+        return "GET", "/uapi/domestic-stock/v1/trading/inquire-daily-ccld", tr_id
 
-    def cancel_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def get_daily_orders(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        주문 취소
+        일별 주문체결 목록 조회 (inquire-daily-ccld, ODNO 미지정 → 당일 전체 주문)
 
         Args:
-            params: 취소 파라미터 (order_id 등)
+            params: build_kis_daily_ccld_params 결과 (CTX_AREA_*로 연속 조회)
 
         Returns:
-            Dict[str, Any]: API 응답
+            Dict[str, Any]: API 응답 (output1 행 목록)
         """
+        method, path, tr_id = self._daily_orders_call()
+        return self._request(method, path, tr_id, params=params)
+
+    async def get_daily_orders_async(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """get_daily_orders 비동기 버전."""
+        method, path, tr_id = self._daily_orders_call()
+        return await self._request_async(method, path, tr_id, params=params)
+
+    def _cancel_order_call(self, params: Dict[str, Any]) -> Tuple[str, str, str, Dict[str, Any]]:
         order_id = params.get("order_id")
         _log.info(f"Canceling KIS order: {order_id}")
 
@@ -388,16 +707,27 @@ class KISClient:
             "RVSE_CNCL_DVSN_CD": "02",  # 정정취소구분 (02: 취소)
             "ORD_QTY": "0",
         }
+        return "POST", "/uapi/domestic-stock/v1/trading/order-rvsecncl", tr_id, body
 
-        return self._request("POST", "/uapi/domestic-stock/v1/trading/order-rvsecncl", tr_id, body=body)
-
-    def get_balance(self) -> Dict[str, Any]:
+    def cancel_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        계좌 잔고 조회
+        주문 취소
+
+        Args:
+            params: 취소 파라미터 (order_id 등)
 
         Returns:
-            Dict[str, Any]: 잔고 정보
+            Dict[str, Any]: API 응답
         """
+        method, path, tr_id, body = self._cancel_order_call(params)
+        return self._request(method, path, tr_id, body=body)
+
+    async def cancel_order_async(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """cancel_order 비동기 버전."""
+        method, path, tr_id, body = self._cancel_order_call(params)
+        return await self._request_async(method, path, tr_id, body=body)
+
+    def _balance_call(self) -> Tuple[str, str, str, Dict[str, Any]]:
         _log.info("Getting KIS account balance")
 
         tr_id = "VTTC8434R" if self.trading_mode == "VTS" else "TTTC8434R"
@@ -415,8 +745,22 @@ class KISClient:
             "CTX_AREA_FK100": "",
             "CTX_AREA_NK100": "",
         }
+        return "GET", "/uapi/domestic-stock/v1/trading/inquire-balance", tr_id, params
+
+    def get_balance(self) -> Dict[str, Any]:
+        """
+        계좌 잔고 조회
+
+        Returns:
+            Dict[str, Any]: 잔고 정보
+        """
+        method, path, tr_id, params = self._balance_call()
+        return self._request(method, path, tr_id, params=params)
 
-        return self._request("GET", "/uapi/domestic-stock/v1/trading/inquire-balance", tr_id, params=params)
+    async def get_balance_async(self) -> Dict[str, Any]:
+        """get_balance 비동기 버전."""
+        method, path, tr_id, params = self._balance_call()
+        return await self._request_async(method, path, tr_id, params=params)
 
     def get_positions(self) -> Dict[str, Any]:
         """
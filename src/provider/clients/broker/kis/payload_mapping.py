@@ -227,3 +227,88 @@ def raw_to_order_response(raw: dict, *, default_broker_order_id: str | None = No
         avg_fill_price=parsed["avg_fill_price"],
         raw=parsed["raw"],
     )
+
+
+# ----- 일별 주문체결 목록 (inquire-daily-ccld, 미체결 주문 일괄 조회) -----
+# Query: CANO, ACNT_PRDT_CD, INQR_STRT_DT, INQR_END_DT, ... CTX_AREA_FK100/NK100 (연속 조회)
+# Response output1 행: odno, ord_qty, tot_ccld_qty, avg_prvs, rmn_qty, cncl_yn, rjct_qty
+
+
+def build_kis_daily_ccld_params(
+    *,
+    cano: str,
+    acnt_prdt_cd: str = "01",
+    date: str,
+    ctx_fk: str = "",
+    ctx_nk: str = "",
+) -> dict:
+    """당일(date=YYYYMMDD) 전체 주문체결 목록 조회 파라미터."""
+    return {
+        "CANO": cano,
+        "ACNT_PRDT_CD": acnt_prdt_cd,
+        "INQR_STRT_DT": date,
+        "INQR_END_DT": date,
+        "SLL_BUY_DVSN_CD": "00",
+        "INQR_DVSN": "00",
+        "PDNO": "",
+        "CCLD_DVSN": "00",
+        "ORD_GNO_BRNO": "",
+        "ODNO": "",
+        "INQR_DVSN_3": "00",
+        "INQR_DVSN_1": "",
+        "CTX_AREA_FK100": ctx_fk,
+        "CTX_AREA_NK100": ctx_nk,
+    }
+
+
+def order_id_key(order_id: object) -> str:
+    """주문번호 매칭 키 (앞자리 0 패딩 차이 무시)."""
+    return str(order_id).strip().lstrip("0") or "0"
+
+
+def _daily_row_status(ord_qty: int, filled: int, canceled: bool, rejected: bool) -> OrderStatus:
+    if canceled:
+        return OrderStatus.CANCELED
+    if rejected and filled == 0:
+        return OrderStatus.REJECTED
+    if ord_qty > 0 and filled >= ord_qty:
+        return OrderStatus.FILLED
+    if filled > 0:
+        return OrderStatus.PARTIALLY_FILLED
+    return OrderStatus.ACCEPTED
+
+
+def kis_daily_orders_to_responses(raw: dict) -> dict[str, OrderResponse]:
+    """inquire-daily-ccld 응답 → {order_id_key(odno): OrderResponse}."""
+    rows = raw.get("output1") or raw.get("output") or []
+    if isinstance(rows, dict):
+        rows = [rows]
+    out: dict[str, OrderResponse] = {}
+    for row in rows:
+        odno = row.get("odno") or row.get("ODNO")
+        if not odno:
+            continue
+        ord_qty = _parse_int(row.get("ord_qty"))
+        filled = _parse_int(row.get("tot_ccld_qty"))
+        status = _daily_row_status(
+            ord_qty,
+            filled,
+            canceled=str(row.get("cncl_yn", "")).upper() == "Y",
+            rejected=_parse_int(row.get("rjct_qty")) > 0,
+        )
+        avg = _parse_float(row.get("avg_prvs"))
+        out[order_id_key(odno)] = OrderResponse(
+            status=status,
+            broker_order_id=str(odno),
+            filled_qty=filled,
+            avg_fill_price=avg if filled > 0 else None,
+            raw=row,
+        )
+    return out
+
+
+def kis_daily_ccld_next(raw: dict) -> tuple[str, str] | None:
+    """연속 조회 키 (CTX_AREA_FK100, CTX_AREA_NK100). 없으면 None."""
+    fk = str(raw.get("ctx_area_fk100") or raw.get("CTX_AREA_FK100") or "").strip()
+    nk = str(raw.get("ctx_area_nk100") or raw.get("CTX_AREA_NK100") or "").strip()
+    return (fk, nk) if nk else None
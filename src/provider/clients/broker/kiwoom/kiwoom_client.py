@@ -2,20 +2,45 @@
 Kiwoom REST API Client
 
 Kiwoom API를 호출하여 주문, 조회, 취소 기능을 제공합니다.
+
+전송: 동기 경로는 keep-alive requests.Session, 비동기 경로(*_async)는 AsyncBrokerTransport.
+속도 제한: rate_limiter(RateLimitScheduler) 주입 시 api-id별 family("kiwoom:{api-id}"), 주문/취소가 조회보다 우선.
+토큰: create_token_manager()로 백그라운드 선제 갱신 (~/.qts_kiwoom_token_*.json 프로세스 간 공유).
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import json
 import logging
+import os
+import re
 import time
-from typing import Any, Dict, Optional
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
 
+from src.provider.clients.auth.token_cache import TokenState
+from src.provider.clients.auth.token_manager import SharedTokenStore, TokenManager
+from src.provider.clients.broker.transport import (
+    AsyncBrokerTransport,
+    TransportError,
+    create_session,
+)
+from src.provider.rate_limit import (
+    DEFAULT_ORDER_TPS,
+    KIWOOM_API_TPS,
+    Priority,
+    RateLimitScheduler,
+    kiwoom_family,
+)
+from src.shared.timezone_utils import KST
+
 
 _log = logging.getLogger(__name__)
 
@@ -24,6 +49,7 @@ _log = logging.getLogger(__name__)
 # ============================================================
 API_PATH_TOKEN = "/oauth2/token"
 API_PATH_ORDER = "/api/dostk/ordr"
+API_PATH_ACCOUNT = "/api/dostk/acnt"
 API_PATH_BALANCE = "/api/v1/balance"
 API_PATH_POSITIONS = "/api/v1/positions"
 
@@ -32,6 +58,16 @@ API_ID_BUY = "kt10000"
 API_ID_SELL = "kt10001"
 API_ID_ORDER_QUERY = "kt10002"
 API_ID_ORDER_CANCEL = "kt10003"
+API_ID_ORDER_LIST = "kt00007"  # 계좌별주문체결내역상세
+
+# 속도 제한 대기열에서 조회보다 먼저 나가는 api-id (매수/매도/취소)
+_ORDER_API_IDS = frozenset({API_ID_BUY, API_ID_SELL, API_ID_ORDER_CANCEL})
+
+
+def _kiwoom_token_cache_path(base_url: str) -> Path:
+    """base_url별 토큰 공유 파일 경로 (TokenManager 사용 시)."""
+    safe = re.sub(r"[^\w\-.]", "_", base_url.strip().rstrip("/"))
+    return Path(os.path.expanduser("~")) / f".qts_kiwoom_token_{safe}.json"
 
 
 class KiwoomAPIError(Exception):
@@ -59,6 +95,10 @@ class KiwoomClient:
         account_no: str,
         acnt_prdt_cd: str = "01",
         timeout: int = 10,
+        *,
+        session: Optional[requests.Session] = None,
+        transport: Optional[AsyncBrokerTransport] = None,
+        rate_limiter: Optional[RateLimitScheduler] = None,
     ):
         """
         KiwoomClient 초기화
@@ -70,6 +110,9 @@ class KiwoomClient:
             account_no: 계좌번호
             acnt_prdt_cd: 계좌상품코드 (기본: "01")
             timeout: HTTP 타임아웃 (초)
+            session: 동기 경로 requests.Session (미지정 시 전용 keep-alive 세션 생성)
+            transport: 비동기 경로 전송 계층 (미지정 시 첫 비동기 호출에서 생성, 브로커 간 공유 가능)
+            rate_limiter: 요청 속도 제한 스케줄러 (api-id family 미등록 시 KIWOOM_API_TPS로 등록)
         """
         self.app_key = app_key
         self.app_secret = app_secret
@@ -81,26 +124,43 @@ class KiwoomClient:
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[float] = None
 
+        self._session = session or create_session()
+        self._transport = transport
+        self._owns_transport = transport is None
+        self._token_lock: Optional[asyncio.Lock] = None
+        self.token_manager: Optional[TokenManager] = None
+        self.rate_limiter = rate_limiter
+
         _log.info(
             f"KiwoomClient initialized (base_url={self.base_url}, "
             f"account={self.account_no})"
         )
 
-    def _get_access_token(self) -> str:
-        """
-        Access Token 발급 또는 캐싱된 토큰 반환.
-
-        Returns:
-            str: Access Token
-
-        Raises:
-            KiwoomAuthError: 인증 실패
-        """
+    @property
+    def transport(self) -> AsyncBrokerTransport:
+        """비동기 경로 전송 계층 (지연 생성)."""
+        if self._transport is None:
+            self._transport = AsyncBrokerTransport(timeout=self.timeout)
+        return self._transport
+
+    async def aclose(self) -> None:
+        """비동기 전송 계층 종료 (직접 생성한 경우만)."""
+        if self._owns_transport and self._transport is not None:
+            await self._transport.close()
+
+    def _cached_token(self) -> Optional[str]:
+        # 백그라운드 갱신기가 있으면 그 토큰 우선
+        if self.token_manager is not None:
+            token = self.token_manager.current_token()
+            if token:
+                return token
         # 캐싱된 토큰이 유효하면 재사용
         if self._access_token and self._token_expires_at:
             if time.time() < self._token_expires_at - 60:  # 1분 여유
                 return self._access_token
+        return None
 
+    def _build_token_request(self) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
         # 토큰 발급 (openapi.kiwoom.com: Body secretkey, 응답 token / expires_dt)
         url = urljoin(self.base_url, API_PATH_TOKEN)
         headers = {"Content-Type": "application/json;charset=UTF-8"}
@@ -109,42 +169,115 @@ class KiwoomClient:
             "appkey": self.app_key,
             "secretkey": self.app_secret,
         }
+        return url, headers, payload
+
+    @staticmethod
+    def _parse_token_response(data: Dict[str, Any]) -> TokenState:
+        token = data.get("token") or data.get("access_token")
+        if not token:
+            raise KiwoomAuthError(f"Token response missing token: {data}")
+
+        # expires_dt: "20241107083713" 형식 (KST) → 만료 시각 파싱
+        expires_at = datetime.fromtimestamp(time.time() + 82800, tz=KST)
+        expires_dt = data.get("expires_dt")
+        if expires_dt and isinstance(expires_dt, str) and len(expires_dt) >= 14:
+            try:
+                # YYYYMMDDHHmmss
+                expires_at = datetime(
+                    int(expires_dt[0:4]), int(expires_dt[4:6]), int(expires_dt[6:8]),
+                    int(expires_dt[8:10]), int(expires_dt[10:12]), int(expires_dt[12:14]),
+                    tzinfo=KST,
+                )
+            except (ValueError, IndexError):
+                pass
+        return TokenState(access_token=token, token_type="Bearer", expires_at=expires_at)
+
+    def _apply_token_response(self, data: Dict[str, Any]) -> str:
+        state = self._parse_token_response(data)
+        self._access_token = state.access_token
+        self._token_expires_at = state.expires_at.timestamp()
+        _log.info("Kiwoom access token acquired")
+        return self._access_token
+
+    def _token_not_ready(self) -> KiwoomAuthError:
+        """갱신기 사용 시 토큰이 없으면 주문을 막지 않고 즉시 실패 + 갱신 요청."""
+        self.token_manager.request_refresh()
+        return KiwoomAuthError("Kiwoom access token not ready (background refresh pending)")
 
+    def _get_access_token(self) -> str:
+        """
+        Access Token 발급 또는 캐싱된 토큰 반환.
+
+        token_manager 사용 시 발급하지 않음 (토큰 없으면 즉시 KiwoomAuthError).
+
+        Returns:
+            str: Access Token
+
+        Raises:
+            KiwoomAuthError: 인증 실패
+        """
+        cached = self._cached_token()
+        if cached:
+            return cached
+        if self.token_manager is not None:
+            raise self._token_not_ready()
+
+        url, headers, payload = self._build_token_request()
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 url, headers=headers, json=payload, timeout=self.timeout
             )
             resp.raise_for_status()
-            data = resp.json()
-
-            token = data.get("token") or data.get("access_token")
-            if not token:
-                raise KiwoomAuthError(f"Token response missing token: {data}")
-
-            self._access_token = token
-            # expires_dt: "20241107083713" 형식 → 만료 시각(KST) 파싱 후 캐시
-            expires_dt = data.get("expires_dt")
-            if expires_dt and isinstance(expires_dt, str) and len(expires_dt) >= 14:
-                try:
-                    from datetime import datetime
-                    # YYYYMMDDHHmmss
-                    dt = datetime(
-                        int(expires_dt[0:4]), int(expires_dt[4:6]), int(expires_dt[6:8]),
-                        int(expires_dt[8:10]), int(expires_dt[10:12]), int(expires_dt[12:14]),
-                    )
-                    self._token_expires_at = dt.timestamp()
-                except (ValueError, IndexError):
-                    self._token_expires_at = time.time() + 82800
-            else:
-                self._token_expires_at = time.time() + 82800
-
-            _log.info("Kiwoom access token acquired")
-            return self._access_token
+            return self._apply_token_response(resp.json())
 
         except requests.RequestException as e:
             _log.error(f"Failed to get Kiwoom access token: {e}")
             raise KiwoomAuthError(f"Token acquisition failed: {e}") from e
 
+    async def _fetch_token_async(self) -> Dict[str, Any]:
+        url, headers, payload = self._build_token_request()
+        try:
+            resp = await self.transport.request("POST", url, headers=headers, json_body=payload)
+        except TransportError as e:
+            _log.error(f"Failed to get Kiwoom access token: {e}")
+            raise KiwoomAuthError(f"Token acquisition failed: {e}") from e
+        if resp.status >= 400:
+            raise KiwoomAuthError(f"Token acquisition failed: HTTP {resp.status}: {resp.text}")
+        return resp.json()
+
+    async def _get_access_token_async(self) -> str:
+        """_get_access_token 비동기 버전 (동시 호출 시 발급 1회)."""
+        cached = self._cached_token()
+        if cached:
+            return cached
+        if self.token_manager is not None:
+            raise self._token_not_ready()
+
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            cached = self._cached_token()
+            if cached:
+                return cached
+            return self._apply_token_response(await self._fetch_token_async())
+
+    async def _issue_token_async(self) -> TokenState:
+        """TokenManager issuer: 발급만 수행."""
+        return self._parse_token_response(await self._fetch_token_async())
+
+    def create_token_manager(self, **kwargs: Any) -> TokenManager:
+        """
+        백그라운드 토큰 갱신기 생성·연결 (토큰 파일을 잠금과 함께 프로세스 간 공유).
+
+        Args:
+            **kwargs: TokenManager 옵션 (refresh_ahead, retry_delay 등)
+        """
+        store = SharedTokenStore(
+            _kiwoom_token_cache_path(self.base_url), extra={"base_url": self.base_url}
+        )
+        self.token_manager = TokenManager("kiwoom", self._issue_token_async, store=store, **kwargs)
+        return self.token_manager
+
     def _make_signature(self, path: str, body: Dict[str, Any]) -> str:
         """
         API 요청 서명 생성 (HMAC-SHA256)
@@ -165,23 +298,18 @@ class KiwoomClient:
         ).hexdigest()
         return signature
 
-    def _request(
+    def _build_request(
         self,
         method: str,
         path: str,
+        token: str,
         body: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None,
         api_id: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """
-        Kiwoom API 공통 요청.
-
-        주문/조회/취소는 POST /api/dostk/ordr + Header api-id (kt10000~kt10003).
-        """
+    ) -> Tuple[str, Dict[str, str]]:
         url = urljoin(self.base_url, path)
         headers = {
             "Content-Type": "application/json;charset=UTF-8",
-            "authorization": f"Bearer {self._get_access_token()}",
+            "authorization": f"Bearer {token}",
             "appkey": self.app_key,
         }
         if api_id:
@@ -190,9 +318,57 @@ class KiwoomClient:
         # 서명: 스펙 확정 전까지 선택 적용 (일부 API만 요구할 수 있음)
         if method.upper() == "POST" and body and not api_id:
             headers["signature"] = self._make_signature(path, body)
+        return url, headers
+
+    def _handle_response(self, method: str, path: str, status: int, text: str, data_fn) -> Dict[str, Any]:
+        # HTTP 상태 코드 확인
+        if status >= 400:
+            _log.error(
+                f"Kiwoom API error: {method} {path} -> {status} {text}"
+            )
+            raise KiwoomAPIError(
+                f"HTTP {status}: {text}"
+            )
+
+        data = data_fn()
+
+        # API 응답 코드 확인
+        return_code = data.get("return_code") or data.get("rt_cd")
+        if return_code and str(return_code) != "0":
+            return_msg = data.get("return_msg") or data.get("msg1", "Unknown error")
+            _log.warning(
+                f"Kiwoom API returned non-zero code: {return_code} - {return_msg}"
+            )
+            # 에러지만 응답은 반환 (caller에서 처리)
+
+        return data
+
+    def _rate_slot(self, path: str, api_id: Optional[str]) -> Tuple[str, Priority]:
+        """속도 제한 family(미등록 시 등록)와 우선순위."""
+        key = api_id or path
+        family = kiwoom_family(key)
+        self.rate_limiter.ensure(family, KIWOOM_API_TPS.get(key, DEFAULT_ORDER_TPS))
+        return family, Priority.ORDER if api_id in _ORDER_API_IDS else Priority.QUERY
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        api_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Kiwoom API 공통 요청.
+
+        주문/조회/취소는 POST /api/dostk/ordr + Header api-id (kt10000~kt10003).
+        """
+        url, headers = self._build_request(method, path, self._get_access_token(), body, api_id)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire_blocking(*self._rate_slot(path, api_id))
 
         try:
-            resp = requests.request(
+            resp = self._session.request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -200,42 +376,57 @@ class KiwoomClient:
                 params=params if params else None,
                 timeout=self.timeout,
             )
-
-            # HTTP 상태 코드 확인
-            if resp.status_code >= 400:
-                _log.error(
-                    f"Kiwoom API error: {method} {path} -> {resp.status_code} {resp.text}"
-                )
-                raise KiwoomAPIError(
-                    f"HTTP {resp.status_code}: {resp.text}"
-                )
-
-            data = resp.json()
-
-            # API 응답 코드 확인
-            return_code = data.get("return_code") or data.get("rt_cd")
-            if return_code and str(return_code) != "0":
-                return_msg = data.get("return_msg") or data.get("msg1", "Unknown error")
-                _log.warning(
-                    f"Kiwoom API returned non-zero code: {return_code} - {return_msg}"
-                )
-                # 에러지만 응답은 반환 (caller에서 처리)
-
-            return data
+            return self._handle_response(method, path, resp.status_code, resp.text, resp.json)
 
         except requests.RequestException as e:
             _log.error(f"Kiwoom API request failed: {method} {path} -> {e}")
             raise KiwoomAPIError(f"Request failed: {e}") from e
 
+    async def _request_async(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        api_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """_request 비동기 버전 (AsyncBrokerTransport 커넥션 풀 사용)."""
+        token = await self._get_access_token_async()
+        url, headers = self._build_request(method, path, token, body, api_id)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(*self._rate_slot(path, api_id))
+        try:
+            resp = await self.transport.request(
+                method,
+                url,
+                headers=headers,
+                json_body=body if body else None,
+                params=params if params else None,
+            )
+        except TransportError as e:
+            _log.error(f"Kiwoom API request failed: {method} {path} -> {e}")
+            raise KiwoomAPIError(f"Request failed: {e}") from e
+        return self._handle_response(method, path, resp.status, resp.text, resp.json)
+
     def place_order(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         주문 전송. openapi.kiwoom.com: POST /api/dostk/ordr, Header api-id: kt10000(매수)/kt10001(매도).
         payload에 _api_id가 있으면 헤더로 사용 후 body에서 제거.
         """
+        body, api_id = self._order_body(payload)
+        return self._request("POST", API_PATH_ORDER, body=body, api_id=api_id)
+
+    async def place_order_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """place_order 비동기 버전."""
+        body, api_id = self._order_body(payload)
+        return await self._request_async("POST", API_PATH_ORDER, body=body, api_id=api_id)
+
+    @staticmethod
+    def _order_body(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
         body = dict(payload)
         api_id = body.pop("_api_id", None) or API_ID_BUY
         _log.info("Placing Kiwoom order: api_id=%s, stk_cd=%s", api_id, body.get("stk_cd"))
-        return self._request("POST", API_PATH_ORDER, body=body, api_id=api_id)
+        return body, api_id
 
     def get_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -246,6 +437,22 @@ class KiwoomClient:
         body = {"ord_no": order_id}
         return self._request("POST", API_PATH_ORDER, body=body, api_id=API_ID_ORDER_QUERY)
 
+    async def get_order_async(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """get_order 비동기 버전."""
+        order_id = params.get("order_id") or params.get("ord_no")
+        return await self._request_async("POST", API_PATH_ORDER, body={"ord_no": order_id}, api_id=API_ID_ORDER_QUERY)
+
+    def get_daily_orders(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        당일 주문체결 내역 조회. openapi.kiwoom.com: POST /api/dostk/acnt, api-id: kt00007.
+        body: build_kiwoom_order_list_body 결과.
+        """
+        return self._request("POST", API_PATH_ACCOUNT, body=body, api_id=API_ID_ORDER_LIST)
+
+    async def get_daily_orders_async(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """get_daily_orders 비동기 버전."""
+        return await self._request_async("POST", API_PATH_ACCOUNT, body=body, api_id=API_ID_ORDER_LIST)
+
     def cancel_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         주문 취소. openapi.kiwoom.com: POST /api/dostk/ordr, api-id: kt10003.
@@ -255,6 +462,12 @@ class KiwoomClient:
         body = {"ord_no": order_id}
         return self._request("POST", API_PATH_ORDER, body=body, api_id=API_ID_ORDER_CANCEL)
 
+    async def cancel_order_async(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """cancel_order 비동기 버전."""
+        order_id = params.get("order_id") or params.get("ord_no")
+        _log.info("Canceling Kiwoom order: %s", order_id)
+        return await self._request_async("POST", API_PATH_ORDER, body={"ord_no": order_id}, api_id=API_ID_ORDER_CANCEL)
+
     def get_balance(self) -> Dict[str, Any]:
         """
         계좌 잔고 조회
@@ -238,3 +238,55 @@ def raw_to_order_response(raw: dict, *, default_broker_order_id: str | None = No
         avg_fill_price=parsed["avg_fill_price"],
         raw=parsed["raw"],
     )
+
+
+# ----- 계좌별 주문체결내역 (kt00007, 미체결 주문 일괄 조회) -----
+# Body: ord_dt, qry_tp, stk_bond_tp, sell_tp, stk_cd, fr_ord_no, dmst_stex_tp
+# Response acnt_ord_cntr_prps_dtl 행: ord_no, ord_qty, cntr_qty, cntr_uv, ord_remnq, mdfy_cncl
+
+
+def build_kiwoom_order_list_body(*, date: str, from_order_no: str = "") -> dict:
+    """당일(date=YYYYMMDD) 전체 주문체결 내역 조회 body."""
+    return {
+        "ord_dt": date,
+        "qry_tp": "1",
+        "stk_bond_tp": "0",
+        "sell_tp": "0",
+        "stk_cd": "",
+        "fr_ord_no": from_order_no,
+        "dmst_stex_tp": "%",
+    }
+
+
+def order_id_key(order_id: object) -> str:
+    """주문번호 매칭 키 (앞자리 0 패딩 차이 무시)."""
+    return str(order_id).strip().lstrip("0") or "0"
+
+
+def kiwoom_order_list_to_responses(raw: dict) -> dict[str, OrderResponse]:
+    """kt00007 응답 → {order_id_key(ord_no): OrderResponse}."""
+    rows = raw.get("acnt_ord_cntr_prps_dtl") or []
+    out: dict[str, OrderResponse] = {}
+    for row in rows:
+        ord_no = row.get("ord_no")
+        if not ord_no:
+            continue
+        ord_qty = _parse_int(row.get("ord_qty"))
+        filled = _parse_int(row.get("cntr_qty"))
+        if "취소" in str(row.get("mdfy_cncl") or ""):
+            status = OrderStatus.CANCELED
+        elif ord_qty > 0 and filled >= ord_qty:
+            status = OrderStatus.FILLED
+        elif filled > 0:
+            status = OrderStatus.PARTIALLY_FILLED
+        else:
+            status = OrderStatus.ACCEPTED
+        avg = _parse_float(row.get("cntr_uv"))
+        out[order_id_key(ord_no)] = OrderResponse(
+            status=status,
+            broker_order_id=str(ord_no),
+            filled_qty=filled,
+            avg_fill_price=avg if filled > 0 else None,
+            raw=row,
+        )
+    return out
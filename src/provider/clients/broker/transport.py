@@ -0,0 +1,196 @@
+"""
+Broker HTTP Transport
+
+KIS/Kiwoom 클라이언트 공용 HTTP 전송 계층입니다.
+
+- AsyncBrokerTransport: aiohttp 기반 keep-alive 커넥션 풀 (이벤트 루프에서 직접 await)
+  - 호스트별 동시 요청 상한 (limit_per_host, host_limits로 호스트별 재정의)
+  - 요청/신규 커넥션 수 집계 (stats) → 커넥션 재사용 여부 확인
+- create_session(): 동기 경로용 requests.Session (HTTPAdapter 풀, 요청마다 TCP/TLS 핸드셰이크 방지)
+
+HTTP/1.1 파이프라이닝은 사용하지 않습니다. KIS/Kiwoom 모두 파이프라이닝 지원을 명시하지 않으며
+aiohttp/requests도 지원하지 않으므로, 동시 요청은 풀 내 병렬 keep-alive 커넥션으로 처리합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+_log = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_LIMIT_PER_HOST = 8
+
+
+class TransportError(Exception):
+    """HTTP 전송 실패 (연결/타임아웃). HTTP 4xx/5xx는 TransportResponse로 반환."""
+    pass
+
+
+@dataclass
+class TransportResponse:
+    """HTTP 응답 (본문은 전부 읽은 상태)."""
+
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def status_code(self) -> int:
+        return self.status
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else {}
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """동기 경로용 keep-alive requests.Session."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class AsyncBrokerTransport:
+    """
+    aiohttp 기반 비동기 브로커 전송 계층.
+
+    세션은 첫 요청 시 현재 이벤트 루프에서 생성되며, 루프가 바뀌면 새로 만듭니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        host_limits: Optional[Mapping[str, int]] = None,
+        keepalive_timeout: float = 30.0,
+        timeout: float = 10.0,
+    ) -> None:
+        """
+        Args:
+            limit: 전체 커넥션 풀 상한
+            limit_per_host: 호스트별 동시 요청 상한 (기본값)
+            host_limits: 호스트(netloc)별 동시 요청 상한 재정의
+            keepalive_timeout: 유휴 keep-alive 커넥션 유지 시간 (초)
+            timeout: 요청 기본 타임아웃 (초)
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncBrokerTransport")
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.host_limits: Dict[str, int] = dict(host_limits or {})
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        self.requests = 0
+        self.connections_created = 0
+        self.errors = 0
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._host_semaphores.get(host)
+        if sem is None:
+            sem = self._host_semaphores[host] = asyncio.Semaphore(
+                self.host_limits.get(host, self.limit_per_host)
+            )
+        return sem
+
+    async def _on_connection_create(self, session: Any, ctx: Any, params: Any) -> None:
+        self.connections_created += 1
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+        if self._session is not None and self._loop is not loop:
+            _log.debug("Event loop changed; recreating broker HTTP session")
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._on_connection_create)
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=300,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            trace_configs=[trace],
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        self._loop = loop
+        self._host_semaphores = {}
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Optional[bytes] = None,
+        json_body: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> TransportResponse:
+        """
+        HTTP 요청 후 본문까지 읽어 반환.
+
+        Raises:
+            TransportError: 연결 실패/타임아웃
+        """
+        session = self._get_session()
+        host = urlsplit(url).netloc
+        self.requests += 1
+        kwargs: Dict[str, Any] = {}
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        try:
+            async with self._host_semaphore(host):
+                async with session.request(
+                    method,
+                    url,
+                    headers=dict(headers or {}),
+                    data=data,
+                    json=json_body if data is None else None,
+                    params=dict(params) if params else None,
+                    **kwargs,
+                ) as resp:
+                    body = await resp.read()
+                    return TransportResponse(resp.status, body, dict(resp.headers))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.errors += 1
+            raise TransportError(f"{method} {url} failed: {e!r}") from e
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "errors": self.errors,
+        }
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
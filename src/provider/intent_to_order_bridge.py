@@ -9,8 +9,9 @@ Arch §3, broker/README §3: "브릿지: Intent→Request, Response→ExecutionR
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
 from src.shared.timezone_utils import now_kst
 
@@ -18,6 +19,8 @@ from src.provider.models.intent import ExecutionIntent
 from src.provider.models.order_request import OrderRequest, OrderSide, OrderType
 from src.provider.models.order_response import OrderResponse, OrderStatus
 from src.provider.models.response import ExecutionResponse
+from src.provider.brokers.batch import DEFAULT_BATCH_CONCURRENCY, run_sync, submit_concurrently
+from src.provider.rate_limit import TokenBucket, order_tps_for
 
 if TYPE_CHECKING:
     from src.provider.clients.broker.order_base import OrderAdapter
@@ -106,6 +109,7 @@ class OrderAdapterToBrokerEngineAdapter:
     - Stateless: 어댑터·TokenCache 참조만 보유.
     - KIS/Kiwoom 등 OrderAdapter가 동일한 경로로 LiveBroker에 주입 가능.
     - create_broker_for_execution(live_allowed, adapter=this) 사용.
+    - 비동기 전송·submit_batch는 브로커 주문 TPS 토큰 버킷 + 동시 전송 상한 적용.
     """
 
     def __init__(
@@ -114,12 +118,19 @@ class OrderAdapterToBrokerEngineAdapter:
         *,
         broker_id: Optional[str] = None,
         dry_run: bool = False,
+        tps: Optional[float] = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
     ) -> None:
         self._order_adapter = order_adapter
         self._dry_run = dry_run
         self._broker_id = broker_id or getattr(
             order_adapter, "broker_id", "unknown"
         )
+        if tps is None:
+            trading_mode = getattr(getattr(order_adapter, "_client", None), "trading_mode", None)
+            tps = order_tps_for(self._broker_id, trading_mode)
+        self.limiter = TokenBucket(tps)
+        self.max_concurrency = max_concurrency
 
     def submit_intent(self, intent: ExecutionIntent) -> ExecutionResponse:
         """
@@ -140,3 +151,41 @@ class OrderAdapterToBrokerEngineAdapter:
         return order_response_to_execution_response(
             order_resp, intent, self._broker_id
         )
+
+    async def submit_intent_async(self, intent: ExecutionIntent) -> ExecutionResponse:
+        """submit_intent 비동기 버전 (place_order_async 지원 어댑터는 직접 await, 그 외 워커 스레드)."""
+        req = intent_to_order_request(intent, dry_run=self._dry_run)
+        if req is None:
+            return self.submit_intent(intent)
+
+        await self.limiter.acquire()
+        place_async = getattr(self._order_adapter, "place_order_async", None)
+        if place_async is not None:
+            order_resp = await place_async(req)
+        else:
+            order_resp = await asyncio.to_thread(self._order_adapter.place_order, req)
+        return order_response_to_execution_response(
+            order_resp, intent, self._broker_id
+        )
+
+    def _error_response(self, intent: ExecutionIntent, e: Exception) -> ExecutionResponse:
+        return ExecutionResponse(
+            intent_id=intent.intent_id,
+            accepted=False,
+            broker=self._broker_id,
+            message=f"Error: {e}",
+            timestamp=now_kst(),
+        )
+
+    async def submit_batch_async(self, intents: Sequence[ExecutionIntent]) -> List[ExecutionResponse]:
+        """일괄 동시 전송 (TPS 한도·max_concurrency 내). 응답은 입력 순서, 실패는 intent별 거부 응답."""
+        return await submit_concurrently(
+            intents,
+            self.submit_intent_async,
+            on_error=self._error_response,
+            max_concurrency=self.max_concurrency,
+        )
+
+    def submit_batch(self, intents: Sequence[ExecutionIntent]) -> List[ExecutionResponse]:
+        """submit_batch_async 동기 버전. 실행 중인 이벤트 루프 안에서 호출하면 RuntimeError."""
+        return run_sync(lambda: self.submit_batch_async(intents))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import List, Sequence
 
 from src.provider.models.intent import ExecutionIntent
 from src.provider.models.response import ExecutionResponse
@@ -30,3 +31,30 @@ class BrokerEngine(ABC):
         - 외부 통신 금지
         """
         raise NotImplementedError
+
+    async def submit_intent_async(self, intent: ExecutionIntent) -> ExecutionResponse:
+        """
+        Async submit path used by the ETEDA loop.
+
+        기본 구현은 submit_intent 직접 호출 (Phase 1 엔진은 외부 통신이 없으므로 블로킹 없음).
+        네트워크 I/O가 있는 엔진은 재정의하여 이벤트 루프를 막지 않아야 한다.
+        """
+        return self.submit_intent(intent)
+
+    def submit_batch(self, intents: Sequence[ExecutionIntent]) -> List[ExecutionResponse]:
+        """
+        Submit multiple execution intents as one batch.
+
+        Returns responses in input order. 기본 구현은 submit_intent 순차 호출이며,
+        일괄 전송을 지원하는 브로커는 재정의할 수 있다.
+        """
+        return [self.submit_intent(intent) for intent in intents]
+
+    async def submit_batch_async(self, intents: Sequence[ExecutionIntent]) -> List[ExecutionResponse]:
+        """
+        Async batch path used by the ETEDA loop.
+
+        Returns responses in input order; 한 intent의 실패는 해당 응답(accepted=False)으로만 보고한다.
+        기본 구현은 submit_batch 직접 호출. 네트워크 엔진은 재정의하여 브로커 TPS 한도 내에서 동시 전송한다.
+        """
+        return self.submit_batch(intents)
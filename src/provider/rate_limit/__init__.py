@@ -0,0 +1,34 @@
+"""
+Rate limiting (브로커/외부 API 요청 속도 제한).
+
+- TokenBucket: 단일 버킷
+- RateLimitScheduler: API family별 버킷 + 우선순위 대기열 + 대기 시간 지표
+"""
+
+from src.provider.rate_limit.quotas import BROKER_ORDER_TPS, DEFAULT_ORDER_TPS, order_tps_for
+from src.provider.rate_limit.scheduler import (
+    KIWOOM_API_TPS,
+    SHEETS_READ,
+    SHEETS_WRITE,
+    Priority,
+    RateLimitScheduler,
+    kiwoom_family,
+    register_broker_families,
+    register_sheets_families,
+)
+from src.provider.rate_limit.token_bucket import TokenBucket
+
+__all__ = [
+    "TokenBucket",
+    "RateLimitScheduler",
+    "Priority",
+    "BROKER_ORDER_TPS",
+    "DEFAULT_ORDER_TPS",
+    "KIWOOM_API_TPS",
+    "SHEETS_READ",
+    "SHEETS_WRITE",
+    "order_tps_for",
+    "kiwoom_family",
+    "register_broker_families",
+    "register_sheets_families",
+]
@@ -0,0 +1,30 @@
+"""
+API Quotas
+
+브로커 주문 TPS 기본값입니다. 공개 문서 기준 보수적 값이며 생성자 인자로 재정의할 수 있습니다.
+
+- KIS: 실전 초당 20건, 모의투자(VTS) 초당 2건
+- Kiwoom REST: 초당 5건
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+BROKER_ORDER_TPS: Dict[str, float] = {
+    "kis": 20.0,
+    "kis:VTS": 2.0,
+    "kiwoom": 5.0,
+}
+
+DEFAULT_ORDER_TPS = 5.0
+
+
+def order_tps_for(broker_id: str, trading_mode: Optional[str] = None) -> float:
+    """브로커(+거래 모드)별 주문 TPS. 미등록 브로커는 DEFAULT_ORDER_TPS."""
+    broker_id = (broker_id or "").lower()
+    if trading_mode:
+        tps = BROKER_ORDER_TPS.get(f"{broker_id}:{trading_mode.upper()}")
+        if tps is not None:
+            return tps
+    return BROKER_ORDER_TPS.get(broker_id, DEFAULT_ORDER_TPS)
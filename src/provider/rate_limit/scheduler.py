@@ -0,0 +1,285 @@
+"""
+Rate Limit Scheduler
+
+API 계열(family)별 토큰 버킷 + 우선순위 대기열입니다. 한도에 부딪힌 뒤 백오프하는 대신
+요청을 한도 안으로 미리 줄 세워 쿼터 상한까지 사용합니다.
+
+- family: 하나의 쿼터를 공유하는 요청 묶음 = TokenBucket 1개
+  - "kis": KIS REST 앱키 단위 TPS (주문·조회 공유 → Priority로 주문이 먼저)
+  - "kiwoom:{api-id}": Kiwoom api-id별 TPS
+  - "sheets.read" / "sheets.write": GOOGLE_SHEETS_API_QUOTA (분당)
+- Priority: ORDER < QUERY < BULK (값이 작을수록 먼저). 토큰이 모자랄 때 대기열에서 ORDER가 먼저 나감
+- 대기 시간 지표: family·lane별 LatencyHistogram (get_metrics / register_metrics)
+
+acquire()(비동기)만 우선순위 대기열을 거칩니다. acquire_blocking()(동기 경로)은 버킷 예약 후 sleep 합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from src.monitoring.latency_histogram import LatencyHistogram
+from src.provider.rate_limit.quotas import order_tps_for
+from src.provider.rate_limit.token_bucket import TokenBucket
+
+
+_log = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """대기열 우선순위 (작을수록 먼저)."""
+
+    ORDER = 0
+    QUERY = 1
+    BULK = 2
+
+
+@dataclass
+class _Family:
+    bucket: TokenBucket
+    waiters: List[Tuple[int, int, asyncio.Future]] = field(default_factory=list)
+    pump: Optional[asyncio.Task] = None
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    wait_hist: Dict[Priority, LatencyHistogram] = field(default_factory=dict)
+    acquired: Dict[Priority, int] = field(default_factory=dict)
+    queued: Dict[Priority, int] = field(default_factory=dict)
+
+
+class RateLimitScheduler:
+    """
+    family별 토큰 버킷 + 우선순위 대기열.
+
+    사용:
+        scheduler = RateLimitScheduler()
+        scheduler.register("kis", rate=20)
+        await scheduler.acquire("kis", Priority.ORDER)
+        async with scheduler.slot("kis", Priority.QUERY): ...
+    """
+
+    def __init__(self, *, strict: bool = False) -> None:
+        """
+        Args:
+            strict: True면 미등록 family acquire 시 KeyError, False면 제한 없이 통과
+        """
+        self.strict = strict
+        self._families: Dict[str, _Family] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 등록
+    # ------------------------------------------------------------------
+
+    def register(
+        self,
+        family: str,
+        rate: float,
+        *,
+        capacity: Optional[float] = None,
+        per: float = 1.0,
+    ) -> TokenBucket:
+        """
+        family 등록 (이미 있으면 교체).
+
+        Args:
+            family: 이름 (예: "kis", "kiwoom:kt10000", "sheets.read")
+            rate: per초당 허용 요청 수
+            capacity: 버스트 크기 (기본: 초당 rate, 최소 1)
+            per: rate 기준 구간(초). 분당 쿼터는 per=60
+        """
+        bucket = TokenBucket(rate / per, capacity)
+        with self._lock:
+            self._families[family] = _Family(bucket=bucket)
+        return bucket
+
+    def ensure(self, family: str, rate: float, **kwargs: Any) -> TokenBucket:
+        """미등록일 때만 register (공유 스케줄러에서 기존 설정 유지)."""
+        fam = self._families.get(family)
+        if fam is not None:
+            return fam.bucket
+        return self.register(family, rate, **kwargs)
+
+    def families(self) -> List[str]:
+        return list(self._families)
+
+    def bucket(self, family: str) -> Optional[TokenBucket]:
+        fam = self._families.get(family)
+        return fam.bucket if fam else None
+
+    def _family(self, family: str) -> Optional[_Family]:
+        fam = self._families.get(family)
+        if fam is None and self.strict:
+            raise KeyError(f"Unknown rate limit family: {family}")
+        return fam
+
+    # ------------------------------------------------------------------
+    # 획득
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _record(fam: _Family, priority: Priority, waited: float) -> None:
+        hist = fam.wait_hist.get(priority)
+        if hist is None:
+            hist = fam.wait_hist[priority] = LatencyHistogram()
+        hist.record(waited)
+        fam.acquired[priority] = fam.acquired.get(priority, 0) + 1
+
+    async def acquire(self, family: str, priority: Priority = Priority.QUERY) -> float:
+        """
+        family 토큰 1개 획득까지 대기 (우선순위 순). 반환: 대기 시간(초).
+
+        대기열이 비어 있고 토큰이 있으면 즉시 통과합니다.
+        """
+        fam = self._family(family)
+        if fam is None:
+            return 0.0
+        priority = Priority(priority)
+        loop = asyncio.get_running_loop()
+        if fam.loop is not loop:
+            # 이벤트 루프가 바뀌면 이전 루프의 대기열은 무효
+            fam.loop, fam.waiters, fam.pump = loop, [], None
+
+        if not fam.waiters and fam.bucket.try_acquire():
+            self._record(fam, priority, 0.0)
+            return 0.0
+
+        started = time.perf_counter()
+        fut: asyncio.Future = loop.create_future()
+        heapq.heappush(fam.waiters, (int(priority), next(self._seq), fut))
+        fam.queued[priority] = fam.queued.get(priority, 0) + 1
+        if fam.pump is None or fam.pump.done():
+            fam.pump = loop.create_task(self._pump(fam), name=f"ratelimit-{family}")
+        await fut
+        waited = time.perf_counter() - started
+        self._record(fam, priority, waited)
+        return waited
+
+    async def _pump(self, fam: _Family) -> None:
+        """토큰이 생길 때마다 대기열 맨 앞(최우선) waiter를 깨움."""
+        while fam.waiters:
+            # 취소된 waiter 정리
+            while fam.waiters and fam.waiters[0][2].done():
+                heapq.heappop(fam.waiters)
+            if not fam.waiters:
+                break
+            delay = fam.bucket.delay_for()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            if not fam.bucket.try_acquire():
+                await asyncio.sleep(0)
+                continue
+            _, _, fut = heapq.heappop(fam.waiters)
+            if fut.done():
+                # 토큰을 잡은 뒤 취소됨 → 다음 waiter에게 넘김
+                fam.bucket.refund()
+                continue
+            fut.set_result(None)
+
+    def acquire_blocking(self, family: str, priority: Priority = Priority.QUERY) -> float:
+        """acquire 동기 버전 (우선순위 대기열 없이 버킷 예약 후 대기)."""
+        fam = self._family(family)
+        if fam is None:
+            return 0.0
+        waited = fam.bucket.acquire_blocking()
+        self._record(fam, Priority(priority), waited)
+        return waited
+
+    @asynccontextmanager
+    async def slot(self, family: str, priority: Priority = Priority.QUERY) -> AsyncIterator[float]:
+        """async with 형태의 acquire (대기 시간을 as 값으로)."""
+        yield await self.acquire(family, priority)
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+
+    def queue_depth(self, family: str) -> int:
+        fam = self._families.get(family)
+        if fam is None:
+            return 0
+        return sum(1 for _, _, fut in fam.waiters if not fut.done())
+
+    def wait_snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """{family: {lane: 대기 시간 요약(ms)}}"""
+        return {
+            name: {p.name.lower(): h.snapshot(scale=1000.0) for p, h in fam.wait_hist.items()}
+            for name, fam in self._families.items()
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """MetricsCollector 수집기 형식 ({'counters': ..., 'gauges': ...})."""
+        counters: Dict[str, int] = {}
+        gauges: Dict[str, float] = {}
+        for name, fam in self._families.items():
+            prefix = f"ratelimit.{name}"
+            gauges[f"{prefix}.queue_depth"] = float(self.queue_depth(name))
+            gauges[f"{prefix}.tokens"] = fam.bucket.available
+            for priority, hist in fam.wait_hist.items():
+                lane = f"{prefix}.{priority.name.lower()}"
+                counters[f"{lane}.acquired"] = fam.acquired.get(priority, 0)
+                counters[f"{lane}.queued"] = fam.queued.get(priority, 0)
+                snap = hist.snapshot(scale=1000.0)
+                for stat in ("mean", "p50", "p99", "max"):
+                    gauges[f"{lane}.wait_{stat}_ms"] = snap[stat]
+        return {"counters": counters, "gauges": gauges}
+
+    def register_metrics(self, collector: Any, name: str = "ratelimit") -> None:
+        """MetricsCollector에 수집기 등록."""
+        collector.register_collector(name, self.get_metrics)
+
+
+# ----------------------------------------------------------------------
+# 기본 family 구성
+# ----------------------------------------------------------------------
+
+SHEETS_READ = "sheets.read"
+SHEETS_WRITE = "sheets.write"
+
+# Kiwoom REST api-id별 기본 TPS (주문 계열)
+KIWOOM_API_TPS: Dict[str, float] = {
+    "kt10000": 5.0,
+    "kt10001": 5.0,
+    "kt10002": 5.0,
+    "kt10003": 5.0,
+}
+
+
+def kiwoom_family(api_id: str) -> str:
+    return f"kiwoom:{api_id}"
+
+
+def register_broker_families(
+    scheduler: RateLimitScheduler,
+    *,
+    kis_trading_mode: Optional[str] = None,
+    kiwoom_api_tps: Optional[Dict[str, float]] = None,
+) -> RateLimitScheduler:
+    """KIS(앱키 TPS, 주문·조회 공유) + Kiwoom api-id별 family 등록."""
+    scheduler.register("kis", order_tps_for("kis", kis_trading_mode))
+    for api_id, tps in (kiwoom_api_tps or KIWOOM_API_TPS).items():
+        scheduler.register(kiwoom_family(api_id), tps)
+    return scheduler
+
+
+def register_sheets_families(
+    scheduler: RateLimitScheduler,
+    quota_per_minute: Optional[int] = None,
+) -> RateLimitScheduler:
+    """Sheets 읽기/쓰기 family 등록 (GOOGLE_SHEETS_API_QUOTA, 분당; 버스트는 쿼터의 1/10)."""
+    quota = quota_per_minute or int(os.getenv("GOOGLE_SHEETS_API_QUOTA", "100"))
+    capacity = max(1.0, quota / 10)
+    scheduler.register(SHEETS_READ, quota, per=60.0, capacity=capacity)
+    scheduler.register(SHEETS_WRITE, quota, per=60.0, capacity=capacity)
+    return scheduler
+
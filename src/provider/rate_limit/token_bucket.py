@@ -0,0 +1,117 @@
+"""
+Token Bucket
+
+초당 rate개 토큰을 채우고 capacity까지 버스트를 허용하는 토큰 버킷입니다.
+
+- 예약 방식: acquire()는 잠금 안에서 토큰을 선차감(음수 허용)하고 필요한 대기 시간만 계산
+  → 호출 순서대로(FIFO) 배정되며 asyncio 잠금을 쓰지 않으므로 이벤트 루프·스레드에 무관
+- acquire(): 비동기 대기, acquire_blocking(): 동기 경로용 time.sleep 대기
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class TokenBucket:
+    """초당 rate 요청, 최대 capacity 버스트."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            rate: 초당 토큰 보충 수 (TPS)
+            capacity: 버킷 크기 (미지정 시 rate, 최소 1)
+            clock: 단조 시계 (테스트 주입용)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        if self.capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+        self.acquired = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """토큰 예약 후 사용 가능 시점까지 대기 시간(초) 반환."""
+        if tokens > self.capacity:
+            raise ValueError("tokens must be <= capacity")
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.wait_seconds += wait
+            return wait
+
+    def delay_for(self, tokens: float = 1.0) -> float:
+        """tokens만큼 쌓이기까지 남은 시간(초). 예약하지 않음."""
+        with self._lock:
+            self._refill(self._clock())
+            missing = tokens - self._tokens
+            return missing / self.rate if missing > 0 else 0.0
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """대기 없이 가능할 때만 획득."""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            self.acquired += 1
+            return True
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """획득했지만 사용하지 않은 토큰 반환."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+            self.acquired -= 1
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """토큰 획득까지 대기. 반환: 대기한 시간(초)."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def acquire_blocking(self, tokens: float = 1.0) -> float:
+        """acquire 동기 버전."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "rate": self.rate,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "wait_seconds": self.wait_seconds,
+        }
@@ -0,0 +1,518 @@
+"""
+Order Book (주문별 생명주기 저장소)
+
+OrderStateMachine(단일 _state, 응답 즉시 TERMINAL)과 달리 주문 단위로
+SUBMITTED → ACCEPTED → PARTIALLY_FILLED → FILLED / CANCELED / REJECTED / EXPIRED 를 추적합니다.
+
+- OrderRecord: __slots__ 레코드 (미체결 수백 건 기준 메모리·속성 접근 비용 최소화)
+- OrderBook: intent_id / broker_order_id 키 + symbol / state 보조 인덱스
+  - 체결 타임아웃: (deadline, seq, intent_id) 힙 → due_timeouts()는 만료분만 꺼냄 (전체 스캔 없음)
+- OrderFillPoller: 하나의 타이머로 미체결 주문 전체를 한 번에 조회 (get_order 일괄)
+  - 어댑터에 get_orders_async(queries)가 있으면 1회 호출, 없으면 get_order_async 동시 조회 (max_concurrency)
+  - 조회 후 due_timeouts() → on_timeout (PartialFillMonitor 타임아웃 → 취소/조정 판단은 호출부)
+
+단일 이벤트 루프(또는 단일 스레드)에서 사용하는 것을 전제로 합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from src.provider.clients.broker.order_base import OrderQuery
+from src.provider.models.intent import ExecutionIntent
+from src.provider.models.order_response import OrderResponse, OrderStatus
+from src.provider.models.response import ExecutionResponse
+from src.provider.rate_limit import Priority, RateLimitScheduler
+from .order_state import CLOSED_STATES, OPEN_STATES, OrderState
+from .transition import Transition
+
+
+_log = logging.getLogger(__name__)
+
+
+class OrderRecord:
+    """주문 1건의 현재 상태. OrderBook을 통해서만 갱신합니다."""
+
+    __slots__ = (
+        "intent_id",
+        "symbol",
+        "side",
+        "qty",
+        "broker_order_id",
+        "state",
+        "filled_qty",
+        "avg_fill_price",
+        "message",
+        "created_at",
+        "updated_at",
+        "deadline",
+        "history",
+    )
+
+    def __init__(self, intent_id: str, symbol: str, side: str, qty: int, created_at: float) -> None:
+        self.intent_id = intent_id
+        self.symbol = symbol
+        self.side = side
+        self.qty = qty
+        self.broker_order_id: Optional[str] = None
+        self.state = OrderState.SUBMITTED
+        self.filled_qty = 0
+        self.avg_fill_price: Optional[float] = None
+        self.message: Optional[str] = None
+        self.created_at = created_at
+        self.updated_at = created_at
+        self.deadline: Optional[float] = None
+        self.history: List[Transition] = []
+
+    @property
+    def remaining_qty(self) -> int:
+        return max(0, self.qty - self.filled_qty)
+
+    @property
+    def is_open(self) -> bool:
+        return self.state in OPEN_STATES
+
+    def __repr__(self) -> str:
+        return (
+            f"OrderRecord(intent_id={self.intent_id!r}, symbol={self.symbol!r}, "
+            f"state={self.state.value}, filled={self.filled_qty}/{self.qty})"
+        )
+
+
+_STATUS_TO_STATE = {
+    OrderStatus.ACCEPTED: OrderState.ACCEPTED,
+    OrderStatus.REJECTED: OrderState.REJECTED,
+    OrderStatus.PARTIALLY_FILLED: OrderState.PARTIALLY_FILLED,
+    OrderStatus.FILLED: OrderState.FILLED,
+    OrderStatus.CANCELED: OrderState.CANCELED,
+}
+
+
+class OrderBook:
+    """
+    다중 주문 생명주기 저장소.
+
+    사용:
+        book = OrderBook(fill_timeout=3.0)
+        book.track(intent)
+        book.on_order_response(intent.intent_id, order_response)  # place_order 응답 (broker_order_id 연결)
+        book.apply_by_broker_order_id(boid, get_order_response)   # 체결 조회 결과
+        for record in book.due_timeouts(): ...
+    """
+
+    def __init__(
+        self,
+        *,
+        fill_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            fill_timeout: 주문별 기본 체결 타임아웃(초). None이면 타임아웃 없음
+            clock: 단조 시계 (테스트 주입용)
+        """
+        self.fill_timeout = fill_timeout
+        self._clock = clock
+        self._orders: Dict[str, OrderRecord] = {}
+        self._by_broker: Dict[str, OrderRecord] = {}
+        self._by_symbol: Dict[str, Set[str]] = {}
+        self._by_state: Dict[OrderState, Set[str]] = {}
+        self._deadlines: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+
+    # ------------------------------------------------------------------
+    # 등록
+    # ------------------------------------------------------------------
+
+    def add(
+        self,
+        intent_id: str,
+        symbol: str,
+        side: str,
+        qty: int,
+        *,
+        broker_order_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> OrderRecord:
+        """
+        전송한 주문 등록 (SUBMITTED).
+
+        Args:
+            timeout: 이 주문의 체결 타임아웃(초). None이면 fill_timeout
+        """
+        if intent_id in self._orders:
+            raise ValueError(f"Order already tracked: {intent_id}")
+        record = OrderRecord(intent_id, symbol, side, int(qty), self._clock())
+        self._orders[intent_id] = record
+        self._by_symbol.setdefault(symbol, set()).add(intent_id)
+        self._by_state.setdefault(record.state, set()).add(intent_id)
+        record.history.append(Transition(prev=OrderState.CREATED, next=record.state, reason="submitted"))
+        if broker_order_id:
+            self.bind_broker_order_id(intent_id, broker_order_id)
+        timeout = self.fill_timeout if timeout is None else timeout
+        if timeout is not None:
+            self.set_deadline(intent_id, record.created_at + timeout)
+        return record
+
+    def track(self, intent: ExecutionIntent, **kwargs: Any) -> OrderRecord:
+        """ExecutionIntent로 add."""
+        return self.add(intent.intent_id, intent.symbol, intent.side, int(intent.quantity), **kwargs)
+
+    def bind_broker_order_id(self, intent_id: str, broker_order_id: str) -> None:
+        record = self._orders[intent_id]
+        if record.broker_order_id and record.broker_order_id != broker_order_id:
+            self._by_broker.pop(record.broker_order_id, None)
+        record.broker_order_id = broker_order_id
+        self._by_broker[broker_order_id] = record
+
+    def set_deadline(self, intent_id: str, deadline: Optional[float]) -> None:
+        """체결 타임아웃 시각(clock 기준) 설정/해제. 이전 힙 항목은 꺼낼 때 무시됩니다."""
+        record = self._orders[intent_id]
+        record.deadline = deadline
+        if deadline is not None:
+            heapq.heappush(self._deadlines, (deadline, next(self._seq), intent_id))
+
+    def remove(self, intent_id: str) -> Optional[OrderRecord]:
+        """주문 제거 (인덱스 포함). 힙 항목은 꺼낼 때 무시됩니다."""
+        record = self._orders.pop(intent_id, None)
+        if record is None:
+            return None
+        if record.broker_order_id:
+            self._by_broker.pop(record.broker_order_id, None)
+        self._discard_index(self._by_symbol, record.symbol, intent_id)
+        self._discard_index(self._by_state, record.state, intent_id)
+        return record
+
+    def prune_closed(self) -> int:
+        """종료 상태 주문 일괄 제거. 반환: 제거 건수."""
+        closed = [iid for state in CLOSED_STATES for iid in self._by_state.get(state, ())]
+        for intent_id in closed:
+            self.remove(intent_id)
+        return len(closed)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, intent_id: object) -> bool:
+        return intent_id in self._orders
+
+    def get(self, intent_id: str) -> Optional[OrderRecord]:
+        return self._orders.get(intent_id)
+
+    def by_broker_order_id(self, broker_order_id: str) -> Optional[OrderRecord]:
+        return self._by_broker.get(broker_order_id)
+
+    def by_symbol(self, symbol: str) -> List[OrderRecord]:
+        return [self._orders[iid] for iid in self._by_symbol.get(symbol, ())]
+
+    def by_state(self, *states: OrderState) -> List[OrderRecord]:
+        return [self._orders[iid] for state in states for iid in self._by_state.get(state, ())]
+
+    def open_orders(self, symbol: Optional[str] = None) -> List[OrderRecord]:
+        """미체결 주문 (SUBMITTED / ACCEPTED / PARTIALLY_FILLED). symbol 지정 시 해당 종목만."""
+        if symbol is None:
+            return self.by_state(*OPEN_STATES)
+        return [r for r in self.by_symbol(symbol) if r.is_open]
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 주문 수 + 대기 중 타임아웃 힙 크기."""
+        counts = {state.value: len(ids) for state, ids in self._by_state.items() if ids}
+        counts["total"] = len(self._orders)
+        counts["deadlines"] = len(self._deadlines)
+        return counts
+
+    # ------------------------------------------------------------------
+    # 전이
+    # ------------------------------------------------------------------
+
+    def on_execution_response(self, resp: ExecutionResponse) -> List[Transition]:
+        """BrokerEngine 접수 응답 반영 (ACCEPTED / REJECTED)."""
+        next_state = OrderState.ACCEPTED if resp.accepted else OrderState.REJECTED
+        record = self._orders[resp.intent_id]
+        if record.state is not OrderState.SUBMITTED:
+            return []
+        record.message = resp.message
+        return self._transition(record, next_state, "accepted" if resp.accepted else "rejected")
+
+    def on_order_response(self, intent_id: str, resp: OrderResponse) -> List[Transition]:
+        """place_order / get_order 응답(OrderResponse) 반영: broker_order_id 연결 + 체결 수량/상태 갱신."""
+        record = self._orders[intent_id]
+        if resp.broker_order_id and record.broker_order_id != resp.broker_order_id:
+            self.bind_broker_order_id(intent_id, resp.broker_order_id)
+        return self._apply(record, resp)
+
+    def apply_by_broker_order_id(self, broker_order_id: str, resp: OrderResponse) -> List[Transition]:
+        """get_order 결과 반영 (broker_order_id로 주문 탐색). 모르는 주문이면 []."""
+        record = self._by_broker.get(broker_order_id)
+        if record is None:
+            return []
+        return self._apply(record, resp)
+
+    def mark(self, intent_id: str, state: OrderState, reason: str) -> List[Transition]:
+        """외부 판단에 따른 강제 전이 (예: 타임아웃 → EXPIRED, 취소 확인 → CANCELED)."""
+        record = self._orders[intent_id]
+        if record.state in CLOSED_STATES:
+            return []
+        return self._transition(record, state, reason)
+
+    def _apply(self, record: OrderRecord, resp: OrderResponse) -> List[Transition]:
+        if record.state in CLOSED_STATES:
+            return []
+        if resp.message:
+            record.message = resp.message
+        filled_changed = resp.filled_qty > record.filled_qty
+        if filled_changed:
+            record.filled_qty = min(resp.filled_qty, record.qty) if record.qty else resp.filled_qty
+            if resp.avg_fill_price is not None:
+                record.avg_fill_price = resp.avg_fill_price
+
+        next_state = _STATUS_TO_STATE.get(resp.status)
+        if next_state is None:
+            # UNKNOWN: 상태는 유지, 체결 수량만 반영
+            next_state = record.state
+        if next_state in (OrderState.ACCEPTED, OrderState.PARTIALLY_FILLED) and record.filled_qty:
+            next_state = OrderState.PARTIALLY_FILLED
+        if record.qty and record.filled_qty >= record.qty and next_state in OPEN_STATES:
+            next_state = OrderState.FILLED
+
+        if next_state is record.state:
+            if filled_changed:
+                record.updated_at = self._clock()
+                transition = Transition(prev=record.state, next=record.state, reason="fill")
+                record.history.append(transition)
+                return [transition]
+            return []
+        reason = "fill" if filled_changed else resp.status.value.lower()
+        return self._transition(record, next_state, reason)
+
+    def _transition(self, record: OrderRecord, next_state: OrderState, reason: str) -> List[Transition]:
+        prev = record.state
+        if prev is next_state:
+            return []
+        self._discard_index(self._by_state, prev, record.intent_id)
+        self._by_state.setdefault(next_state, set()).add(record.intent_id)
+        record.state = next_state
+        record.updated_at = self._clock()
+        if next_state in CLOSED_STATES:
+            record.deadline = None
+        transition = Transition(prev=prev, next=next_state, reason=reason)
+        record.history.append(transition)
+        return [transition]
+
+    @staticmethod
+    def _discard_index(index: Dict[Any, Set[str]], key: Any, intent_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(intent_id)
+            if not ids:
+                del index[key]
+
+    # ------------------------------------------------------------------
+    # 타임아웃
+    # ------------------------------------------------------------------
+
+    def next_deadline(self) -> Optional[float]:
+        """가장 이른 유효 타임아웃 시각 (없으면 None)."""
+        self._drop_stale_deadlines()
+        return self._deadlines[0][0] if self._deadlines else None
+
+    def due_timeouts(self, now: Optional[float] = None) -> List[OrderRecord]:
+        """
+        체결 타임아웃이 지난 미체결 주문을 꺼냄 (deadline 해제, 같은 주문은 한 번만 반환).
+
+        힙 맨 앞부터 만료분만 꺼내므로 비용은 O(만료 건수 × log N).
+        상태는 바꾸지 않습니다 (취소/가격 조정/EXPIRED 표시는 호출부 판단).
+        """
+        now = self._clock() if now is None else now
+        due: List[OrderRecord] = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, _, intent_id = heapq.heappop(self._deadlines)
+            record = self._orders.get(intent_id)
+            if record is None or record.deadline != deadline or not record.is_open:
+                continue
+            record.deadline = None
+            due.append(record)
+        return due
+
+    def _drop_stale_deadlines(self) -> None:
+        while self._deadlines:
+            deadline, _, intent_id = self._deadlines[0]
+            record = self._orders.get(intent_id)
+            if record is not None and record.deadline == deadline and record.is_open:
+                return
+            heapq.heappop(self._deadlines)
+
+
+OrderCallback = Callable[..., Union[None, Awaitable[None]]]
+
+
+class OrderFillPoller:
+    """
+    미체결 주문 체결 조회 폴러 (타이머 1개).
+
+    매 interval마다 OrderBook의 미체결 주문(broker_order_id 보유분)을 한 번에 조회해 반영하고
+    체결 타임아웃이 지난 주문을 on_timeout으로 넘깁니다.
+
+    사용:
+        poller = OrderFillPoller(book, kis_order_adapter, interval=0.5, on_timeout=cancel)
+        await poller.start()
+        ...
+        await poller.stop()
+    """
+
+    def __init__(
+        self,
+        book: OrderBook,
+        adapter: Any,
+        *,
+        interval: float = 1.0,
+        max_concurrency: int = 8,
+        rate_limiter: Optional[RateLimitScheduler] = None,
+        rate_family: Optional[str] = None,
+        on_update: Optional[OrderCallback] = None,
+        on_timeout: Optional[OrderCallback] = None,
+    ) -> None:
+        """
+        Args:
+            book: 대상 OrderBook
+            adapter: get_orders_async(queries) 또는 get_order_async(query)를 가진 브로커 어댑터
+            interval: 조회 주기(초)
+            max_concurrency: 개별 조회 시 동시 요청 상한
+            rate_limiter: 공유 RateLimitScheduler (조회는 Priority.QUERY로 주문 뒤에 줄 섬)
+            rate_family: rate_limiter family (기본: adapter.broker_id)
+            on_update: (record, transitions) 콜백 (async 가능)
+            on_timeout: (record) 콜백 (async 가능)
+        """
+        self.book = book
+        self.adapter = adapter
+        self.interval = interval
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter
+        self.rate_family = rate_family or getattr(adapter, "broker_id", "broker")
+        self.on_update = on_update
+        self.on_timeout = on_timeout
+        self._task: Optional[asyncio.Task] = None
+
+        self.polls = 0
+        self.queries = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="order-fill-poller")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                await self.poll_once()
+            except Exception as e:  # 폴러는 죽지 않음
+                self.last_error = str(e)
+                _log.error(f"OrderFillPoller poll failed: {e}")
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def poll_once(self) -> int:
+        """
+        1회 조회 + 타임아웃 처리.
+
+        Returns:
+            int: 상태/체결 수량이 바뀐 주문 수
+        """
+        self.polls += 1
+        records = [r for r in self.book.open_orders() if r.broker_order_id]
+        changed = 0
+        if records:
+            responses = await self._query(records)
+            for record, resp in zip(records, responses):
+                # 조회 중(await) remove/prune_closed로 빠진 주문은 건너뜀
+                if resp is None or self.book.get(record.intent_id) is not record:
+                    continue
+                transitions = self.book.on_order_response(record.intent_id, resp)
+                if transitions:
+                    changed += 1
+                    await self._call(self.on_update, record, transitions)
+
+        for record in self.book.due_timeouts():
+            self.timeouts += 1
+            await self._call(self.on_timeout, record)
+        return changed
+
+    async def _query(self, records: List[OrderRecord]) -> List[Optional[OrderResponse]]:
+        queries = [OrderQuery(broker_order_id=r.broker_order_id) for r in records]
+        self.queries += len(queries)
+
+        get_many = getattr(self.adapter, "get_orders_async", None)
+        if get_many is not None:
+            try:
+                await self._throttle()
+                return list(await get_many(queries))
+            except Exception as e:
+                self.failures += len(queries)
+                self.last_error = str(e)
+                _log.warning(f"OrderFillPoller batch query failed: {e}")
+                return [None] * len(queries)
+
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def one(query: OrderQuery) -> Optional[OrderResponse]:
+            async with sem:
+                try:
+                    await self._throttle()
+                    return await self.adapter.get_order_async(query)
+                except Exception as e:
+                    self.failures += 1
+                    self.last_error = str(e)
+                    _log.warning(f"OrderFillPoller query failed ({query.broker_order_id}): {e}")
+                    return None
+
+        return list(await asyncio.gather(*(one(q) for q in queries)))
+
+    async def _throttle(self) -> None:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(self.rate_family, Priority.QUERY)
+
+    @staticmethod
+    async def _call(callback: Optional[OrderCallback], *args: Any) -> None:
+        if callback is None:
+            return
+        try:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            _log.error(f"OrderFillPoller callback failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "polls": self.polls,
+            "queries": self.queries,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "open": len(self.book.open_orders()),
+            "last_error": self.last_error,
+        }
@@ -9,3 +9,22 @@ class OrderState(str, Enum):
     ACCEPTED = "ACCEPTED"
     REJECTED = "REJECTED"
     TERMINAL = "TERMINAL"
+
+    # OrderBook(주문별 생명주기) 전용
+    PARTIALLY_FILLED = "PARTIALLY_FILLED"
+    FILLED = "FILLED"
+    CANCELED = "CANCELED"
+    EXPIRED = "EXPIRED"
+
+
+# 체결/취소 대기 중인 상태 (OrderFillPoller 조회 대상)
+OPEN_STATES = frozenset({OrderState.SUBMITTED, OrderState.ACCEPTED, OrderState.PARTIALLY_FILLED})
+
+# 더 이상 전이하지 않는 상태
+CLOSED_STATES = frozenset({
+    OrderState.REJECTED,
+    OrderState.TERMINAL,
+    OrderState.FILLED,
+    OrderState.CANCELED,
+    OrderState.EXPIRED,
+})
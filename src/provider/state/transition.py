@@ -20,6 +20,8 @@ class OrderStateMachine:
     - run_once 호출 단위로 SUBMITTED를 찍고
     - accepted에 따라 ACCEPTED/REJECTED
     - 즉시 TERMINAL까지 밀어 넣어도 됨(최소 기반선)
+
+    주문별 부분 체결/체결/취소 추적은 order_book.OrderBook 사용.
     """
 
     def __init__(self) -> None:
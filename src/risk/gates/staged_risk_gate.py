@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, List, Tuple
 
 from ...strategy.multiplexer.strategy_multiplexer import StrategyIntent
-from ..calculators.strategy_risk_calculator import StrategyRiskCalculator
+from ..calculators.strategy_risk_calculator import RiskResult, StrategyRiskCalculator
 from ..policies.risk_policy import RiskStage
 
 
+_SEVERITY = {RiskStage.WARN: 0, RiskStage.REDUCE: 1, RiskStage.BLOCK: 2}
+
+
 @dataclass(frozen=True)
 class StagedGateEvent:
     strategy_id: str
@@ -20,6 +24,10 @@ class StagedRiskGate:
     Phase 6: RiskGate 단계화(Warn/Reduce/Block).
     - 입력: StrategyIntent (Strategy Context 포함)
     - 출력: 허용된 StrategyIntent 목록 + 이벤트 로그
+
+    Arbitration이 통합한 Intent(sources에 여러 전략)는 수량을 보탠 전략 모두의 정책으로 평가하고
+    가장 제한적인 결과(허용 수량 최소, 동률이면 BLOCK > REDUCE > WARN)를 적용합니다.
+    이벤트의 strategy_id는 그 결과를 낸 전략. 출력은 sources 등 나머지 필드를 유지합니다.
     """
 
     def __init__(self, calculator: StrategyRiskCalculator) -> None:
@@ -30,24 +38,30 @@ class StagedRiskGate:
         events: List[StagedGateEvent] = []
 
         for si in intents:
-            rr = self._calc.evaluate(strategy_id=si.strategy_id, intent=si.intent)
+            strategy_id, rr = self._evaluate(si)
 
             if rr.stage == RiskStage.BLOCK or rr.allowed_qty <= 0:
-                events.append(StagedGateEvent(si.strategy_id, rr.stage, rr.reason))
+                events.append(StagedGateEvent(strategy_id, rr.stage, rr.reason))
                 continue
 
             if rr.stage in (RiskStage.WARN, RiskStage.REDUCE):
-                events.append(StagedGateEvent(si.strategy_id, rr.stage, rr.reason))
+                events.append(StagedGateEvent(strategy_id, rr.stage, rr.reason))
 
             new_intent = si.intent
             # REDUCE거나 WARN cap인 경우 qty 반영(보수적으로 동일 처리)
             if rr.allowed_qty is not None:
                 new_intent = self._calc.apply_qty(si.intent, rr.allowed_qty)
 
-            allowed.append(StrategyIntent(si.strategy_id, si.strategy_name, new_intent))
+            allowed.append(dataclasses.replace(si, intent=new_intent))
 
         return allowed, events
 
+    def _evaluate(self, si: StrategyIntent) -> Tuple[str, RiskResult]:
+        """(결과를 낸 strategy_id, 가장 제한적인 RiskResult)."""
+        strategy_ids = si.sources or (si.strategy_id,)
+        results = [(sid, self._calc.evaluate(strategy_id=sid, intent=si.intent)) for sid in strategy_ids]
+        return min(results, key=lambda item: (item[1].allowed_qty, -_SEVERITY[item[1].stage]))
+
     def unwrap_for_loop(self, allowed: List[StrategyIntent]) -> List[Any]:
         """
         Execution Loop는 Intent list만 받도록 유지한다.
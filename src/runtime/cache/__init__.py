@@ -0,0 +1,32 @@
+"""
+NG-4 Caching Layer
+
+L1 프로세스 내 LRU+TTL 캐시 + 선택적 L2(Redis 호환 백엔드) 계층 캐시.
+L2 장애 시 Circuit Breaker가 L2를 우회하고 원본으로 폴백합니다.
+"""
+
+from .backends import CacheBackend, CacheBackendError, InMemoryBackend, RedisBackend
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .local import MISSING, LocalCache
+from .manager import CacheManager
+from .models import DEFAULT_TTL, DEFAULT_TTLS, CacheKeys, key_family, ttl_for
+from .patterns import CacheAside, WriteThrough
+
+__all__ = [
+    "CacheAside",
+    "CacheBackend",
+    "CacheBackendError",
+    "CacheKeys",
+    "CacheManager",
+    "CircuitBreaker",
+    "CircuitState",
+    "DEFAULT_TTL",
+    "DEFAULT_TTLS",
+    "InMemoryBackend",
+    "LocalCache",
+    "MISSING",
+    "RedisBackend",
+    "WriteThrough",
+    "key_family",
+    "ttl_for",
+]
@@ -0,0 +1,161 @@
+"""
+L2 Cache Backends (NG-4)
+
+docs/arch/sub/19_Caching_Architecture.md §2, §6 참조.
+
+- CacheBackend: L2 인터페이스 (bytes 값 + TTL, 비동기)
+- InMemoryBackend: 프로세스 내 Redis 대체 (테스트/로컬 실행). 장애 주입 지원
+- RedisBackend: redis.asyncio 연결 풀 래퍼 (redis 패키지는 선택 의존성)
+
+백엔드 오류는 모두 CacheBackendError로 변환되어 CacheManager의 Circuit Breaker가 집계합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - optional dependency
+    aioredis = None
+
+
+class CacheBackendError(Exception):
+    """L2 캐시 연결/타임아웃/명령 실패."""
+
+
+class CacheBackend(ABC):
+    """
+    L2 캐시 백엔드 인터페이스 (Redis 호환).
+
+    값은 직렬화된 bytes. TTL은 초 단위(소수 허용, 100ms/50ms 키 지원).
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> int:
+        raise NotImplementedError
+
+    async def ping(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        return None
+
+
+class InMemoryBackend(CacheBackend):
+    """
+    Redis 없이 동작하는 L2 대체 구현.
+
+    Args:
+        latency: 명령당 지연(초, 네트워크 왕복 모사)
+        clock: 단조 시계
+
+    fail=True로 설정하면 모든 명령이 CacheBackendError를 발생시킵니다 (장애 테스트).
+    """
+
+    def __init__(self, *, latency: float = 0.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.latency = latency
+        self.fail = False
+        self.calls = 0
+        self._clock = clock
+        self._data: Dict[str, Tuple[float, bytes]] = {}
+
+    async def _command(self) -> None:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail:
+            raise CacheBackendError("in-memory backend unavailable")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        await self._command()
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            del self._data[key]
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._command()
+        self._data[key] = (self._clock() + ttl, value)
+
+    async def delete(self, *keys: str) -> int:
+        await self._command()
+        return sum(self._data.pop(k, None) is not None for k in keys)
+
+    async def ping(self) -> bool:
+        await self._command()
+        return True
+
+
+class RedisBackend(CacheBackend):
+    """
+    redis.asyncio 클라이언트 래퍼.
+
+    TTL은 PX(밀리초)로 설정합니다. 클라이언트를 직접 주입하거나 from_url로 연결 풀을 생성합니다.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    @classmethod
+    def from_url(
+        cls,
+        redis_url: str,
+        pool_size: int = 10,
+        *,
+        socket_timeout: float = 0.05,
+    ) -> "RedisBackend":
+        if aioredis is None:
+            raise ImportError("redis package is required for RedisBackend (pip install redis)")
+        client = aioredis.from_url(
+            redis_url,
+            max_connections=pool_size,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+        )
+        return cls(client)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self._client.get(key)
+        except Exception as e:
+            raise CacheBackendError(str(e)) from e
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            await self._client.set(key, value, px=max(1, int(ttl * 1000)))
+        except Exception as e:
+            raise CacheBackendError(str(e)) from e
+
+    async def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        try:
+            return int(await self._client.delete(*keys))
+        except Exception as e:
+            raise CacheBackendError(str(e)) from e
+
+    async def ping(self) -> bool:
+        try:
+            return bool(await self._client.ping())
+        except Exception as e:
+            raise CacheBackendError(str(e)) from e
+
+    async def close(self) -> None:
+        close = getattr(self._client, "aclose", None) or getattr(self._client, "close", None)
+        if close is not None:
+            await close()
@@ -0,0 +1,102 @@
+"""
+Cache Circuit Breaker (NG-4)
+
+docs/arch/sub/19_Caching_Architecture.md §6.2 참조.
+
+CLOSED → (연속 실패 failure_threshold회) → OPEN → (recovery_timeout 경과) → HALF_OPEN
+HALF_OPEN에서는 시험 요청 half_open_max_calls건만 허용, 성공 시 CLOSED / 실패 시 다시 OPEN.
+OPEN 동안 CacheManager는 L2를 건너뛰고 L1 + 원본(loader)으로 동작합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+
+class CircuitState(str, Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        *,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._opened_at: Optional[float] = None
+        self._half_open_calls = 0
+        self.consecutive_failures = 0
+        self.opened_count = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if (
+            self._state == CircuitState.OPEN
+            and self._opened_at is not None
+            and self._clock() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+
+    def allow(self) -> bool:
+        """요청 허용 여부 (HALF_OPEN은 시험 요청 수만큼 허용)."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.consecutive_failures = 0
+            if self._state != CircuitState.CLOSED:
+                self._state = CircuitState.CLOSED
+                self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN or (
+                self._state == CircuitState.CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+                self.opened_count += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._opened_at = None
+            self.consecutive_failures = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "opened_count": self.opened_count,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,180 @@
+"""
+Cache Manager (NG-4)
+
+docs/arch/sub/19_Caching_Architecture.md §2, §6 참조.
+
+L1(LocalCache, 프로세스 내) → L2(CacheBackend, 선택) 계층 캐시.
+
+- get: L1 → L2 순 조회, L2 히트는 L1에 채움. 모두 미스면 MISSING
+- set / delete: L1과 L2 동시 반영
+- L2 호출은 Circuit Breaker + 타임아웃으로 보호. 실패/차단 시 L1만 사용 (Graceful Degradation)
+- 지표: 계층별 히트/미스, L2 오류/우회, 조회 지연 (get_metrics / register_metrics)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import pickle
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.monitoring.latency_histogram import LatencyHistogram
+
+from .backends import CacheBackend, CacheBackendError
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .local import MISSING, LocalCache
+
+
+_log = logging.getLogger(__name__)
+
+
+class CacheManager:
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        local: Optional[LocalCache] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        op_timeout: Optional[float] = 0.05,
+        dumps: Callable[[Any], bytes] = pickle.dumps,
+        loads: Callable[[bytes], Any] = pickle.loads,
+    ) -> None:
+        """
+        Args:
+            backend: L2 백엔드 (None이면 L1 전용)
+            local: L1 캐시 (기본 LocalCache())
+            breaker: L2 Circuit Breaker (기본 연속 5회 실패 → 30초 차단)
+            op_timeout: L2 명령 타임아웃(초, None이면 무제한)
+            dumps / loads: L2 값 직렬화
+        """
+        self.local = local or LocalCache()
+        self.backend = backend
+        self.breaker = breaker or CircuitBreaker()
+        self.op_timeout = op_timeout
+        self._dumps = dumps
+        self._loads = loads
+        self.get_hist = LatencyHistogram()
+        self.l2_hist = LatencyHistogram()
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.l2_errors = 0
+        self.l2_skipped = 0
+
+    def ttl_for(self, key: str) -> float:
+        return self.local.ttl_for(key)
+
+    # ------------------------------------------------------------------
+    # 조회 / 쓰기
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> Any:
+        """캐시 값 또는 MISSING. L2 장애는 미스로 처리 (예외 없음)."""
+        started = time.perf_counter()
+        value = self.local.get(key)
+        if value is not MISSING:
+            self.l1_hits += 1
+        else:
+            raw = await self._l2(self.backend.get, key) if self.backend is not None else None
+            if raw is not None:
+                value = self._loads(raw)
+                self.local.set(key, value)
+                self.l2_hits += 1
+            else:
+                self.misses += 1
+        self.get_hist.record(time.perf_counter() - started)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """L1 + L2 저장. 반환: L2까지 반영했으면 True (L1 전용 구성은 항상 True)."""
+        ttl = self.ttl_for(key) if ttl is None else ttl
+        self.local.set(key, value, ttl)
+        if self.backend is None:
+            return True
+        return await self._l2(self.backend.set, key, self._dumps(value), ttl, default=False, ok=True)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.local.delete(key)
+        if self.backend is not None and keys:
+            await self._l2(self.backend.delete, *keys)
+
+    async def health_check(self) -> bool:
+        if self.backend is None:
+            return True
+        return bool(await self._l2(self.backend.ping, default=False))
+
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
+
+    async def _l2(
+        self,
+        op: Callable[..., Awaitable[Any]],
+        *args: Any,
+        default: Any = None,
+        ok: Any = MISSING,
+    ) -> Any:
+        """Circuit Breaker + 타임아웃 보호 L2 호출. 실패 시 default. ok가 주어지면 성공 시 ok 반환."""
+        if not self.breaker.allow():
+            self.l2_skipped += 1
+            return default
+        started = time.perf_counter()
+        try:
+            coro = op(*args)
+            result = await (asyncio.wait_for(coro, self.op_timeout) if self.op_timeout else coro)
+        except (CacheBackendError, asyncio.TimeoutError, OSError) as e:
+            self.l2_errors += 1
+            self.breaker.record_failure()
+            _log.warning(f"L2 cache {getattr(op, '__name__', 'op')} failed: {e!r}")
+            return default
+        self.breaker.record_success()
+        self.l2_hist.record(time.perf_counter() - started)
+        return result if ok is MISSING else ok
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        return {
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "hit_rate": (self.l1_hits + self.l2_hits) / lookups if lookups else 0.0,
+            "l2_errors": self.l2_errors,
+            "l2_skipped": self.l2_skipped,
+            "circuit": self.breaker.stats(),
+            "local": self.local.stats(),
+            "get_ms": self.get_hist.snapshot(scale=1000.0),
+            "l2_ms": self.l2_hist.snapshot(scale=1000.0),
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """MetricsCollector 수집기 형식 ({'counters': ..., 'gauges': ...})."""
+        counters = {
+            "cache.l1_hits": self.l1_hits,
+            "cache.l2_hits": self.l2_hits,
+            "cache.misses": self.misses,
+            "cache.l2_errors": self.l2_errors,
+            "cache.l2_skipped": self.l2_skipped,
+            "cache.evictions": self.local.evictions,
+        }
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        get_ms = self.get_hist.snapshot(scale=1000.0)
+        l2_ms = self.l2_hist.snapshot(scale=1000.0)
+        gauges = {
+            "cache.hit_rate": (self.l1_hits + self.l2_hits) / lookups if lookups else 0.0,
+            "cache.l1_size": float(len(self.local)),
+            "cache.circuit_open": 0.0 if self.breaker.state == CircuitState.CLOSED else 1.0,
+            "cache.get_p50_ms": get_ms["p50"],
+            "cache.get_p99_ms": get_ms["p99"],
+            "cache.l2_p99_ms": l2_ms["p99"],
+        }
+        return {"counters": counters, "gauges": gauges}
+
+    def register_metrics(self, collector: Any, name: str = "cache") -> None:
+        """MetricsCollector에 수집기 등록."""
+        collector.register_collector(name, self.get_metrics)
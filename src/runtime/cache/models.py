@@ -0,0 +1,45 @@
+"""
+Cache Models (NG-4)
+
+docs/arch/sub/19_Caching_Architecture.md §3, §5.1 참조.
+
+- CacheKeys: 키 스키마 (family:{식별자})
+- DEFAULT_TTLS: 키 family별 TTL(초). 모든 키는 명시적 TTL을 가짐
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping, Optional
+
+
+class CacheKeys:
+    PRICE = "price:{symbol}"            # 100ms TTL
+    POSITION = "pos:{symbol}"           # 1s TTL
+    ALL_POSITIONS = "pos:__all__"       # 1s TTL (PortfolioEngine.get_positions 전체 목록)
+    ORDERBOOK = "book:{symbol}:{side}"  # 50ms TTL
+    RISK = "risk:account"               # 5s TTL
+    ORDER = "ord:{order_id}"            # 60s TTL
+    STRATEGY = "strat:{strategy_id}"    # 60s TTL
+    CONFIG = "cfg:{key}"                # 60s TTL (UnifiedConfig 조회 결과)
+
+
+DEFAULT_TTLS: Dict[str, float] = {
+    "price": 0.1,
+    "pos": 1.0,
+    "book": 0.05,
+    "risk": 5.0,
+    "ord": 60.0,
+    "strat": 60.0,
+    "cfg": 60.0,
+}
+
+DEFAULT_TTL = 1.0
+
+
+def key_family(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+def ttl_for(key: str, ttls: Optional[Mapping[str, float]] = None, default: float = DEFAULT_TTL) -> float:
+    """키 family의 TTL (미등록 family는 default)."""
+    return (DEFAULT_TTLS if ttls is None else ttls).get(key_family(key), default)
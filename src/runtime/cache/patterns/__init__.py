@@ -0,0 +1,8 @@
+"""
+NG-4 캐시 패턴 (Cache-Aside / Write-Through).
+"""
+
+from .aside import CacheAside
+from .write import WriteThrough
+
+__all__ = ["CacheAside", "WriteThrough"]
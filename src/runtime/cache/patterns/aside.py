@@ -0,0 +1,75 @@
+"""
+Cache-Aside (NG-4)
+
+docs/arch/sub/19_Caching_Architecture.md §4.1, §6.1 참조.
+
+1. CacheManager 조회 (L1 → L2)
+2. 미스면 loader(원본) 호출 — 같은 키의 동시 미스는 loader 1회로 합침 (single-flight)
+3. 결과를 캐시에 저장 후 반환
+
+캐시 장애(L2 오류/Circuit OPEN)는 CacheManager에서 미스로 처리되므로 항상 원본으로 폴백합니다.
+loader 예외는 캐시하지 않고 호출자에게 전파합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from ..local import MISSING
+from ..manager import CacheManager
+
+
+Loader = Callable[[], Union[Any, Awaitable[Any]]]
+
+
+async def _call(fn: Callable[..., Any], *args: Any) -> Any:
+    result = fn(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+class CacheAside:
+    def __init__(self, cache: CacheManager) -> None:
+        self.cache = cache
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self.loads = 0
+        self.coalesced = 0
+
+    async def get(self, key: str, loader: Loader, ttl: Optional[float] = None) -> Any:
+        value = await self.cache.get(key)
+        if value is not MISSING:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self.loads += 1
+            value = await _call(loader)
+            await self.cache.set(key, value, ttl)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없으면 'exception was never retrieved' 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def refresh(self, key: str, loader: Loader, ttl: Optional[float] = None) -> Any:
+        """캐시를 무시하고 원본에서 다시 읽어 저장 (이벤트 기반 갱신용)."""
+        value = await _call(loader)
+        await self.cache.set(key, value, ttl)
+        return value
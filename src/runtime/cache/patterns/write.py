@@ -0,0 +1,51 @@
+"""
+Write-Through (NG-4)
+
+docs/arch/sub/19_Caching_Architecture.md §4.2 참조.
+
+1. 원본(writer)에 쓰기 — 원본이 진실 공급원이므로 먼저 반영
+2. 성공 시 캐시 갱신
+3. 원본 쓰기 실패 시 해당 키 캐시 무효화 (이전 값이 원본과 어긋났을 수 있음)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Optional
+
+from ..manager import CacheManager
+from .aside import _call
+
+
+_log = logging.getLogger(__name__)
+
+
+class WriteThrough:
+    def __init__(self, cache: CacheManager) -> None:
+        self.cache = cache
+        self.writes = 0
+        self.failures = 0
+
+    async def write(
+        self,
+        key: str,
+        value: Any,
+        writer: Callable[[Any], Any],
+        ttl: Optional[float] = None,
+    ) -> bool:
+        """
+        Args:
+            writer: 원본 쓰기 (value 인자, 동기/비동기). 반환값이 None이 아니면 그 값을 캐시
+        Returns:
+            원본 쓰기 성공 여부
+        """
+        try:
+            stored = await _call(writer, value)
+        except Exception as e:
+            self.failures += 1
+            _log.error(f"Write-through to source failed for {key}: {e}")
+            await self.cache.delete(key)
+            return False
+        self.writes += 1
+        await self.cache.set(key, value if stored is None else stored, ttl)
+        return True
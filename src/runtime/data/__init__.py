@@ -0,0 +1,38 @@
+"""
+NG-3 Data Layer
+
+Google Sheets 대신 핫 패스에서 사용하는 로컬 저장소 (오프라인 동작).
+트랜잭션 테이블은 SQLite(WAL), 분석 테이블은 컬럼 저장소, Sheets는 비동기 미러입니다.
+"""
+
+from .adapters import (
+    DEFAULT_SHEET_MAPPINGS,
+    ColumnarStore,
+    DataSourceAdapter,
+    DataSourceError,
+    GoogleSheetsAdapter,
+    HybridAdapter,
+    SheetMapping,
+    SQLiteAdapter,
+    open_local_store,
+)
+from .repositories import LocalHistoryRepository, LocalLedgerRepository, LocalPositionRepository
+from .schema import ANALYTIC_TABLES, TRANSACTIONAL_TABLES, TableSpec
+
+__all__ = [
+    "ANALYTIC_TABLES",
+    "ColumnarStore",
+    "DEFAULT_SHEET_MAPPINGS",
+    "DataSourceAdapter",
+    "DataSourceError",
+    "GoogleSheetsAdapter",
+    "HybridAdapter",
+    "LocalHistoryRepository",
+    "LocalLedgerRepository",
+    "LocalPositionRepository",
+    "SQLiteAdapter",
+    "SheetMapping",
+    "TRANSACTIONAL_TABLES",
+    "TableSpec",
+    "open_local_store",
+]
@@ -0,0 +1,26 @@
+"""
+NG-3 DataSourceAdapter 구현.
+
+- SQLiteAdapter: 트랜잭션 테이블 (WAL)
+- ColumnarStore: 분석 테이블 (history / tick_data / ohlcv_1d)
+- GoogleSheetsAdapter: 대시보드 시트 미러
+- HybridAdapter: 로컬 저장소 라우팅 + Sheets 비동기 dual-write
+"""
+
+from .base import DataSourceAdapter, DataSourceError
+from .columnar import ColumnarStore
+from .hybrid import HybridAdapter, open_local_store
+from .sheets import DEFAULT_SHEET_MAPPINGS, GoogleSheetsAdapter, SheetMapping
+from .sqlite import SQLiteAdapter
+
+__all__ = [
+    "ColumnarStore",
+    "DEFAULT_SHEET_MAPPINGS",
+    "DataSourceAdapter",
+    "DataSourceError",
+    "GoogleSheetsAdapter",
+    "HybridAdapter",
+    "SQLiteAdapter",
+    "SheetMapping",
+    "open_local_store",
+]
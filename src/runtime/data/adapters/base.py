@@ -0,0 +1,73 @@
+"""
+DataSourceAdapter (NG-3)
+
+docs/arch/sub/18_Data_Layer_Architecture.md §4.1 참조.
+
+저장소 공통 인터페이스. 테이블(TableSpec) 단위로 dict 행을 읽고 씁니다.
+
+- read: 등호 필터 + 시간 컬럼 기간(start 이상, end 미만) + limit
+- write / batch_write: 키가 있는 테이블은 upsert, 없는 테이블은 append
+- 로컬 저장소(SQLite / 컬럼 저장소)는 동기 API (호출당 수 μs~ms, 이벤트 루프에서 직접 호출)
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from ..schema import TableSpec
+
+
+class DataSourceError(Exception):
+    """저장소 연결/쿼리/스키마 오류."""
+
+
+class DataSourceAdapter(ABC):
+    #: 이 저장소가 관리하는 테이블
+    tables: Mapping[str, TableSpec]
+
+    def spec(self, table: str) -> TableSpec:
+        try:
+            return self.tables[table]
+        except KeyError:
+            raise DataSourceError(f"unknown table: {table}") from None
+
+    def supports(self, table: str) -> bool:
+        return table in self.tables
+
+    @abstractmethod
+    def read(
+        self,
+        table: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        *,
+        start: Any = None,
+        end: Any = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def batch_write(self, table: str, rows: Iterable[Mapping[str, Any]]) -> int:
+        raise NotImplementedError
+
+    def write(self, table: str, row: Mapping[str, Any]) -> bool:
+        return self.batch_write(table, [row]) == 1
+
+    @abstractmethod
+    def delete(self, table: str, filters: Mapping[str, Any]) -> int:
+        raise NotImplementedError
+
+    def health_check(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        return None
+
+
+def check_columns(spec: TableSpec, columns: Iterable[str]) -> None:
+    """스키마에 없는 컬럼 거부 (컬럼명은 SQL에 직접 들어가므로 필수)."""
+    known = spec.column_names
+    unknown = [c for c in columns if c not in known]
+    if unknown:
+        raise DataSourceError(f"unknown column(s) for {spec.name}: {', '.join(unknown)}")
@@ -0,0 +1,247 @@
+"""
+ColumnarStore (NG-3)
+
+분석용 테이블(history, tick_data, ohlcv_1d) 컬럼 저장소.
+
+- 파티션(심볼)별 컬럼 numpy 배열, 시간 컬럼 오름차순 유지
+- 기간 조회는 시간 컬럼 searchsorted 2회 + 슬라이스 (행 수와 무관하게 O(log n))
+- append는 파티션 버퍼에 쌓고 다음 조회/flush 때 한 번에 병합 (정렬이 깨졌을 때만 안정 정렬)
+- 키 테이블(history: date, ohlcv_1d: symbol+time)은 같은 시각 행을 마지막 값으로 대체
+- root가 있으면 flush 시 {root}/{table}/{partition}.npz로 저장, 생성 시 로드 (오프라인 영속화)
+
+time 컬럼은 epoch 초(float64), date 컬럼은 datetime64[D]로 저장합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+import numpy as np
+
+from src.shared.timezone_utils import KST, to_kst
+
+from ..schema import ANALYTIC_TABLES, TableSpec
+from .base import DataSourceAdapter, DataSourceError, check_columns
+
+
+_NO_PARTITION = "_all"
+
+
+def _to_epoch(value: Any) -> float:
+    if isinstance(value, datetime):
+        return to_kst(value).timestamp()
+    if isinstance(value, date):
+        return to_kst(datetime(value.year, value.month, value.day)).timestamp()
+    if isinstance(value, str):
+        return to_kst(datetime.fromisoformat(value)).timestamp()
+    return float(value)
+
+
+def _to_day(value: Any) -> np.datetime64:
+    if isinstance(value, datetime):
+        value = to_kst(value).date()
+    if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+        return np.datetime64(datetime.fromtimestamp(float(value), KST).date(), "D")
+    return np.datetime64(value, "D")
+
+
+def _column_array(kind: str, values: List[Any]) -> np.ndarray:
+    if kind == "time":
+        return np.array([_to_epoch(v) for v in values], dtype=np.float64)
+    if kind == "date":
+        return np.array([_to_day(v) for v in values], dtype="datetime64[D]")
+    if kind == "str":
+        return np.array(["" if v is None else str(v) for v in values], dtype=str)
+    if kind == "int":
+        return np.array([0 if v is None else int(v) for v in values], dtype=np.int64)
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+
+class _Partition:
+    __slots__ = ("columns", "pending")
+
+    def __init__(self, columns: Optional[Dict[str, np.ndarray]] = None) -> None:
+        self.columns: Dict[str, np.ndarray] = columns or {}
+        self.pending: List[Mapping[str, Any]] = []
+
+    def __len__(self) -> int:
+        first = next(iter(self.columns.values()), None)
+        return 0 if first is None else int(first.shape[0])
+
+
+class ColumnarStore(DataSourceAdapter):
+    def __init__(
+        self,
+        root: Optional[Union[str, Path]] = None,
+        *,
+        tables: Optional[Mapping[str, TableSpec]] = None,
+    ) -> None:
+        """
+        Args:
+            root: 영속화 디렉터리 (None이면 메모리 전용)
+            tables: 관리할 테이블 (기본 ANALYTIC_TABLES). time_column 필수
+        """
+        self.tables = dict(ANALYTIC_TABLES if tables is None else tables)
+        for spec in self.tables.values():
+            if spec.time_column is None:
+                raise DataSourceError(f"columnar table {spec.name} requires a time column")
+        self.root = Path(root) if root is not None else None
+        self._lock = threading.RLock()
+        self._parts: Dict[str, Dict[str, _Partition]] = {name: {} for name in self.tables}
+        if self.root is not None:
+            self._load()
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def batch_write(self, table: str, rows: Iterable[Mapping[str, Any]]) -> int:
+        spec = self.spec(table)
+        count = 0
+        with self._lock:
+            parts = self._parts[table]
+            for row in rows:
+                check_columns(spec, row)
+                if spec.time_column not in row:
+                    raise DataSourceError(f"{table} row requires {spec.time_column}")
+                key = str(row.get(spec.partition, "")) if spec.partition else _NO_PARTITION
+                parts.setdefault(key, _Partition()).pending.append(row)
+                count += 1
+        return count
+
+    def _merge(self, spec: TableSpec, part: _Partition) -> None:
+        if not part.pending:
+            return
+        rows, part.pending = part.pending, []
+        fresh = {name: _column_array(kind, [row.get(name) for row in rows]) for name, kind in spec.columns}
+        if part.columns:
+            merged = {name: np.concatenate([part.columns[name], fresh[name]]) for name in fresh}
+            boundary = part.columns[spec.time_column][-1] if len(part) else None
+        else:
+            merged, boundary = fresh, None
+        t = merged[spec.time_column]
+        new_t = fresh[spec.time_column]
+        in_order = bool(np.all(new_t[1:] >= new_t[:-1])) and (boundary is None or new_t[0] >= boundary)
+        if not in_order:
+            order = np.argsort(t, kind="stable")
+            merged = {name: col[order] for name, col in merged.items()}
+            t = merged[spec.time_column]
+        if spec.key and t.size > 1:
+            # 같은 시각(키) 중 마지막 입력만 유지 (안정 정렬이므로 입력 순서 보존)
+            keep = np.append(t[1:] != t[:-1], True)
+            if not keep.all():
+                merged = {name: col[keep] for name, col in merged.items()}
+        part.columns = merged
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def read_columns(
+        self,
+        table: str,
+        partition: Optional[str] = None,
+        *,
+        start: Any = None,
+        end: Any = None,
+    ) -> Dict[str, np.ndarray]:
+        """파티션 기간 조회 결과를 컬럼 배열로 반환 (지표 계산용, 행 dict 변환 없음)."""
+        spec = self.spec(table)
+        key = partition if spec.partition else _NO_PARTITION
+        with self._lock:
+            part = self._parts[table].get(key)
+            if part is None:
+                return {name: _column_array(kind, []) for name, kind in spec.columns}
+            self._merge(spec, part)
+            columns = part.columns
+        t = columns[spec.time_column]
+        convert = _to_day if spec.column_type(spec.time_column) == "date" else _to_epoch
+        lo = 0 if start is None else int(np.searchsorted(t, convert(start), side="left"))
+        hi = t.size if end is None else int(np.searchsorted(t, convert(end), side="left"))
+        return {name: col[lo:hi] for name, col in columns.items()}
+
+    def read(
+        self,
+        table: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        *,
+        start: Any = None,
+        end: Any = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        spec = self.spec(table)
+        filters = dict(filters or {})
+        check_columns(spec, filters)
+        if spec.partition and spec.partition in filters:
+            keys = [str(filters.pop(spec.partition))]
+        else:
+            with self._lock:
+                keys = sorted(self._parts[table])
+        out: List[Dict[str, Any]] = []
+        for key in keys:
+            columns = self.read_columns(table, key, start=start, end=end)
+            n = columns[spec.time_column].size
+            mask = np.ones(n, dtype=bool)
+            for column, value in filters.items():
+                mask &= columns[column] == _column_array(spec.column_type(column) or "float", [value])[0]
+            idx = np.flatnonzero(mask)
+            lists = [
+                (name, (columns[name][idx].astype(str) if kind == "date" else columns[name][idx]).tolist())
+                for name, kind in spec.columns
+            ]
+            out.extend({name: values[i] for name, values in lists} for i in range(idx.size))
+        if len(keys) > 1:
+            out.sort(key=lambda row: row[spec.time_column])
+        return out[:limit] if limit is not None else out
+
+    def partitions(self, table: str) -> List[str]:
+        with self._lock:
+            return sorted(self._parts[self.spec(table).name])
+
+    def delete(self, table: str, filters: Mapping[str, Any]) -> int:
+        """파티션 단위 삭제만 지원 (예: {'symbol': '005930'}). 빈 필터는 테이블 전체 삭제."""
+        spec = self.spec(table)
+        with self._lock:
+            parts = self._parts[table]
+            if not filters:
+                removed = sum(len(p) + len(p.pending) for p in parts.values())
+                parts.clear()
+                return removed
+            if spec.partition is None or set(filters) != {spec.partition}:
+                raise DataSourceError(f"{table} supports partition deletes only")
+            part = parts.pop(str(filters[spec.partition]), None)
+            return 0 if part is None else len(part) + len(part.pending)
+
+    # ------------------------------------------------------------------
+    # 영속화
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """버퍼 병합 후 root 디렉터리에 파티션별 npz 저장 (root 없으면 병합만)."""
+        with self._lock:
+            for table, parts in self._parts.items():
+                spec = self.tables[table]
+                for key, part in parts.items():
+                    self._merge(spec, part)
+                    if self.root is not None:
+                        path = self.root / table
+                        path.mkdir(parents=True, exist_ok=True)
+                        np.savez(path / f"{key}.npz", **part.columns)
+
+    def _load(self) -> None:
+        for table, spec in self.tables.items():
+            path = self.root / table
+            if not path.is_dir():
+                continue
+            for file in path.glob("*.npz"):
+                with np.load(file, allow_pickle=False) as data:
+                    columns = {name: data[name] for name in spec.column_names if name in data}
+                if len(columns) == len(spec.columns):
+                    self._parts[table][file.stem] = _Partition(columns)
+
+    def close(self) -> None:
+        if self.root is not None:
+            self.flush()
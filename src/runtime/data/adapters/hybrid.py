@@ -0,0 +1,223 @@
+"""
+HybridAdapter (NG-3)
+
+docs/arch/sub/18_Data_Layer_Architecture.md §4.4 참조.
+
+로컬 저장소(SQLite / ColumnarStore)를 primary로, Google Sheets를 비동기 미러로 쓰는 어댑터.
+
+- 읽기/쓰기는 테이블별 primary 저장소로 라우팅 (핫 패스에서 Sheets 호출 없음)
+- 미러 대상 테이블의 쓰기는 대기열에 적재만 하고 반환. flush / 백그라운드 태스크가 Sheets로 반영
+  - append 테이블: 새 행을 모아 append 1회
+  - snapshot 테이블: 변경 표시만 하고 flush 시 primary 전체 행으로 덮어쓰기 1회
+- 미러 실패는 재시도 대기열로 되돌리고, max_retries 초과 시 버리고 불일치로 집계 (primary는 영향 없음)
+- mirror=None이면 순수 로컬(오프라인) 라우터로 동작
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from ..schema import TableSpec
+from .base import DataSourceAdapter, DataSourceError
+from .columnar import ColumnarStore
+from .sheets import GoogleSheetsAdapter
+from .sqlite import SQLiteAdapter
+
+
+_log = logging.getLogger(__name__)
+
+
+class HybridAdapter(DataSourceAdapter):
+    def __init__(
+        self,
+        stores: Sequence[DataSourceAdapter],
+        mirror: Optional[GoogleSheetsAdapter] = None,
+        *,
+        interval: float = 5.0,
+        max_retries: int = 3,
+    ) -> None:
+        """
+        Args:
+            stores: primary 저장소 목록 (테이블은 먼저 등록한 저장소가 담당)
+            mirror: Sheets 미러 (None이면 미러 없음)
+            interval: 백그라운드 미러 주기(초)
+            max_retries: 미러 실패 재시도 횟수 (초과 시 버림)
+        """
+        self.stores = list(stores)
+        self.mirror = mirror
+        self.interval = interval
+        self.max_retries = max_retries
+        self._routes: Dict[str, DataSourceAdapter] = {}
+        for store in self.stores:
+            for name in store.tables:
+                self._routes.setdefault(name, store)
+        self.tables: Dict[str, TableSpec] = {name: store.tables[name] for name, store in self._routes.items()}
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[Mapping[str, Any]]] = {}
+        self._attempts: Dict[str, int] = {}
+        self._dirty: set = set()
+        self._task: Optional[asyncio.Task] = None
+        self.mirrored_rows = 0
+        self.mirror_errors = 0
+        self.mirror_dropped = 0
+        self.last_error: Optional[str] = None
+
+    def store_for(self, table: str) -> DataSourceAdapter:
+        try:
+            return self._routes[table]
+        except KeyError:
+            raise DataSourceError(f"unknown table: {table}") from None
+
+    # ------------------------------------------------------------------
+    # DataSourceAdapter
+    # ------------------------------------------------------------------
+
+    def read(
+        self,
+        table: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        *,
+        start: Any = None,
+        end: Any = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        return self.store_for(table).read(table, filters, start=start, end=end, limit=limit)
+
+    def batch_write(self, table: str, rows: Iterable[Mapping[str, Any]]) -> int:
+        rows = list(rows)
+        count = self.store_for(table).batch_write(table, rows)
+        if self.mirror is not None and self.mirror.supports(table) and rows:
+            with self._lock:
+                if self.mirror.mode(table) == "snapshot":
+                    self._dirty.add(table)
+                else:
+                    self._pending.setdefault(table, []).extend(rows)
+        return count
+
+    def delete(self, table: str, filters: Mapping[str, Any]) -> int:
+        count = self.store_for(table).delete(table, filters)
+        if count and self.mirror is not None and self.mirror.supports(table) and self.mirror.mode(table) == "snapshot":
+            with self._lock:
+                self._dirty.add(table)
+        return count
+
+    def health_check(self) -> bool:
+        return all(store.health_check() for store in self.stores)
+
+    def close(self) -> None:
+        for store in self.stores:
+            store.close()
+
+    # ------------------------------------------------------------------
+    # Sheets 미러
+    # ------------------------------------------------------------------
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return sum(len(rows) for rows in self._pending.values()) + len(self._dirty)
+
+    async def flush(self) -> int:
+        """대기 중인 미러 쓰기 반영. 반환: 반영한 행 수."""
+        if self.mirror is None:
+            return 0
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            dirty, self._dirty = self._dirty, set()
+        written = 0
+        for table, rows in pending.items():
+            try:
+                written += await self.mirror.append(table, rows)
+                self._attempts.pop(table, None)
+            except Exception as e:
+                self._mirror_failed(table, e, rows)
+        for table in dirty:
+            try:
+                written += await self.mirror.replace(table, self.read(table))
+                self._attempts.pop(table, None)
+            except Exception as e:
+                self._mirror_failed(table, e, None)
+        self.mirrored_rows += written
+        return written
+
+    def _mirror_failed(self, table: str, error: Exception, rows: Optional[List[Mapping[str, Any]]]) -> None:
+        self.mirror_errors += 1
+        self.last_error = f"{table}: {error}"
+        attempts = self._attempts.get(table, 0) + 1
+        if attempts > self.max_retries:
+            self._attempts.pop(table, None)
+            self.mirror_dropped += len(rows) if rows is not None else 1
+            _log.error(f"Sheets mirror gave up on {table} after {attempts - 1} retries: {error}")
+            return
+        self._attempts[table] = attempts
+        _log.warning(f"Sheets mirror failed for {table} (attempt {attempts}): {error}")
+        with self._lock:
+            if rows is None:
+                self._dirty.add(table)
+            else:
+                # 실패 행을 먼저 재시도해 append 순서 유지
+                self._pending[table] = rows + self._pending.get(table, [])
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.mirror is not None and not self.running:
+            self._task = asyncio.create_task(self._run(), name="sheets-mirror")
+
+    async def stop(self, flush: bool = True) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if flush:
+            await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                await self.flush()
+            except Exception as e:  # 미러는 죽지 않음
+                self.last_error = str(e)
+                _log.error(f"Sheets mirror flush failed: {e}")
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tables": sorted(self.tables),
+            "pending": self.pending,
+            "mirrored_rows": self.mirrored_rows,
+            "mirror_errors": self.mirror_errors,
+            "mirror_dropped": self.mirror_dropped,
+            "last_error": self.last_error,
+        }
+
+
+def open_local_store(
+    root: Union[str, Path],
+    *,
+    mirror: Optional[GoogleSheetsAdapter] = None,
+    interval: float = 5.0,
+) -> HybridAdapter:
+    """
+    {root}/qts.db (SQLite WAL, 트랜잭션 테이블) + {root}/columnar (분석 테이블) 로컬 저장소 생성.
+
+    mirror를 주면 Sheets 대시보드로 비동기 dual-write (start()로 백그라운드 반영 시작).
+    """
+    root = Path(root)
+    return HybridAdapter(
+        [SQLiteAdapter(root / "qts.db"), ColumnarStore(root / "columnar")],
+        mirror,
+        interval=interval,
+    )
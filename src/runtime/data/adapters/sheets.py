@@ -0,0 +1,154 @@
+"""
+GoogleSheetsAdapter (NG-3)
+
+docs/arch/sub/18_Data_Layer_Architecture.md §4.3 참조.
+
+로컬 저장소 행을 사람용 대시보드 시트로 반영하는 쓰기 전용 미러 (HybridAdapter의 secondary).
+기존 GoogleSheetsClient(비동기)를 그대로 사용합니다.
+
+- append 테이블(t_ledger, history): 새 행만 append_sheet_data
+- snapshot 테이블(positions): 현재 전체 행을 batch_update 1회로 덮어쓰기
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .base import DataSourceError
+
+
+@dataclass(frozen=True)
+class SheetMapping:
+    """
+    Args:
+        sheet: 시트 이름
+        columns: (테이블 컬럼, 시트 헤더) 목록 — 시트 열 순서
+        mode: "append" 또는 "snapshot"
+        first_row: 데이터 시작 행 (snapshot 덮어쓰기 위치, 1행은 헤더)
+        percent_columns: 저장소는 소수(0.012), 시트는 퍼센트 수치(1.2)로 표기하는 컬럼
+    """
+
+    sheet: str
+    columns: Tuple[Tuple[str, str], ...]
+    mode: str = "append"
+    first_row: int = 2
+    percent_columns: Tuple[str, ...] = ()
+
+    def _cell(self, column: str, value: Any) -> Any:
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return None
+        if column in self.percent_columns:
+            return float(value) * 100.0
+        return value
+
+    def to_record(self, row: Mapping[str, Any]) -> Dict[str, Any]:
+        """저장소 행 → 시트 헤더 키 dict (기존 Sheets 리포지토리 반환 형식)."""
+        return {header: self._cell(column, row.get(column)) for column, header in self.columns}
+
+    def to_values(self, rows: Sequence[Mapping[str, Any]]) -> List[List[Any]]:
+        out = []
+        for row in rows:
+            cells = (self._cell(column, row.get(column)) for column, _ in self.columns)
+            out.append(["" if cell is None else cell for cell in cells])
+        return out
+
+
+# 기존 시트 헤더와 동일한 열 이름 (PortfolioEngine / PerformanceEngine 파싱 키)
+DEFAULT_SHEET_MAPPINGS: Dict[str, SheetMapping] = {
+    "positions": SheetMapping(
+        sheet="Position",
+        columns=(
+            ("symbol", "Symbol"),
+            ("name", "Name"),
+            ("market", "Market"),
+            ("qty", "Qty"),
+            ("avg_price", "Avg_Price(Current_Currency)"),
+            ("current_price", "Current_Price(Current_Currency)"),
+            ("strategy", "Strategy"),
+            ("sector", "Sector"),
+        ),
+        mode="snapshot",
+    ),
+    "t_ledger": SheetMapping(
+        sheet="T_Ledger",
+        columns=(
+            ("timestamp", "Timestamp"),
+            ("symbol", "Symbol"),
+            ("side", "Side"),
+            ("qty", "Qty"),
+            ("price", "Price"),
+            ("amount", "Amount"),
+            ("fee", "Fee"),
+            ("strategy_tag", "Strategy"),
+            ("order_id", "Order_ID"),
+            ("broker", "Broker"),
+        ),
+    ),
+    "history": SheetMapping(
+        sheet="History",
+        columns=(
+            ("date", "Date"),
+            ("total_equity", "Total_Equity"),
+            ("daily_pnl", "Daily_PnL"),
+            ("daily_return", "Daily_Return"),
+            ("cumulative_return", "Cumulative_Return"),
+            ("volatility_20d", "Volatility_20D"),
+            ("high_watermark", "High_Watermark"),
+            ("drawdown", "Drawdown"),
+            ("mdd", "MDD"),
+        ),
+        percent_columns=("daily_return", "cumulative_return", "volatility_20d", "drawdown", "mdd"),
+    ),
+}
+
+
+class GoogleSheetsAdapter:
+    def __init__(self, client: Any, mappings: Optional[Mapping[str, SheetMapping]] = None) -> None:
+        """
+        Args:
+            client: GoogleSheetsClient 호환 객체 (append_sheet_data / batch_update)
+            mappings: 테이블 → SheetMapping (기본 DEFAULT_SHEET_MAPPINGS)
+        """
+        self.client = client
+        self.mappings: Dict[str, SheetMapping] = dict(DEFAULT_SHEET_MAPPINGS if mappings is None else mappings)
+        self._last_rows: Dict[str, int] = {}  # snapshot 테이블별 직전 기록 행 수
+
+    def supports(self, table: str) -> bool:
+        return table in self.mappings
+
+    def mode(self, table: str) -> str:
+        return self._mapping(table).mode
+
+    def _mapping(self, table: str) -> SheetMapping:
+        try:
+            return self.mappings[table]
+        except KeyError:
+            raise DataSourceError(f"no sheet mapping for table: {table}") from None
+
+    async def append(self, table: str, rows: Sequence[Mapping[str, Any]]) -> int:
+        mapping = self._mapping(table)
+        if not rows:
+            return 0
+        await self.client.append_sheet_data(f"{mapping.sheet}!A:A", mapping.to_values(rows))
+        return len(rows)
+
+    async def replace(self, table: str, rows: Sequence[Mapping[str, Any]]) -> int:
+        """시트 데이터 영역을 rows로 덮어쓰기 (행 수가 줄면 남는 행은 빈 값으로 채움)."""
+        mapping = self._mapping(table)
+        values = mapping.to_values(rows)
+        previous = self._last_rows.get(table, 0)
+        if previous > len(values):
+            values.extend([[""] * len(mapping.columns)] * (previous - len(values)))
+        if values:
+            await self.client.batch_update({f"{mapping.sheet}!A{mapping.first_row}": values})
+        self._last_rows[table] = len(rows)
+        return len(rows)
+
+    async def health_check(self) -> bool:
+        check = getattr(self.client, "health_check", None)
+        if check is None:
+            return True
+        result = await check()
+        return bool(result.get("healthy", True)) if isinstance(result, dict) else bool(result)
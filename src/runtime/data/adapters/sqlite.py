@@ -0,0 +1,222 @@
+"""
+SQLiteAdapter (NG-3)
+
+트랜잭션 테이블(positions, t_ledger, strategies, risk_configs)용 내장 SQL 저장소.
+
+- 파일 DB는 WAL 모드 + synchronous=NORMAL: 읽기가 쓰기를 막지 않고, 커밋은 fsync 없이 WAL append
+- TableSpec으로 테이블/인덱스 생성 (symbol, (symbol, timestamp) 등 조회 경로 인덱스)
+- 키 테이블은 INSERT ... ON CONFLICT DO UPDATE (전달된 컬럼만 갱신)
+- batch_write는 단일 트랜잭션 + executemany
+- time 컬럼은 KST ISO-8601 문자열로 저장 (사전순 = 시간순, 기간 조회 인덱스 사용)
+- 연결 1개를 잠금으로 공유 (check_same_thread=False). 문장 캐시는 sqlite3 내장 캐시 사용
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from src.shared.timezone_utils import KST, to_kst
+
+from ..schema import TRANSACTIONAL_TABLES, TableSpec
+from .base import DataSourceAdapter, DataSourceError, check_columns
+
+
+_SQL_TYPES = {"str": "TEXT", "float": "REAL", "int": "INTEGER", "time": "TEXT", "date": "TEXT"}
+
+
+def _sql_value(kind: Optional[str], value: Any) -> Any:
+    if value is None:
+        return None
+    if kind == "time":
+        if isinstance(value, datetime):
+            return to_kst(value).isoformat()
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(float(value), KST).isoformat()
+        return str(value)
+    if kind == "date":
+        return value.isoformat()[:10] if isinstance(value, (date, datetime)) else str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+class SQLiteAdapter(DataSourceAdapter):
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        *,
+        tables: Optional[Mapping[str, TableSpec]] = None,
+        wal: bool = True,
+        timeout: float = 5.0,
+    ) -> None:
+        """
+        Args:
+            path: DB 파일 경로 (":memory:"면 메모리 DB)
+            tables: 관리할 테이블 (기본 TRANSACTIONAL_TABLES)
+            wal: 파일 DB에 WAL 저널 사용
+            timeout: 잠금 대기(초)
+        """
+        self.tables = dict(TRANSACTIONAL_TABLES if tables is None else tables)
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        # isolation_level=None: 자동 커밋, 배치는 명시적 BEGIN/COMMIT
+        self._conn = sqlite3.connect(self.path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        if wal and self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        with self.transaction() as conn:
+            for spec in self.tables.values():
+                cols = ", ".join(f"{name} {_SQL_TYPES[kind]}" for name, kind in spec.columns)
+                if spec.key:
+                    cols += f", PRIMARY KEY ({', '.join(spec.key)})"
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {spec.name} ({cols})")
+                for index in spec.indexes:
+                    conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{spec.name}_{'_'.join(index)} "
+                        f"ON {spec.name} ({', '.join(index)})"
+                    )
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """단일 트랜잭션 (중첩 호출은 바깥 트랜잭션에 합류)."""
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self._conn
+                return
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _where(
+        self,
+        spec: TableSpec,
+        filters: Optional[Mapping[str, Any]],
+        start: Any,
+        end: Any,
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if filters:
+            check_columns(spec, filters)
+            for column, value in filters.items():
+                clauses.append(f"{column} = ?")
+                params.append(_sql_value(spec.column_type(column), value))
+        if (start is not None or end is not None) and spec.time_column is None:
+            raise DataSourceError(f"{spec.name} has no time column")
+        kind = spec.column_type(spec.time_column) if spec.time_column else None
+        if start is not None:
+            clauses.append(f"{spec.time_column} >= ?")
+            params.append(_sql_value(kind, start))
+        if end is not None:
+            clauses.append(f"{spec.time_column} < ?")
+            params.append(_sql_value(kind, end))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def read(
+        self,
+        table: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        *,
+        start: Any = None,
+        end: Any = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        spec = self.spec(table)
+        where, params = self._where(spec, filters, start, end)
+        order = spec.time_column or (spec.key[0] if spec.key else "rowid")
+        sql = f"SELECT {', '.join(spec.column_names)} FROM {spec.name}{where} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise DataSourceError(f"read {table} failed: {e}") from e
+        return [dict(row) for row in rows]
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def batch_write(self, table: str, rows: Iterable[Mapping[str, Any]]) -> int:
+        spec = self.spec(table)
+        # 같은 컬럼 집합끼리 묶어 executemany (부분 갱신 행이 다른 컬럼을 NULL로 덮지 않도록)
+        groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        for row in rows:
+            columns = tuple(c for c in spec.column_names if c in row)
+            if len(columns) != len(row):
+                check_columns(spec, row)
+            groups.setdefault(columns, []).append([_sql_value(spec.column_type(c), row[c]) for c in columns])
+        count = 0
+        try:
+            with self.transaction() as conn:
+                for columns, values in groups.items():
+                    conn.executemany(self._insert_sql(spec, columns), values)
+                    count += len(values)
+        except sqlite3.Error as e:
+            raise DataSourceError(f"write {table} failed: {e}") from e
+        return count
+
+    @staticmethod
+    def _insert_sql(spec: TableSpec, columns: Tuple[str, ...]) -> str:
+        sql = (
+            f"INSERT INTO {spec.name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        if spec.key:
+            missing = [k for k in spec.key if k not in columns]
+            if missing:
+                raise DataSourceError(f"{spec.name} upsert requires key column(s): {', '.join(missing)}")
+            updates = [c for c in columns if c not in spec.key]
+            if updates:
+                sql += (
+                    f" ON CONFLICT ({', '.join(spec.key)}) DO UPDATE SET "
+                    + ", ".join(f"{c} = excluded.{c}" for c in updates)
+                )
+            else:
+                sql += " ON CONFLICT DO NOTHING"
+        return sql
+
+    def delete(self, table: str, filters: Mapping[str, Any]) -> int:
+        spec = self.spec(table)
+        where, params = self._where(spec, filters, None, None)
+        try:
+            with self.transaction() as conn:
+                return conn.execute(f"DELETE FROM {spec.name}{where}", params).rowcount
+        except sqlite3.Error as e:
+            raise DataSourceError(f"delete {table} failed: {e}") from e
+
+    def health_check(self) -> bool:
+        try:
+            with self._lock:
+                return self._conn.execute("SELECT 1").fetchone()[0] == 1
+        except sqlite3.Error:
+            return False
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
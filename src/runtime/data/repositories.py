@@ -0,0 +1,110 @@
+"""
+Local Repositories (NG-3)
+
+DataSourceAdapter 기반 리포지토리. 기존 Sheets 리포지토리(PositionRepository, T_LedgerRepository,
+HistoryRepository)와 같은 비동기 메서드와 같은 시트 헤더 키의 dict를 반환하므로 엔진 코드 변경 없이 교체됩니다.
+
+로컬 저장소 호출은 동기(수십 μs~ms)이므로 이벤트 루프에서 직접 호출합니다.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Mapping, Optional
+
+from src.shared.timezone_utils import now_kst
+
+from .adapters.base import DataSourceAdapter
+from .adapters.sheets import DEFAULT_SHEET_MAPPINGS
+
+
+def _to_sheet(table: str, row: Mapping[str, Any]) -> Dict[str, Any]:
+    return DEFAULT_SHEET_MAPPINGS[table].to_record(row)
+
+
+class LocalPositionRepository:
+    """positions 테이블 (심볼 PK)."""
+
+    def __init__(self, adapter: DataSourceAdapter):
+        self._adapter = adapter
+
+    async def get_all(self) -> List[dict]:
+        return [_to_sheet("positions", row) for row in self._adapter.read("positions")]
+
+    async def get_by_symbol(self, symbol: str) -> Optional[dict]:
+        rows = self._adapter.read("positions", {"symbol": symbol}, limit=1)
+        return _to_sheet("positions", rows[0]) if rows else None
+
+    async def upsert(self, symbol: str, qty: float, avg_price: float, **fields: Any) -> bool:
+        """포지션 갱신 (qty 0이면 삭제). fields: name / market / current_price / strategy / sector."""
+        if not qty:
+            return self._adapter.delete("positions", {"symbol": symbol}) > 0
+        row = {"symbol": symbol, "qty": qty, "avg_price": avg_price, "updated_at": now_kst(), **fields}
+        return self._adapter.write("positions", row)
+
+
+class LocalLedgerRepository:
+    """t_ledger 테이블 (append 전용, (symbol, timestamp) 인덱스)."""
+
+    def __init__(self, adapter: DataSourceAdapter):
+        self._adapter = adapter
+
+    async def get_all(self) -> List[dict]:
+        return [_to_sheet("t_ledger", row) for row in self._adapter.read("t_ledger")]
+
+    async def get_by_symbol(
+        self,
+        symbol: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[dict]:
+        rows = self._adapter.read("t_ledger", {"symbol": symbol}, start=start, end=end)
+        return [_to_sheet("t_ledger", row) for row in rows]
+
+    async def append(self, entry: Mapping[str, Any]) -> bool:
+        """체결 기록 (timestamp 없으면 현재 시각, amount 없으면 qty × price)."""
+        row = dict(entry)
+        row.setdefault("timestamp", now_kst())
+        if row.get("amount") is None and row.get("qty") is not None and row.get("price") is not None:
+            row["amount"] = float(row["qty"]) * float(row["price"])
+        return self._adapter.write("t_ledger", row)
+
+
+class LocalHistoryRepository:
+    """history 테이블 (일자 키, 컬럼 저장소)."""
+
+    def __init__(self, adapter: DataSourceAdapter):
+        self._adapter = adapter
+
+    async def get_all(self) -> List[dict]:
+        return [_to_sheet("history", row) for row in self._adapter.read("history")]
+
+    async def get_execution_history(self, days: int = 30) -> List[dict]:
+        start = now_kst().date() - timedelta(days=days)
+        return [_to_sheet("history", row) for row in self._adapter.read("history", start=start)]
+
+    async def get_performance_metrics(self, days: int = 252) -> List[dict]:
+        return await self.get_execution_history(days)
+
+    async def log_execution(
+        self,
+        total_equity: float,
+        daily_pnl: float,
+        daily_return: float,
+        cumulative_return: float,
+        volatility: Optional[float] = None,
+        high_watermark: Optional[float] = None,
+        drawdown: Optional[float] = None,
+        record_date: Optional[date] = None,
+    ) -> bool:
+        """일별 성과 기록 (수익률 계열은 소수, 같은 날짜는 마지막 기록으로 대체)."""
+        return self._adapter.write("history", {
+            "date": record_date or now_kst().date(),
+            "total_equity": total_equity,
+            "daily_pnl": daily_pnl,
+            "daily_return": daily_return,
+            "cumulative_return": cumulative_return,
+            "volatility_20d": volatility,
+            "high_watermark": high_watermark,
+            "drawdown": drawdown,
+        })
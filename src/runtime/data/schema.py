@@ -0,0 +1,150 @@
+"""
+Local Data Schema (NG-3)
+
+docs/arch/sub/18_Data_Layer_Architecture.md §3 참조.
+
+- TableSpec: 테이블 정의 (컬럼 타입, upsert 키, 시간 컬럼, 인덱스, 파티션 컬럼)
+- TRANSACTIONAL_TABLES: SQLite(WAL) 저장 — positions, t_ledger, strategies, risk_configs
+- ANALYTIC_TABLES: 컬럼 저장소 저장 — history, tick_data, ohlcv_1d
+
+컬럼 타입: str / float / int / time(epoch 초 또는 ISO-8601) / date(YYYY-MM-DD)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    name: str
+    columns: Tuple[Tuple[str, str], ...]
+    key: Tuple[str, ...] = ()                  # upsert 키 (비어 있으면 append 전용)
+    time_column: Optional[str] = None          # 기간 조회 컬럼
+    indexes: Tuple[Tuple[str, ...], ...] = ()
+    partition: Optional[str] = None            # 컬럼 저장소 파티션 컬럼 (심볼별 분할)
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        return tuple(name for name, _ in self.columns)
+
+    def column_type(self, column: str) -> Optional[str]:
+        for name, kind in self.columns:
+            if name == column:
+                return kind
+        return None
+
+
+POSITIONS = TableSpec(
+    name="positions",
+    columns=(
+        ("symbol", "str"),
+        ("name", "str"),
+        ("market", "str"),
+        ("qty", "float"),
+        ("avg_price", "float"),
+        ("current_price", "float"),
+        ("strategy", "str"),
+        ("sector", "str"),
+        ("updated_at", "time"),
+    ),
+    key=("symbol",),
+    time_column="updated_at",
+    indexes=(("market",), ("strategy",)),
+)
+
+T_LEDGER = TableSpec(
+    name="t_ledger",
+    columns=(
+        ("timestamp", "time"),
+        ("symbol", "str"),
+        ("side", "str"),
+        ("qty", "float"),
+        ("price", "float"),
+        ("amount", "float"),
+        ("fee", "float"),
+        ("strategy_tag", "str"),
+        ("order_id", "str"),
+        ("broker", "str"),
+    ),
+    time_column="timestamp",
+    indexes=(("timestamp",), ("symbol", "timestamp"), ("strategy_tag", "timestamp")),
+)
+
+STRATEGIES = TableSpec(
+    name="strategies",
+    columns=(
+        ("strategy_id", "str"),
+        ("param_name", "str"),
+        ("value", "str"),
+        ("value_type", "str"),
+        ("description", "str"),
+        ("updated_at", "time"),
+    ),
+    key=("strategy_id", "param_name"),
+    time_column="updated_at",
+)
+
+RISK_CONFIGS = TableSpec(
+    name="risk_configs",
+    columns=(
+        ("config_key", "str"),
+        ("value", "float"),
+        ("description", "str"),
+        ("updated_at", "time"),
+    ),
+    key=("config_key",),
+)
+
+HISTORY = TableSpec(
+    name="history",
+    columns=(
+        ("date", "date"),
+        ("total_equity", "float"),
+        ("daily_pnl", "float"),
+        ("daily_return", "float"),
+        ("cumulative_return", "float"),
+        ("volatility_20d", "float"),
+        ("high_watermark", "float"),
+        ("drawdown", "float"),
+        ("mdd", "float"),
+    ),
+    key=("date",),
+    time_column="date",
+)
+
+TICK_DATA = TableSpec(
+    name="tick_data",
+    columns=(
+        ("time", "time"),
+        ("symbol", "str"),
+        ("price", "float"),
+        ("volume", "float"),
+        ("bid", "float"),
+        ("ask", "float"),
+    ),
+    time_column="time",
+    partition="symbol",
+)
+
+OHLCV_1D = TableSpec(
+    name="ohlcv_1d",
+    columns=(
+        ("time", "date"),
+        ("symbol", "str"),
+        ("open", "float"),
+        ("high", "float"),
+        ("low", "float"),
+        ("close", "float"),
+        ("volume", "float"),
+    ),
+    key=("symbol", "time"),
+    time_column="time",
+    partition="symbol",
+)
+
+TRANSACTIONAL_TABLES: Dict[str, TableSpec] = {
+    spec.name: spec for spec in (POSITIONS, T_LEDGER, STRATEGIES, RISK_CONFIGS)
+}
+ANALYTIC_TABLES: Dict[str, TableSpec] = {spec.name: spec for spec in (HISTORY, TICK_DATA, OHLCV_1D)}
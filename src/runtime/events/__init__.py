@@ -0,0 +1,32 @@
+"""
+NG-1 Event Priority System
+
+우선순위(P0~P3) lane별 bounded 큐 + 전용 핸들러 스레드 이벤트 버스.
+"""
+
+from .dispatcher import ALL_EVENTS, EventDispatcher
+from .event import QTSEvent
+from .priority import (
+    DEFAULT_LANES,
+    DEFAULT_PRIORITY,
+    EVENT_PRIORITY,
+    EventPriority,
+    LaneConfig,
+    OverflowPolicy,
+    priority_for,
+)
+from .queue import EventQueue
+
+__all__ = [
+    "ALL_EVENTS",
+    "DEFAULT_LANES",
+    "DEFAULT_PRIORITY",
+    "EVENT_PRIORITY",
+    "EventDispatcher",
+    "EventPriority",
+    "EventQueue",
+    "LaneConfig",
+    "OverflowPolicy",
+    "QTSEvent",
+    "priority_for",
+]
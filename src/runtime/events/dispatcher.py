@@ -0,0 +1,372 @@
+"""
+EventDispatcher (NG-1 이벤트 버스)
+
+docs/arch/sub/17_Event_Priority_Architecture.md §3, §5, §7 참조.
+
+- 우선순위 lane별 EventQueue + 전용 핸들러 스레드
+  - P0: 전용 스레드 1개 (BLOCK, 유실 없음) → P1~P3 부하와 격리
+  - P1: 스레드 2개 (DROP_OLDEST), P2: 워커 4개 (COLLAPSE), P3: 1개 (SAMPLE)
+  - async 핸들러: handler_loop를 주면 그 루프(보통 애플리케이션 이벤트 루프)로 넘겨 실행하고 완료까지 대기,
+    없으면 핸들러 스레드별 전용 루프에서 실행. 전용 루프에서는 다른 루프에 묶인 객체
+    (asyncio.Lock/Queue, aiohttp 세션, 다른 루프의 Future 등)를 쓰면 안 됨
+- 구독 단위 lane 지정: subscribe(..., priority=P3) 이면 P0 이벤트라도 그 구독자는 P3 lane에서 처리
+  (느린 대시보드 구독자가 체결 lane을 막지 않음)
+- 지표: lane별 적재→처리 시작 지연 / 핸들러 실행 시간 LatencyHistogram + 큐 카운터 (get_metrics)
+
+생산자(publish)는 큐 적재만 하고 반환합니다. 핸들러 완료를 기다리지 않습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from src.monitoring.latency_histogram import LatencyHistogram
+
+from .event import QTSEvent
+from .priority import DEFAULT_LANES, EventPriority, LaneConfig, OverflowPolicy, priority_for
+from .queue import EventQueue
+
+
+_log = logging.getLogger(__name__)
+
+EventHandler = Callable[[QTSEvent], Any]
+
+ALL_EVENTS = "*"
+
+
+async def _as_coroutine(awaitable: Any) -> Any:
+    return await awaitable
+
+
+class _Subscription:
+    __slots__ = ("handler", "priority", "source")
+
+    def __init__(self, handler: EventHandler, priority: Optional[EventPriority], source: Optional[str]) -> None:
+        self.handler = handler
+        self.priority = priority
+        self.source = source
+
+
+class _Lane:
+    def __init__(self, priority: EventPriority, config: LaneConfig) -> None:
+        self.priority = priority
+        self.config = config
+        self.queue = EventQueue(config.capacity, config.policy, sample_rate=config.sample_rate)
+        self.threads: List[threading.Thread] = []
+        self.lock = threading.Lock()
+        self.wait_hist = LatencyHistogram()
+        self.handle_hist = LatencyHistogram()
+        self.published = 0
+        self.handled = 0
+        self.errors = 0
+        self.late = 0
+
+
+class EventDispatcher:
+    """
+    우선순위 이벤트 버스.
+
+    사용:
+        bus = EventDispatcher()
+        bus.subscribe("FILL_CONFIRMED", on_fill)                       # P0 lane
+        bus.subscribe("positions_updated", dashboard, priority=EventPriority.P3)
+        bus.start()
+        bus.publish("FILL_CONFIRMED", {...}, source="BROKER_KIS")
+        await bus.publish_async("positions_updated", {...})
+        bus.stop()
+    """
+
+    def __init__(
+        self,
+        lanes: Optional[Dict[EventPriority, LaneConfig]] = None,
+        *,
+        block_timeout: Optional[float] = None,
+        handler_loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        """
+        Args:
+            lanes: lane별 설정 (미지정 lane은 DEFAULT_LANES)
+            block_timeout: BLOCK lane 적재 대기 상한(초). None이면 공간이 생길 때까지 대기
+            handler_loop: async 핸들러를 실행할 루프 (run_coroutine_threadsafe). 이 루프 스레드에서는
+                publish 대신 publish_async를 써야 함 (가득 찬 BLOCK lane 대기 중 핸들러가 그 루프를 기다리면 교착)
+        """
+        configs = dict(DEFAULT_LANES)
+        configs.update(lanes or {})
+        self._lanes: Dict[EventPriority, _Lane] = {
+            EventPriority(p): _Lane(EventPriority(p), cfg) for p, cfg in sorted(configs.items())
+        }
+        self.block_timeout = block_timeout
+        self.handler_loop = handler_loop
+        self._subs: Dict[str, List[_Subscription]] = {}
+        self._subs_lock = threading.Lock()
+        self._running = False
+        self.unrouted = 0
+
+    # ------------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------------
+
+    def subscribe(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        *,
+        priority: Optional[EventPriority] = None,
+        source: Optional[str] = None,
+    ) -> EventHandler:
+        """
+        핸들러 등록. handler(event: QTSEvent)는 동기/async 모두 가능.
+
+        Args:
+            event_type: 이벤트 타입 ("*"면 전체)
+            priority: 이 구독자를 처리할 lane (None이면 이벤트 우선순위 lane)
+            source: 지정 시 해당 source 이벤트만 수신
+        """
+        sub = _Subscription(handler, EventPriority(priority) if priority is not None else None, source)
+        with self._subs_lock:
+            # 교체 방식(copy-on-write): 핸들러 스레드는 잠금 없이 목록을 읽음
+            self._subs[event_type] = self._subs.get(event_type, []) + [sub]
+        return handler
+
+    def unsubscribe(self, event_type: str, handler: EventHandler) -> bool:
+        with self._subs_lock:
+            subs = self._subs.get(event_type, [])
+            kept = [s for s in subs if s.handler is not handler]
+            if len(kept) == len(subs):
+                return False
+            if kept:
+                self._subs[event_type] = kept
+            else:
+                self._subs.pop(event_type, None)
+            return True
+
+    def _matching(self, event: QTSEvent) -> List[_Subscription]:
+        subs = self._subs.get(event.event_type, []) + self._subs.get(ALL_EVENTS, [])
+        return [s for s in subs if s.source is None or s.source == event.source]
+
+    def _lane_of(self, sub: _Subscription, event: QTSEvent) -> EventPriority:
+        return sub.priority if sub.priority is not None else event.priority
+
+    # ------------------------------------------------------------------
+    # 발행
+    # ------------------------------------------------------------------
+
+    def _make_event(
+        self,
+        event_type: str,
+        payload: Any,
+        priority: Optional[EventPriority],
+        source: str,
+        collapse_key: Optional[Hashable],
+    ) -> QTSEvent:
+        return QTSEvent(
+            priority=EventPriority(priority) if priority is not None else priority_for(event_type),
+            event_type=event_type,
+            payload=payload,
+            source=source,
+            collapse_key=collapse_key,
+        )
+
+    def _target_lanes(self, event: QTSEvent) -> List[_Lane]:
+        targets = {self._lane_of(s, event) for s in self._matching(event)}
+        if not targets:
+            self.unrouted += 1
+        return [self._lanes[p] for p in sorted(targets)]
+
+    def publish(
+        self,
+        event_type: str,
+        payload: Any = None,
+        *,
+        priority: Optional[EventPriority] = None,
+        source: str = "",
+        collapse_key: Optional[Hashable] = None,
+        block: bool = True,
+    ) -> bool:
+        """
+        이벤트 발행 (구독자 lane 큐에 적재 후 즉시 반환).
+
+        BLOCK lane이 가득 차면 block=True일 때 공간이 생길 때까지(block_timeout) 대기합니다.
+        이벤트 루프 스레드에서는 publish_async 사용.
+
+        Returns:
+            bool: 모든 대상 lane에 적재(병합 포함)되었는지. 구독자가 없으면 True
+        """
+        event = self._make_event(event_type, payload, priority, source, collapse_key)
+        ok = True
+        for lane in self._target_lanes(event):
+            lane.published += 1
+            ok = lane.queue.put(event, block=block, timeout=self.block_timeout) and ok
+        return ok
+
+    async def publish_async(
+        self,
+        event_type: str,
+        payload: Any = None,
+        *,
+        priority: Optional[EventPriority] = None,
+        source: str = "",
+        collapse_key: Optional[Hashable] = None,
+    ) -> bool:
+        """
+        publish 비동기 버전: 먼저 대기 없이 적재하고, BLOCK lane이 가득 찼을 때만
+        워커 스레드에서 대기 (이벤트 루프는 막지 않음).
+        """
+        event = self._make_event(event_type, payload, priority, source, collapse_key)
+        ok = True
+        for lane in self._target_lanes(event):
+            lane.published += 1
+            queue = lane.queue
+            if queue.put_nowait(event):
+                continue
+            if queue.policy is OverflowPolicy.BLOCK:
+                ok = await asyncio.to_thread(queue.put, event, True, self.block_timeout) and ok
+            else:
+                ok = False
+        return ok
+
+    # ------------------------------------------------------------------
+    # 처리
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """lane별 핸들러 스레드 시작."""
+        if self._running:
+            return
+        self._running = True
+        for lane in self._lanes.values():
+            if lane.queue.closed:
+                # stop() 이후 재시작: 닫힌 큐 교체
+                lane.queue = EventQueue(lane.config.capacity, lane.config.policy, sample_rate=lane.config.sample_rate)
+            for i in range(max(1, lane.config.workers)):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(lane,),
+                    name=f"events-{lane.priority.name}-{i}",
+                    daemon=True,
+                )
+                lane.threads.append(thread)
+                thread.start()
+
+    def stop(self, timeout: float = 5.0, drain: bool = True) -> None:
+        """
+        핸들러 스레드 종료.
+
+        Args:
+            timeout: 스레드별 join 대기 상한(초)
+            drain: True면 남은 이벤트 처리 후 종료, False면 버림
+        """
+        if not self._running:
+            return
+        for lane in self._lanes.values():
+            if not drain:
+                while lane.queue.get(timeout=0) is not None:
+                    lane.queue.dropped += 1
+            lane.queue.close()
+        for lane in self._lanes.values():
+            for thread in lane.threads:
+                thread.join(timeout)
+            lane.threads = []
+        self._running = False
+
+    def _worker(self, lane: _Lane) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                event = lane.queue.get(timeout=0.1)
+                if event is None:
+                    if lane.queue.closed:
+                        break
+                    continue
+                self._handle(lane, event, loop)
+        finally:
+            loop.close()
+
+    def _handle(self, lane: _Lane, event: QTSEvent, loop: asyncio.AbstractEventLoop) -> None:
+        started = time.perf_counter()
+        waited = started - event.enqueued_at
+        errors = 0
+        for sub in self._matching(event):
+            if self._lane_of(sub, event) is not lane.priority:
+                continue
+            try:
+                result = sub.handler(event)
+                if inspect.isawaitable(result):
+                    self._await(result, loop)
+            except Exception as e:
+                errors += 1
+                _log.error(f"Event handler failed ({event.event_type}, {lane.priority.name}): {e}")
+        elapsed = time.perf_counter() - started
+
+        late = lane.config.max_latency_ms is not None and waited * 1000.0 > lane.config.max_latency_ms
+        with lane.lock:
+            lane.wait_hist.record(waited)
+            lane.handle_hist.record(elapsed)
+            lane.handled += 1
+            lane.errors += errors
+            if late:
+                lane.late += 1
+
+    def _await(self, awaitable: Any, loop: asyncio.AbstractEventLoop) -> None:
+        """async 핸들러 완료까지 대기: handler_loop가 있으면 그 루프에서, 없으면 스레드 전용 루프에서."""
+        target = self.handler_loop
+        if target is None:
+            loop.run_until_complete(awaitable)
+            return
+        if not target.is_running():
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError("handler_loop is not running")
+        asyncio.run_coroutine_threadsafe(_as_coroutine(awaitable), target).result()
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+
+    def queue_depth(self, priority: EventPriority) -> int:
+        return len(self._lanes[EventPriority(priority)].queue)
+
+    def latency_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """{P0: 적재→처리 시작 지연 요약(ms)}"""
+        out: Dict[str, Dict[str, Any]] = {}
+        for priority, lane in self._lanes.items():
+            with lane.lock:
+                out[priority.name] = lane.wait_hist.snapshot(scale=1000.0)
+        return out
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """MetricsCollector 수집기 형식 ({'counters': ..., 'gauges': ...})."""
+        counters: Dict[str, int] = {"events.unrouted": self.unrouted}
+        gauges: Dict[str, float] = {}
+        for priority, lane in self._lanes.items():
+            prefix = f"events.{priority.name}"
+            q = lane.queue
+            with lane.lock:
+                counters[f"{prefix}.published"] = lane.published
+                counters[f"{prefix}.handled"] = lane.handled
+                counters[f"{prefix}.errors"] = lane.errors
+                counters[f"{prefix}.late"] = lane.late
+                wait = lane.wait_hist.snapshot(scale=1000.0)
+                handle = lane.handle_hist.snapshot(scale=1000.0)
+            counters[f"{prefix}.dropped"] = q.dropped
+            counters[f"{prefix}.collapsed"] = q.collapsed
+            counters[f"{prefix}.sampled_out"] = q.sampled_out
+            counters[f"{prefix}.rejected"] = q.rejected
+            gauges[f"{prefix}.queue_depth"] = float(len(q))
+            for stat in ("mean", "p50", "p99", "max"):
+                gauges[f"{prefix}.latency_{stat}_ms"] = wait[stat]
+            gauges[f"{prefix}.handle_p99_ms"] = handle["p99"]
+        return {"counters": counters, "gauges": gauges}
+
+    def register_metrics(self, collector: Any, name: str = "events") -> None:
+        """MetricsCollector에 수집기 등록."""
+        collector.register_collector(name, self.get_metrics)
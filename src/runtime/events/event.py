@@ -0,0 +1,36 @@
+"""
+QTSEvent (NG-1)
+
+이벤트 데이터 구조. enqueued_at(perf_counter)은 적재→처리 지연 측정용입니다.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Hashable, Optional
+
+from src.shared.timezone_utils import now_kst
+
+from .priority import EventPriority
+
+
+@dataclass
+class QTSEvent:
+    priority: EventPriority
+    event_type: str
+    payload: Any
+    timestamp: datetime = field(default_factory=now_kst)
+    source: str = ""
+    event_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    collapse_key: Optional[Hashable] = None
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def key(self) -> Hashable:
+        """COLLAPSE 병합 키 (기본: source + event_type)."""
+        if self.collapse_key is not None:
+            return self.collapse_key
+        return (self.source, self.event_type)
@@ -0,0 +1,112 @@
+"""
+Event Priority (NG-1)
+
+docs/arch/sub/17_Event_Priority_Architecture.md §2, §10 참조.
+
+- EventPriority: P0(체결) < P1(시세) < P2(전략) < P3(UI/로그), 값이 작을수록 우선
+- OverflowPolicy: 큐가 찼을 때 처리 방식
+- LaneConfig: 우선순위 lane별 큐 용량 / 정책 / 워커 수
+- EVENT_PRIORITY: 이벤트 타입 → 기본 우선순위 카탈로그
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from typing import Dict, Optional
+
+
+class EventPriority(IntEnum):
+    P0 = 0  # Execution/Fill (< 10ms)
+    P1 = 1  # Market Data (< 50ms)
+    P2 = 2  # Strategy (< 500ms)
+    P3 = 3  # UI/Logging (Best Effort)
+
+
+class OverflowPolicy(str, Enum):
+    BLOCK = "BLOCK"              # 생산자 대기, 유실 불가
+    DROP_OLDEST = "DROP_OLDEST"  # 가장 오래된 이벤트 드롭
+    COLLAPSE = "COLLAPSE"        # 같은 collapse key 대기 이벤트를 최신 것으로 병합
+    SAMPLE = "SAMPLE"            # 넘친 이벤트 중 1/N만 유지
+
+
+@dataclass(frozen=True)
+class LaneConfig:
+    """
+    Args:
+        capacity: 큐 용량
+        policy: 오버플로우 정책
+        workers: 핸들러 스레드 수 (각 스레드는 자체 이벤트 루프 보유)
+        sample_rate: SAMPLE 정책에서 유지할 비율
+        max_latency_ms: 적재→처리 시작 지연 경고 기준 (None이면 경고 없음)
+    """
+
+    capacity: int
+    policy: OverflowPolicy
+    workers: int = 1
+    sample_rate: float = 0.1
+    max_latency_ms: Optional[float] = None
+
+
+DEFAULT_LANES: Dict[EventPriority, LaneConfig] = {
+    EventPriority.P0: LaneConfig(capacity=100, policy=OverflowPolicy.BLOCK, workers=1, max_latency_ms=10.0),
+    EventPriority.P1: LaneConfig(capacity=10000, policy=OverflowPolicy.DROP_OLDEST, workers=2, max_latency_ms=50.0),
+    EventPriority.P2: LaneConfig(capacity=1000, policy=OverflowPolicy.COLLAPSE, workers=4, max_latency_ms=500.0),
+    EventPriority.P3: LaneConfig(capacity=50000, policy=OverflowPolicy.SAMPLE, workers=1, sample_rate=0.1),
+}
+
+
+# 이벤트 타입 → 기본 우선순위 (미등록 타입은 DEFAULT_PRIORITY)
+EVENT_PRIORITY: Dict[str, EventPriority] = {
+    # P0: 체결/주문/안전
+    "FILL_CONFIRMED": EventPriority.P0,
+    "FILL_PARTIAL": EventPriority.P0,
+    "ORDER_REJECTED": EventPriority.P0,
+    "ORDER_CANCELLED": EventPriority.P0,
+    "POSITION_UPDATE": EventPriority.P0,
+    "EMERGENCY_STOP": EventPriority.P0,
+    "BROKER_DISCONNECT": EventPriority.P0,
+    # P0: Micro Risk Loop (NG-2) 액션
+    "EMERGENCY_LIQUIDATE": EventPriority.P0,
+    "REDUCE_POSITION": EventPriority.P0,
+    "RISK_WARNING": EventPriority.P0,
+    # P1: 시세
+    "PRICE_TICK": EventPriority.P1,
+    "ORDERBOOK_UPDATE": EventPriority.P1,
+    "VOLUME_UPDATE": EventPriority.P1,
+    "INDEX_UPDATE": EventPriority.P1,
+    "VIX_UPDATE": EventPriority.P1,
+    # P2: 전략/평가
+    "ETEDA_CYCLE_START": EventPriority.P2,
+    "STRATEGY_EVALUATE": EventPriority.P2,
+    "RISK_EVALUATE": EventPriority.P2,
+    "PORTFOLIO_EVALUATE": EventPriority.P2,
+    "INDICATOR_UPDATE": EventPriority.P2,
+    "SIGNAL_GENERATED": EventPriority.P2,
+    "STRATEGY_SIGNAL": EventPriority.P2,
+    # P3: UI/로그
+    "DASHBOARD_UPDATE": EventPriority.P3,
+    "LOG_WRITE": EventPriority.P3,
+    "REPORT_GENERATE": EventPriority.P3,
+    "NOTIFICATION_SEND": EventPriority.P3,
+    "METRIC_RECORD": EventPriority.P3,
+    # 엔진(BaseEngine._emit_event) 이벤트: 대시보드/리포트 갱신용
+    "engine_started": EventPriority.P3,
+    "engine_stopped": EventPriority.P3,
+    "positions_updated": EventPriority.P2,
+    "portfolio_summary_updated": EventPriority.P3,
+    "portfolio_kpi_updated": EventPriority.P3,
+    "exposure_calculated": EventPriority.P2,
+    "sector_allocation_updated": EventPriority.P3,
+    "strategy_allocation_updated": EventPriority.P3,
+    "performance_metrics_calculated": EventPriority.P3,
+    "daily_performance_updated": EventPriority.P3,
+    "monthly_performance_updated": EventPriority.P3,
+    "performance_kpi_updated": EventPriority.P3,
+}
+
+DEFAULT_PRIORITY = EventPriority.P2
+
+
+def priority_for(event_type: str) -> EventPriority:
+    return EVENT_PRIORITY.get(event_type, DEFAULT_PRIORITY)
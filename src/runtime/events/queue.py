@@ -0,0 +1,192 @@
+"""
+EventQueue (NG-1)
+
+우선순위 lane 하나의 bounded 큐 (스레드 안전). 오버플로우 정책:
+
+- BLOCK: 공간이 생길 때까지 생산자 대기 (timeout 시 거부)
+- DROP_OLDEST: 가장 오래된 이벤트를 버리고 적재
+- COLLAPSE: 같은 key의 대기 이벤트가 있으면 그 자리를 최신 이벤트로 교체 (항상 병합),
+  병합 대상이 없는데 가득 차면 DROP_OLDEST
+- SAMPLE: 가득 찬 동안 넘친 이벤트 N개 중 1개만 (가장 오래된 것을 밀어내고) 적재
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, List, Optional
+
+from .event import QTSEvent
+from .priority import OverflowPolicy
+
+
+class EventQueue:
+    def __init__(
+        self,
+        capacity: int,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        *,
+        sample_rate: float = 0.1,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.policy = OverflowPolicy(policy)
+        self._sample_every = max(1, int(round(1.0 / sample_rate))) if sample_rate > 0 else 0
+        # 각 칸은 [event] 셀: COLLAPSE 시 자리를 유지한 채 내용만 교체
+        self._items: Deque[List[QTSEvent]] = deque()
+        self._cells: Dict[Hashable, List[QTSEvent]] = {}
+        self._cond = threading.Condition()  # RLock: put_nowait가 잠금 보유 중 put 호출
+        self._closed = False
+        self._overflow_seen = 0
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.collapsed = 0
+        self.sampled_out = 0
+        self.rejected = 0
+        self.high_watermark = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+
+    def put(self, event: QTSEvent, block: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        이벤트 적재.
+
+        Args:
+            block: BLOCK 정책에서 공간이 없을 때 대기 여부
+            timeout: BLOCK 대기 상한 (초, None이면 무한)
+
+        Returns:
+            bool: 큐에 들어갔거나(병합 포함) False = 거부/드롭
+        """
+        with self._cond:
+            if self._closed:
+                self.rejected += 1
+                return False
+
+            if self.policy is OverflowPolicy.COLLAPSE:
+                cell = self._cells.get(event.key)
+                if cell is not None:
+                    cell[0] = event
+                    self.collapsed += 1
+                    return True
+
+            if len(self._items) >= self.capacity:
+                if not self._make_room(event, block, timeout):
+                    return False
+
+            cell = [event]
+            self._items.append(cell)
+            if self.policy is OverflowPolicy.COLLAPSE:
+                self._cells[event.key] = cell
+            self.enqueued += 1
+            if len(self._items) > self.high_watermark:
+                self.high_watermark = len(self._items)
+            self._cond.notify()
+            return True
+
+    def put_nowait(self, event: QTSEvent) -> bool:
+        """
+        대기 없이 적재 시도. BLOCK 정책에서 가득 찼거나 닫혔으면 거부로 세지 않고 False
+        (호출자가 put(block=True)로 재시도). 다른 정책은 put(block=False)와 같음.
+        """
+        with self._cond:
+            if self.policy is OverflowPolicy.BLOCK and (self._closed or len(self._items) >= self.capacity):
+                return False
+            return self.put(event, block=False)
+
+    def _make_room(self, event: QTSEvent, block: bool, timeout: Optional[float]) -> bool:
+        """가득 찬 상태에서 정책대로 자리 확보 (lock 보유 상태에서 호출)."""
+        policy = self.policy
+        if policy is OverflowPolicy.BLOCK:
+            if not block:
+                self.rejected += 1
+                return False
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while len(self._items) >= self.capacity and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self.rejected += 1
+                    return False
+                self._cond.wait(remaining)
+            if self._closed:
+                self.rejected += 1
+                return False
+            return True
+
+        if policy is OverflowPolicy.SAMPLE:
+            self._overflow_seen += 1
+            if not self._sample_every or self._overflow_seen % self._sample_every:
+                self.sampled_out += 1
+                return False
+
+        # DROP_OLDEST / COLLAPSE(병합 대상 없음) / SAMPLE(채택분)
+        self._pop_locked()
+        self.dropped += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # 꺼내기
+    # ------------------------------------------------------------------
+
+    def _pop_locked(self) -> QTSEvent:
+        cell = self._items.popleft()
+        event = cell[0]
+        if self._cells and self._cells.get(event.key) is cell:
+            del self._cells[event.key]
+        return event
+
+    def get(self, timeout: Optional[float] = None) -> Optional[QTSEvent]:
+        """이벤트 1개 꺼냄. timeout 경과 또는 close 후 비어 있으면 None."""
+        with self._cond:
+            if not self._items:
+                if self._closed:
+                    return None
+                self._cond.wait_for(lambda: self._items or self._closed, timeout)
+                if not self._items:
+                    return None
+            event = self._pop_locked()
+            self._cond.notify_all()  # BLOCK 생산자 깨움
+            return event
+
+    def get_batch(self, max_items: int, timeout: Optional[float] = None) -> List[QTSEvent]:
+        """최대 max_items개 꺼냄 (첫 이벤트까지만 대기)."""
+        first = self.get(timeout)
+        if first is None:
+            return []
+        batch = [first]
+        with self._cond:
+            while self._items and len(batch) < max_items:
+                batch.append(self._pop_locked())
+            self._cond.notify_all()
+        return batch
+
+    def close(self) -> None:
+        """이후 적재 거부, 대기 중인 생산자/소비자 깨움 (남은 이벤트는 get으로 소진 가능)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self._items),
+            "capacity": self.capacity,
+            "policy": self.policy.value,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "collapsed": self.collapsed,
+            "sampled_out": self.sampled_out,
+            "rejected": self.rejected,
+            "high_watermark": self.high_watermark,
+        }
@@ -0,0 +1,43 @@
+"""
+NG-2 Micro Risk Loop
+
+ETEDA와 분리된 100ms 주기 리스크 루프 + copy-on-write 포지션 섀도우.
+"""
+
+from .actions import (
+    FULL_EXIT,
+    KILL_SWITCH,
+    PARTIAL_EXIT,
+    RISK_WARNING,
+    ActionDispatcher,
+    MicroRiskAction,
+)
+from .micro_loop import MicroRiskLoop
+from .rules import (
+    MAEConfig,
+    MarketRiskState,
+    RiskRuleEvaluator,
+    TimeInTradeConfig,
+    TrailingStopConfig,
+    VolatilityConfig,
+)
+from .shadow import PositionShadow, ShadowPosition, ShadowPublisher
+
+__all__ = [
+    "FULL_EXIT",
+    "KILL_SWITCH",
+    "PARTIAL_EXIT",
+    "RISK_WARNING",
+    "ActionDispatcher",
+    "MAEConfig",
+    "MarketRiskState",
+    "MicroRiskAction",
+    "MicroRiskLoop",
+    "PositionShadow",
+    "RiskRuleEvaluator",
+    "ShadowPosition",
+    "ShadowPublisher",
+    "TimeInTradeConfig",
+    "TrailingStopConfig",
+    "VolatilityConfig",
+]
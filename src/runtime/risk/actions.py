@@ -0,0 +1,114 @@
+"""
+Micro Risk Actions (NG-2)
+
+docs/arch/sub/16_Micro_Risk_Loop_Architecture.md §2.5 참조.
+
+- MicroRiskAction: 규칙 평가 결과 (심볼별 1건)
+- ActionDispatcher: 액션 → NG-1 이벤트 버스 P0 이벤트
+  - FULL_EXIT / KILL_SWITCH → EMERGENCY_LIQUIDATE
+  - PARTIAL_EXIT → REDUCE_POSITION
+  - RISK_WARNING → RISK_WARNING
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from src.shared.timezone_utils import now_kst
+
+from ..events import EventDispatcher, EventPriority
+
+
+_log = logging.getLogger(__name__)
+
+FULL_EXIT = "FULL_EXIT"
+PARTIAL_EXIT = "PARTIAL_EXIT"
+KILL_SWITCH = "KILL_SWITCH"
+RISK_WARNING = "RISK_WARNING"
+
+# 심각도 (심볼당 가장 심각한 액션 1건만 유지)
+ACTION_SEVERITY: Dict[str, int] = {
+    KILL_SWITCH: 3,
+    FULL_EXIT: 2,
+    PARTIAL_EXIT: 1,
+    RISK_WARNING: 0,
+}
+
+# 액션 → 버스 이벤트 타입
+ACTION_EVENT_TYPES: Dict[str, str] = {
+    KILL_SWITCH: "EMERGENCY_LIQUIDATE",
+    FULL_EXIT: "EMERGENCY_LIQUIDATE",
+    PARTIAL_EXIT: "REDUCE_POSITION",
+    RISK_WARNING: "RISK_WARNING",
+}
+
+
+@dataclass(frozen=True)
+class MicroRiskAction:
+    action_type: str
+    symbol: str
+    qty: float
+    reason: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    action_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    timestamp: datetime = field(default_factory=now_kst)
+
+    @property
+    def severity(self) -> int:
+        return ACTION_SEVERITY.get(self.action_type, 0)
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "action_id": self.action_id,
+            "action_type": self.action_type,
+            "symbol": self.symbol,
+            "qty": self.qty,
+            "reason": self.reason,
+            "timestamp": self.timestamp.isoformat(),
+            **self.payload,
+        }
+
+
+class ActionDispatcher:
+    """
+    MicroRiskAction 전달.
+
+    Args:
+        bus: NG-1 EventDispatcher (None이면 버스 발행 생략)
+        on_action: 액션 콜백 (테스트/직접 연동용, 동기)
+        source: 버스 이벤트 source
+    """
+
+    def __init__(
+        self,
+        bus: Optional[EventDispatcher] = None,
+        *,
+        on_action: Optional[Callable[[MicroRiskAction], Any]] = None,
+        source: str = "MICRO_RISK",
+    ) -> None:
+        self.bus = bus
+        self.on_action = on_action
+        self.source = source
+        self.dispatched: Dict[str, int] = {}
+
+    def dispatch(self, actions: List[MicroRiskAction]) -> None:
+        for action in actions:
+            self.dispatched[action.action_type] = self.dispatched.get(action.action_type, 0) + 1
+            if action.severity >= ACTION_SEVERITY[PARTIAL_EXIT]:
+                _log.warning(f"Micro risk {action.action_type}: {action.symbol} qty={action.qty} ({action.reason})")
+            if self.bus is not None:
+                self.bus.publish(
+                    ACTION_EVENT_TYPES.get(action.action_type, RISK_WARNING),
+                    action.to_payload(),
+                    priority=EventPriority.P0,
+                    source=self.source,
+                )
+            if self.on_action is not None:
+                try:
+                    self.on_action(action)
+                except Exception as e:
+                    _log.error(f"Micro risk action callback failed: {e}")
@@ -0,0 +1,173 @@
+"""
+Micro Risk Loop (NG-2)
+
+docs/arch/sub/16_Micro_Risk_Loop_Architecture.md §4 참조.
+
+ETEDA와 분리된 전용 스레드에서 interval(기본 100ms)마다:
+    1. ShadowPublisher.snapshot 참조 읽기 (잠금 없음)
+    2. RiskRuleEvaluator로 전 포지션 벡터 평가
+    3. 중복 억제 후 ActionDispatcher로 전달 (NG-1 P0 이벤트)
+
+중복 억제: 같은 포지션(심볼 + 진입 시각)의 같은 액션/사유는 한 번만 전달.
+FULL_EXIT은 포지션이 남아 있으면 repeat_after초마다 재전달 (청산 주문 유실 대비).
+사이클 소요 시간은 LatencyHistogram으로 기록 (get_metrics / register_metrics).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.monitoring.latency_histogram import LatencyHistogram
+
+from .actions import FULL_EXIT, KILL_SWITCH, ActionDispatcher, MicroRiskAction
+from .rules import MarketRiskState, RiskRuleEvaluator
+from .shadow import ShadowPublisher
+
+
+_log = logging.getLogger(__name__)
+
+
+class MicroRiskLoop:
+    def __init__(
+        self,
+        shadow: ShadowPublisher,
+        *,
+        evaluator: Optional[RiskRuleEvaluator] = None,
+        dispatcher: Optional[ActionDispatcher] = None,
+        market_state: Optional[Callable[[], Optional[MarketRiskState]]] = None,
+        interval: float = 0.1,
+        repeat_after: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            shadow: ETEDA가 포지션 스냅샷을 발행하는 ShadowPublisher
+            evaluator: 규칙 평가기 (기본 설정)
+            dispatcher: 액션 전달기 (기본: 버스 없음, 로그만)
+            market_state: 사이클마다 호출되는 시장 상태 공급자 (VIX 등)
+            interval: 사이클 주기(초)
+            repeat_after: FULL_EXIT 재전달 간격(초)
+            clock: epoch 초 시계 (보유 시간 계산용)
+        """
+        self.shadow = shadow
+        self.evaluator = evaluator or RiskRuleEvaluator()
+        self.dispatcher = dispatcher or ActionDispatcher()
+        self.market_state = market_state
+        self.interval = interval
+        self.repeat_after = repeat_after
+        self._clock = clock
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._fired: Dict[Tuple[str, float, str, str], float] = {}
+        self.cycle_hist = LatencyHistogram()
+        self.cycles = 0
+        self.overruns = 0
+        self.errors = 0
+        self.actions_sent = 0
+        self.last_error: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="micro-risk-loop", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """현재 사이클을 마치고 종료."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        next_at = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.run_cycle()
+            except Exception as e:  # 루프는 죽지 않음
+                self.errors += 1
+                self.last_error = str(e)
+                _log.error(f"Micro risk cycle failed: {e}")
+            next_at += self.interval
+            delay = next_at - time.monotonic()
+            if delay < 0:
+                # 주기 초과: 밀린 사이클은 건너뛰고 지금부터 다시 정렬
+                self.overruns += 1
+                next_at = time.monotonic()
+                delay = 0.0
+            self._stop.wait(delay)
+
+    def run_cycle(self, now: Optional[float] = None) -> List[MicroRiskAction]:
+        """1 사이클 (스냅샷 평가 + 전달). 반환: 이번 사이클에 전달한 액션."""
+        started = time.perf_counter()
+        snapshot = self.shadow.snapshot
+        now = self._clock() if now is None else now
+        market = self.market_state() if self.market_state is not None else None
+
+        actions = self._dedupe(self.evaluator.evaluate(snapshot, market, now), now)
+        if actions:
+            self.dispatcher.dispatch(actions)
+            self.actions_sent += len(actions)
+        # 청산된 포지션의 억제 기록 정리
+        if self._fired:
+            self._fired = {k: t for k, t in self._fired.items() if k[0] in snapshot}
+
+        self.cycles += 1
+        self.cycle_hist.record(time.perf_counter() - started)
+        return actions
+
+    def _dedupe(self, actions: List[MicroRiskAction], now: float) -> List[MicroRiskAction]:
+        out: List[MicroRiskAction] = []
+        for action in actions:
+            key = (action.symbol, action.payload.get("entry_time", 0.0), action.action_type, action.reason)
+            last = self._fired.get(key)
+            if last is not None:
+                if action.action_type not in (FULL_EXIT, KILL_SWITCH) or now - last < self.repeat_after:
+                    continue
+            self._fired[key] = now
+            out.append(action)
+        return out
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cycles": self.cycles,
+            "overruns": self.overruns,
+            "errors": self.errors,
+            "actions": self.actions_sent,
+            "positions": len(self.shadow.snapshot),
+            "cycle_ms": self.cycle_hist.snapshot(scale=1000.0),
+            "last_error": self.last_error,
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """MetricsCollector 수집기 형식 ({'counters': ..., 'gauges': ...})."""
+        snap = self.cycle_hist.snapshot(scale=1000.0)
+        counters = {
+            "micro_risk.cycles": self.cycles,
+            "micro_risk.overruns": self.overruns,
+            "micro_risk.errors": self.errors,
+            "micro_risk.actions": self.actions_sent,
+        }
+        gauges = {f"micro_risk.cycle_{stat}_ms": snap[stat] for stat in ("mean", "p50", "p99", "max")}
+        gauges["micro_risk.positions"] = float(len(self.shadow.snapshot))
+        return {"counters": counters, "gauges": gauges}
+
+    def register_metrics(self, collector: Any, name: str = "micro_risk") -> None:
+        """MetricsCollector에 수집기 등록."""
+        collector.register_collector(name, self.get_metrics)
@@ -0,0 +1,194 @@
+"""
+Micro Risk Rules (NG-2)
+
+docs/arch/sub/16_Micro_Risk_Loop_Architecture.md §3 참조.
+
+PositionShadow 배열 전체에 대해 4가지 규칙을 벡터 연산으로 평가합니다 (포지션 수와 무관하게 numpy 연산 수 고정).
+
+1. Trailing Stop: 진입 후 최대 수익(MFE)이 activation 이상이면 활성,
+   고점(숏은 저점) 대비 trail_distance 되돌림 시 FULL_EXIT. 고점이 래칫이므로 스탑도 위로만 이동
+2. MAE: 진입 후 최대 불리 이동이 partial 임계값 이상이면 PARTIAL_EXIT, threshold 이상이면 FULL_EXIT
+3. Time-in-Trade: 전략별 최대 보유 시간 초과 시 FULL_EXIT (수익 중이면 연장), warning 비율 도달 시 RISK_WARNING
+4. Volatility Kill-Switch: VIX ≥ scalp_kill_level → SCALP 전량 청산, VIX ≥ swing_reduce_level → SWING 비율 감축
+
+심볼당 가장 심각한 액션 1건만 반환합니다 (같은 심각도면 위 순서가 우선).
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from .actions import ACTION_SEVERITY, FULL_EXIT, PARTIAL_EXIT, RISK_WARNING, MicroRiskAction
+from .shadow import STRATEGY_CODES, PositionShadow
+
+
+@dataclass(frozen=True)
+class TrailingStopConfig:
+    activation_profit_pct: float = 0.01
+    trail_distance_pct: float = 0.005
+    min_trail_distance: float = 0.0  # 가격 단위 최소 거리 (0이면 비율만)
+
+
+@dataclass(frozen=True)
+class MAEConfig:
+    position_mae_threshold_pct: float = 0.02
+    partial_exit_at_pct: float = 0.015
+    partial_exit_ratio: float = 0.5
+
+
+@dataclass(frozen=True)
+class TimeInTradeConfig:
+    scalp_max_time_sec: Optional[float] = 3600.0
+    swing_max_time_sec: Optional[float] = 604800.0
+    portfolio_max_time_sec: Optional[float] = None
+    warning_at_pct: float = 0.8
+    extension_time_sec: float = 1800.0  # 수익 중이면 연장
+
+
+@dataclass(frozen=True)
+class VolatilityConfig:
+    scalp_kill_level: float = 40.0
+    swing_reduce_level: float = 50.0
+    swing_reduce_ratio: float = 0.5
+
+
+@dataclass(frozen=True)
+class MarketRiskState:
+    """규칙 평가용 시장 상태 (시세 피드/Observer에서 주입)."""
+
+    vix: Optional[float] = None
+
+
+# 규칙 순서 = 같은 심각도에서의 우선순위
+_REASONS = (
+    ("MAE_THRESHOLD_EXCEEDED", FULL_EXIT),
+    ("TRAILING_STOP_HIT", FULL_EXIT),
+    ("TIME_IN_TRADE_EXCEEDED", FULL_EXIT),
+    ("VOLATILITY_KILL_SWITCH", FULL_EXIT),
+    ("MAE_PARTIAL_THRESHOLD", PARTIAL_EXIT),
+    ("VOLATILITY_REDUCE", PARTIAL_EXIT),
+    ("TIME_IN_TRADE_WARNING", RISK_WARNING),
+)
+
+
+class RiskRuleEvaluator:
+    def __init__(
+        self,
+        *,
+        trailing: TrailingStopConfig = TrailingStopConfig(),
+        mae: MAEConfig = MAEConfig(),
+        time_in_trade: TimeInTradeConfig = TimeInTradeConfig(),
+        volatility: VolatilityConfig = VolatilityConfig(),
+    ) -> None:
+        self.trailing = trailing
+        self.mae = mae
+        self.time_in_trade = time_in_trade
+        self.volatility = volatility
+        # 전략 코드 → 최대 보유 시간 (inf = 제한 없음)
+        limits = np.full(max(STRATEGY_CODES.values()) + 2, np.inf)
+        for name, value in (
+            ("SCALP", time_in_trade.scalp_max_time_sec),
+            ("SWING", time_in_trade.swing_max_time_sec),
+            ("PORTFOLIO", time_in_trade.portfolio_max_time_sec),
+        ):
+            if value is not None:
+                limits[STRATEGY_CODES[name]] = value
+        self._time_limits = limits
+
+    def evaluate(
+        self,
+        shadow: PositionShadow,
+        market: Optional[MarketRiskState] = None,
+        now: Optional[float] = None,
+    ) -> List[MicroRiskAction]:
+        n = len(shadow)
+        if n == 0:
+            return []
+        now = time.time() if now is None else now
+        market = market or MarketRiskState()
+
+        direction = shadow.direction
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_avg = np.where(shadow.avg_price > 0, 1.0 / shadow.avg_price, 0.0)
+        price = shadow.current_price
+        pnl_pct = direction * (price - shadow.avg_price) * inv_avg
+        # 롱: 고점=최대 유리, 저점=최대 불리 / 숏: 반대
+        favorable = np.where(direction > 0, shadow.highest, shadow.lowest)
+        adverse = np.where(direction > 0, shadow.lowest, shadow.highest)
+        mfe_pct = direction * (favorable - shadow.avg_price) * inv_avg
+        mae_pct = np.minimum(direction * (adverse - shadow.avg_price) * inv_avg, 0.0)
+        held_sec = now - shadow.entry_time
+        qty = np.abs(shadow.qty)
+
+        # 1. Trailing stop
+        cfg = self.trailing
+        distance = np.maximum(favorable * cfg.trail_distance_pct, cfg.min_trail_distance)
+        stop_price = favorable - direction * distance
+        trailing_active = mfe_pct >= cfg.activation_profit_pct
+        trailing_hit = trailing_active & (direction * (price - stop_price) <= 0)
+
+        # 2. MAE
+        mae_full = mae_pct <= -self.mae.position_mae_threshold_pct
+        mae_partial = mae_pct <= -self.mae.partial_exit_at_pct
+
+        # 3. Time-in-trade
+        limit = self._time_limits[shadow.strategy.astype(np.intp)]
+        limit = np.where(pnl_pct > 0, limit + self.time_in_trade.extension_time_sec, limit)
+        time_exceeded = held_sec >= limit
+        time_warning = held_sec >= limit * self.time_in_trade.warning_at_pct
+
+        # 4. Volatility
+        vix = market.vix
+        vol = self.volatility
+        is_scalp = shadow.strategy == STRATEGY_CODES["SCALP"]
+        is_swing = shadow.strategy == STRATEGY_CODES["SWING"]
+        vol_kill = is_scalp & (vix is not None and vix >= vol.scalp_kill_level)
+        vol_reduce = is_swing & (vix is not None and vix >= vol.swing_reduce_level)
+
+        masks = (mae_full, trailing_hit, time_exceeded, vol_kill, mae_partial, vol_reduce, time_warning)
+        severity = np.full(n, -1, dtype=np.int8)
+        rule = np.full(n, -1, dtype=np.int8)
+        for r, (mask, (_, action_type)) in enumerate(zip(masks, _REASONS)):
+            sev = ACTION_SEVERITY[action_type]
+            take = mask & (severity < sev)
+            severity[take] = sev
+            rule[take] = r
+
+        actions: List[MicroRiskAction] = []
+        for i in np.flatnonzero(rule >= 0):
+            reason, action_type = _REASONS[rule[i]]
+            if action_type == PARTIAL_EXIT:
+                ratio = self.mae.partial_exit_ratio if reason == "MAE_PARTIAL_THRESHOLD" else vol.swing_reduce_ratio
+                action_qty = float(np.floor(qty[i] * ratio))
+                if action_qty <= 0:
+                    continue
+            elif action_type == FULL_EXIT:
+                action_qty = float(qty[i])
+            else:
+                action_qty = 0.0
+            payload = {
+                "side": "SELL" if direction[i] > 0 else "BUY",
+                "current_price": float(price[i]),
+                "pnl_pct": float(pnl_pct[i]),
+                "mae_pct": float(mae_pct[i]),
+                "time_in_trade_sec": float(held_sec[i]),
+                "entry_time": float(shadow.entry_time[i]),
+            }
+            if trailing_active[i]:
+                payload["stop_price"] = float(stop_price[i])
+            if np.isfinite(limit[i]):
+                payload["max_time_sec"] = float(limit[i])
+            if vix is not None:
+                payload["vix"] = float(vix)
+            actions.append(MicroRiskAction(
+                action_type=action_type,
+                symbol=shadow.symbols[i],
+                qty=action_qty,
+                reason=reason,
+                payload=payload,
+            ))
+        return actions
@@ -0,0 +1,245 @@
+"""
+Position Shadow (NG-2)
+
+docs/arch/sub/16_Micro_Risk_Loop_Architecture.md §2.2 참조.
+
+- PositionShadow: 포지션 읽기 전용 스냅샷 (불변). 심볼당 한 행, 필드별 numpy 배열(struct-of-arrays)
+  → Micro Risk 규칙을 전 포지션에 대해 벡터 연산 한 번으로 평가
+- ShadowPublisher: copy-on-write 발행자. ETEDA(포지션) / 시세 피드(가격)가 새 스냅샷을 만들어
+  참조 1회 교체로 원자적 발행. 읽는 쪽(MicroRiskLoop)은 잠금 없이 snapshot 참조만 읽음
+- 로컬 필드(진입 시각, 진입 후 최고/최저가)는 보유가 이어지는 동안 이전 스냅샷에서 승계
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# 전략 코드 (TimeInTrade 한도 구분)
+STRATEGY_CODES: Dict[str, int] = {"SCALP": 0, "SWING": 1, "PORTFOLIO": 2}
+_STRATEGY_NAMES = {code: name for name, code in STRATEGY_CODES.items()}
+OTHER_STRATEGY = 3
+
+
+def strategy_code(strategy: Optional[str]) -> int:
+    return STRATEGY_CODES.get(str(strategy or "").strip().upper(), OTHER_STRATEGY)
+
+
+@dataclass(frozen=True)
+class ShadowPosition:
+    """PositionShadow 한 행의 읽기용 뷰."""
+
+    symbol: str
+    qty: float
+    avg_price: float
+    current_price: float
+    entry_time: float
+    highest_price: float
+    lowest_price: float
+    strategy: str
+
+    @property
+    def unrealized_pnl_pct(self) -> float:
+        if not self.avg_price:
+            return 0.0
+        sign = 1.0 if self.qty >= 0 else -1.0
+        return sign * (self.current_price - self.avg_price) / self.avg_price
+
+
+def _frozen(values: Any, dtype: Any) -> np.ndarray:
+    arr = np.array(values, dtype=dtype)
+    arr.flags.writeable = False
+    return arr
+
+
+class PositionShadow:
+    """
+    포지션 불변 스냅샷 (심볼별 행, 필드별 배열).
+
+    배열은 writeable=False 입니다. 갱신은 with_prices / ShadowPublisher로 새 스냅샷을 만듭니다.
+    시각 필드(entry_time, published_at)는 time.time() 기준 epoch 초.
+    """
+
+    __slots__ = (
+        "symbols", "qty", "avg_price", "current_price", "entry_time",
+        "highest", "lowest", "strategy", "version", "published_at", "_index",
+    )
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        qty: Any,
+        avg_price: Any,
+        current_price: Any,
+        entry_time: Any,
+        highest: Any,
+        lowest: Any,
+        strategy: Any,
+        *,
+        version: int = 0,
+        published_at: Optional[float] = None,
+    ) -> None:
+        self.symbols: Tuple[str, ...] = tuple(symbols)
+        self.qty = _frozen(qty, np.float64)
+        self.avg_price = _frozen(avg_price, np.float64)
+        self.current_price = _frozen(current_price, np.float64)
+        self.entry_time = _frozen(entry_time, np.float64)
+        self.highest = _frozen(highest, np.float64)
+        self.lowest = _frozen(lowest, np.float64)
+        self.strategy = _frozen(strategy, np.int8)
+        self.version = version
+        self.published_at = time.time() if published_at is None else published_at
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    @classmethod
+    def empty(cls) -> "PositionShadow":
+        return cls((), [], [], [], [], [], [], [], version=0)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    def index(self, symbol: str) -> Optional[int]:
+        return self._index.get(symbol)
+
+    def get(self, symbol: str) -> Optional[ShadowPosition]:
+        i = self._index.get(symbol)
+        if i is None:
+            return None
+        return ShadowPosition(
+            symbol=symbol,
+            qty=float(self.qty[i]),
+            avg_price=float(self.avg_price[i]),
+            current_price=float(self.current_price[i]),
+            entry_time=float(self.entry_time[i]),
+            highest_price=float(self.highest[i]),
+            lowest_price=float(self.lowest[i]),
+            strategy=_STRATEGY_NAMES.get(int(self.strategy[i]), "OTHER"),
+        )
+
+    @property
+    def direction(self) -> np.ndarray:
+        """롱 +1 / 숏 -1"""
+        return np.where(self.qty >= 0, 1.0, -1.0)
+
+    def unrealized_pnl_pct(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = self.direction * (self.current_price - self.avg_price) / self.avg_price
+        return np.nan_to_num(pct, nan=0.0, posinf=0.0, neginf=0.0)
+
+    def with_prices(
+        self,
+        prices: Mapping[str, float],
+        *,
+        version: Optional[int] = None,
+        published_at: Optional[float] = None,
+    ) -> "PositionShadow":
+        """현재가 갱신본 (copy-on-write). 최고/최저가는 래칫. 모르는 심볼은 무시."""
+        rows = [(self._index[s], float(p)) for s, p in prices.items() if s in self._index and p]
+        if not rows:
+            return self
+        current = self.current_price.copy()
+        idx, values = zip(*rows)
+        current[list(idx)] = values
+        return PositionShadow(
+            self.symbols,
+            self.qty,
+            self.avg_price,
+            current,
+            self.entry_time,
+            np.maximum(self.highest, current),
+            np.minimum(self.lowest, current),
+            self.strategy,
+            version=self.version + 1 if version is None else version,
+            published_at=published_at,
+        )
+
+
+class ShadowPublisher:
+    """
+    PositionShadow copy-on-write 발행자.
+
+    쓰기(publish_positions / update_prices)는 내부 잠금으로 직렬화하고
+    새 스냅샷을 참조 1회 대입으로 교체합니다. 읽기(snapshot)는 잠금이 없습니다.
+    """
+
+    def __init__(self, clock: Any = time.time) -> None:
+        self._clock = clock
+        self._write_lock = threading.Lock()
+        self._snapshot = PositionShadow.empty()
+
+    @property
+    def snapshot(self) -> PositionShadow:
+        return self._snapshot
+
+    def publish(self, shadow: PositionShadow) -> PositionShadow:
+        with self._write_lock:
+            self._snapshot = shadow
+        return shadow
+
+    def publish_positions(self, positions: Iterable[Any]) -> PositionShadow:
+        """
+        포지션 목록으로 새 스냅샷 발행 (ETEDA 포지션 조회 직후).
+
+        positions: symbol / quantity(또는 qty) / avg_price / current_price / strategy 속성 또는 키를 가진 객체.
+        수량 0인 포지션은 제외. 이전 스냅샷에 있던 심볼은 진입 시각·최고/최저가를 승계합니다.
+        current_price가 없으면 직전 현재가(새 진입은 평균가)를 사용합니다.
+        """
+        rows = []
+        for pos in positions:
+            qty = float(_field(pos, "quantity", _field(pos, "qty", 0)) or 0)
+            if not qty:
+                continue
+            rows.append((
+                str(_field(pos, "symbol")),
+                qty,
+                float(_field(pos, "avg_price", 0) or 0),
+                float(_field(pos, "current_price", 0) or 0),
+                strategy_code(_field(pos, "strategy")),
+            ))
+
+        with self._write_lock:
+            prev = self._snapshot
+            now = self._clock()
+            symbols, qty, avg, price, strat, entry, high, low = [], [], [], [], [], [], [], []
+            for symbol, q, a, p, s in rows:
+                i = prev.index(symbol)
+                # 같은 방향 보유가 이어지면 로컬 필드 승계, 아니면 새 진입
+                held = i is not None and np.sign(prev.qty[i]) == np.sign(q)
+                if p <= 0:
+                    # 현재가 미제공: 직전 현재가(없으면 평균가)로 대체해 최고/최저가 오염 방지
+                    p = float(prev.current_price[i]) if held else a
+                symbols.append(symbol)
+                qty.append(q)
+                avg.append(a)
+                price.append(p)
+                strat.append(s)
+                entry.append(prev.entry_time[i] if held else now)
+                high.append(max(prev.highest[i], p) if held else p)
+                low.append(min(prev.lowest[i], p) if held else p)
+            shadow = PositionShadow(
+                symbols, qty, avg, price, entry, high, low, strat,
+                version=prev.version + 1, published_at=now,
+            )
+            self._snapshot = shadow
+        return shadow
+
+    def update_prices(self, prices: Mapping[str, float]) -> PositionShadow:
+        """현재가만 갱신해 발행 (시세 틱/ETEDA Extract)."""
+        with self._write_lock:
+            shadow = self._snapshot.with_prices(prices, published_at=self._clock())
+            self._snapshot = shadow
+        return shadow
+
+
+def _field(obj: Any, name: str, default: Any = None) -> Any:
+    if isinstance(obj, Mapping):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
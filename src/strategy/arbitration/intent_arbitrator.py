@@ -1,34 +1,160 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+import copy
+import dataclasses
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from ..multiplexer.strategy_multiplexer import StrategyIntent
 
+_log = logging.getLogger(__name__)
+
+Scorer = Callable[[StrategyIntent], float]
+
+QTY_EPSILON = 1e-9  # |순수량|이 이 값 이하면 완전 상쇄로 봄 (부동소수 합산 오차)
+
+_SYMBOL_KEYS = ("symbol", "ticker", "code")
+_SIDE_KEYS = ("side", "direction")
+_QTY_KEYS = ("qty", "quantity", "size")
+
+
+@dataclass(frozen=True)
+class ArbitrationStats:
+    inputs: int  # 입력 Intent 수
+    outputs: int  # 출력 Intent 수 (브로커로 보낼 주문 수)
+    netted: int  # 매수/매도 상쇄가 일어난 심볼 수
+    flattened: int  # 완전 상쇄로 주문이 사라진 심볼 수
+    dropped: int  # min_score 미달로 제외된 Intent 수
+    invalid: int = 0  # 수량이 NaN/inf라 제외된 Intent 수
+
+
+class _Book:
+    """심볼 1개의 매수/매도 누적 수량과 측별 최고 점수 Intent."""
+
+    __slots__ = ("order", "buy_qty", "sell_qty", "buy", "sell", "sources")
+
+    def __init__(self, order: int) -> None:
+        self.order = order
+        self.buy_qty = 0.0
+        self.sell_qty = 0.0
+        self.buy: Optional[Tuple[float, StrategyIntent]] = None
+        self.sell: Optional[Tuple[float, StrategyIntent]] = None
+        self.sources: Dict[str, None] = {}
+
 
 class IntentArbitrator:
     """
-    Phase 6: 제한적 Arbitration.
-    - 동일 symbol/side 중복이면 첫 번째만 남김(보수적).
-    - 최적화/점수화/성과 비교 금지.
+    Phase 6 Arbitration: 심볼별 1개 Intent로 통합.
+
+    - 심볼 → _Book 해시맵으로 1회 순회 (O(n))
+    - 같은 방향 수량은 합산, 반대 방향은 상쇄 (순매수 > 0 → BUY, < 0 → SELL,
+      |순매수| <= epsilon → 주문 없음)
+    - 통합 Intent는 이긴 방향에서 점수가 가장 높은 Intent를 복사해 수량만 바꿈
+      (동점은 먼저 들어온 Intent), 출력은 점수 내림차순
+    - 점수: scorer(StrategyIntent) 또는 priorities[strategy_id] (기본 0).
+      min_score가 있으면 미달 Intent는 통합 전에 제외
+    - side가 BUY/SELL이 아니거나 수량이 없는 Intent는 기존 규칙대로 (symbol, side)별 첫 번째만 유지
+    - 수량이 NaN/inf인 Intent는 제외 (last_stats.invalid)
     """
 
+    def __init__(
+        self,
+        scorer: Optional[Scorer] = None,
+        *,
+        priorities: Optional[Mapping[str, float]] = None,
+        min_score: Optional[float] = None,
+        epsilon: float = QTY_EPSILON,
+    ) -> None:
+        self.priorities: Dict[str, float] = dict(priorities or {})
+        self.scorer: Scorer = scorer or self._priority_score
+        self.min_score = min_score
+        self.epsilon = epsilon
+        self.last_stats = ArbitrationStats(0, 0, 0, 0, 0)
+
+    def _priority_score(self, si: StrategyIntent) -> float:
+        return self.priorities.get(si.strategy_id, 0.0)
+
     def arbitrate(self, intents: List[StrategyIntent]) -> List[StrategyIntent]:
-        seen: Dict[Tuple[str, str], bool] = {}
-        out: List[StrategyIntent] = []
+        books: Dict[str, _Book] = {}
+        passthrough: Dict[Tuple[str, str], Tuple[float, int, StrategyIntent]] = {}
+        dropped = invalid = 0
 
-        for si in intents:
-            symbol = self._get_attr(si.intent, ("symbol", "ticker", "code"), default="")
-            side = self._get_attr(si.intent, ("side", "direction"), default="")
-            key = (str(symbol), str(side))
+        for order, si in enumerate(intents):
+            score = self.scorer(si)
+            if self.min_score is not None and score < self.min_score:
+                dropped += 1
+                continue
+            symbol = str(self._get_attr(si.intent, _SYMBOL_KEYS, default=""))
+            side = str(self._get_attr(si.intent, _SIDE_KEYS, default=""))
+            qty = self._get_attr(si.intent, _QTY_KEYS, default=None)
+            normalized = side.upper()
+            if isinstance(qty, float) and not math.isfinite(qty):
+                _log.warning("Intent from %s dropped: non-finite qty %r (%s)", si.strategy_id, qty, symbol)
+                invalid += 1
+                continue
+            if normalized not in ("BUY", "SELL") or not isinstance(qty, (int, float)) or qty <= 0:
+                passthrough.setdefault((symbol, side), (score, order, si))
+                continue
+
+            book = books.get(symbol)
+            if book is None:
+                book = books[symbol] = _Book(order)
+            book.sources.setdefault(si.strategy_id)
+            if normalized == "BUY":
+                book.buy_qty += qty
+                if book.buy is None or score > book.buy[0]:
+                    book.buy = (score, si)
+            else:
+                book.sell_qty += qty
+                if book.sell is None or score > book.sell[0]:
+                    book.sell = (score, si)
 
-            if key in seen:
+        ranked: List[Tuple[float, int, StrategyIntent]] = list(passthrough.values())
+        netted = flattened = 0
+        for book in books.values():
+            if book.buy is not None and book.sell is not None:
+                netted += 1
+            net = book.buy_qty - book.sell_qty
+            if abs(net) <= self.epsilon:
+                flattened += 1
                 continue
-            seen[key] = True
-            out.append(si)
+            score, best = book.buy if net > 0 else book.sell
+            ranked.append((score, book.order, self._consolidate(best, abs(net), tuple(book.sources))))
 
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        out = [si for _, _, si in ranked]
+        self.last_stats = ArbitrationStats(len(intents), len(out), netted, flattened, dropped, invalid)
         return out
 
+    def _consolidate(self, si: StrategyIntent, qty: float, sources: Tuple[str, ...]) -> StrategyIntent:
+        current = self._get_attr(si.intent, _QTY_KEYS, default=None)
+        if current != qty:
+            if isinstance(current, int) and float(qty).is_integer():
+                qty = int(qty)
+            intent = self._with_qty(si.intent, qty)
+        else:
+            intent = si.intent
+        return dataclasses.replace(si, intent=intent, sources=sources)
+
+    def _with_qty(self, intent: Any, qty: float) -> Any:
+        if isinstance(intent, Mapping):
+            key = next(k for k in _QTY_KEYS if k in intent)
+            return {**intent, key: qty}
+        key = next(k for k in _QTY_KEYS if hasattr(intent, k))
+        if dataclasses.is_dataclass(intent):
+            return dataclasses.replace(intent, **{key: qty})
+        clone = copy.copy(intent)
+        setattr(clone, key, qty)
+        return clone
+
     def _get_attr(self, obj: Any, keys: tuple[str, ...], default: Any) -> Any:
+        if isinstance(obj, Mapping):
+            for k in keys:
+                if k in obj:
+                    return obj[k]
+            return default
         for k in keys:
             if hasattr(obj, k):
                 return getattr(obj, k)
@@ -12,7 +12,9 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 from dataclasses import dataclass
 
+from ...monitoring.latency_histogram import LatencyHistogram
 from ...qts.core.config.config_models import UnifiedConfig
+from ...runtime.events import EventDispatcher, EventPriority, QTSEvent
 from ...shared.timezone_utils import now_kst
 
 
@@ -33,6 +35,40 @@ class EngineMetrics:
     error_operations: int = 0
     average_execution_time: float = 0.0
     last_execution_time: Optional[float] = None
+    total_execution_time: float = 0.0
+    max_execution_time: float = 0.0
+
+
+class OperationMetrics:
+    """operation별 실행 지표 (누적합 + 지연 히스토그램, 갱신 O(1))"""
+
+    __slots__ = ("count", "success", "errors", "total_time", "latency")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.success = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.latency = LatencyHistogram()
+
+    def record(self, execution_time: float, success: bool) -> None:
+        self.count += 1
+        if success:
+            self.success += 1
+        else:
+            self.errors += 1
+        self.total_time += execution_time
+        self.latency.record(execution_time)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """count/success/errors + 지연(ms) p50/p95/p99/max"""
+        data: Dict[str, Any] = {
+            'count': self.count,
+            'success': self.success,
+            'errors': self.errors,
+        }
+        data.update({f"{k}_ms": v for k, v in self.latency.snapshot(scale=1000.0).items() if k != 'count'})
+        return data
 
 
 class BaseEngine(ABC):
@@ -55,9 +91,15 @@ class BaseEngine(ABC):
         # 상태 관리
         self.state = EngineState()
         self.metrics = EngineMetrics()
+        self._latency = LatencyHistogram()
+        self._operation_metrics: Dict[str, OperationMetrics] = {}
         
-        # 이벤트 콜백
+        # 이벤트 콜백 (event_bus 연결 시 버스 구독으로 전달)
         self._event_callbacks: Dict[str, List[callable]] = {}
+        self._event_bus: Optional[EventDispatcher] = None
+        self._bus_handlers: Dict[tuple, callable] = {}
+        self._event_priorities: Dict[str, EventPriority] = {}
+        self._event_source = f"{self.__class__.__name__}:{id(self):x}"
         
         self.logger.info(f"{self.__class__.__name__} initialized")
     
@@ -117,6 +159,8 @@ class BaseEngine(ABC):
             self._event_callbacks[event_type] = []
         
         self._event_callbacks[event_type].append(callback)
+        if self._event_bus is not None:
+            self._subscribe_bus(event_type, callback)
         self.logger.debug(f"Registered callback for event: {event_type}")
     
     def unregister_event_callback(self, event_type: str, callback: callable) -> None:
@@ -133,6 +177,45 @@ class BaseEngine(ABC):
                 self.logger.debug(f"Unregistered callback for event: {event_type}")
             except ValueError:
                 pass
+        handler = self._bus_handlers.pop((event_type, id(callback)), None)
+        if handler is not None and self._event_bus is not None:
+            self._event_bus.unsubscribe(event_type, handler)
+    
+    def attach_event_bus(
+        self,
+        bus: EventDispatcher,
+        priorities: Optional[Dict[str, EventPriority]] = None,
+    ) -> None:
+        """
+        이벤트 버스 연결: 이후 _emit_event는 버스에 발행만 하고 반환 (콜백을 인라인으로 기다리지 않음).
+
+        등록된 콜백은 버스 구독자가 되어 lane 핸들러 스레드(자체 이벤트 루프)에서 실행됩니다.
+
+        Args:
+            bus: EventDispatcher
+            priorities: event_type별 콜백 처리 lane 지정 (예: 대시보드 콜백을 P3로)
+        """
+        if self._event_bus is not None:
+            for (event_type, _), handler in self._bus_handlers.items():
+                self._event_bus.unsubscribe(event_type, handler)
+            self._bus_handlers.clear()
+        self._event_bus = bus
+        self._event_priorities = dict(priorities or {})
+        for event_type, callbacks in self._event_callbacks.items():
+            for callback in callbacks:
+                self._subscribe_bus(event_type, callback)
+    
+    def _subscribe_bus(self, event_type: str, callback: callable) -> None:
+        def handler(event: QTSEvent):
+            return callback(event.payload)
+        
+        self._bus_handlers[(event_type, id(callback))] = handler
+        self._event_bus.subscribe(
+            event_type,
+            handler,
+            priority=self._event_priorities.get(event_type),
+            source=self._event_source,
+        )
     
     async def _emit_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """
@@ -142,6 +225,9 @@ class BaseEngine(ABC):
             event_type: 이벤트 타입
             data: 이벤트 데이터
         """
+        if self._event_bus is not None:
+            await self._event_bus.publish_async(event_type, data, source=self._event_source)
+            return
         if event_type in self._event_callbacks:
             for callback in self._event_callbacks[event_type]:
                 try:
@@ -149,13 +235,14 @@ class BaseEngine(ABC):
                 except Exception as e:
                     self.logger.error(f"Error in event callback for {event_type}: {str(e)}")
     
-    def _update_metrics(self, execution_time: float, success: bool) -> None:
+    def _update_metrics(self, execution_time: float, success: bool, operation: Optional[str] = None) -> None:
         """
-        성과 지표 업데이트
+        성과 지표 업데이트 (누적합 기반 O(1))
         
         Args:
-            execution_time: 실행 시간
+            execution_time: 실행 시간 (초)
             success: 성공 여부
+            operation: execute()의 operation 값 (operation별 지표 분리용)
         """
         self.metrics.total_operations += 1
         self.metrics.last_execution_time = execution_time
@@ -166,13 +253,67 @@ class BaseEngine(ABC):
             self.metrics.error_operations += 1
             self.state.error_count += 1
         
-        # 평균 실행 시간 계산
-        if self.metrics.total_operations > 0:
-            total_time = sum([
-                self.metrics.last_execution_time or 0.0
-                for _ in range(self.metrics.total_operations)
-            ])
-            self.metrics.average_execution_time = total_time / self.metrics.total_operations
+        # 평균 실행 시간: 누적합 / 건수
+        self.metrics.total_execution_time += execution_time
+        if execution_time > self.metrics.max_execution_time:
+            self.metrics.max_execution_time = execution_time
+        self.metrics.average_execution_time = self.metrics.total_execution_time / self.metrics.total_operations
+        
+        self._latency.record(execution_time)
+        key = operation if operation else 'unknown'
+        op_metrics = self._operation_metrics.get(key)
+        if op_metrics is None:
+            op_metrics = self._operation_metrics[key] = OperationMetrics()
+        op_metrics.record(execution_time, success)
+    
+    def get_latency_snapshot(self) -> Dict[str, Any]:
+        """
+        실행 지연 분포 스냅샷 (ms)
+        
+        Returns:
+            Dict[str, Any]: {'overall': {count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}, 'operations': {op: {...}}}
+        """
+        overall = {
+            (k if k == 'count' else f"{k}_ms"): v
+            for k, v in self._latency.snapshot(scale=1000.0).items()
+        }
+        return {
+            'overall': overall,
+            'operations': {op: m.snapshot() for op, m in self._operation_metrics.items()},
+        }
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        MetricsCollector 수집기 형식 지표 ({'counters': ..., 'gauges': ...})
+        
+        키: engine.<EngineName>.<metric>, engine.<EngineName>.op.<operation>.<metric>
+        """
+        prefix = f"engine.{self.__class__.__name__}"
+        counters: Dict[str, int] = {
+            f"{prefix}.operations": self.metrics.total_operations,
+            f"{prefix}.errors": self.metrics.error_operations,
+        }
+        gauges: Dict[str, float] = {}
+        for k, v in self._latency.snapshot(scale=1000.0).items():
+            if k != 'count':
+                gauges[f"{prefix}.{k}_ms"] = v
+        for op, m in self._operation_metrics.items():
+            op_prefix = f"{prefix}.op.{op}"
+            counters[f"{op_prefix}.calls"] = m.count
+            counters[f"{op_prefix}.errors"] = m.errors
+            for k, v in m.latency.snapshot(scale=1000.0).items():
+                if k != 'count':
+                    gauges[f"{op_prefix}.{k}_ms"] = v
+        return {'counters': counters, 'gauges': gauges}
+    
+    def register_metrics(self, collector: Any) -> None:
+        """
+        MetricsCollector에 엔진 지표 수집기 등록 (pull 방식, snapshot() 시 get_metrics 호출)
+        
+        Args:
+            collector: MetricsCollector (register_collector 제공)
+        """
+        collector.register_collector(f"engine.{self.__class__.__name__}", self.get_metrics)
     
     def _update_state(self, is_running: bool, error: Optional[str] = None) -> None:
         """
@@ -224,7 +365,9 @@ class BaseEngine(ABC):
                     if self.metrics.total_operations > 0 else 0.0
                 ),
                 'average_execution_time': self.metrics.average_execution_time,
-                'last_execution_time': self.metrics.last_execution_time
+                'last_execution_time': self.metrics.last_execution_time,
+                'max_execution_time': self.metrics.max_execution_time,
+                'latency': self.get_latency_snapshot()
             },
             'config': {
                 'config_map_size': len(self.config.config_map),
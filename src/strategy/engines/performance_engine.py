@@ -14,7 +14,17 @@ import asyncio
 import statistics
 import math
 
+import time
+
+import numpy as np
+
 from .base_engine import BaseEngine, EngineState, EngineMetrics
+from .performance_metrics import (
+    StreamingPerformanceMetrics,
+    compute_return_metrics,
+    parse_daily_returns,
+)
+from .performance_series import ReturnSeries
 from ...qts.core.config.config_models import UnifiedConfig
 from ...db.repositories.enhanced_performance_repository import EnhancedPerformanceRepository
 from ...db.repositories.history_repository import HistoryRepository
@@ -61,6 +71,30 @@ class MonthlyPerformance:
     sharpe_ratio: float
 
 
+@dataclass
+class RollingPerformance:
+    """N일 롤링 성과 (창 마지막 날짜 기준)"""
+    date: date
+    window: int
+    rolling_return: float
+    rolling_volatility: float
+    rolling_sharpe: float
+    drawdown: float
+    drawdown_duration: int
+    max_drawdown_duration: int
+
+
+@dataclass
+class PeriodPerformance:
+    """월/연 단위 성과"""
+    period: str
+    days: int
+    period_return: float
+    volatility: float
+    sharpe_ratio: float
+    equity_return: float
+
+
 class PerformanceEngine(BaseEngine):
     """
     성과 엔진
@@ -68,6 +102,9 @@ class PerformanceEngine(BaseEngine):
     성과 추적, 수익률 계산, 리스크 지표, 통계 분석 등 성과 관련 기능을 제공합니다.
     """
     
+    # 롤링/기간 분석 시계열 캐시 TTL (대시보드 갱신 간 재사용)
+    SERIES_CACHE_TTL_SEC = 60.0
+    
     def __init__(
         self,
         config: UnifiedConfig,
@@ -94,6 +131,20 @@ class PerformanceEngine(BaseEngine):
         self._monthly_performance_cache: List[MonthlyPerformance] = []
         self._last_cache_update: Optional[datetime] = None
         
+        # 파싱된 일별 수익률 (history 변경 시에만 재파싱) + 증분 지표 상태
+        # _daily_returns는 _returns_buf 앞부분 뷰: 앞 _keyed_len개는 _daily_returns_key(history 원본)에서 파싱,
+        # 나머지는 append_daily_return으로 추가된 값 (버퍼는 2배씩 확장 → append 분할상환 O(1))
+        self._returns_buf: np.ndarray = np.empty(0, dtype=np.float64)
+        self._daily_returns: np.ndarray = self._returns_buf
+        self._daily_returns_key: Optional[Tuple[Any, ...]] = None
+        self._keyed_len = 0
+        self._streaming_metrics: Optional[StreamingPerformanceMetrics] = None
+        
+        # 롤링/기간 분석용 날짜 인덱스 시계열 (TTL 동안 재사용, 조회 결과는 시계열에 메모이즈)
+        self._return_series: Optional[ReturnSeries] = None
+        self._return_series_loaded_at: Optional[float] = None
+        self._series_ttl_sec: float = self.SERIES_CACHE_TTL_SEC
+        
         # 설정
         self._risk_free_rate = 0.02  # 무위험 이자율 (연 2%)
         self._trading_days_per_year = 252
@@ -192,6 +243,12 @@ class PerformanceEngine(BaseEngine):
                 result = await self.get_monthly_performance(data.get('year'))
             elif operation == 'update_performance_kpi':
                 result = await self.update_performance_kpi(data.get('kpi_data', {}))
+            elif operation == 'get_rolling_performance':
+                result = await self.get_rolling_performance(
+                    data.get('window', 20), data.get('start_date'), data.get('end_date')
+                )
+            elif operation == 'get_period_performance':
+                result = await self.get_period_performance(data.get('freq', 'M'), data.get('year'))
             elif operation == 'calculate_sharpe_ratio':
                 result = self._calculate_sharpe_ratio(data.get('returns', []))
             elif operation == 'calculate_max_drawdown':
@@ -201,8 +258,8 @@ class PerformanceEngine(BaseEngine):
             else:
                 raise ValueError(f"Unknown operation: {operation}")
             
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self._update_metrics(execution_time, success=True)
+            execution_time = (now_kst() - start_time).total_seconds()
+            self._update_metrics(execution_time, success=True, operation=operation)
             
             return {
                 'success': True,
@@ -213,7 +270,7 @@ class PerformanceEngine(BaseEngine):
             
         except Exception as e:
             execution_time = (now_kst() - start_time).total_seconds()
-            self._update_metrics(execution_time, success=False)
+            self._update_metrics(execution_time, success=False, operation=data.get('operation'))
             self._update_state(is_running=True, error=str(e))
             
             return {
@@ -234,54 +291,24 @@ class PerformanceEngine(BaseEngine):
             perf_data = await self._history_repo.get_performance_metrics(days=252)
             history_data = await self._history_repo.get_execution_history(days=252)
             
-            # 일별 수익률 추출
-            daily_returns = []
-            for record in history_data:
-                try:
-                    return_str = record.get('Daily_Return', '0%')
-                    # '%' 제거하고 숫자로 변환
-                    return_val = float(str(return_str).replace('%', '').replace(',', '')) / 100.0
-                    daily_returns.append(return_val)
-                except (ValueError, TypeError):
-                    continue
-            
-            # 지표 계산
-            total_return = self._calculate_total_return(daily_returns)
-            mdd = self._calculate_max_drawdown_from_returns(daily_returns)
-            volatility = self._calculate_volatility(daily_returns)
-            sharpe_ratio = self._calculate_sharpe_ratio(daily_returns)
-            
-            win_rate, avg_win, avg_loss = self._calculate_trade_statistics(daily_returns)
-            max_consecutive_losses = self._calculate_max_consecutive_losses(daily_returns)
-            profit_factor = self._calculate_profit_factor(daily_returns)
-            calmar_ratio = total_return / abs(mdd) if mdd != 0 else 0.0
-            
-            metrics = PerformanceMetrics(
-                total_return=total_return,
-                mdd=mdd,
-                daily_volatility=volatility,
-                sharpe_ratio=sharpe_ratio,
-                win_rate=win_rate,
-                avg_win=avg_win,
-                avg_loss=avg_loss,
-                max_consecutive_losses=max_consecutive_losses,
-                profit_factor=profit_factor,
-                calmar_ratio=calmar_ratio
-            )
-            
+            # 일별 수익률 배열 (history 변경 시에만 재파싱) → 전체 지표 일괄 계산
+            daily_returns = self._load_daily_returns(history_data)
+            metrics = PerformanceMetrics(**compute_return_metrics(
+                daily_returns, self._risk_free_rate, self._trading_days_per_year
+            ))
             
             self._performance_cache = metrics
             self._last_cache_update = now_kst()
             
             # Performance 대시보드에 KPI 업데이트
             kpi_data = {
-                'total_return': total_return,
-                'mdd': mdd,
-                'daily_vol': volatility,
-                'sharpe': sharpe_ratio,
-                'win_rate': win_rate,
-                'avg_win': avg_win,
-                'avg_loss': avg_loss
+                'total_return': metrics.total_return,
+                'mdd': metrics.mdd,
+                'daily_vol': metrics.daily_volatility,
+                'sharpe': metrics.sharpe_ratio,
+                'win_rate': metrics.win_rate,
+                'avg_win': metrics.avg_win,
+                'avg_loss': metrics.avg_loss
             }
             self._performance_repo.update_kpi_summary(kpi_data)
             
@@ -365,31 +392,14 @@ class PerformanceEngine(BaseEngine):
             if year is None:
                 year = now_kst().year
             
-            # HistoryRepository를 통해 연도별 데이터 조회 및 월별 집계
-            history_data = await self._history_repo.get_all()
-            
-            # 월별 데이터 그룹화
-            monthly_data = {}
-            for record in history_data:
-                try:
-                    record_date = datetime.strptime(record.get('Date', ''), '%Y-%m-%d').date()
-                    if record_date.year == year:
-                        month_key = f"{year}-{record_date.month:02d}"
-                        if month_key not in monthly_data:
-                            monthly_data[month_key] = []
-                        monthly_data[month_key].append(record)
-                except (ValueError, TypeError):
-                    continue
-            
-            # 월별 수익률 먼저 계산 (실제 데이터 기반)
-            monthly_returns_ordered: List[Tuple[str, float]] = []
-            for month_key in sorted(monthly_data.keys()):
-                records = monthly_data[month_key]
-                if records:
-                    first_equity = float(records[0].get('Total_Equity', 0))
-                    last_equity = float(records[-1].get('Total_Equity', 0))
-                    monthly_return = ((last_equity - first_equity) / first_equity) if first_equity > 0 else 0.0
-                    monthly_returns_ordered.append((month_key, monthly_return))
+            # 날짜 인덱스 시계열의 월별 집계 재사용 (기간 첫/끝 평가금액 기준 수익률)
+            series = await self.get_return_series()
+            prefix = f"{year}-"
+            monthly_returns_ordered: List[Tuple[str, float]] = [
+                (period['period'], period['equity_return'])
+                for period in series.resample('M')
+                if period['period'].startswith(prefix)
+            ]
             
             # 연도 내 월별 수익률의 표준편차 (실제 데이터 기반)
             returns_only = [r for _, r in monthly_returns_ordered]
@@ -432,6 +442,111 @@ class PerformanceEngine(BaseEngine):
             self.logger.error(f"Failed to get monthly performance: {str(e)}")
             raise
     
+    def configure_series_cache(self, ttl_sec: float) -> None:
+        """롤링/기간 분석 시계열 캐시 TTL 설정 (0 이하면 매 조회 재적재)."""
+        self._series_ttl_sec = ttl_sec
+    
+    def invalidate_return_series(self) -> None:
+        """시계열 캐시 무효화 (다음 조회 시 history 재적재)."""
+        self._return_series = None
+        self._return_series_loaded_at = None
+    
+    async def get_return_series(self, force_reload: bool = False) -> ReturnSeries:
+        """
+        날짜 인덱스 일별 수익률 시계열 조회 (read-through, TTL).
+        
+        Args:
+            force_reload: True면 TTL과 무관하게 history 재적재
+            
+        Returns:
+            ReturnSeries: 날짜 오름차순 시계열
+        """
+        fresh = (
+            self._return_series is not None
+            and self._return_series_loaded_at is not None
+            and self._series_ttl_sec > 0
+            and (time.monotonic() - self._return_series_loaded_at) < self._series_ttl_sec
+        )
+        if fresh and not force_reload:
+            return self._return_series
+        
+        history_data = await self._history_repo.get_all()
+        self._return_series = ReturnSeries.from_records(
+            history_data, self._risk_free_rate, self._trading_days_per_year
+        )
+        self._return_series_loaded_at = time.monotonic()
+        return self._return_series
+    
+    async def get_rolling_performance(self, window: int = 20, start_date: Optional[date] = None,
+                                      end_date: Optional[date] = None) -> List[RollingPerformance]:
+        """
+        N일 롤링 성과 조회 (Sharpe, 변동성, 낙폭 지속 기간)
+        
+        Args:
+            window: 롤링 창 크기 (거래일)
+            start_date: 시작 날짜 (None이면 처음부터)
+            end_date: 종료 날짜 (None이면 끝까지)
+            
+        Returns:
+            List[RollingPerformance]: 창이 채워진 날짜부터의 롤링 성과 목록
+        """
+        try:
+            series = await self.get_return_series()
+            rolling = series.rolling(int(window))
+            
+            dates = rolling['dates']
+            lo = 0 if start_date is None else int(np.searchsorted(dates, np.datetime64(start_date, 'D'), side='left'))
+            hi = len(dates) if end_date is None else int(np.searchsorted(dates, np.datetime64(end_date, 'D'), side='right'))
+            
+            return [
+                RollingPerformance(
+                    date=dates[k].astype(date),
+                    window=int(window),
+                    rolling_return=float(rolling['return'][k]),
+                    rolling_volatility=float(rolling['volatility'][k]),
+                    rolling_sharpe=float(rolling['sharpe_ratio'][k]),
+                    drawdown=float(rolling['drawdown'][k]),
+                    drawdown_duration=int(rolling['drawdown_duration'][k]),
+                    max_drawdown_duration=int(rolling['max_drawdown_duration'][k]),
+                )
+                for k in range(lo, max(lo, hi))
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get rolling performance: {str(e)}")
+            raise
+    
+    async def get_period_performance(self, freq: str = 'M', year: Optional[int] = None) -> List[PeriodPerformance]:
+        """
+        월('M')/연('Y') 단위 성과 조회 (일별 수익률 복리 기준)
+        
+        Args:
+            freq: 'M' 또는 'Y'
+            year: 연도 필터 (None이면 전체)
+            
+        Returns:
+            List[PeriodPerformance]: 기간 오름차순 성과 목록
+        """
+        try:
+            series = await self.get_return_series()
+            prefix = None if year is None else f"{year}"
+            return [
+                PeriodPerformance(
+                    period=period['period'],
+                    days=period['days'],
+                    period_return=period['return'],
+                    volatility=period['volatility'],
+                    sharpe_ratio=period['sharpe_ratio'],
+                    equity_return=period['equity_return'],
+                )
+                for period in series.resample(freq)
+                if prefix is None or period['period'].startswith(prefix)
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get period performance: {str(e)}")
+            raise
+    
     async def update_performance_kpi(self, kpi_data: Dict[str, Any]) -> bool:
         """
         성과 KPI 업데이트
@@ -476,6 +591,74 @@ class PerformanceEngine(BaseEngine):
             self.logger.error(f"Failed to update performance KPI: {str(e)}")
             raise
     
+    def _load_daily_returns(self, history_data: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        History 레코드를 일별 수익률 배열로 변환.
+
+        - 이전에 읽은 history 뒤에 레코드만 추가된 경우 새 레코드만 파싱. append_daily_return으로
+          이미 반영한 값과 같으면 그대로 두고, 그 뒤 값만 배열·증분 지표에 이어 붙임
+        - 그 외(앞부분 변경, 조회 구간 이동, append 값과 불일치)에만 전체 재파싱 + 증분 지표 재시드
+        """
+        # 원본 문자열 튜플 비교만으로 변경 여부 판단 (float 파싱 생략)
+        key = tuple(record.get('Daily_Return') for record in history_data)
+        known = self._daily_returns_key
+        if known is not None and len(key) >= len(known) and key[:len(known)] == known:
+            tail = parse_daily_returns(history_data[len(known):])
+            appended = self._daily_returns[self._keyed_len:]
+            n = len(appended)
+            if len(tail) >= n and np.allclose(tail[:n], appended, rtol=1e-9, atol=1e-12):
+                if len(tail) > n:
+                    self._extend_daily_returns(tail[n:])
+                self._daily_returns_key = key
+                self._keyed_len = len(self._daily_returns)
+                return self._daily_returns
+
+        parsed = parse_daily_returns(history_data)
+        self._returns_buf = parsed
+        self._daily_returns = parsed
+        self._daily_returns_key = key
+        self._keyed_len = len(parsed)
+        self._streaming_metrics = StreamingPerformanceMetrics.from_returns(
+            parsed, self._risk_free_rate, self._trading_days_per_year
+        )
+        return self._daily_returns
+
+    def _extend_daily_returns(self, values: np.ndarray) -> None:
+        """수익률 배열과 증분 지표 상태에 값 추가."""
+        size, extra = len(self._daily_returns), len(values)
+        if size + extra > len(self._returns_buf):
+            buf = np.empty(max(size + extra, 2 * len(self._returns_buf), 16), dtype=np.float64)
+            buf[:size] = self._daily_returns
+            self._returns_buf = buf
+        self._returns_buf[size:size + extra] = values
+        self._daily_returns = self._returns_buf[:size + extra]
+        if self._streaming_metrics is None:
+            self._streaming_metrics = StreamingPerformanceMetrics.from_returns(
+                self._daily_returns, self._risk_free_rate, self._trading_days_per_year
+            )
+        else:
+            self._streaming_metrics.extend(values)
+    
+    def append_daily_return(self, daily_return: float) -> PerformanceMetrics:
+        """
+        신규 일별 수익률 1건 반영 (증분 모드, O(1)).
+        
+        전체 history를 다시 읽지 않고 HWM/낙폭/Welford 분산 등 누적 상태만 갱신합니다.
+        추가한 값은 수익률 배열에도 이어 붙이며, 이후 history에 같은 값이 들어오면 재파싱하지 않습니다.
+        
+        Args:
+            daily_return: 소수 수익률 (예: 0.001 = 0.1%)
+            
+        Returns:
+            PerformanceMetrics: 갱신된 성과 지표
+        """
+        self._extend_daily_returns(np.array([daily_return], dtype=np.float64))
+        
+        metrics = PerformanceMetrics(**self._streaming_metrics.metrics())
+        self._performance_cache = metrics
+        self._last_cache_update = now_kst()
+        return metrics
+    
     def _calculate_total_return(self, returns: List[float]) -> float:
         """총 수익률 계산"""
         if not returns:
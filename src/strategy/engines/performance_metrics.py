@@ -0,0 +1,265 @@
+"""
+Performance Metrics Core (NumPy)
+
+PerformanceEngine의 성과 지표 계산 코어입니다.
+
+- parse_daily_returns: History 레코드의 'Daily_Return'('0.1%') 문자열을 1회 파싱하여 float64 배열로 변환
+- compute_return_metrics: 배열 1개로 전체 지표를 한 번에 계산 (벡터 연산)
+- StreamingPerformanceMetrics: 일별 수익률 append 시 O(1)로 HWM/낙폭/Welford 분산 등 누적 상태 갱신
+
+지표 정의는 PerformanceEngine의 _calculate_* 구현과 동일합니다.
+(MDD는 단순 누적 수익률 기준, 변동성은 표본 표준편차 × sqrt(연 거래일))
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, List, Mapping
+
+import numpy as np
+
+RETURN_FIELD = "Daily_Return"
+
+
+def parse_return_value(value: Any) -> float:
+    """'0.1%', '1,234%', 0.1 등 퍼센트 표기 값을 소수 수익률로 변환 (실패 시 ValueError/TypeError)."""
+    return float(str(value).replace('%', '').replace(',', '')) / 100.0
+
+
+def parse_daily_returns(
+    records: Iterable[Mapping[str, Any]],
+    field: str = RETURN_FIELD,
+) -> np.ndarray:
+    """
+    History 레코드 목록에서 일별 수익률 배열 생성.
+
+    파싱 불가 값은 건너뜁니다 (기존 calculate_performance_metrics 동작과 동일).
+    """
+    values: List[float] = []
+    for record in records:
+        try:
+            values.append(parse_return_value(record.get(field, '0%')))
+        except (ValueError, TypeError):
+            continue
+    return np.asarray(values, dtype=np.float64)
+
+
+def empty_metrics() -> Dict[str, Any]:
+    return {
+        'total_return': 0.0,
+        'mdd': 0.0,
+        'daily_volatility': 0.0,
+        'sharpe_ratio': 0.0,
+        'win_rate': 0.0,
+        'avg_win': 0.0,
+        'avg_loss': 0.0,
+        'max_consecutive_losses': 0,
+        'profit_factor': 0.0,
+        'calmar_ratio': 0.0,
+    }
+
+
+def _max_run_length(mask: np.ndarray) -> int:
+    """불리언 배열에서 True 연속 구간의 최대 길이."""
+    if not mask.any():
+        return 0
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.view(np.int8), [0]))))
+    return int((edges[1::2] - edges[0::2]).max())
+
+
+def _profit_factor(win_sum: float, loss_sum: float, wins: int, losses: int) -> float:
+    if losses == 0:
+        return float('inf') if wins else 0.0
+    total_loss = -loss_sum
+    return win_sum / total_loss if total_loss != 0 else float('inf')
+
+
+def _finalize(
+    *,
+    total_return: float,
+    mdd: float,
+    volatility: float,
+    mean: float,
+    n: int,
+    wins: int,
+    losses: int,
+    win_sum: float,
+    loss_sum: float,
+    max_consecutive_losses: int,
+    risk_free_rate: float,
+    trading_days: int,
+) -> Dict[str, Any]:
+    sharpe = 0.0
+    if n >= 2 and volatility != 0:
+        sharpe = (mean * trading_days - risk_free_rate) / volatility
+    return {
+        'total_return': float(total_return),
+        'mdd': float(mdd),
+        'daily_volatility': float(volatility),
+        'sharpe_ratio': float(sharpe),
+        'win_rate': wins / n if n else 0.0,
+        'avg_win': float(win_sum / wins) if wins else 0.0,
+        'avg_loss': float(loss_sum / losses) if losses else 0.0,
+        'max_consecutive_losses': int(max_consecutive_losses),
+        'profit_factor': _profit_factor(float(win_sum), float(loss_sum), wins, losses),
+        'calmar_ratio': float(total_return / abs(mdd)) if mdd != 0 else 0.0,
+    }
+
+
+def compute_return_metrics(
+    returns: Any,
+    risk_free_rate: float = 0.02,
+    trading_days: int = 252,
+) -> Dict[str, Any]:
+    """
+    일별 수익률 배열로 전체 성과 지표 계산.
+
+    Returns:
+        Dict[str, Any]: PerformanceMetrics 필드명과 동일한 키의 지표 dict
+    """
+    r = np.asarray(returns, dtype=np.float64)
+    n = int(r.size)
+    if n == 0:
+        return empty_metrics()
+
+    total_return = float(np.prod(1.0 + r) - 1.0)
+
+    # 누적 수익률의 고점(시작값 0) 대비 낙폭
+    cumulative = np.cumsum(r)
+    peak = np.maximum.accumulate(np.maximum(cumulative, 0.0))
+    safe_peak = np.where(peak != 0, peak, 1.0)
+    drawdown = np.where(peak != 0, (peak - cumulative) / safe_peak, 0.0)
+    mdd = float(drawdown.max())
+
+    mean = float(r.mean())
+    volatility = 0.0
+    if n >= 2:
+        volatility = float(r.std(ddof=1)) * math.sqrt(trading_days)
+
+    win_mask = r > 0
+    loss_mask = r < 0
+    return _finalize(
+        total_return=total_return,
+        mdd=mdd,
+        volatility=volatility,
+        mean=mean,
+        n=n,
+        wins=int(win_mask.sum()),
+        losses=int(loss_mask.sum()),
+        win_sum=float(r[win_mask].sum()),
+        loss_sum=float(r[loss_mask].sum()),
+        max_consecutive_losses=_max_run_length(loss_mask),
+        risk_free_rate=risk_free_rate,
+        trading_days=trading_days,
+    )
+
+
+class StreamingPerformanceMetrics:
+    """
+    증분(스트리밍) 성과 지표 상태.
+
+    append(r) 1회당 O(1): 복리 누적, 누적 수익률 HWM/현재 낙폭/MDD,
+    Welford 평균·분산, 승/패 건수·합계, 연속 손실 구간을 갱신합니다.
+    """
+
+    __slots__ = (
+        'risk_free_rate', 'trading_days',
+        'count', 'growth', 'cumulative', 'high_watermark', 'drawdown', 'max_drawdown',
+        'mean', 'm2', 'wins', 'losses', 'win_sum', 'loss_sum',
+        'consecutive_losses', 'max_consecutive_losses',
+    )
+
+    def __init__(self, risk_free_rate: float = 0.02, trading_days: int = 252):
+        self.risk_free_rate = risk_free_rate
+        self.trading_days = trading_days
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.growth = 1.0
+        self.cumulative = 0.0
+        self.high_watermark = 0.0
+        self.drawdown = 0.0
+        self.max_drawdown = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.wins = 0
+        self.losses = 0
+        self.win_sum = 0.0
+        self.loss_sum = 0.0
+        self.consecutive_losses = 0
+        self.max_consecutive_losses = 0
+
+    @classmethod
+    def from_returns(
+        cls,
+        returns: Any,
+        risk_free_rate: float = 0.02,
+        trading_days: int = 252,
+    ) -> "StreamingPerformanceMetrics":
+        """기존 수익률 배열로 상태 시드 (O(n), 이후 append는 O(1))."""
+        state = cls(risk_free_rate, trading_days)
+        state.extend(returns)
+        return state
+
+    def extend(self, returns: Any) -> None:
+        for r in np.asarray(returns, dtype=np.float64).tolist():
+            self.append(r)
+
+    def append(self, r: float) -> None:
+        r = float(r)
+        self.count += 1
+        self.growth *= (1.0 + r)
+
+        self.cumulative += r
+        if self.cumulative > self.high_watermark:
+            self.high_watermark = self.cumulative
+        if self.high_watermark != 0:
+            self.drawdown = (self.high_watermark - self.cumulative) / self.high_watermark
+        else:
+            self.drawdown = 0.0
+        if self.drawdown > self.max_drawdown:
+            self.max_drawdown = self.drawdown
+
+        # Welford
+        delta = r - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (r - self.mean)
+
+        if r > 0:
+            self.wins += 1
+            self.win_sum += r
+        if r < 0:
+            self.losses += 1
+            self.loss_sum += r
+            self.consecutive_losses += 1
+            if self.consecutive_losses > self.max_consecutive_losses:
+                self.max_consecutive_losses = self.consecutive_losses
+        else:
+            self.consecutive_losses = 0
+
+    @property
+    def variance(self) -> float:
+        """표본 분산 (n < 2 이면 0)."""
+        return self.m2 / (self.count - 1) if self.count >= 2 else 0.0
+
+    def metrics(self) -> Dict[str, Any]:
+        if self.count == 0:
+            return empty_metrics()
+        volatility = 0.0
+        if self.count >= 2:
+            volatility = math.sqrt(max(self.variance, 0.0)) * math.sqrt(self.trading_days)
+        return _finalize(
+            total_return=self.growth - 1.0,
+            mdd=self.max_drawdown,
+            volatility=volatility,
+            mean=self.mean,
+            n=self.count,
+            wins=self.wins,
+            losses=self.losses,
+            win_sum=self.win_sum,
+            loss_sum=self.loss_sum,
+            max_consecutive_losses=self.max_consecutive_losses,
+            risk_free_rate=self.risk_free_rate,
+            trading_days=self.trading_days,
+        )
@@ -0,0 +1,265 @@
+"""
+Performance Return Series (날짜 인덱스 시계열)
+
+PerformanceEngine의 롤링/기간별 분석용 in-memory 시계열입니다.
+
+- History 레코드를 1회 파싱하여 날짜(datetime64[D])·일별 수익률·평가금액 배열로 보관 (날짜 정렬)
+- 누적합(prefix sum) 배열을 미리 만들어 두어 구간 수익률/변동성/Sharpe를 O(1), 롤링 창을 O(n)으로 계산
+- 조회 결과는 시계열 인스턴스에 메모이즈 (시계열은 불변, 재적재 시 새 인스턴스)
+
+수익률 구간 합성은 log(1+r) 누적합 차이로, 분산은 (Σr², Σr) 누적합 차이로 계산합니다.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .performance_metrics import parse_return_value
+
+PERIOD_UNITS = {'M': 'datetime64[M]', 'Y': 'datetime64[Y]'}
+
+
+def _parse_dates(raw: List[Any]) -> np.ndarray:
+    """'YYYY-MM-DD' 문자열 목록 → datetime64[D] (파싱 불가 값은 NaT)."""
+    try:
+        return np.array(raw, dtype='datetime64[D]')
+    except (ValueError, TypeError):
+        parsed = []
+        for value in raw:
+            try:
+                parsed.append(np.datetime64(str(value)[:10], 'D'))
+            except (ValueError, TypeError):
+                parsed.append(np.datetime64('NaT'))
+        return np.array(parsed, dtype='datetime64[D]')
+
+
+def _float_or_nan(value: Any) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return math.nan
+
+
+class ReturnSeries:
+    """
+    날짜 인덱스 일별 수익률 시계열.
+
+    dates / returns / equity는 같은 길이의 배열이며 날짜 오름차순입니다.
+    """
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        returns: np.ndarray,
+        equity: Optional[np.ndarray] = None,
+        risk_free_rate: float = 0.02,
+        trading_days: int = 252,
+    ):
+        order = np.argsort(dates, kind='stable')
+        self.dates = np.asarray(dates, dtype='datetime64[D]')[order]
+        self.returns = np.asarray(returns, dtype=np.float64)[order]
+        if equity is None:
+            equity = np.full(self.returns.shape, np.nan)
+        self.equity = np.asarray(equity, dtype=np.float64)[order]
+        self.risk_free_rate = risk_free_rate
+        self.trading_days = trading_days
+
+        # prefix sum (앞에 0 추가: 구간 [i, j) 합 = p[j] - p[i]).
+        # 분산 누적합은 전체 평균으로 중심화하여 상쇄 오차를 줄임 (분산은 이동 불변)
+        self._center = float(self.returns.mean()) if self.returns.size else 0.0
+        centered = self.returns - self._center
+        self._csum = np.concatenate(([0.0], np.cumsum(centered)))
+        self._csum2 = np.concatenate(([0.0], np.cumsum(centered * centered)))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self._clog = np.concatenate(([0.0], np.cumsum(np.log1p(self.returns))))
+
+        self._memo: Dict[Tuple[Any, ...], Any] = {}
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        risk_free_rate: float = 0.02,
+        trading_days: int = 252,
+    ) -> "ReturnSeries":
+        """History 레코드('Date', 'Daily_Return', 'Total_Equity')로 시계열 생성. 날짜/수익률 파싱 불가 행은 제외."""
+        raw_dates: List[Any] = []
+        returns: List[float] = []
+        equity: List[float] = []
+        for record in records:
+            try:
+                r = parse_return_value(record.get('Daily_Return', '0%'))
+            except (ValueError, TypeError):
+                continue
+            raw_dates.append(record.get('Date', ''))
+            returns.append(r)
+            equity.append(_float_or_nan(record.get('Total_Equity')))
+
+        dates = _parse_dates(raw_dates)
+        valid = ~np.isnat(dates)
+        return cls(
+            dates[valid],
+            np.asarray(returns, dtype=np.float64)[valid],
+            np.asarray(equity, dtype=np.float64)[valid],
+            risk_free_rate,
+            trading_days,
+        )
+
+    def __len__(self) -> int:
+        return int(self.returns.size)
+
+    # ------------------------------------------------------------------
+    # 구간 조회 (O(log n) 인덱스 + O(1) 통계)
+    # ------------------------------------------------------------------
+
+    def index_range(self, start: Optional[date] = None, end: Optional[date] = None) -> Tuple[int, int]:
+        """[start, end] 날짜 구간의 배열 인덱스 [i, j)."""
+        i = 0 if start is None else int(np.searchsorted(self.dates, np.datetime64(start, 'D'), side='left'))
+        j = len(self) if end is None else int(np.searchsorted(self.dates, np.datetime64(end, 'D'), side='right'))
+        return i, max(i, j)
+
+    def _window_stats(self, i: np.ndarray, j: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """구간 [i, j)별 (복리 수익률, 연율화 변동성, Sharpe) 배열."""
+        n = (j - i).astype(np.float64)
+        s = self._csum[j] - self._csum[i]
+        s2 = self._csum2[j] - self._csum2[i]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(n > 0, s / np.maximum(n, 1.0), 0.0) + self._center
+            var = np.where(n >= 2, (s2 - s * s / np.maximum(n, 1.0)) / np.maximum(n - 1.0, 1.0), 0.0)
+            vol = np.sqrt(np.maximum(var, 0.0)) * math.sqrt(self.trading_days)
+            sharpe = np.where(
+                (n >= 2) & (vol > 0),
+                (mean * self.trading_days - self.risk_free_rate) / np.where(vol > 0, vol, 1.0),
+                0.0,
+            )
+            compounded = np.expm1(self._clog[j] - self._clog[i])
+        return compounded, vol, sharpe
+
+    def range_stats(self, start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, Any]:
+        """날짜 구간 요약 (total_return, volatility, sharpe_ratio, days)."""
+        i, j = self.index_range(start, end)
+        ret, vol, sharpe = self._window_stats(np.array([i]), np.array([j]))
+        return {
+            'days': j - i,
+            'total_return': float(ret[0]),
+            'volatility': float(vol[0]),
+            'sharpe_ratio': float(sharpe[0]),
+        }
+
+    # ------------------------------------------------------------------
+    # 롤링 창
+    # ------------------------------------------------------------------
+
+    def rolling(self, window: int) -> Dict[str, np.ndarray]:
+        """
+        N일 롤링 지표 (창이 채워진 날짜부터).
+
+        Returns:
+            Dict[str, np.ndarray]: dates, return, volatility, sharpe_ratio,
+            drawdown, drawdown_duration, max_drawdown_duration
+        """
+        if window < 1:
+            raise ValueError(f"window must be >= 1: {window}")
+        key = ('rolling', window)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        n = len(self)
+        if n < window:
+            end = np.empty(0, dtype=np.int64)
+        else:
+            end = np.arange(window, n + 1)
+        start = end - window
+        ret, vol, sharpe = self._window_stats(start, end)
+
+        drawdown, duration = self.drawdown_series()
+        last = end - 1
+        if end.size:
+            max_duration = np.lib.stride_tricks.sliding_window_view(duration, window).max(axis=1)
+        else:
+            max_duration = np.empty(0, dtype=np.int64)
+
+        result = {
+            'dates': self.dates[last],
+            'return': ret,
+            'volatility': vol,
+            'sharpe_ratio': sharpe,
+            'drawdown': drawdown[last],
+            'drawdown_duration': duration[last],
+            'max_drawdown_duration': max_duration,
+        }
+        self._memo[key] = result
+        return result
+
+    def drawdown_series(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        복리 누적 기준 (낙폭, 낙폭 지속 일수) 배열.
+
+        지속 일수는 직전 고점(HWM) 이후 경과한 거래일 수이며 고점 갱신일은 0입니다.
+        """
+        cached = self._memo.get(('drawdown',))
+        if cached is not None:
+            return cached
+        growth = np.exp(self._clog[1:])
+        hwm = np.maximum.accumulate(np.maximum(growth, 1.0)) if growth.size else growth
+        drawdown = np.where(hwm > 0, (hwm - growth) / np.where(hwm > 0, hwm, 1.0), 0.0)
+        idx = np.arange(growth.size)
+        at_peak = growth >= hwm
+        last_peak = np.maximum.accumulate(np.where(at_peak, idx, -1)) if growth.size else idx
+        duration = idx - last_peak
+        result = (drawdown, duration)
+        self._memo[('drawdown',)] = result
+        return result
+
+    # ------------------------------------------------------------------
+    # 기간별 리샘플링 (월/연)
+    # ------------------------------------------------------------------
+
+    def _period_bounds(self, freq: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        unit = PERIOD_UNITS.get(freq.upper())
+        if unit is None:
+            raise ValueError(f"Unsupported freq: {freq} (use 'M' or 'Y')")
+        periods = self.dates.astype(unit)
+        labels, starts = np.unique(periods, return_index=True)
+        ends = np.append(starts[1:], len(self)).astype(np.int64)
+        return labels, starts.astype(np.int64), ends
+
+    def resample(self, freq: str = 'M') -> List[Dict[str, Any]]:
+        """
+        월('M')/연('Y') 단위 집계.
+
+        Returns:
+            List[Dict[str, Any]]: period, days, return(일별 수익률 복리), volatility, sharpe_ratio,
+            start_equity, end_equity, equity_return(기간 첫/끝 평가금액 기준)
+        """
+        key = ('resample', freq.upper())
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        labels, starts, ends = self._period_bounds(freq)
+        ret, vol, sharpe = self._window_stats(starts, ends)
+        first_equity = self.equity[starts] if starts.size else np.empty(0)
+        last_equity = self.equity[ends - 1] if ends.size else np.empty(0)
+
+        periods = []
+        for k, label in enumerate(labels):
+            fe = float(first_equity[k])
+            le = float(last_equity[k])
+            periods.append({
+                'period': str(label),
+                'days': int(ends[k] - starts[k]),
+                'return': float(ret[k]),
+                'volatility': float(vol[k]),
+                'sharpe_ratio': float(sharpe[k]),
+                'start_equity': fe,
+                'end_equity': le,
+                'equity_return': (le - fe) / fe if fe > 0 else 0.0,
+            })
+        self._memo[key] = periods
+        return periods
@@ -18,6 +18,7 @@ from ...db.repositories.enhanced_portfolio_repository import EnhancedPortfolioRe
 from ...db.repositories.position_repository import PositionRepository
 from ...db.repositories.position_repository import PositionRepository
 from ...db.repositories.t_ledger_repository import T_LedgerRepository
+from ...runtime.cache import CacheAside, CacheKeys, CacheManager
 from ...shared.timezone_utils import now_kst
 
 
@@ -84,8 +85,24 @@ class PortfolioEngine(BaseEngine):
         self._positions_cache: Dict[str, Position] = {}
         self._portfolio_summary_cache: Optional[PortfolioSummary] = None
         self._last_cache_update: Optional[datetime] = None
+        # NG-4 계층 캐시 (attach_cache 시 get_positions가 cache-aside로 동작)
+        self._cache: Optional[CacheManager] = None
+        self._positions_aside: Optional[CacheAside] = None
         
         self.logger.info("PortfolioEngine created with injected repositories")
+
+    def attach_cache(self, cache: CacheManager) -> None:
+        """
+        NG-4 캐시 연결: get_positions는 pos:__all__ 키(1s TTL)를 먼저 조회하고,
+        미스일 때만 PositionRepository를 읽습니다. 동시 미스는 조회 1회로 합쳐집니다.
+        """
+        self._cache = cache
+        self._positions_aside = CacheAside(cache)
+
+    async def invalidate_positions(self) -> None:
+        """체결 등으로 포지션이 바뀌었을 때 캐시 무효화 (캐시 미연결 시 no-op)."""
+        if self._cache is not None:
+            await self._cache.delete(CacheKeys.ALL_POSITIONS)
     
     async def initialize(self) -> bool:
         """
@@ -184,8 +201,8 @@ class PortfolioEngine(BaseEngine):
             else:
                 raise ValueError(f"Unknown operation: {operation}")
             
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self._update_metrics(execution_time, success=True)
+            execution_time = (now_kst() - start_time).total_seconds()
+            self._update_metrics(execution_time, success=True, operation=operation)
             
             return {
                 'success': True,
@@ -196,7 +213,7 @@ class PortfolioEngine(BaseEngine):
             
         except Exception as e:
             execution_time = (now_kst() - start_time).total_seconds()
-            self._update_metrics(execution_time, success=False)
+            self._update_metrics(execution_time, success=False, operation=data.get('operation'))
             self._update_state(is_running=True, error=str(e))
             
             return {
@@ -261,9 +278,17 @@ class PortfolioEngine(BaseEngine):
         """
         현재 포지션 목록 조회
         
+        캐시가 연결되어 있으면 TTL 내 재조회는 캐시에서 반환합니다 (attach_cache 참조).
+        
         Returns:
             List[Position]: 포지션 목록
         """
+        if self._positions_aside is not None:
+            return list(await self._positions_aside.get(CacheKeys.ALL_POSITIONS, self._load_positions))
+        return await self._load_positions()
+    
+    async def _load_positions(self) -> List[Position]:
+        """PositionRepository에서 포지션 목록 조회 및 변환"""
         try:
             # PositionRepository를 통해 실제 데이터 조회
             raw_positions = await self._position_repo.get_all()
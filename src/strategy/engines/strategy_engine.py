@@ -68,14 +68,14 @@ class StrategyEngine(BaseEngine):
                 pos = position_data if isinstance(position_data, dict) else {}
                 result = self.calculate_signal(market_data, pos)
                 execution_time = (now_kst() - start_time).total_seconds()
-                self._update_metrics(execution_time, success=True)
+                self._update_metrics(execution_time, success=True, operation=operation)
                 return {"success": True, "data": result, "execution_time": execution_time}
             execution_time = (now_kst() - start_time).total_seconds()
-            self._update_metrics(execution_time, success=False)
+            self._update_metrics(execution_time, success=False, operation=data.get("operation"))
             return {"success": False, "error": f"Unknown operation: {operation}", "execution_time": execution_time}
         except Exception as e:
             execution_time = (now_kst() - start_time).total_seconds()
-            self._update_metrics(execution_time, success=False)
+            self._update_metrics(execution_time, success=False, operation=data.get("operation"))
             self._update_state(self.state.is_running, error=str(e))
             return {"success": False, "error": str(e), "execution_time": execution_time}
 
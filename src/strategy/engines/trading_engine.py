@@ -92,14 +92,14 @@ class TradingEngine(BaseEngine):
                 intent = _intent_from_data(data)
                 response = self._broker.submit_intent(intent)
                 execution_time = (now_kst() - start_time).total_seconds()
-                self._update_metrics(execution_time, success=True)
+                self._update_metrics(execution_time, success=True, operation=operation)
                 return {
                     "success": True,
                     "data": _response_to_dict(response),
                     "execution_time": execution_time,
                 }
             execution_time = (now_kst() - start_time).total_seconds()
-            self._update_metrics(execution_time, success=False)
+            self._update_metrics(execution_time, success=False, operation=data.get("operation"))
             return {
                 "success": False,
                 "error": f"Unknown operation: {operation}",
@@ -107,6 +107,6 @@ class TradingEngine(BaseEngine):
             }
         except Exception as e:
             execution_time = (now_kst() - start_time).total_seconds()
-            self._update_metrics(execution_time, success=False)
+            self._update_metrics(execution_time, success=False, operation=data.get("operation"))
             self._update_state(self.state.is_running, error=str(e))
             return {"success": False, "error": str(e), "execution_time": execution_time}
@@ -0,0 +1,406 @@
+"""
+Streaming Technical Indicators
+
+틱 단위로 O(1) 갱신되는 기술적 지표 모음입니다. 전략은 틱마다 창 전체를 재계산하지 않고
+지표 인스턴스를 update()한 뒤 value()/update() 반환값을 읽습니다.
+
+- EMA / SMA(링 버퍼) / RSI(Wilder) / BollingerBands(롤링 Welford) / VWAP / ATR(Wilder)
+- 심볼별 상태는 슬롯 인덱스로 관리하고, 필드별 array.array('d'/'q') 한 벌에 모든 심볼을 저장
+  (심볼마다 객체/deque를 만들지 않음, 링 버퍼는 심볼 × period 평탄 배열)
+- warmup(): 과거 배열(numpy)로 최종 상태를 벡터화 계산해 적재. 순차 update() 결과와 같은 상태
+- 준비 전(데이터가 period 미만)에는 None 반환
+
+사용 예:
+    rsi = RSI(14)
+    rsi.warmup("005930", history_close)
+    value = rsi.update("005930", price)
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def _wilder_tail(seed: float, values: np.ndarray, alpha: float) -> float:
+    """seed에서 시작해 values를 지수 평활 (x ← x + alpha·(v − x))한 최종값 (가중합으로 일괄 계산)."""
+    if values.size == 0:
+        return seed
+    decay = 1.0 - alpha
+    weights = alpha * decay ** np.arange(values.size - 1, -1, -1, dtype=np.float64)
+    return float(decay ** values.size * seed + np.dot(weights, values))
+
+
+def _as_array(values: Sequence[float]) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64).ravel()
+
+
+class _SymbolState:
+    """
+    심볼 → 슬롯 인덱스와 필드별 배열 상태를 관리하는 지표 베이스.
+
+    _FIELDS: (필드명, typecode) — 슬롯당 값 1개
+    _ring_size: 슬롯당 링 버퍼 길이 (0이면 없음, self._ring에 슬롯 순서로 평탄 저장)
+    """
+
+    _FIELDS: Tuple[Tuple[str, str], ...] = ()
+
+    def __init__(self, period: int = 0) -> None:
+        if period < 0:
+            raise ValueError(f"period must be >= 0: {period}")
+        self.period = period
+        self._slots: Dict[str, int] = {}
+        for name, typecode in self._FIELDS:
+            setattr(self, name, array(typecode))
+        self._ring = array("d")
+        self._ring_size = 0
+
+    def _slot(self, symbol: str) -> int:
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = self._slots[symbol] = len(self._slots)
+            for name, typecode in self._FIELDS:
+                getattr(self, name).append(0 if typecode == "q" else 0.0)
+            self._ring.extend(array("d", bytes(8 * self._ring_size)))
+        return slot
+
+    @property
+    def symbols(self) -> Tuple[str, ...]:
+        return tuple(self._slots)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def reset(self, symbol: str) -> None:
+        """심볼 상태 초기화 (예: 세션 경계의 VWAP)."""
+        slot = self._slots.get(symbol)
+        if slot is None:
+            return
+        for name, typecode in self._FIELDS:
+            getattr(self, name)[slot] = 0 if typecode == "q" else 0.0
+        base = slot * self._ring_size
+        for i in range(base, base + self._ring_size):
+            self._ring[i] = 0.0
+
+    def _load_ring(self, slot: int, values: np.ndarray) -> None:
+        """values를 순차 update()한 것과 같은 위치(i % size)로 링 버퍼에 적재 (마지막 size개)."""
+        size = self._ring_size
+        n = values.size
+        tail = values[-size:]
+        base = slot * size
+        for offset, value in zip(range(n - tail.size, n), tail.tolist()):
+            self._ring[base + offset % size] = value
+
+
+class _Smoothed(_SymbolState):
+    """
+    SMA 시드 + 지수 평활 지표 공통부 (EMA, Wilder 평활).
+
+    처음 period개 입력의 평균을 시드로 하고 이후 value ← value + alpha·(x − value).
+    """
+
+    _FIELDS = (("_value", "d"), ("_acc", "d"), ("_count", "q"))
+
+    def __init__(self, period: int, alpha: float) -> None:
+        if period < 1:
+            raise ValueError(f"period must be >= 1: {period}")
+        super().__init__(period)
+        self.alpha = alpha
+
+    def _push(self, slot: int, x: float) -> Optional[float]:
+        count = self._count[slot] + 1
+        self._count[slot] = count
+        if count < self.period:
+            self._acc[slot] += x
+            return None
+        if count == self.period:
+            value = (self._acc[slot] + x) / self.period
+        else:
+            value = self._value[slot]
+            value += self.alpha * (x - value)
+        self._value[slot] = value
+        return value
+
+    def _load(self, slot: int, values: np.ndarray) -> Optional[float]:
+        n = values.size
+        self._count[slot] = n
+        if n < self.period:
+            self._acc[slot] = float(values.sum())
+            self._value[slot] = 0.0
+            return None
+        self._acc[slot] = 0.0
+        value = _wilder_tail(float(values[: self.period].mean()), values[self.period:], self.alpha)
+        self._value[slot] = value
+        return value
+
+    def value(self, symbol: str) -> Optional[float]:
+        slot = self._slots.get(symbol)
+        if slot is None or self._count[slot] < self.period:
+            return None
+        return self._value[slot]
+
+
+class EMA(_Smoothed):
+    """지수 이동평균 (alpha = 2 / (period + 1), 첫 period개 SMA 시드)."""
+
+    def __init__(self, period: int) -> None:
+        super().__init__(period, 2.0 / (period + 1))
+
+    def update(self, symbol: str, price: float) -> Optional[float]:
+        return self._push(self._slot(symbol), price)
+
+    def warmup(self, symbol: str, prices: Sequence[float]) -> Optional[float]:
+        return self._load(self._slot(symbol), _as_array(prices))
+
+
+class SMA(_SymbolState):
+    """단순 이동평균 (링 버퍼 + 누적합)."""
+
+    _FIELDS = (("_sum", "d"), ("_count", "q"), ("_pos", "q"))
+
+    def __init__(self, period: int) -> None:
+        if period < 1:
+            raise ValueError(f"period must be >= 1: {period}")
+        super().__init__(period)
+        self._ring_size = period
+
+    def update(self, symbol: str, price: float) -> Optional[float]:
+        slot = self._slot(symbol)
+        pos = self._pos[slot]
+        i = slot * self.period + pos
+        count = self._count[slot]
+        if count >= self.period:
+            self._sum[slot] += price - self._ring[i]
+        else:
+            self._sum[slot] += price
+            count += 1
+            self._count[slot] = count
+        self._ring[i] = price
+        self._pos[slot] = (pos + 1) % self.period
+        return self._sum[slot] / self.period if count >= self.period else None
+
+    def warmup(self, symbol: str, prices: Sequence[float]) -> Optional[float]:
+        values = _as_array(prices)
+        slot = self._slot(symbol)
+        self.reset(symbol)
+        self._load_ring(slot, values)
+        tail = values[-self.period:]
+        self._sum[slot] = float(tail.sum())
+        self._count[slot] = tail.size
+        self._pos[slot] = values.size % self.period
+        return self.value(symbol)
+
+    def value(self, symbol: str) -> Optional[float]:
+        slot = self._slots.get(symbol)
+        if slot is None or self._count[slot] < self.period:
+            return None
+        return self._sum[slot] / self.period
+
+
+class RSI(_SymbolState):
+    """
+    Wilder RSI.
+
+    처음 period개 가격 변화의 평균 상승/하락폭을 시드로, 이후 avg ← (avg·(period − 1) + x) / period.
+    평균 하락폭이 0이면 100 (상승폭도 0이면 50).
+    """
+
+    _FIELDS = (("_prev", "d"), ("_gain", "d"), ("_loss", "d"), ("_count", "q"))
+
+    def __init__(self, period: int = 14) -> None:
+        if period < 1:
+            raise ValueError(f"period must be >= 1: {period}")
+        super().__init__(period)
+
+    def update(self, symbol: str, price: float) -> Optional[float]:
+        slot = self._slot(symbol)
+        count = self._count[slot]
+        prev = self._prev[slot]
+        self._prev[slot] = price
+        self._count[slot] = count + 1
+        if count == 0:
+            return None
+        change = price - prev
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        period = self.period
+        if count < period:
+            self._gain[slot] += gain
+            self._loss[slot] += loss
+            return None
+        if count == period:
+            avg_gain = (self._gain[slot] + gain) / period
+            avg_loss = (self._loss[slot] + loss) / period
+        else:
+            avg_gain = (self._gain[slot] * (period - 1) + gain) / period
+            avg_loss = (self._loss[slot] * (period - 1) + loss) / period
+        self._gain[slot] = avg_gain
+        self._loss[slot] = avg_loss
+        return self._rsi(avg_gain, avg_loss)
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else 50.0
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    def warmup(self, symbol: str, prices: Sequence[float]) -> Optional[float]:
+        values = _as_array(prices)
+        slot = self._slot(symbol)
+        self.reset(symbol)
+        if values.size == 0:
+            return None
+        self._prev[slot] = float(values[-1])
+        self._count[slot] = values.size
+        changes = np.diff(values)
+        gains = np.maximum(changes, 0.0)
+        losses = np.maximum(-changes, 0.0)
+        period = self.period
+        if changes.size < period:
+            self._gain[slot] = float(gains.sum())
+            self._loss[slot] = float(losses.sum())
+            return None
+        alpha = 1.0 / period
+        self._gain[slot] = _wilder_tail(float(gains[:period].mean()), gains[period:], alpha)
+        self._loss[slot] = _wilder_tail(float(losses[:period].mean()), losses[period:], alpha)
+        return self.value(symbol)
+
+    def value(self, symbol: str) -> Optional[float]:
+        slot = self._slots.get(symbol)
+        if slot is None or self._count[slot] <= self.period:
+            return None
+        return self._rsi(self._gain[slot], self._loss[slot])
+
+
+class BollingerBands(_SymbolState):
+    """
+    볼린저 밴드 (lower, middle, upper) — 모표준편차 기준.
+
+    창 평균/제곱편차합(M2)을 롤링 Welford로 갱신: 창이 찼으면 가장 오래된 값을 같은 단계에서 교체.
+    """
+
+    _FIELDS = (("_mean", "d"), ("_m2", "d"), ("_count", "q"), ("_pos", "q"))
+
+    def __init__(self, period: int = 20, num_std: float = 2.0) -> None:
+        if period < 1:
+            raise ValueError(f"period must be >= 1: {period}")
+        super().__init__(period)
+        self.num_std = num_std
+        self._ring_size = period
+
+    def update(self, symbol: str, price: float) -> Optional[Tuple[float, float, float]]:
+        slot = self._slot(symbol)
+        pos = self._pos[slot]
+        i = slot * self.period + pos
+        count = self._count[slot]
+        mean = self._mean[slot]
+        if count >= self.period:
+            old = self._ring[i]
+            delta = price - old
+            new_mean = mean + delta / self.period
+            self._m2[slot] += delta * (price - new_mean + old - mean)
+        else:
+            count += 1
+            self._count[slot] = count
+            delta = price - mean
+            new_mean = mean + delta / count
+            self._m2[slot] += delta * (price - new_mean)
+        self._mean[slot] = new_mean
+        self._ring[i] = price
+        self._pos[slot] = (pos + 1) % self.period
+        return self._bands(slot) if count >= self.period else None
+
+    def _bands(self, slot: int) -> Tuple[float, float, float]:
+        mean = self._mean[slot]
+        width = self.num_std * math.sqrt(max(self._m2[slot], 0.0) / self.period)
+        return mean - width, mean, mean + width
+
+    def warmup(self, symbol: str, prices: Sequence[float]) -> Optional[Tuple[float, float, float]]:
+        values = _as_array(prices)
+        slot = self._slot(symbol)
+        self.reset(symbol)
+        self._load_ring(slot, values)
+        tail = values[-self.period:]
+        if tail.size:
+            mean = float(tail.mean())
+            self._mean[slot] = mean
+            self._m2[slot] = float(np.square(tail - mean).sum())
+        self._count[slot] = tail.size
+        self._pos[slot] = values.size % self.period
+        return self.value(symbol)
+
+    def value(self, symbol: str) -> Optional[Tuple[float, float, float]]:
+        slot = self._slots.get(symbol)
+        if slot is None or self._count[slot] < self.period:
+            return None
+        return self._bands(slot)
+
+
+class VWAP(_SymbolState):
+    """거래량 가중 평균가 (누적 Σp·v / Σv). 세션 경계에서 reset(symbol)."""
+
+    _FIELDS = (("_pv", "d"), ("_volume", "d"))
+
+    def update(self, symbol: str, price: float, volume: float) -> Optional[float]:
+        slot = self._slot(symbol)
+        self._pv[slot] += price * volume
+        self._volume[slot] += volume
+        return self.value(symbol)
+
+    def warmup(self, symbol: str, prices: Sequence[float], volumes: Sequence[float]) -> Optional[float]:
+        slot = self._slot(symbol)
+        volume = _as_array(volumes)
+        self._pv[slot] = float(np.dot(_as_array(prices), volume))
+        self._volume[slot] = float(volume.sum())
+        return self.value(symbol)
+
+    def value(self, symbol: str) -> Optional[float]:
+        slot = self._slots.get(symbol)
+        if slot is None or self._volume[slot] <= 0:
+            return None
+        return self._pv[slot] / self._volume[slot]
+
+
+class ATR(_Smoothed):
+    """
+    Wilder ATR.
+
+    TR = max(high − low, |high − 이전 종가|, |low − 이전 종가|) (첫 봉은 high − low).
+    틱 데이터는 high = low = close = 가격으로 넣으면 |가격 변화|의 평활값.
+    """
+
+    _FIELDS = _Smoothed._FIELDS + (("_prev_close", "d"), ("_bars", "q"))
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__(period, 1.0 / period)
+
+    def update(self, symbol: str, high: float, low: float, close: float) -> Optional[float]:
+        slot = self._slot(symbol)
+        tr = high - low
+        if self._bars[slot]:
+            prev = self._prev_close[slot]
+            tr = max(tr, abs(high - prev), abs(low - prev))
+        self._bars[slot] += 1
+        self._prev_close[slot] = close
+        return self._push(slot, tr)
+
+    def warmup(
+        self, symbol: str, high: Sequence[float], low: Sequence[float], close: Sequence[float]
+    ) -> Optional[float]:
+        h, l, c = _as_array(high), _as_array(low), _as_array(close)
+        slot = self._slot(symbol)
+        self.reset(symbol)
+        if c.size == 0:
+            return None
+        tr = h - l
+        prev = c[:-1]
+        tr[1:] = np.maximum(tr[1:], np.maximum(np.abs(h[1:] - prev), np.abs(l[1:] - prev)))
+        self._bars[slot] = c.size
+        self._prev_close[slot] = float(c[-1])
+        return self._load(slot, tr)
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Any, List, Optional, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from ..registry.strategy_registry import StrategyRegistry, StrategyLike
+from src.monitoring.latency_histogram import LatencyHistogram
+
+from ..registry.strategy_registry import EntryPoint, StrategyRegistry, StrategyLike
 
 _log = logging.getLogger(__name__)
 
+MODE_SEQUENTIAL = "sequential"
+MODE_THREAD = "thread"
+MODE_PROCESS = "process"
+_MODES = (MODE_SEQUENTIAL, MODE_THREAD, MODE_PROCESS)
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_TIMEOUT = "timeout"
+STATUS_BUSY = "busy"
+STATUS_UNBOUND = "unbound"
+
 
 @dataclass(frozen=True)
 class StrategyIntent:
@@ -18,6 +33,22 @@ class StrategyIntent:
     strategy_id: str
     strategy_name: str
     intent: Any  # runtime.execution.models.intent.Intent 를 직접 import하지 않음(결합 최소화)
+    sources: Tuple[str, ...] = ()  # Arbitration 통합 시 수량을 보탠 strategy_id 목록
+
+
+@dataclass(frozen=True)
+class StrategyRun:
+    """collect 1회의 전략별 실행 결과 (latency_s: 제출 → 완료, 미완료면 마감까지)."""
+    strategy_id: str
+    strategy_name: str
+    status: str  # ok / failed / timeout / busy / unbound
+    latency_s: float
+    intents: int = 0
+
+
+def _invoke(entry: EntryPoint, snapshot: Any) -> List[Any]:
+    # 워커(스레드/프로세스)에서 실행: 제너레이터는 피클 불가하므로 list로 확정
+    return list(entry(snapshot))
 
 
 class StrategyMultiplexer:
@@ -25,38 +56,211 @@ class StrategyMultiplexer:
     Phase 6: 다중 Strategy를 순회하며 Intent를 수집.
     - 전략 간 상호 인지 금지
     - 단일 전략 실패는 전체 실패로 전파하지 않음
+
+    실행 모드:
+    - sequential (기본): 현재 스레드에서 순차 실행
+    - thread: ThreadPoolExecutor 동시 실행 (I/O 대기 위주 전략)
+    - process: ProcessPoolExecutor 동시 실행 (CPU 위주 전략). 전략 객체와 snapshot을 매 호출 피클하므로
+      전략은 피클 가능해야 하고, 워커에서 바뀐 전략 상태는 부모로 돌아오지 않음
+
+    time_budget_s / budgets[strategy_id]: 전략별 시간 예산(초). 예산 안에 끝나지 않은 전략은
+    대기 중이면 취소하고, 이미 실행 중이거나 늦게 끝난 결과는 버림 (timeout). 실행 중인 스레드/프로세스
+    작업은 강제 중단할 수 없으므로, 이전 작업이 끝나지 않은 전략은 다음 collect에서 재제출하지 않고
+    busy로 보고 (같은 전략 인스턴스의 동시 실행·워커 잠식 방지).
+    전략별 지연은 LatencyHistogram으로 누적 (get_metrics / register_metrics), 직전 결과는 last_runs.
     """
 
-    def __init__(self, registry: StrategyRegistry) -> None:
+    def __init__(
+        self,
+        registry: StrategyRegistry,
+        *,
+        mode: str = MODE_SEQUENTIAL,
+        max_workers: Optional[int] = None,
+        time_budget_s: Optional[float] = None,
+        budgets: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        if mode not in _MODES:
+            raise ValueError(f"mode must be one of {_MODES}: {mode}")
         self._registry = registry
+        self.mode = mode
+        self.max_workers = max_workers
+        self.time_budget_s = time_budget_s
+        self.budgets: Dict[str, float] = dict(budgets or {})
+        self._executor: Optional[Executor] = None
+        self._in_flight: Dict[str, Tuple[Future, float]] = {}  # strategy_id → (미완료 작업, 제출 시각)
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.timeouts: Dict[str, int] = {}
+        self.busy: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}
+        self.last_runs: Tuple[StrategyRun, ...] = ()
 
     def collect(self, snapshot: Any) -> List[StrategyIntent]:
+        bindings = self._registry.active_entries()
+        if self.mode == MODE_SEQUENTIAL:
+            runs = self._collect_sequential(bindings, snapshot)
+        else:
+            runs = self._collect_parallel(bindings, snapshot)
+
         out: List[StrategyIntent] = []
+        report: List[StrategyRun] = []
+        for s, status, latency_s, intents in runs:
+            report.append(StrategyRun(s.strategy_id, s.name, status, latency_s, len(intents)))
+            self._record(s, status, latency_s)
+            for it in intents:
+                out.append(StrategyIntent(s.strategy_id, s.name, it))
+        self.last_runs = tuple(report)
+        return out
+
+    def budget_for(self, strategy_id: str) -> Optional[float]:
+        return self.budgets.get(strategy_id, self.time_budget_s)
 
-        for s in self._registry.active_strategies():
+    def _collect_sequential(self, bindings, snapshot: Any) -> List[Tuple[StrategyLike, str, float, List[Any]]]:
+        runs = []
+        for s, entry in bindings:
+            if entry is None:
+                runs.append(self._unbound(s))
+                continue
+            started = time.perf_counter()
             try:
-                intents = self._generate_intents(s, snapshot)
-                for it in intents:
-                    out.append(StrategyIntent(s.strategy_id, s.name, it))
+                intents = _invoke(entry, snapshot)
             except Exception as e:
                 # Phase 6 원칙: 한 Strategy의 실패가 전체를 깨지 않음
                 _log.warning("Strategy %s (id=%s) failed: %s", s.name, s.strategy_id, e)
+                runs.append((s, STATUS_FAILED, time.perf_counter() - started, []))
                 continue
+            runs.append(self._judge(s, time.perf_counter() - started, intents))
+        return runs
 
-        return out
+    def _collect_parallel(self, bindings, snapshot: Any) -> List[Tuple[StrategyLike, str, float, List[Any]]]:
+        executor = self._ensure_executor()
+        started = time.perf_counter()
+        finished: Dict[Future, float] = {}
+        submitted: List[Tuple[int, StrategyLike, Future]] = []
+        runs: List[Any] = [None] * len(bindings)
+        for i, (s, entry) in enumerate(bindings):
+            if entry is None:
+                runs[i] = self._unbound(s)
+                continue
+            previous = self._in_flight.get(s.strategy_id)
+            if previous is not None:
+                if not previous[0].done():
+                    runs[i] = self._busy(s, started - previous[1])
+                    continue
+                del self._in_flight[s.strategy_id]
+            future = executor.submit(_invoke, entry, snapshot)
+            future.add_done_callback(lambda f: finished.setdefault(f, time.perf_counter()))
+            submitted.append((i, s, future))
+
+        self._wait_deadlines({f: self._deadline(started, s.strategy_id) for _, s, f in submitted})
+
+        for i, s, future in submitted:
+            if not future.done():
+                # 대기 중이면 취소, 실행 중이면 결과만 버리고 끝날 때까지 재제출하지 않음
+                if not future.cancel():
+                    self._in_flight[s.strategy_id] = (future, started)
+                runs[i] = self._late(s, time.perf_counter() - started)
+                continue
+            latency_s = finished.get(future, time.perf_counter()) - started
+            error = future.exception()
+            if error is not None:
+                _log.warning("Strategy %s (id=%s) failed: %s", s.name, s.strategy_id, error)
+                runs[i] = (s, STATUS_FAILED, latency_s, [])
+                continue
+            runs[i] = self._judge(s, latency_s, future.result())
+        return runs
+
+    def _deadline(self, started: float, strategy_id: str) -> Optional[float]:
+        budget = self.budget_for(strategy_id)
+        return None if budget is None else started + budget
+
+    @staticmethod
+    def _wait_deadlines(deadlines: Dict[Future, Optional[float]]) -> None:
+        """모든 작업이 끝나거나 남은 작업이 전부 각자 마감을 넘길 때까지 대기."""
+        pending = set(deadlines)
+        while pending:
+            now = time.perf_counter()
+            pending = {f for f in pending if deadlines[f] is None or deadlines[f] > now}
+            if not pending:
+                return
+            live = [deadlines[f] for f in pending if deadlines[f] is not None]
+            _, pending = wait(pending, timeout=min(live) - now if live else None, return_when=FIRST_COMPLETED)
+
+    def _judge(self, s: StrategyLike, latency_s: float, intents: List[Any]) -> Tuple[StrategyLike, str, float, List[Any]]:
+        budget = self.budget_for(s.strategy_id)
+        if budget is not None and latency_s > budget:
+            return self._late(s, latency_s)
+        return s, STATUS_OK, latency_s, intents
+
+    def _late(self, s: StrategyLike, latency_s: float) -> Tuple[StrategyLike, str, float, List[Any]]:
+        _log.warning(
+            "Strategy %s (id=%s) exceeded time budget (%.1fms > %.1fms), intents dropped",
+            s.name, s.strategy_id, latency_s * 1000.0, (self.budget_for(s.strategy_id) or 0.0) * 1000.0,
+        )
+        return s, STATUS_TIMEOUT, latency_s, []
+
+    def _busy(self, s: StrategyLike, latency_s: float) -> Tuple[StrategyLike, str, float, List[Any]]:
+        _log.warning(
+            "Strategy %s (id=%s) still running previous cycle (%.1fms), skipped",
+            s.name, s.strategy_id, latency_s * 1000.0,
+        )
+        return s, STATUS_BUSY, latency_s, []
+
+    def _unbound(self, s: StrategyLike) -> Tuple[StrategyLike, str, float, List[Any]]:
+        _log.warning(
+            "Strategy %s (id=%s) failed: Strategy must implement generate_intents/generate or be callable",
+            s.name, s.strategy_id,
+        )
+        return s, STATUS_UNBOUND, 0.0, []
+
+    def _record(self, s: StrategyLike, status: str, latency_s: float) -> None:
+        if status == STATUS_UNBOUND:
+            return
+        hist = self.latency.get(s.strategy_id)
+        if hist is None:
+            hist = self.latency[s.strategy_id] = LatencyHistogram()
+        hist.record(latency_s)
+        if status == STATUS_TIMEOUT:
+            self.timeouts[s.strategy_id] = self.timeouts.get(s.strategy_id, 0) + 1
+        elif status == STATUS_BUSY:
+            self.busy[s.strategy_id] = self.busy.get(s.strategy_id, 0) + 1
+        elif status == STATUS_FAILED:
+            self.failures[s.strategy_id] = self.failures.get(s.strategy_id, 0) + 1
+
+    def _ensure_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == MODE_PROCESS:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="strategy")
+        return self._executor
+
+    def close(self) -> None:
+        """워커 풀 종료 (대기 중 작업 취소, 실행 중 작업은 기다리지 않음)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._in_flight.clear()
+
+    def __enter__(self) -> "StrategyMultiplexer":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """MetricsCollector 수집기 형식 ({'counters': ..., 'gauges': ...}), 전략별 지연(ms)."""
+        counters: Dict[str, Any] = {}
+        gauges: Dict[str, float] = {}
+        for sid, hist in self.latency.items():
+            snap = hist.snapshot(scale=1000.0)
+            counters[f"strategy.{sid}.runs"] = hist.count
+            counters[f"strategy.{sid}.timeouts"] = self.timeouts.get(sid, 0)
+            counters[f"strategy.{sid}.busy"] = self.busy.get(sid, 0)
+            counters[f"strategy.{sid}.failures"] = self.failures.get(sid, 0)
+            for stat in ("mean", "p50", "p99", "max"):
+                gauges[f"strategy.{sid}.latency_{stat}_ms"] = snap[stat]
+        return {"counters": counters, "gauges": gauges}
 
-    def _generate_intents(self, strategy: StrategyLike, snapshot: Any) -> Sequence[Any]:
-        """
-        Strategy 구현체의 실제 메서드명에 의존하지 않기 위해
-        관용적으로 다음 중 하나를 지원:
-        - generate_intents(snapshot)
-        - generate(snapshot)
-        - __call__(snapshot)
-        """
-        if hasattr(strategy, "generate_intents"):
-            return list(strategy.generate_intents(snapshot))  # type: ignore[attr-defined]
-        if hasattr(strategy, "generate"):
-            return list(strategy.generate(snapshot))  # type: ignore[attr-defined]
-        if callable(strategy):
-            return list(strategy(snapshot))  # type: ignore[misc]
-        raise AttributeError("Strategy must implement generate_intents/generate or be callable")
+    def register_metrics(self, collector: Any, name: str = "strategy_multiplexer") -> None:
+        """MetricsCollector에 수집기 등록."""
+        collector.register_collector(name, self.get_metrics)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Protocol
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
 
 
 class StrategyLike(Protocol):
@@ -12,6 +12,21 @@ class StrategyLike(Protocol):
     def is_enabled(self) -> bool: ...
 
 
+EntryPoint = Callable[[Any], Sequence[Any]]
+
+
+def bind_entry_point(strategy: Any) -> Optional[EntryPoint]:
+    """
+    Strategy 구현체의 Intent 생성 메서드를 1회 바인딩.
+    generate_intents(snapshot) → generate(snapshot) → __call__(snapshot) 순. 없으면 None.
+    """
+    for attr in ("generate_intents", "generate"):
+        method = getattr(strategy, attr, None)
+        if callable(method):
+            return method
+    return strategy if callable(strategy) else None
+
+
 @dataclass(frozen=True)
 class StrategyRef:
     strategy_id: str
@@ -26,15 +41,22 @@ class StrategyRegistry:
 
     def __init__(self) -> None:
         self._items: Dict[str, StrategyLike] = {}
+        self._entries: Dict[str, Optional[EntryPoint]] = {}
 
     def register(self, strategy: StrategyLike) -> None:
         sid = strategy.strategy_id
         if not sid or not isinstance(sid, str):
             raise ValueError("strategy.strategy_id must be non-empty str")
         self._items[sid] = strategy
+        self._entries[sid] = bind_entry_point(strategy)
 
     def unregister(self, strategy_id: str) -> None:
         self._items.pop(strategy_id, None)
+        self._entries.pop(strategy_id, None)
+
+    def entry_point(self, strategy_id: str) -> Optional[EntryPoint]:
+        """등록 시 바인딩한 Intent 생성 callable (없으면 None)."""
+        return self._entries.get(strategy_id)
 
     def get(self, strategy_id: str) -> Optional[StrategyLike]:
         return self._items.get(strategy_id)
@@ -45,5 +67,9 @@ class StrategyRegistry:
     def active_strategies(self) -> List[StrategyLike]:
         return [s for s in self._items.values() if s.is_enabled()]
 
+    def active_entries(self) -> List[Tuple[StrategyLike, Optional[EntryPoint]]]:
+        """활성 전략과 바인딩된 entry point 쌍 (매 호출 hasattr 탐색 없음)."""
+        return [(s, self._entries[sid]) for sid, s in self._items.items() if s.is_enabled()]
+
     def __len__(self) -> int:
         return len(self._items)
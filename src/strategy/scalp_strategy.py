@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .indicators import RSI, SMA, BollingerBands
+from .interfaces.strategy import ExecutionContext, Intent, MarketContext, Strategy
+
+
+# Config_Scalp 카테고리별 기본값 (ConfigScalpRepository.get_*_parameters 반환 형식과 동일한 KEY)
+DEFAULT_SCALP_PARAMETERS: Dict[str, Dict[str, Any]] = {
+    "GOLDEN_CROSS": {"scalp_gc_short_period": 5, "scalp_gc_long_period": 20},
+    "RSI": {"scalp_rsi_period": 14, "scalp_rsi_oversold": 30, "scalp_rsi_overbought": 70},
+    "BOLLINGER_BANDS": {"scalp_bb_period": 20, "scalp_bb_std": 2.0},
+    "EXECUTION": {"scalp_max_qty_per_order": 1},
+}
+
+
+def merge_scalp_parameters(params: Optional[Mapping[str, Mapping[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+    """카테고리별 파라미터를 기본값 위에 덮어쓴 사본 반환."""
+    merged = {category: dict(values) for category, values in DEFAULT_SCALP_PARAMETERS.items()}
+    for category, values in (params or {}).items():
+        merged.setdefault(category, {}).update(values)
+    return merged
+
+
+class ScalpParameterStrategy(Strategy):
+    """
+    Config_Scalp 파라미터(골든크로스 / RSI / 볼린저 밴드 / 실행 설정)를 사용하는 스캘프 전략.
+
+    - 진입(무포지션): 단기 MA 상향 돌파 또는 RSI ≤ oversold 또는 가격 ≤ 하단 밴드
+    - 청산(보유 중): 단기 MA 하향 돌파 또는 RSI ≥ overbought 또는 가격 ≥ 상단 밴드
+    - 기간이 0 이하인 지표는 비활성
+    - 지표는 src.strategy.indicators 스트리밍 지표(SMA / Wilder RSI / 볼린저)에서 틱당 O(1)로 읽음
+    """
+
+    def __init__(self, params: Optional[Mapping[str, Mapping[str, Any]]] = None) -> None:
+        p = merge_scalp_parameters(params)
+        gc, rsi, bb, ex = p["GOLDEN_CROSS"], p["RSI"], p["BOLLINGER_BANDS"], p["EXECUTION"]
+        self.short_period = int(gc["scalp_gc_short_period"])
+        self.long_period = int(gc["scalp_gc_long_period"])
+        self.rsi_period = int(rsi["scalp_rsi_period"])
+        self.rsi_oversold = float(rsi["scalp_rsi_oversold"])
+        self.rsi_overbought = float(rsi["scalp_rsi_overbought"])
+        self.bb_period = int(bb["scalp_bb_period"])
+        self.bb_std = float(bb["scalp_bb_std"])
+        self.qty = max(1, int(ex["scalp_max_qty_per_order"]))
+        has_cross = self.short_period > 0 and self.long_period > 0
+        self._short = SMA(self.short_period) if has_cross else None
+        self._long = SMA(self.long_period) if has_cross else None
+        self._rsi = RSI(self.rsi_period) if self.rsi_period > 0 else None
+        self._bands = BollingerBands(self.bb_period, self.bb_std) if self.bb_period > 1 else None
+        self._last_spread: Dict[str, Optional[float]] = {}
+
+    def _update(self, symbol: str, price: float) -> Tuple[Optional[float], Optional[float], Optional[tuple]]:
+        spread = None
+        if self._short is not None:
+            short = self._short.update(symbol, price)
+            long = self._long.update(symbol, price)
+            if short is not None and long is not None:
+                spread = short - long
+        rsi = self._rsi.update(symbol, price) if self._rsi is not None else None
+        bands = self._bands.update(symbol, price) if self._bands is not None else None
+        return spread, rsi, bands
+
+    def warmup(self, symbol: str, prices: Sequence[float]) -> None:
+        """과거 가격 배열로 지표 상태 일괄 적재 (generate_intents를 순차 호출한 것과 같은 지표 상태)."""
+        spread = None
+        if self._short is not None:
+            short = self._short.warmup(symbol, prices)
+            long = self._long.warmup(symbol, prices)
+            if short is not None and long is not None:
+                spread = short - long
+        if self._rsi is not None:
+            self._rsi.warmup(symbol, prices)
+        if self._bands is not None:
+            self._bands.warmup(symbol, prices)
+        self._last_spread[symbol] = spread
+
+    def generate_intents(self, market: MarketContext, execution: ExecutionContext) -> Sequence[Intent]:
+        spread, rsi, bands = self._update(market.symbol, float(market.price))
+        previous = self._last_spread.get(market.symbol)
+        self._last_spread[market.symbol] = spread
+        crossed_up = spread is not None and previous is not None and previous <= 0 < spread
+        crossed_down = spread is not None and previous is not None and previous >= 0 > spread
+
+        intents: List[Intent] = []
+        if execution.position_qty <= 0:
+            if crossed_up:
+                reason = "scalp_golden_cross"
+            elif rsi is not None and rsi <= self.rsi_oversold:
+                reason = "scalp_rsi_oversold"
+            elif bands is not None and market.price <= bands[0]:
+                reason = "scalp_bb_lower"
+            else:
+                return intents
+            intents.append(Intent(symbol=market.symbol, side="BUY", qty=self.qty, reason=reason))
+        else:
+            if crossed_down:
+                reason = "scalp_dead_cross"
+            elif rsi is not None and rsi >= self.rsi_overbought:
+                reason = "scalp_rsi_overbought"
+            elif bands is not None and market.price >= bands[2]:
+                reason = "scalp_bb_upper"
+            else:
+                return intents
+            intents.append(Intent(symbol=market.symbol, side="SELL", qty=execution.position_qty, reason=reason))
+        return intents
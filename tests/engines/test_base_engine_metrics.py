@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+BaseEngine 실행 지표 테스트 (누적합 평균, operation별 지연 히스토그램, MetricsCollector 연동)
+"""
+
+import pytest
+
+from src.monitoring.metrics_collector import MetricsCollector
+from src.qts.core.config.config_models import UnifiedConfig
+from src.strategy.engines.base_engine import BaseEngine
+from src.strategy.engines.strategy_engine import StrategyEngine
+
+
+class _Engine(BaseEngine):
+    async def initialize(self) -> bool:
+        return True
+
+    async def start(self) -> bool:
+        return True
+
+    async def stop(self) -> bool:
+        return True
+
+    async def execute(self, data):
+        return {"success": True, "data": None, "execution_time": 0.0}
+
+
+def _engine():
+    return _Engine(UnifiedConfig(config_map={}, metadata={}))
+
+
+def test_average_uses_running_sum():
+    engine = _engine()
+    for t in (0.1, 0.2, 0.3):
+        engine._update_metrics(t, success=True, operation="a")
+    engine._update_metrics(0.4, success=False, operation="b")
+
+    assert engine.metrics.total_operations == 4
+    assert engine.metrics.average_execution_time == pytest.approx(0.25)
+    assert engine.metrics.max_execution_time == 0.4
+    assert engine.state.error_count == 1
+
+
+def test_latency_snapshot_per_operation():
+    engine = _engine()
+    for i in range(100):
+        engine._update_metrics((i + 1) / 1000.0, success=True, operation="calc")
+    engine._update_metrics(0.5, success=False)
+
+    snap = engine.get_latency_snapshot()
+    calc = snap["operations"]["calc"]
+    assert calc["count"] == 100 and calc["errors"] == 0
+    assert calc["p50_ms"] == pytest.approx(50.0, rel=0.1)
+    assert calc["p99_ms"] == pytest.approx(99.0, rel=0.1)
+    assert calc["max_ms"] == pytest.approx(100.0)
+    assert snap["operations"]["unknown"]["errors"] == 1
+    assert snap["overall"]["count"] == 101
+
+
+def test_register_metrics_exports_through_collector():
+    engine = _engine()
+    engine._update_metrics(0.01, success=True, operation="calc")
+    collector = MetricsCollector()
+    engine.register_metrics(collector)
+
+    snap = collector.snapshot()
+    assert snap.counters["engine._Engine.operations"] == 1
+    assert snap.counters["engine._Engine.op.calc.calls"] == 1
+    assert snap.gauges["engine._Engine.op.calc.p95_ms"] == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_execute_records_operation_breakdown():
+    engine = StrategyEngine(UnifiedConfig(config_map={}, metadata={}))
+    await engine.execute({"operation": "calculate_signal", "market_data": {}, "position_data": {}})
+    await engine.execute({"operation": "nope"})
+
+    ops = engine.get_latency_snapshot()["operations"]
+    assert ops["calculate_signal"]["count"] == 1
+    assert ops["nope"]["errors"] == 1
+    status = await engine.get_status()
+    assert "latency" in status["metrics"]
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Performance Metrics Core 테스트 (NumPy 일괄 계산 / 증분 모드)
+
+- 기존 PerformanceEngine._calculate_* 구현과 동일 결과(회귀 고정)
+- 증분 모드 append 결과 == 전체 재계산 결과
+"""
+
+import math
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from src.qts.core.config.config_models import UnifiedConfig
+from src.strategy.engines.performance_engine import PerformanceEngine, PerformanceMetrics
+from src.strategy.engines.performance_metrics import (
+    StreamingPerformanceMetrics,
+    compute_return_metrics,
+    parse_daily_returns,
+)
+
+RETURN_CASES = [
+    [],
+    [0.01],
+    [0.0, 0.0, 0.0],
+    [0.01, 0.02, 0.03],
+    [-0.01, -0.02],
+    [0.05, 0.03, -0.02, -0.04, -0.01, 0.02, 0.01],
+    [0.01, -0.01, -0.02, -0.01, 0.02, -0.03, -0.01],
+    [-0.01, 0.02, -0.03, 0.04, 0.0, -0.005],
+]
+
+
+def _make_engine(history):
+    history_repo = AsyncMock()
+    history_repo.get_execution_history = AsyncMock(return_value=history)
+    history_repo.get_performance_metrics = AsyncMock(return_value={})
+    performance_repo = Mock()
+    performance_repo.update_kpi_summary = Mock(return_value=None)
+    return PerformanceEngine(
+        UnifiedConfig(config_map={}, metadata={}),
+        history_repo=history_repo,
+        performance_repo=performance_repo,
+    )
+
+
+def _reference(engine, returns):
+    """기존 순수 Python 구현으로 계산한 지표."""
+    total_return = engine._calculate_total_return(returns)
+    mdd = engine._calculate_max_drawdown_from_returns(returns)
+    win_rate, avg_win, avg_loss = engine._calculate_trade_statistics(returns)
+    return {
+        'total_return': total_return,
+        'mdd': mdd,
+        'daily_volatility': engine._calculate_volatility(returns),
+        'sharpe_ratio': engine._calculate_sharpe_ratio(returns),
+        'win_rate': win_rate,
+        'avg_win': avg_win,
+        'avg_loss': avg_loss,
+        'max_consecutive_losses': engine._calculate_max_consecutive_losses(returns),
+        'profit_factor': engine._calculate_profit_factor(returns),
+        'calmar_ratio': total_return / abs(mdd) if mdd != 0 else 0.0,
+    }
+
+
+def _assert_metrics_equal(actual, expected):
+    assert set(actual) == set(expected)
+    for key, value in expected.items():
+        if math.isinf(value):
+            assert actual[key] == value, key
+        else:
+            assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+
+@pytest.mark.parametrize("returns", RETURN_CASES)
+def test_vectorized_metrics_match_reference(returns):
+    engine = _make_engine([])
+    _assert_metrics_equal(compute_return_metrics(np.array(returns)), _reference(engine, returns))
+
+
+@pytest.mark.parametrize("returns", RETURN_CASES)
+def test_streaming_append_matches_full_recompute(returns):
+    state = StreamingPerformanceMetrics()
+    for i, r in enumerate(returns):
+        state.append(r)
+        _assert_metrics_equal(state.metrics(), compute_return_metrics(returns[:i + 1]))
+    if not returns:
+        _assert_metrics_equal(state.metrics(), compute_return_metrics([]))
+
+
+def test_parse_daily_returns_skips_invalid_values():
+    records = [
+        {"Daily_Return": "0.1%"},
+        {"Daily_Return": "1,000%"},
+        {"Daily_Return": "n/a"},
+        {"Daily_Return": None},
+        {},
+    ]
+    parsed = parse_daily_returns(records)
+    assert parsed.dtype == np.float64
+    np.testing.assert_allclose(parsed, [0.001, 10.0, 0.0])
+
+
+@pytest.mark.asyncio
+async def test_engine_reuses_parsed_returns_and_appends_incrementally():
+    history = [{"Date": f"2024-01-{d:02d}", "Daily_Return": v} for d, v in
+               enumerate(["0.1%", "0.15%", "-0.25%", "0.3%"], start=1)]
+    engine = _make_engine(history)
+
+    metrics = await engine.calculate_performance_metrics()
+    parsed = engine._daily_returns
+    await engine.calculate_performance_metrics()
+    assert engine._daily_returns is parsed
+    assert isinstance(metrics, PerformanceMetrics)
+    assert metrics.max_consecutive_losses == 1
+
+    updated = engine.append_daily_return(-0.002)
+    expected = compute_return_metrics([0.001, 0.0015, -0.0025, 0.003, -0.002])
+    assert updated.total_return == pytest.approx(expected['total_return'])
+    assert updated.daily_volatility == pytest.approx(expected['daily_volatility'])
+    assert updated.mdd == pytest.approx(expected['mdd'])
+    assert engine._performance_cache is updated
+
+
+@pytest.mark.asyncio
+async def test_engine_does_not_reparse_when_history_catches_up_with_appends():
+    history = [{"Date": f"2024-01-{d:02d}", "Daily_Return": v} for d, v in
+               enumerate(["0.1%", "0.15%", "-0.25%"], start=1)]
+    engine = _make_engine(history)
+    await engine.calculate_performance_metrics()
+    state = engine._streaming_metrics
+
+    for r in (0.003, -0.002):
+        engine.append_daily_return(r)
+    # 저장소가 추가된 일자(+ 하루 더)를 반영 → 새 레코드만 파싱, 증분 상태는 재시드하지 않음
+    history = history + [{"Daily_Return": "0.3%"}, {"Daily_Return": "-0.2%"}, {"Daily_Return": "0.05%"}]
+    engine._history_repo.get_execution_history.return_value = history
+    metrics = await engine.calculate_performance_metrics()
+
+    returns = [0.001, 0.0015, -0.0025, 0.003, -0.002, 0.0005]
+    assert engine._streaming_metrics is state and state.count == 6
+    np.testing.assert_allclose(engine._daily_returns, returns)
+    assert metrics.total_return == pytest.approx(compute_return_metrics(returns)['total_return'])
+
+    # 저장소 값이 append한 값과 다르면 저장소 기준으로 재시드
+    engine.append_daily_return(0.01)
+    engine._history_repo.get_execution_history.return_value = history + [{"Daily_Return": "-1%"}]
+    await engine.calculate_performance_metrics()
+    assert engine._streaming_metrics is not state
+    np.testing.assert_allclose(engine._daily_returns, returns + [-0.01])
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Performance Return Series 테스트 (롤링 창 / 월·연 리샘플링 / 엔진 캐시)
+
+- 누적합 기반 롤링 지표 == 창별 전체 재계산(compute_return_metrics)
+- get_monthly_performance는 시계열 캐시 재사용 (history 재조회 없음)
+"""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from src.qts.core.config.config_models import UnifiedConfig
+from src.strategy.engines.performance_engine import PerformanceEngine, RollingPerformance
+from src.strategy.engines.performance_metrics import compute_return_metrics
+from src.strategy.engines.performance_series import ReturnSeries
+
+
+def _records(returns, start=date(2023, 12, 28)):
+    equity = 1_000_000.0
+    records = []
+    for k, r in enumerate(returns):
+        equity *= 1.0 + r
+        records.append({
+            "Date": (start + timedelta(days=k)).isoformat(),
+            "Daily_Return": f"{r * 100:.6f}%",
+            "Total_Equity": equity,
+        })
+    return records
+
+
+def _make_engine(records):
+    history_repo = AsyncMock()
+    history_repo.get_all = AsyncMock(return_value=records)
+    performance_repo = Mock()
+    performance_repo.update_kpi_summary = Mock(return_value=None)
+    return PerformanceEngine(
+        UnifiedConfig(config_map={}, metadata={}),
+        history_repo=history_repo,
+        performance_repo=performance_repo,
+    )
+
+
+RETURNS = list(np.random.default_rng(7).normal(0.0005, 0.01, size=90))
+
+
+def test_rolling_matches_window_recompute():
+    series = ReturnSeries.from_records(_records(RETURNS))
+    rolling = series.rolling(20)
+
+    assert len(rolling["dates"]) == len(RETURNS) - 19
+    for k in (0, 17, len(RETURNS) - 20):
+        window = series.returns[k:k + 20]
+        expected = compute_return_metrics(window)
+        assert rolling["return"][k] == pytest.approx(expected["total_return"], rel=1e-9)
+        assert rolling["volatility"][k] == pytest.approx(expected["daily_volatility"], rel=1e-9)
+        assert rolling["sharpe_ratio"][k] == pytest.approx(expected["sharpe_ratio"], rel=1e-9)
+    assert series.rolling(20) is rolling
+
+
+def test_drawdown_duration_counts_days_since_high_watermark():
+    series = ReturnSeries.from_records(_records([0.01, -0.02, 0.005, 0.02, -0.01]))
+    drawdown, duration = series.drawdown_series()
+
+    assert duration.tolist() == [0, 1, 2, 0, 1]
+    assert drawdown[0] == 0.0 and drawdown[1] > 0.0
+    assert series.rolling(3)["max_drawdown_duration"].tolist() == [2, 2, 2]
+
+
+def test_records_are_date_sorted_and_invalid_rows_dropped():
+    records = _records([0.01, 0.02, 0.03])[::-1] + [{"Date": "bad", "Daily_Return": "1%"}]
+    series = ReturnSeries.from_records(records)
+
+    assert len(series) == 3
+    np.testing.assert_allclose(series.returns, [0.01, 0.02, 0.03])
+    stats = series.range_stats(date(2023, 12, 29), date(2023, 12, 30))
+    assert stats["days"] == 2
+    assert stats["total_return"] == pytest.approx(1.02 * 1.03 - 1.0)
+
+
+def test_resample_month_and_year():
+    series = ReturnSeries.from_records(_records(RETURNS))
+    months = series.resample("M")
+    years = series.resample("Y")
+
+    assert [m["period"] for m in months] == ["2023-12", "2024-01", "2024-02", "2024-03"]
+    assert sum(m["days"] for m in months) == len(RETURNS)
+    assert months[0]["return"] == pytest.approx(compute_return_metrics(series.returns[:4])["total_return"])
+    assert [y["period"] for y in years] == ["2023", "2024"]
+    growth = np.prod([1.0 + y["return"] for y in years]) - 1.0
+    assert growth == pytest.approx(compute_return_metrics(series.returns)["total_return"])
+    with pytest.raises(ValueError):
+        series.resample("W")
+
+
+@pytest.mark.asyncio
+async def test_engine_series_cached_between_queries():
+    engine = _make_engine(_records(RETURNS))
+
+    rolling = await engine.get_rolling_performance(20, start_date=date(2024, 2, 1))
+    monthly = await engine.get_monthly_performance(2024)
+    periods = await engine.get_period_performance("Y")
+
+    assert isinstance(rolling[0], RollingPerformance) and rolling[0].date == date(2024, 2, 1)
+    assert [m.month for m in monthly] == ["2024-01", "2024-02", "2024-03"]
+    assert [p.period for p in periods] == ["2023", "2024"]
+    assert engine._history_repo.get_all.await_count == 1
+
+    engine.invalidate_return_series()
+    await engine.get_period_performance("M", year=2024)
+    assert engine._history_repo.get_all.await_count == 2
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+BaseSheetRepository 데이터 행 캐시 테스트 (read-through, TTL, id 인덱스, write-back 병합)
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from src.db.repositories.dividend_repository import DividendRepository
+from src.db.repositories.config_scalp_repository import ConfigScalpRepository
+
+
+class FakeSheetsClient:
+    """시트 1개를 메모리에 보관하는 Mock 클라이언트 (호출 횟수 기록)."""
+
+    spreadsheet_id = "sid"
+
+    def __init__(self, sheet: List[List[Any]]):
+        self.sheet = [list(row) for row in sheet]
+        self.get_calls: List[str] = []
+        self.update_calls: List[str] = []
+        self.batch_update_calls: List[Dict[str, List[List[Any]]]] = []
+
+    async def get_sheet_data(self, range_name: str) -> List[List[Any]]:
+        self.get_calls.append(range_name)
+        cells = range_name.split("!")[1]
+        start = int("".join(ch for ch in cells.split(":")[0] if ch.isdigit()))
+        if cells.endswith(":Z"):
+            rows = self.sheet[start - 1:]
+        else:
+            rows = self.sheet[start - 1:start]
+        while rows and not any(str(c).strip() for c in rows[-1]):
+            rows = rows[:-1]
+        return [list(r) for r in rows]
+
+    async def update_sheet_data(self, range_name: str, values: List[List[Any]]) -> Dict[str, Any]:
+        self.update_calls.append(range_name)
+        self._write(range_name, values)
+        return {}
+
+    async def batch_update(self, ranges_values: Dict[str, List[List[Any]]]) -> Dict[str, Any]:
+        self.batch_update_calls.append(dict(ranges_values))
+        for range_name, values in ranges_values.items():
+            self._write(range_name, values)
+        return {}
+
+    async def append_sheet_data(self, range_name: str, values: List[List[Any]]) -> Dict[str, Any]:
+        self.sheet.extend(list(v) for v in values)
+        return {}
+
+    def _write(self, range_name: str, values: List[List[Any]]) -> None:
+        start = int(range_name.split("!A")[1].split(":")[0])
+        for offset, row in enumerate(values):
+            idx = start - 1 + offset
+            while len(self.sheet) <= idx:
+                self.sheet.append([])
+            self.sheet[idx] = list(row)
+
+
+def _dividend_sheet():
+    return [
+        ["Year", "Jan", "Feb"],
+        ["2022", "10", "20"],
+        ["", "", ""],
+        ["2023", "30", "40"],
+        ["2024", "50", "60"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_reuses_cached_sheet():
+    client = FakeSheetsClient(_dividend_sheet())
+    repo = DividendRepository(client, "sid")
+
+    assert (await repo.get_by_id("2023"))["Jan"] == 30
+    assert (await repo.get_by_id("2024"))["Feb"] == 60
+    assert await repo.get_by_id("1999") is None
+    assert await repo.count_records() == 3
+
+    data_reads = [r for r in client.get_calls if r.endswith(":Z")]
+    assert len(data_reads) == 1
+    assert repo.get_cache_stats()["hits"] >= 3
+
+
+@pytest.mark.asyncio
+async def test_find_row_by_id_accounts_for_blank_rows():
+    client = FakeSheetsClient(_dividend_sheet())
+    repo = DividendRepository(client, "sid")
+
+    assert await repo._find_row_by_id("2022", "Year") == 2
+    assert await repo._find_row_by_id("2023", "Year") == 4
+    assert await repo._get_next_empty_row() == 6
+
+
+@pytest.mark.asyncio
+async def test_ttl_zero_disables_cache_and_invalidate_forces_reload():
+    client = FakeSheetsClient(_dividend_sheet())
+    repo = DividendRepository(client, "sid")
+
+    await repo.get_by_id("2022")
+    repo.invalidate_cache()
+    await repo.get_by_id("2022")
+    assert len([r for r in client.get_calls if r.endswith(":Z")]) == 2
+
+    repo.configure_cache(0)
+    await repo.get_by_id("2022")
+    await repo.get_by_id("2022")
+    assert len([r for r in client.get_calls if r.endswith(":Z")]) == 4
+
+
+@pytest.mark.asyncio
+async def test_update_writes_through_to_cache():
+    client = FakeSheetsClient(_dividend_sheet())
+    repo = DividendRepository(client, "sid")
+
+    await repo.update("2023", {"Jan": 99})
+
+    assert client.update_calls == ["Dividend!A4:Z4"]
+    assert client.sheet[3] == ["2023", "99", "40"]
+    assert (await repo.get_by_id("2023"))["Jan"] == 99
+    assert len([r for r in client.get_calls if r.endswith(":Z")]) == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_writes_merges_updates_into_single_request():
+    client = FakeSheetsClient(_dividend_sheet())
+    repo = DividendRepository(client, "sid")
+
+    async with repo.coalesce_writes():
+        await repo.update("2022", {"Jan": 1})
+        await repo.update("2023", {"Jan": 2})
+        await repo.update("2024", {"Jan": 3})
+        await repo.update("2024", {"Feb": 4})
+        assert client.update_calls == []
+        assert (await repo.get_by_id("2024"))["Feb"] == 4
+
+    assert client.update_calls == []
+    assert client.batch_update_calls == [
+        {
+            "Dividend!A2:Z2": [["2022", "1", "20"]],
+            "Dividend!A4:Z5": [["2023", "2", "40"], ["2024", "3", "4"]],
+        }
+    ]
+    assert client.sheet[4] == ["2024", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_writes_discards_buffer_on_error():
+    client = FakeSheetsClient(_dividend_sheet())
+    repo = DividendRepository(client, "sid")
+
+    with pytest.raises(RuntimeError):
+        async with repo.coalesce_writes():
+            await repo.update("2022", {"Jan": 1})
+            raise RuntimeError("boom")
+
+    assert client.batch_update_calls == [] and client.update_calls == []
+    assert (await repo.get_by_id("2022"))["Jan"] == 10
+
+
+@pytest.mark.asyncio
+async def test_create_invalidates_cache_and_case_insensitive_lookup():
+    client = FakeSheetsClient([
+        ["CATEGORY", "SUB_CATEGORY", "KEY", "VALUE", "DESCRIPTION"],
+        ["RSI", "PARAM", "rsi_period", "14", "period"],
+    ])
+    repo = ConfigScalpRepository(client, "sid")
+
+    assert (await repo.get_by_id("RSI_PERIOD"))["VALUE"] == 14
+    await repo.create({
+        "CATEGORY": "BB", "SUB_CATEGORY": "PARAM", "KEY": "bb_period", "VALUE": "20", "DESCRIPTION": "period",
+    })
+    assert (await repo.get_by_id("bb_period"))["VALUE"] == 20
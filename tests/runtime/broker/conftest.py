@@ -2,14 +2,19 @@
 Broker test fixtures (Phase 8).
 
 - MockKISOrderClient: KISOrderClientProtocol 구현, 회귀 테스트용.
+- StubBrokerServer: KIS/Kiwoom REST 엔드포인트 로컬 대역 (aiohttp, 별도 스레드 루프) — 전송 계층 테스트용.
 - real_broker 마커: 실 브로커 스모크는 opt-in (pytest -m "" 시 제외).
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import asyncio
+import hashlib
+import threading
+from typing import Any, Dict, Set
 
 import pytest
+from aiohttp import web
 
 
 # ----- KIS Order Client mock (contract-compliant) -----
@@ -75,3 +80,113 @@ def mock_kis_order_client() -> MockKISOrderClient:
 def mock_kis_order_client_reject() -> MockKISOrderClient:
     """Client that rejects place_order (for error-path tests)."""
     return MockKISOrderClient(place_order_ok=False)
+
+
+# ----- Local stub broker server (KIS/Kiwoom REST) -----
+
+
+class StubBrokerServer:
+    """
+    KIS/Kiwoom REST 최소 대역 서버.
+
+    - KIS: /oauth2/tokenP, /uapi/hashkey (sha256(body)), order-cash (hashkey 헤더가 있으면 검증)
+    - Kiwoom: /oauth2/token, /api/dostk/ordr
+    - 집계: 경로별 요청 수, 서로 다른 클라이언트 커넥션(peer) 수, 주문 동시 처리 최대치
+    """
+
+    def __init__(self, order_delay: float = 0.0, token_delay: float = 0.0, hashkey_delay: float = 0.0) -> None:
+        self.order_delay = order_delay
+        self.token_delay = token_delay
+        self.hashkey_delay = hashkey_delay
+        self.hits: Dict[str, int] = {}
+        self.peers: Set[Any] = set()
+        self.inflight = 0
+        self.max_inflight = 0
+        self.base_url = ""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._runner = None
+        self._lock = threading.Lock()
+
+    def start(self) -> "StubBrokerServer":
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(timeout=10)
+        return self
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(timeout=10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+
+    async def _start(self) -> None:
+        app = web.Application(middlewares=[self._track])
+        app.router.add_post("/oauth2/tokenP", self._kis_token)
+        app.router.add_post("/uapi/hashkey", self._kis_hashkey)
+        app.router.add_post("/uapi/domestic-stock/v1/trading/order-cash", self._kis_order)
+        app.router.add_post("/oauth2/token", self._kiwoom_token)
+        app.router.add_post("/api/dostk/ordr", self._kiwoom_order)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    @property
+    def connection_count(self) -> int:
+        return len(self.peers)
+
+    def _json(self, data: Dict[str, Any], status: int = 200):
+        return web.json_response(data, status=status)
+
+    @web.middleware
+    async def _track(self, request, handler):
+        with self._lock:
+            self.hits[request.path] = self.hits.get(request.path, 0) + 1
+            self.peers.add(request.transport.get_extra_info("peername"))
+        return await handler(request)
+
+    async def _delay_order(self) -> None:
+        with self._lock:
+            self.inflight += 1
+            self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            if self.order_delay:
+                await asyncio.sleep(self.order_delay)
+        finally:
+            with self._lock:
+                self.inflight -= 1
+
+    async def _kis_token(self, request):
+        await asyncio.sleep(self.token_delay)
+        return self._json({"access_token": "kis-token", "token_type": "Bearer", "expires_in": 86400})
+
+    async def _kis_hashkey(self, request):
+        await asyncio.sleep(self.hashkey_delay)
+        return self._json({"HASH": hashlib.sha256(await request.read()).hexdigest()})
+
+    async def _kis_order(self, request):
+        body = await request.read()
+        hashkey = request.headers.get("hashkey")
+        if hashkey is not None and hashkey != hashlib.sha256(body).hexdigest():
+            return self._json({"rt_cd": "1", "msg_cd": "IGW00002", "msg1": "hashkey mismatch"})
+        n = self.hits[request.path]
+        await self._delay_order()
+        return self._json({"rt_cd": "0", "msg1": "ok", "output": {"ODNO": f"{n:010d}"}})
+
+    async def _kiwoom_token(self, request):
+        return self._json({"token": "kiwoom-token", "expires_dt": "29991231235959", "return_code": 0})
+
+    async def _kiwoom_order(self, request):
+        n = self.hits[request.path]
+        await self._delay_order()
+        return self._json({"return_code": 0, "return_msg": "ok", "ord_no": f"K{n}"})
+
+
+@pytest.fixture
+def stub_broker_server(monkeypatch, tmp_path):
+    """로컬 스텁 브로커 서버 (KIS 토큰 파일 캐시는 tmp HOME으로 격리)."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    server = StubBrokerServer(order_delay=0.05).start()
+    yield server
+    server.stop()
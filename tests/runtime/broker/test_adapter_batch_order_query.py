@@ -0,0 +1,105 @@
+"""
+KIS/Kiwoom 어댑터 get_orders_async 테스트 (당일 주문체결 목록 1회 조회 → broker_order_id 매칭).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from src.provider.clients.broker.adapters.kis_adapter import KISOrderAdapter
+from src.provider.clients.broker.adapters.kiwoom_adapter import KiwoomOrderAdapter
+from src.provider.clients.broker.order_base import OrderQuery
+from src.provider.models.order_response import OrderStatus
+from src.provider.state.order_book import OrderFillPoller
+
+from tests.runtime.execution_state.test_order_book import _book_with_orders
+
+
+class ListClient:
+    """get_daily_orders(_async)만 흉내내는 mock client. pages를 순서대로 반환."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.calls = []
+
+    async def get_daily_orders_async(self, params):
+        self.calls.append(params)
+        return self.pages[min(len(self.calls), len(self.pages)) - 1]
+
+    async def get_order_async(self, payload):
+        raise AssertionError("per-order query must not be used when list query is available")
+
+
+def _q(boid):
+    return OrderQuery(broker_order_id=boid)
+
+
+def test_kis_matches_daily_list_with_one_call_and_zero_padding():
+    client = ListClient([{
+        "output1": [
+            {"odno": "0000012345", "ord_qty": "10", "tot_ccld_qty": "10", "avg_prvs": "70100", "cncl_yn": "N"},
+            {"odno": "0000012346", "ord_qty": "10", "tot_ccld_qty": "4", "avg_prvs": "70000", "cncl_yn": "N"},
+            {"odno": "0000012347", "ord_qty": "5", "tot_ccld_qty": "0", "cncl_yn": "Y"},
+        ],
+        "ctx_area_nk100": "",
+    }])
+    adapter = KISOrderAdapter(client, acnt_no="12345678")
+
+    out = asyncio.run(adapter.get_orders_async([_q("12345"), _q("0000012346"), _q("12347"), _q("99999")]))
+
+    assert len(client.calls) == 1
+    assert client.calls[0]["CANO"] == "12345678"
+    assert [r.status if r else None for r in out] == [
+        OrderStatus.FILLED, OrderStatus.PARTIALLY_FILLED, OrderStatus.CANCELED, None,
+    ]
+    assert out[0].filled_qty == 10 and out[0].avg_fill_price == 70100.0
+    assert out[1].filled_qty == 4
+
+
+def test_kis_follows_continuation_until_all_found():
+    client = ListClient([
+        {"output1": [{"odno": "1", "ord_qty": "1", "tot_ccld_qty": "0"}], "ctx_area_fk100": "F", "ctx_area_nk100": "N1"},
+        {"output1": [{"odno": "2", "ord_qty": "1", "tot_ccld_qty": "1"}], "ctx_area_fk100": "F", "ctx_area_nk100": "N2"},
+        {"output1": [{"odno": "3", "ord_qty": "1", "tot_ccld_qty": "1"}], "ctx_area_nk100": ""},
+    ])
+    adapter = KISOrderAdapter(client, acnt_no="12345678")
+
+    out = asyncio.run(adapter.get_orders_async([_q("1"), _q("2")]))
+
+    assert len(client.calls) == 2  # 2번째 페이지에서 모두 찾았으므로 중단
+    assert client.calls[1]["CTX_AREA_NK100"] == "N1"
+    assert [r.status for r in out] == [OrderStatus.ACCEPTED, OrderStatus.FILLED]
+
+
+def test_kiwoom_matches_order_list_with_one_call():
+    client = ListClient([{
+        "acnt_ord_cntr_prps_dtl": [
+            {"ord_no": "0000101", "ord_qty": "3", "cntr_qty": "3", "cntr_uv": "5000"},
+            {"ord_no": "0000102", "ord_qty": "3", "cntr_qty": "1", "cntr_uv": "5010"},
+            {"ord_no": "0000103", "ord_qty": "3", "cntr_qty": "0", "mdfy_cncl": "취소"},
+        ],
+    }])
+    adapter = KiwoomOrderAdapter(client)
+
+    out = asyncio.run(adapter.get_orders_async([_q("101"), _q("0000102"), _q("103"), _q("104")]))
+
+    assert len(client.calls) == 1
+    assert [r.status if r else None for r in out] == [
+        OrderStatus.FILLED, OrderStatus.PARTIALLY_FILLED, OrderStatus.CANCELED, None,
+    ]
+    assert out[1].filled_qty == 1 and out[1].avg_fill_price == 5010.0
+
+
+def test_poller_uses_adapter_list_query():
+    book = _book_with_orders(4)
+    client = ListClient([{
+        "output1": [
+            {"odno": f"B-{i}", "ord_qty": "10", "tot_ccld_qty": "10", "avg_prvs": "100"} for i in range(4)
+        ],
+    }])
+    poller = OrderFillPoller(book, KISOrderAdapter(client, acnt_no="12345678"))
+
+    asyncio.run(poller.poll_once())
+
+    assert len(client.calls) == 1
+    assert book.open_orders() == []
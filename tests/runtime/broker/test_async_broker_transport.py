@@ -0,0 +1,114 @@
+"""
+비동기 브로커 전송 계층 테스트 (로컬 스텁 브로커 서버).
+
+검증:
+- keep-alive 커넥션 재사용 (요청 수 ≫ 커넥션 수)
+- 호스트별 동시 요청 상한
+- KIS hashkey/토큰 비동기 경로, 동시 토큰 발급 1회
+- BrokerEngine.submit_intent_async → OrderAdapter.place_order_async → client *_async
+"""
+
+from __future__ import annotations
+
+import asyncio
+from urllib.parse import urlsplit
+
+from src.provider.adapters.order_adapter_to_broker_engine_adapter import (
+    OrderAdapterToBrokerEngineAdapter,
+)
+from src.provider.brokers.live_broker import LiveBroker
+from src.provider.clients.broker.adapters.kis_adapter import KISOrderAdapter
+from src.provider.clients.broker.adapters.kiwoom_adapter import KiwoomOrderAdapter
+from src.provider.clients.broker.kis.kis_client import KISClient
+from src.provider.clients.broker.kiwoom.kiwoom_client import KiwoomClient
+from src.provider.clients.broker.transport import AsyncBrokerTransport
+from src.provider.models.intent import ExecutionIntent
+
+
+def _kis_client(server, transport=None):
+    return KISClient("key", "secret", server.base_url, "12345678", transport=transport)
+
+
+def _intent(i, symbol="005930"):
+    return ExecutionIntent(intent_id=f"I-{i}", symbol=symbol, side="BUY", quantity=1, intent_type="MARKET")
+
+
+def test_async_orders_reuse_pooled_connections(stub_broker_server):
+    server = stub_broker_server
+
+    async def run():
+        client = _kis_client(server)
+        results = []
+        for i in range(5):
+            results.append(await client.place_order_async({"PDNO": "005930", "ORD_QTY": str(i + 1)}))
+        await client.aclose()
+        return client, results
+
+    client, results = asyncio.run(run())
+
+    assert all(r["rt_cd"] == "0" for r in results)  # hashkey 검증 통과
+    assert server.hits["/oauth2/tokenP"] == 1
+    assert server.hits["/uapi/hashkey"] == 5
+    # 토큰 1 + (hashkey + 주문) × 5 = 11 요청을 keep-alive 커넥션 재사용으로
+    # (첫 주문의 토큰/hashkey 병렬 발급만 커넥션 2개)
+    assert client.transport.stats()["requests"] == 11
+    assert server.connection_count <= 2
+
+
+def test_per_host_concurrency_limit_and_single_token_fetch(stub_broker_server):
+    server = stub_broker_server
+
+    async def run():
+        host = urlsplit(server.base_url).netloc
+        transport = AsyncBrokerTransport(host_limits={host: 2})
+        client = _kis_client(server, transport=transport)
+        results = await asyncio.gather(
+            *(client.place_order_async({"PDNO": "005930", "ORD_QTY": "1"}) for _ in range(8))
+        )
+        await transport.close()
+        return results
+
+    results = asyncio.run(run())
+
+    assert len({r["output"]["ODNO"] for r in results}) == 8
+    assert server.hits["/oauth2/tokenP"] == 1
+    assert server.max_inflight <= 2
+    assert server.connection_count <= 2
+
+
+def test_submit_intent_async_through_broker_engine(stub_broker_server):
+    server = stub_broker_server
+
+    async def run():
+        transport = AsyncBrokerTransport()  # 두 브로커가 하나의 풀 공유
+        kis = OrderAdapterToBrokerEngineAdapter(
+            KISOrderAdapter(_kis_client(server, transport), acnt_no="12345678")
+        )
+        kiwoom = LiveBroker(adapter=OrderAdapterToBrokerEngineAdapter(
+            KiwoomOrderAdapter(
+                KiwoomClient("key", "secret", server.base_url, "12345678", transport=transport),
+                acnt_no="12345678",
+            )
+        ))
+        responses = await asyncio.gather(
+            *(kis.submit_intent_async(_intent(i)) for i in range(3)),
+            *(kiwoom.submit_intent_async(_intent(10 + i)) for i in range(3)),
+        )
+        await transport.close()
+        return responses
+
+    responses = asyncio.run(run())
+
+    assert all(r.accepted for r in responses)
+    assert [r.broker for r in responses] == ["kis"] * 3 + ["kiwoom"] * 3
+    assert server.hits["/api/dostk/ordr"] == 3
+
+
+def test_sync_client_uses_keep_alive_session(stub_broker_server):
+    server = stub_broker_server
+    client = _kis_client(server)
+
+    for _ in range(3):
+        assert client.place_order({"PDNO": "005930", "ORD_QTY": "1"})["rt_cd"] == "0"
+
+    assert server.connection_count == 1
@@ -0,0 +1,184 @@
+"""
+BrokerEngine.submit_batch 테스트 (동시 전송, TPS 토큰 버킷, 입력 순서, intent별 실패, 연속 실패 guard).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from src.provider.adapters.order_adapter_to_broker_engine_adapter import (
+    OrderAdapterToBrokerEngineAdapter,
+)
+from src.provider.brokers import LiveBroker, MockBroker, NoopBroker
+from src.provider.clients.broker.adapters.base_adapter import BaseBrokerAdapter
+from src.provider.clients.broker.adapters.kis_adapter import KISOrderAdapter
+from src.provider.clients.broker.kis.kis_client import KISClient
+from src.provider.models.intent import ExecutionIntent
+from src.provider.models.order_response import OrderResponse, OrderStatus
+from src.provider.rate_limit import TokenBucket, order_tps_for
+
+
+class SlowAdapter(BaseBrokerAdapter):
+    """지연 + 심볼 기반 실패를 흉내내는 비동기 어댑터."""
+
+    def __init__(self, delay=0.05, fail_symbols=(), raise_symbols=()):
+        self.delay = delay
+        self.fail_symbols = set(fail_symbols)
+        self.raise_symbols = set(raise_symbols)
+        self.inflight = 0
+        self.max_inflight = 0
+        self.sent = []
+
+    @property
+    def broker_id(self):
+        return "slow"
+
+    def place_order(self, req):
+        raise NotImplementedError
+
+    def get_order(self, query):
+        raise NotImplementedError
+
+    def cancel_order(self, query):
+        raise NotImplementedError
+
+    async def place_order_async(self, req):
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.inflight -= 1
+        self.sent.append(req.symbol)
+        if req.symbol in self.raise_symbols:
+            raise ConnectionError("broker unreachable")
+        if req.symbol in self.fail_symbols:
+            return OrderResponse(status=OrderStatus.REJECTED, message="rejected")
+        return OrderResponse(status=OrderStatus.ACCEPTED, broker_order_id=f"O-{req.symbol}")
+
+
+def _intents(symbols):
+    return [
+        ExecutionIntent(intent_id=f"I-{i}", symbol=s, side="BUY", quantity=1, intent_type="MARKET")
+        for i, s in enumerate(symbols)
+    ]
+
+
+def test_token_bucket_reserves_in_order():
+    now = [0.0]
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    now[0] = 1.5  # 1.5초치(3토큰)로 선차감분(-2) 상환 후 1토큰
+    assert bucket.try_acquire() and not bucket.try_acquire()
+    assert bucket.stats()["waited"] == 2
+    assert order_tps_for("kis", "VTS") < order_tps_for("kis", "REAL")
+
+
+def test_submit_batch_concurrent_in_order_with_partial_failures():
+    adapter = SlowAdapter(delay=0.05, fail_symbols={"S3"}, raise_symbols={"S5"})
+    engine = OrderAdapterToBrokerEngineAdapter(adapter, tps=1000, max_concurrency=4)
+    symbols = [f"S{i}" for i in range(12)]
+
+    started = time.monotonic()
+    responses = engine.submit_batch(_intents(symbols))
+    elapsed = time.monotonic() - started
+
+    assert [r.intent_id for r in responses] == [f"I-{i}" for i in range(12)]
+    assert [r.accepted for r in responses] == [s not in ("S3", "S5") for s in symbols]
+    assert "broker unreachable" in responses[5].message
+    assert adapter.max_inflight == 4
+    assert elapsed < 12 * 0.05  # 순차 전송보다 빠름
+
+
+def test_submit_batch_respects_tps_quota():
+    adapter = SlowAdapter(delay=0.0)
+    engine = OrderAdapterToBrokerEngineAdapter(adapter, tps=20)
+
+    async def run():
+        started = time.monotonic()
+        responses = await engine.submit_batch_async(_intents([f"S{i}" for i in range(30)]))
+        return responses, time.monotonic() - started
+
+    responses, elapsed = asyncio.run(run())
+
+    assert all(r.accepted for r in responses)
+    # 버스트 20 + 나머지 10은 초당 20건 → 약 0.5초
+    assert elapsed >= 0.45
+    assert engine.limiter.stats()["waited"] == 10
+
+
+def test_live_broker_batch_applies_consecutive_failure_guard():
+    adapter = SlowAdapter(delay=0.01, fail_symbols={"F0", "F1", "F2"})
+    broker = LiveBroker(
+        adapter=OrderAdapterToBrokerEngineAdapter(adapter, tps=1000),
+        max_consecutive_failures=3,
+        max_concurrency=1,
+    )
+
+    responses = broker.submit_batch(_intents(["OK", "F0", "F1", "F2", "S4", "S5"]))
+
+    assert [r.accepted for r in responses] == [True, False, False, False, False, False]
+    assert [r.broker for r in responses[4:]] == ["failsafe", "failsafe"]
+    assert adapter.sent == ["OK", "F0", "F1", "F2"]  # 차단 이후 전송 없음
+
+
+def test_live_broker_batch_overshoot_is_bounded_by_concurrency():
+    adapter = SlowAdapter(delay=0.02, fail_symbols={f"F{i}" for i in range(20)})
+    broker = LiveBroker(
+        adapter=OrderAdapterToBrokerEngineAdapter(adapter, tps=1000),
+        max_consecutive_failures=3,
+        max_concurrency=4,
+    )
+
+    responses = asyncio.run(broker.submit_batch_async(_intents([f"F{i}" for i in range(20)])))
+
+    # 첫 4건은 guard 통과 후 동시에 전송 중이었으므로 차단 이후 1건 초과 전송, 나머지는 전송 전 차단
+    assert len(adapter.sent) == 4
+    assert [r.broker for r in responses].count("failsafe") == 16
+
+
+def test_sync_submit_batch_refuses_running_loop():
+    broker = LiveBroker(adapter=OrderAdapterToBrokerEngineAdapter(SlowAdapter(delay=0.0), tps=1000))
+
+    async def run():
+        broker.submit_batch(_intents(["A"]))
+
+    with pytest.raises(RuntimeError, match="submit_batch_async"):
+        asyncio.run(run())
+
+
+def test_phase1_brokers_batch_in_order():
+    intents = _intents(["A", "B"]) + [
+        ExecutionIntent(intent_id="I-z", symbol="C", side="BUY", quantity=0, intent_type="MARKET")
+    ]
+
+    mock = asyncio.run(MockBroker().submit_batch_async(intents))
+    noop = NoopBroker().submit_batch(intents)
+
+    assert [r.accepted for r in mock] == [True, True, False]
+    assert [r.intent_id for r in noop] == ["I-0", "I-1", "I-z"] and not any(r.accepted for r in noop)
+
+
+def test_live_kis_batch_through_stub_server(stub_broker_server):
+    server = stub_broker_server
+    client = KISClient("key", "secret", server.base_url, "12345678")
+    broker = LiveBroker(adapter=OrderAdapterToBrokerEngineAdapter(
+        KISOrderAdapter(client, acnt_no="12345678"), tps=100
+    ))
+
+    async def run():
+        responses = await broker.submit_batch_async(_intents(["005930", "000660"] * 5))
+        await client.aclose()
+        return responses
+
+    started = time.monotonic()
+    responses = asyncio.run(run())
+
+    assert all(r.accepted for r in responses)
+    assert server.hits["/uapi/domestic-stock/v1/trading/order-cash"] == 10
+    assert server.max_inflight > 1
+    assert time.monotonic() - started < 10 * server.order_delay
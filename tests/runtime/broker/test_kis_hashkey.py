@@ -0,0 +1,109 @@
+"""
+KIS hashkey 경로 테스트 (메모이즈 / omit / 토큰 병렬 발급 / 단계별 지연 노출).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.provider.clients.broker.kis.hashkey import HashkeyProvider
+from src.provider.clients.broker.kis.kis_client import KISClient
+
+ORDER = {"PDNO": "005930", "ORD_QTY": "1", "ORD_DVSN": "01"}
+
+
+def _client(server, **kwargs):
+    return KISClient("key", "secret", server.base_url, "12345678", **kwargs)
+
+
+def test_hashkey_provider_lru_and_omit():
+    fetched = []
+    provider = HashkeyProvider(lambda body: fetched.append(body) or f"h-{body}", cache_size=2)
+
+    assert provider.get("a") == "h-a" and provider.get("a") == "h-a"
+    provider.get("b")
+    provider.get("c")  # "a" 제거
+    assert not provider.is_cached("a") and provider.is_cached("c")
+    assert fetched == ["a", "b", "c"]
+    assert provider.stats() == {"hits": 1, "misses": 3, "omitted": 0, "cached": 2}
+
+    omit = HashkeyProvider(lambda body: "x", mode="omit")
+    assert omit.get("a") is None and omit.stats()["omitted"] == 1
+    with pytest.raises(ValueError):
+        HashkeyProvider(lambda body: "x", mode="local")
+
+
+def test_identical_payload_reuses_memoized_hashkey(stub_broker_server):
+    server = stub_broker_server
+    client = _client(server)
+
+    for _ in range(3):
+        # 키 순서가 달라도 정규화된 body가 같으면 동일 hashkey
+        assert client.place_order(dict(reversed(list(ORDER.items()))))["rt_cd"] == "0"
+        assert client.place_order(ORDER)["rt_cd"] == "0"
+
+    assert server.hits["/uapi/hashkey"] == 1
+    assert client.hashkey.stats()["hits"] == 5
+
+
+def test_omit_mode_skips_hashkey_round_trip(stub_broker_server):
+    server = stub_broker_server
+
+    async def run():
+        client = _client(server, hashkey_mode="omit")
+        results = [await client.place_order_async({**ORDER, "ORD_QTY": str(i)}) for i in range(1, 4)]
+        await client.aclose()
+        return results
+
+    assert all(r["rt_cd"] == "0" for r in asyncio.run(run()))
+    assert "/uapi/hashkey" not in server.hits
+    assert server.hits["/uapi/domestic-stock/v1/trading/order-cash"] == 3
+
+
+@pytest.mark.parametrize("pipeline", [True, False])
+def test_pipelined_hashkey_overlaps_token_fetch(stub_broker_server, pipeline):
+    server = stub_broker_server
+    server.token_delay = server.hashkey_delay = 0.1
+
+    async def run():
+        client = _client(server, pipeline_hashkey=pipeline)
+        result = await client.place_order_async(ORDER)
+        await client.aclose()
+        return client, result
+
+    client, result = asyncio.run(run())
+
+    assert result["rt_cd"] == "0"
+    prepare_ms = client.latency_snapshot()["order.prepare"]["max"]
+    if pipeline:
+        assert prepare_ms < 180  # max(token, hashkey)
+    else:
+        assert prepare_ms >= 200  # token + hashkey
+
+
+def test_prefetch_and_latency_metrics(stub_broker_server):
+    server = stub_broker_server
+
+    async def run():
+        client = _client(server)
+        await client.prefetch_hashkey_async(ORDER)
+        result = await client.place_order_async(ORDER)
+        await client.aclose()
+        return client, result
+
+    client, result = asyncio.run(run())
+
+    assert result["rt_cd"] == "0"
+    assert server.hits["/uapi/hashkey"] == 1
+    assert client.hashkey.stats()["hits"] == 1
+
+    snap = client.latency_snapshot()
+    assert {"order.prepare", "order.http", "order.total"} <= set(snap)
+    assert snap["order.total"]["count"] == 1
+
+    metrics = client.get_metrics()
+    assert metrics["counters"]["broker.kis.hashkey.hits"] == 1
+    assert metrics["counters"]["broker.kis.order.total.count"] == 1
+    assert "broker.kis.order.http.p50_ms" in metrics["gauges"]
@@ -0,0 +1,92 @@
+"""
+RateLimitScheduler 테스트 (family 토큰 버킷, 우선순위 대기열, 대기 시간 지표, 브로커 클라이언트 연동).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from src.provider.clients.broker.kis.kis_client import KISClient
+from src.provider.rate_limit import Priority, RateLimitScheduler, register_broker_families
+
+
+def test_orders_preempt_queued_queries():
+    scheduler = RateLimitScheduler()
+    scheduler.register("kis", 20, capacity=1)
+    done = []
+
+    async def worker(name, priority):
+        await scheduler.acquire("kis", priority)
+        done.append(name)
+
+    async def run():
+        await scheduler.acquire("kis", Priority.ORDER)  # 버스트 소진
+        tasks = [asyncio.create_task(worker(f"q{i}", Priority.QUERY)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(worker(f"o{i}", Priority.ORDER)) for i in range(2)]
+        await asyncio.gather(*tasks)
+
+    started = time.monotonic()
+    asyncio.run(run())
+
+    assert done == ["o0", "o1", "q0", "q1", "q2"]
+    assert time.monotonic() - started >= 0.2  # 5건 × 50ms (허용 오차 포함)
+
+    metrics = scheduler.get_metrics()
+    assert metrics["counters"]["ratelimit.kis.order.acquired"] == 3
+    assert metrics["counters"]["ratelimit.kis.query.queued"] == 3
+    assert metrics["gauges"]["ratelimit.kis.query.wait_max_ms"] > metrics["gauges"]["ratelimit.kis.order.wait_max_ms"]
+    assert metrics["gauges"]["ratelimit.kis.queue_depth"] == 0
+
+
+def test_cancelled_waiter_does_not_consume_token():
+    scheduler = RateLimitScheduler()
+    bucket = scheduler.register("f", 10, capacity=1)
+
+    async def run():
+        await scheduler.acquire("f")
+        first = asyncio.create_task(scheduler.acquire("f"))
+        second = asyncio.create_task(scheduler.acquire("f"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    waited = asyncio.run(run())
+
+    assert 0.05 <= waited < 0.2  # 취소된 waiter 몫을 기다리지 않음
+    assert bucket.acquired == 2
+
+
+def test_unregistered_family_passes_and_defaults_register():
+    scheduler = register_broker_families(RateLimitScheduler(), kis_trading_mode="VTS")
+
+    assert asyncio.run(scheduler.acquire("unknown")) == 0.0
+    assert scheduler.bucket("kis").rate == 2.0
+    assert "kiwoom:kt10000" in scheduler.families()
+    assert scheduler.acquire_blocking("kiwoom:kt10000", Priority.ORDER) == 0.0
+
+
+def test_kis_client_requests_go_through_kis_family(stub_broker_server):
+    server = stub_broker_server
+    scheduler = RateLimitScheduler()
+    scheduler.register("kis", 20, capacity=1)
+    client = KISClient(
+        "key", "secret", server.base_url, "12345678", hashkey_mode="omit", rate_limiter=scheduler
+    )
+
+    async def run():
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(client.place_order_async({"PDNO": "005930", "ORD_QTY": str(i)}) for i in range(1, 5))
+        )
+        await client.aclose()
+        return results, time.monotonic() - started
+
+    results, elapsed = asyncio.run(run())
+
+    assert all(r["rt_cd"] == "0" for r in results)
+    assert elapsed >= 0.14  # 버스트 1 + 3 × 50ms
+    assert scheduler.bucket("kis").rate == 20  # 기존 등록 유지 (ensure)
+    assert client.latency_snapshot()["order.queue"]["count"] == 4
+    assert scheduler.get_metrics()["counters"]["ratelimit.kis.order.acquired"] == 4
@@ -0,0 +1,126 @@
+"""
+TokenManager 테스트 (백그라운드 선제 갱신, 프로세스 간 공유/1회 발급, 주문 경로 논블로킹).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+
+from src.provider.clients.auth import SharedTokenStore, TokenManager, TokenState
+from src.provider.clients.broker.kis.kis_client import KISAuthError, KISClient
+from src.shared.timezone_utils import now_kst
+
+
+class _Issuer:
+    def __init__(self, lifetime: float, fail_first: int = 0, delay: float = 0.0):
+        self.lifetime = lifetime
+        self.fail_first = fail_first
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> TokenState:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.calls <= self.fail_first:
+            raise RuntimeError("issuer down")
+        return TokenState(
+            access_token=f"tok-{self.calls}",
+            token_type="Bearer",
+            expires_at=now_kst() + timedelta(seconds=self.lifetime),
+        )
+
+
+def test_refreshes_ahead_of_expiry_without_gap():
+    issuer = _Issuer(lifetime=2.3)
+
+    async def run():
+        manager = TokenManager("t", issuer, refresh_ahead=2, expiry_margin=1, retry_delay=0.05)
+        assert await manager.start(timeout=1.0)
+        seen = set()
+        deadline = time.monotonic() + 0.8
+        while time.monotonic() < deadline:
+            token = manager.current_token()
+            assert token is not None  # 갱신 중에도 토큰 공백 없음
+            seen.add(token)
+            await asyncio.sleep(0.02)
+        await manager.stop()
+        return manager, seen
+
+    manager, seen = asyncio.run(run())
+
+    assert {"tok-1", "tok-2"} <= seen
+    assert manager.issued >= 2 and not manager.running
+
+
+def test_shared_store_issues_once_across_managers(tmp_path):
+    issuer_a, issuer_b = _Issuer(3600, delay=0.1), _Issuer(3600, delay=0.1)
+
+    async def run():
+        # 같은 파일을 쓰는 두 관리자 = 두 프로세스 (flock은 열린 파일 단위로 배타)
+        a = TokenManager("a", issuer_a, store=SharedTokenStore(tmp_path / "tok.json"))
+        b = TokenManager("b", issuer_b, store=SharedTokenStore(tmp_path / "tok.json"))
+        await asyncio.gather(a.start(timeout=2.0), b.start(timeout=2.0))
+        tokens = (a.current_token(), b.current_token())
+        await asyncio.gather(a.stop(), b.stop())
+        return a, b, tokens
+
+    a, b, tokens = asyncio.run(run())
+
+    assert issuer_a.calls + issuer_b.calls == 1
+    assert tokens[0] == tokens[1]
+    assert a.adopted + b.adopted == 1
+    assert SharedTokenStore(tmp_path / "tok.json").load().access_token == tokens[0]
+
+
+def test_retries_with_backoff_after_issuer_failure():
+    issuer = _Issuer(3600, fail_first=2)
+
+    async def run():
+        manager = TokenManager("t", issuer, retry_delay=0.01)
+        ready = await manager.start(timeout=2.0)
+        await manager.stop()
+        return manager, ready
+
+    manager, ready = asyncio.run(run())
+
+    assert ready and manager.current_token() == "tok-3"
+    assert manager.failures == 2 and manager.last_error is None
+
+
+def test_kis_orders_never_wait_on_token_issuance(stub_broker_server):
+    server = stub_broker_server
+    client = KISClient("key", "secret", server.base_url, "12345678")
+    manager = client.create_token_manager()
+    # 직전 발급 기록 → 발급은 60초 간격 제한에 걸림
+    client._token_store.issue_wait(0)
+
+    async def run():
+        await manager.start(wait_ready=False)
+        started = time.monotonic()
+        with pytest.raises(KISAuthError, match="not ready"):
+            await client.place_order_async({"PDNO": "005930", "ORD_QTY": "1"})
+        elapsed = time.monotonic() - started
+        await manager.stop()
+        return elapsed
+
+    assert asyncio.run(run()) < 1.0
+    assert "/oauth2/tokenP" not in server.hits
+
+    async def run_ready():
+        client._token_store.path.with_suffix(".last_request").unlink()
+        assert await manager.start(timeout=2.0)
+        result = await client.place_order_async({"PDNO": "005930", "ORD_QTY": "1"})
+        await manager.stop()
+        await client.aclose()
+        return result
+
+    assert asyncio.run(run_ready())["rt_cd"] == "0"
+    assert server.hits["/oauth2/tokenP"] == 1
+    # 갱신기가 쓴 공유 파일을 동기 클라이언트(다른 프로세스 역할)도 그대로 사용
+    other = KISClient("key", "secret", server.base_url, "12345678")
+    assert other.place_order({"PDNO": "005930", "ORD_QTY": "2"})["rt_cd"] == "0"
+    assert server.hits["/oauth2/tokenP"] == 1
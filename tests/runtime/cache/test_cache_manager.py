@@ -0,0 +1,175 @@
+"""
+NG-4 계층 캐시 테스트 (L1 LRU/TTL, L2 백필, Circuit Breaker 폴백, Cache-Aside single-flight, Write-Through, 소비자 연동).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.db.mock_sheets_client import MockSheetsClient
+from src.pipeline.eteda_runner import ETEDARunner
+from src.pipeline.mock_safety_hook import MockSafetyHook
+from src.provider.brokers.mock_broker import MockBroker
+from src.qts.core.config.config_models import UnifiedConfig
+from src.runtime.cache import (
+    MISSING,
+    CacheAside,
+    CacheManager,
+    CircuitBreaker,
+    CircuitState,
+    InMemoryBackend,
+    LocalCache,
+    WriteThrough,
+)
+
+_ROOT = Path(__file__).resolve().parents[3]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_local_cache_family_ttl_and_lru():
+    clock = _Clock()
+    cache = LocalCache(max_entries=3, clock=clock)
+    cache.set("price:005930", 70000)
+    cache.set("pos:005930", {"qty": 3})
+    cache.set("risk:account", None)
+    assert cache.get("risk:account") is None  # None도 캐시 값
+
+    clock.now = 0.2  # price 100ms 만료, pos 1s 유지
+    assert cache.get("price:005930") is MISSING
+    assert cache.get("pos:005930") == {"qty": 3}
+
+    cache.set("ord:1", "A")
+    cache.set("ord:2", "B")  # 용량 3 초과 → 가장 오래 사용하지 않은 risk:account 제거
+    assert cache.get("risk:account") is MISSING and cache.evictions == 1
+    assert cache.get_or_set("strat:S1", lambda: "params") == "params"
+    assert cache.get("pos:005930") is MISSING and cache.evictions == 2
+    assert cache.invalidate_prefix("ord:") == 2 and len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_l2_backfills_l1_and_breaker_falls_back_to_source():
+    clock = _Clock()
+    backend = InMemoryBackend()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30.0, clock=clock)
+    writer = CacheManager(backend)
+    reader = CacheManager(backend, breaker=breaker)
+
+    await writer.set("pos:005930", {"qty": 3})
+    assert await reader.get("pos:005930") == {"qty": 3}  # L2 히트 → L1 채움
+    assert await reader.get("pos:005930") == {"qty": 3}
+    assert (reader.l1_hits, reader.l2_hits) == (1, 1)
+
+    backend.fail = True
+    aside = CacheAside(reader)
+    loads = []
+    for i in range(3):
+        assert await aside.get(f"risk:{i}", lambda: loads.append(1) or "db") == "db"
+    assert breaker.state == CircuitState.OPEN and len(loads) == 3
+    calls = backend.calls
+    assert await reader.get("ord:x") is MISSING
+    assert backend.calls == calls and reader.l2_skipped >= 1  # OPEN 동안 L2 우회
+
+    backend.fail = False
+    clock.now = 31.0
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert await reader.set("ord:x", "ok")
+    assert breaker.state == CircuitState.CLOSED
+    metrics = reader.get_metrics()
+    assert metrics["counters"]["cache.l2_errors"] == 2 and metrics["gauges"]["cache.circuit_open"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_cache_aside_single_flight_and_write_through():
+    cache = CacheManager()
+    aside = CacheAside(cache)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [1, 2, 3]
+
+    results = await asyncio.gather(*(aside.get("pos:__all__", loader) for _ in range(10)))
+    assert calls == 1 and aside.coalesced == 9 and all(r == [1, 2, 3] for r in results)
+
+    async def failing_loader():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        await aside.get("risk:account", failing_loader)
+    assert await cache.get("risk:account") is MISSING  # 예외는 캐시하지 않음
+
+    wt = WriteThrough(cache)
+    db = {}
+    assert await wt.write("strat:S1", {"rsi": 30}, lambda v: db.update(S1=v))
+    assert await cache.get("strat:S1") == {"rsi": 30} and db == {"S1": {"rsi": 30}}
+
+    def broken_writer(_):
+        raise IOError("sheet write failed")
+
+    assert not await wt.write("strat:S1", {"rsi": 40}, broken_writer)
+    assert await cache.get("strat:S1") is MISSING  # 실패 시 무효화
+
+
+class _Repo:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_all(self):
+        self.calls += 1
+        return [{"Symbol": "005930", "Qty": "5", "Avg_Price(Current_Currency)": "70000",
+                 "Current_Price(Current_Currency)": "71000"}]
+
+
+@pytest.mark.asyncio
+async def test_runner_uses_cache_for_positions_and_config():
+    config = UnifiedConfig(config_map={"RUN_MODE": "PAPER", "KILLSWITCH_STATUS": "OFF"}, metadata={})
+    cache = CacheManager()
+    runner = ETEDARunner(
+        config=config,
+        sheets_client=MockSheetsClient(),
+        project_root=_ROOT,
+        broker=MockBroker(),
+        safety_hook=MockSafetyHook(initial_state="NORMAL"),
+        cache=cache,
+    )
+    engine = runner._portfolio_engine
+    repo = _Repo()
+    engine._position_repo = repo
+
+    first = await engine.get_positions()
+    second = await engine.get_positions()
+    assert repo.calls == 1 and [p.symbol for p in second] == ["005930"] and first == second
+    await engine.invalidate_positions()
+    await engine.get_positions()
+    assert repo.calls == 2
+
+    assert runner._config_value("RUN_MODE") == "PAPER"
+    assert runner._config_value("safe_mode") is None
+    # Act 게이트 안전 플래그는 캐시하지 않음: 변경 즉시 반영
+    config.config_map["KILLSWITCH_STATUS"] = "ON"
+    assert runner._config_value("KILLSWITCH_STATUS") == "ON"
+    assert (await runner._act({"action": "BUY", "symbol": "005930", "qty": 1, "approved": True}))["reason"] == "kill_switch"
+    config.config_map["KILLSWITCH_STATUS"] = "OFF"
+    config.config_map["system.safe_mode"] = "1"  # 계층 키(접미사)도 새로 탐색
+    assert runner._config_value("safe_mode") == "1"
+    del config.config_map["system.safe_mode"]
+
+    # 브로커가 주문을 접수하면 Act가 포지션 캐시를 무효화 → 다음 조회는 저장소로
+    await engine.get_positions()
+    assert repo.calls == 2
+    act = await runner._act({"action": "BUY", "symbol": "005930", "qty": 1, "approved": True})
+    assert act["accepted"] is True
+    await engine.get_positions()
+    assert repo.calls == 3
@@ -0,0 +1,174 @@
+"""
+GoogleSheetsClient 실행기 오프로딩 / batch API / 호출 지표 테스트 (Mock 기반, 네트워크 없음).
+"""
+
+import asyncio
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.db.google_sheets_client import (
+    GoogleSheetsClient,
+    RateLimitError,
+    ValidationError,
+)
+
+
+def _make_client(max_workers=2):
+    with patch.dict(
+        os.environ,
+        {"GOOGLE_CREDENTIALS_FILE": "/tmp/c", "GOOGLE_SHEET_KEY": "sid"},
+        clear=False,
+    ):
+        client = GoogleSheetsClient(credentials_path="/tmp/c", spreadsheet_id="sid", max_workers=max_workers)
+    client.service = MagicMock()  # authenticate() 스킵
+    client.base_delay = 0.0
+    return client
+
+
+def _http_error(status):
+    from googleapiclient.errors import HttpError
+
+    resp = MagicMock()
+    resp.status = status
+    resp.headers = {"Retry-After": "1"}
+    return HttpError(resp, b"error")
+
+
+@pytest.mark.asyncio
+async def test_get_sheet_data_runs_off_event_loop_thread():
+    client = _make_client()
+    seen = {}
+
+    def _execute():
+        seen["thread"] = threading.current_thread().name
+        return {"values": [["a", "b"]]}
+
+    client.service.spreadsheets().values().get.return_value.execute.side_effect = _execute
+
+    values = await client.get_sheet_data("Sheet1!A:Z")
+
+    assert values == [["a", "b"]]
+    assert seen["thread"].startswith("gsheets-io")
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_inline_mode_executes_on_loop_thread():
+    client = _make_client(max_workers=0)
+    seen = {}
+
+    def _execute():
+        seen["thread"] = threading.current_thread()
+        return {"values": []}
+
+    client.service.spreadsheets().values().get.return_value.execute.side_effect = _execute
+
+    await client.get_sheet_data("Sheet1!A:Z")
+
+    assert seen["thread"] is threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_batch_get_maps_results_by_requested_range():
+    client = _make_client()
+    values_api = client.service.spreadsheets().values()
+    values_api.batchGet.return_value.execute.return_value = {
+        "valueRanges": [
+            {"range": "Position!A1:Z1000", "values": [["h"], ["1"]]},
+            {"range": "T_Ledger!A1:Z1"},
+        ]
+    }
+
+    data = await client.batch_get(["Position!A:Z", "T_Ledger!A1:Z1"])
+
+    assert data == {"Position!A:Z": [["h"], ["1"]], "T_Ledger!A1:Z1": []}
+    values_api.batchGet.assert_called_with(spreadsheetId="sid", ranges=["Position!A:Z", "T_Ledger!A1:Z1"])
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_get_empty_ranges_makes_no_request():
+    client = _make_client()
+    assert await client.batch_get([]) == {}
+    assert client.get_call_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_batch_update_sends_single_request():
+    client = _make_client()
+    values_api = client.service.spreadsheets().values()
+    values_api.batchUpdate.return_value.execute.return_value = {"totalUpdatedRows": 2}
+
+    result = await client.batch_update({"S!A2:C2": [[1, 2, 3]], "S!A5:C5": [[4, 5, 6]]}, value_input_option="RAW")
+
+    assert result["totalUpdatedRows"] == 2
+    body = values_api.batchUpdate.call_args.kwargs["body"]
+    assert body["valueInputOption"] == "RAW"
+    assert body["data"] == [
+        {"range": "S!A2:C2", "values": [[1, 2, 3]]},
+        {"range": "S!A5:C5", "values": [[4, 5, 6]]},
+    ]
+    assert client.get_call_stats()["batch_update"].calls == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_update_empty_values_raises_validation_error():
+    client = _make_client()
+    with pytest.raises(ValidationError):
+        await client.batch_update({})
+    with pytest.raises(ValidationError):
+        await client.batch_update({"S!A2": []})
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_latency_and_rate_limits():
+    client = _make_client()
+    client.max_retries = 1
+    client.service.spreadsheets().values().get.return_value.execute.side_effect = _http_error(429)
+
+    with pytest.raises(RateLimitError):
+        await client.get_sheet_data("Sheet1!A:Z")
+
+    stats = client.get_call_stats()["get"]
+    assert stats.calls == 2
+    assert stats.errors == 2
+    assert stats.rate_limited == 2
+
+    metrics = client.get_metrics()
+    assert metrics["counters"]["sheets.get.rate_limited"] == 2
+    assert metrics["counters"]["sheets.quota.requests_last_minute"] == 2
+    assert metrics["gauges"]["sheets.quota.limit_per_minute"] == float(client.api_quota)
+    assert "sheets.get.avg_ms" in metrics["gauges"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_requests_are_paced_by_read_write_buckets():
+    from src.provider.rate_limit import SHEETS_READ, SHEETS_WRITE, RateLimitScheduler
+
+    scheduler = RateLimitScheduler()
+    scheduler.register(SHEETS_READ, 20, capacity=1)
+    scheduler.register(SHEETS_WRITE, 20, capacity=1)
+    with patch.dict(os.environ, {"GOOGLE_CREDENTIALS_FILE": "/tmp/c", "GOOGLE_SHEET_KEY": "sid"}):
+        client = GoogleSheetsClient(credentials_path="/tmp/c", spreadsheet_id="sid", max_workers=0, rate_limiter=scheduler)
+    client.service = MagicMock()
+    client.service.spreadsheets().values().get.return_value.execute.return_value = {"values": []}
+    client.service.spreadsheets().values().update.return_value.execute.return_value = {"updatedCells": 1}
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(3):
+        await client.get_sheet_data("Sheet1!A:Z")
+    await client.update_sheet_data("Sheet1!A1", [["x"]])  # 쓰기 버킷은 별도 → 대기 없음
+    elapsed = loop.time() - started
+
+    assert elapsed >= 0.09  # 읽기 3회 = 버스트 1 + 2 × 50ms
+    metrics = client.get_metrics()
+    assert metrics["counters"]["ratelimit.sheets.read.query.acquired"] == 3
+    assert metrics["counters"]["ratelimit.sheets.write.query.acquired"] == 1
+    assert metrics["gauges"]["ratelimit.sheets.read.query.wait_max_ms"] > 0
+    assert metrics["gauges"]["ratelimit.sheets.write.query.wait_max_ms"] == 0
@@ -0,0 +1,171 @@
+"""
+NG-3 로컬 데이터 계층 테스트 (SQLite WAL 업서트/인덱스 조회, 컬럼 저장소 병합/기간 조회/영속화,
+HybridAdapter 라우팅 + Sheets 비동기 미러, ETEDARunner 로컬 리포지토리 연동).
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from src.db.mock_sheets_client import MockSheetsClient
+from src.pipeline.eteda_runner import ETEDARunner
+from src.pipeline.mock_safety_hook import MockSafetyHook
+from src.provider.brokers.mock_broker import MockBroker
+from src.qts.core.config.config_models import UnifiedConfig
+from src.runtime.data import (
+    ColumnarStore,
+    DataSourceError,
+    GoogleSheetsAdapter,
+    HybridAdapter,
+    LocalHistoryRepository,
+    SQLiteAdapter,
+    open_local_store,
+)
+from src.shared.timezone_utils import KST
+
+_ROOT = Path(__file__).resolve().parents[3]
+
+
+def test_sqlite_wal_upsert_and_indexed_range_read(tmp_path):
+    db = SQLiteAdapter(tmp_path / "qts.db")
+    assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    names = {row[0] for row in db._conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert "idx_t_ledger_symbol_timestamp" in names
+
+    db.write("positions", {"symbol": "005930", "qty": 10, "avg_price": 70000, "sector": "IT"})
+    db.write("positions", {"symbol": "005930", "qty": 15})  # 부분 갱신: 나머지 컬럼 유지
+    [pos] = db.read("positions", {"symbol": "005930"})
+    assert pos["qty"] == 15 and pos["avg_price"] == 70000 and pos["sector"] == "IT"
+
+    fills = [
+        {"timestamp": datetime(2026, 1, 5, 9, m, tzinfo=KST), "symbol": sym, "side": "BUY", "qty": 1, "price": 100.0}
+        for m, sym in enumerate(["005930", "000660", "005930", "005930"])
+    ]
+    assert db.batch_write("t_ledger", fills) == 4
+    rows = db.read(
+        "t_ledger", {"symbol": "005930"},
+        start=datetime(2026, 1, 5, 9, 1, tzinfo=KST), end=datetime(2026, 1, 5, 9, 3, tzinfo=KST),
+    )
+    assert [r["timestamp"][11:16] for r in rows] == ["09:02"]
+    plan = " ".join(
+        str(r[-1]) for r in db._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM t_ledger WHERE symbol = ? AND timestamp >= ?", ("005930", "")
+        )
+    )
+    assert "idx_t_ledger_symbol_timestamp" in plan
+
+    with pytest.raises(DataSourceError):
+        db.write("positions", {"symbol": "X", "bogus": 1})
+    db.close()
+
+    reopened = SQLiteAdapter(tmp_path / "qts.db")
+    assert len(reopened.read("t_ledger")) == 4
+    reopened.close()
+
+
+def test_columnar_merge_dedupe_range_and_persistence(tmp_path):
+    store = ColumnarStore(tmp_path / "columnar")
+    base = datetime(2026, 1, 5, 9, 0, tzinfo=KST).timestamp()
+    ticks = [{"time": base + s, "symbol": "005930", "price": 70000.0 + s, "volume": 1} for s in (0, 2, 4)]
+    store.batch_write("tick_data", ticks)
+    store.batch_write("tick_data", [{"time": base + 1, "symbol": "005930", "price": 1.0, "volume": 1}])  # 역순 도착
+    store.batch_write("tick_data", [{"time": base, "symbol": "000660", "price": 5.0, "volume": 1}])
+
+    cols = store.read_columns("tick_data", "005930", start=base + 1, end=base + 4)
+    assert cols["time"].tolist() == [base + 1, base + 2]
+    assert store.partitions("tick_data") == ["000660", "005930"]
+    assert len(store.read("tick_data")) == 5
+
+    # 키 테이블: 같은 날짜는 마지막 값으로 대체
+    store.write("history", {"date": date(2026, 1, 6), "total_equity": 2.0})
+    store.write("history", {"date": date(2026, 1, 5), "total_equity": 1.0})
+    store.write("history", {"date": date(2026, 1, 6), "total_equity": 3.0})
+    assert [(r["date"], r["total_equity"]) for r in store.read("history")] == [
+        ("2026-01-05", 1.0), ("2026-01-06", 3.0)
+    ]
+    store.close()
+
+    reloaded = ColumnarStore(tmp_path / "columnar")
+    assert len(reloaded.read("tick_data", {"symbol": "005930"})) == 4
+    assert [r["total_equity"] for r in reloaded.read("history", start=date(2026, 1, 6))] == [3.0]
+    assert reloaded.delete("tick_data", {"symbol": "000660"}) == 1
+
+
+class _RecordingSheets:
+    def __init__(self, fail: int = 0):
+        self.fail = fail
+        self.appends = []
+        self.updates = []
+
+    async def append_sheet_data(self, range_name, values):
+        if self.fail:
+            self.fail -= 1
+            raise IOError("quota exceeded")
+        self.appends.append((range_name, values))
+        return True
+
+    async def batch_update(self, updates):
+        self.updates.append(updates)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_hybrid_routes_locally_and_mirrors_to_sheets():
+    client = _RecordingSheets(fail=1)
+    hybrid = HybridAdapter([SQLiteAdapter(), ColumnarStore()], GoogleSheetsAdapter(client), max_retries=1)
+    hybrid.write("positions", {"symbol": "005930", "qty": 3, "avg_price": 100})
+    hybrid.write("positions", {"symbol": "000660", "qty": 1, "avg_price": 50})
+    hybrid.write("t_ledger", {"timestamp": datetime(2026, 1, 5, tzinfo=KST), "symbol": "005930", "qty": 3})
+    history = LocalHistoryRepository(hybrid)
+    await history.log_execution(1_000_000, 1_000, 0.001, 0.05, record_date=date(2026, 1, 5))
+
+    # 쓰기는 로컬만, Sheets 호출은 flush 전까지 없음
+    assert client.appends == [] and client.updates == []
+    assert isinstance(hybrid.store_for("history"), ColumnarStore)
+    [record] = await history.get_all()
+    assert record["Daily_Return"] == pytest.approx(0.1)  # 시트 표기(퍼센트)로 반환
+
+    assert await hybrid.flush() == 3  # t_ledger append 실패 → 재시도 대기
+    assert hybrid.pending == 1 and hybrid.mirror_errors == 1
+    [positions_update] = client.updates
+    assert [row[0] for row in positions_update["Position!A2"]] == ["005930", "000660"]
+
+    assert await hybrid.flush() == 1
+    assert [r for r, _ in client.appends] == ["History!A:A", "T_Ledger!A:A"]
+    assert hybrid.pending == 0
+
+    # 포지션 감소 시 남는 시트 행은 빈 값으로 덮음
+    hybrid.delete("positions", {"symbol": "000660"})
+    await hybrid.flush()
+    assert client.updates[-1]["Position!A2"][1] == [""] * 8
+
+    client.fail = 5
+    hybrid.write("t_ledger", {"timestamp": datetime(2026, 1, 6, tzinfo=KST), "symbol": "005930", "qty": 1})
+    await hybrid.flush()
+    await hybrid.flush()  # max_retries 초과 → 버림
+    assert hybrid.pending == 0 and hybrid.mirror_dropped == 1
+    hybrid.close()
+
+
+@pytest.mark.asyncio
+async def test_runner_reads_positions_from_local_store(tmp_path):
+    store = open_local_store(tmp_path)
+    store.write("positions", {
+        "symbol": "005930", "qty": 5, "avg_price": 70000, "current_price": 71000, "market": "KOSPI",
+    })
+    runner = ETEDARunner(
+        config=UnifiedConfig(config_map={"RUN_MODE": "PAPER"}, metadata={}),
+        sheets_client=MockSheetsClient(),
+        project_root=_ROOT,
+        broker=MockBroker(),
+        safety_hook=MockSafetyHook(initial_state="NORMAL"),
+        data_adapter=store,
+    )
+    [position] = await runner._portfolio_engine.get_positions()
+    assert position.symbol == "005930" and position.quantity == 5
+    await runner._position_repo.upsert("005930", 0, 0)
+    assert await runner._portfolio_engine.get_positions() == []
+    store.close()
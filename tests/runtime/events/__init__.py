@@ -0,0 +1 @@
+# tests/runtime/events
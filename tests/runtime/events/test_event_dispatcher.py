@@ -0,0 +1,221 @@
+"""
+NG-1 EventDispatcher 테스트 (lane별 오버플로우 정책, P0 격리, 구독자 lane 지정, 엔진 연동, 지연 지표).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from src.monitoring.metrics_collector import MetricsCollector
+from src.qts.core.config.config_models import UnifiedConfig
+from src.runtime.events import (
+    EventDispatcher,
+    EventPriority,
+    EventQueue,
+    LaneConfig,
+    OverflowPolicy,
+    QTSEvent,
+)
+from src.strategy.engines.base_engine import BaseEngine
+
+
+def _event(event_type="E", payload=None, source="s"):
+    return QTSEvent(priority=EventPriority.P2, event_type=event_type, payload=payload, source=source)
+
+
+def test_queue_overflow_policies():
+    drop = EventQueue(3, OverflowPolicy.DROP_OLDEST)
+    for i in range(5):
+        assert drop.put(_event(payload=i))
+    assert [drop.get(0).payload for _ in range(3)] == [2, 3, 4] and drop.dropped == 2
+
+    collapse = EventQueue(2, OverflowPolicy.COLLAPSE)
+    for i in range(4):
+        collapse.put(_event("A", i))
+    collapse.put(_event("B", "b"))
+    assert [(e.event_type, e.payload) for e in collapse.get_batch(10, 0)] == [("A", 3), ("B", "b")]
+    assert collapse.collapsed == 3
+
+    sample = EventQueue(2, OverflowPolicy.SAMPLE, sample_rate=0.25)
+    for i in range(10):
+        sample.put(_event(payload=i))
+    # 넘친 8건 중 4번째마다 1건(5, 9) 채택
+    assert [e.payload for e in sample.get_batch(10, 0)] == [5, 9] and sample.sampled_out == 6
+
+    block = EventQueue(1, OverflowPolicy.BLOCK)
+    assert block.put(_event(payload=0))
+    assert not block.put(_event(payload=1), timeout=0.05) and block.rejected == 1
+    threading.Timer(0.05, block.get).start()
+    assert block.put(_event(payload=2), timeout=1.0)  # 소비되면 적재
+    assert block.get(0).payload == 2
+
+
+def test_slow_subscriber_does_not_delay_p0_lane():
+    bus = EventDispatcher()
+    fills, dashboard = [], []
+    slow_started = threading.Event()
+
+    def slow_dashboard(event):
+        slow_started.set()
+        time.sleep(0.1)
+        dashboard.append(event.payload)
+
+    bus.subscribe("FILL_CONFIRMED", lambda e: fills.append((e.payload, threading.current_thread().name)))
+    bus.subscribe("FILL_CONFIRMED", slow_dashboard, priority=EventPriority.P3)
+    bus.subscribe("DASHBOARD_UPDATE", slow_dashboard)
+    bus.start()
+    try:
+        bus.publish("DASHBOARD_UPDATE", "d0")
+        assert slow_started.wait(1.0)
+        started = time.perf_counter()
+        for i in range(20):
+            assert bus.publish("FILL_CONFIRMED", i, source="BROKER_KIS")
+        publish_time = time.perf_counter() - started
+        deadline = time.monotonic() + 1.0
+        while len(fills) < 20 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        fill_done = time.perf_counter() - started
+    finally:
+        bus.stop()
+
+    assert [p for p, _ in fills] == list(range(20))  # P0 단일 전용 스레드: 순서 보장
+    assert {name for _, name in fills} == {"events-P0-0"}
+    assert publish_time < 0.05 and fill_done < 0.09  # P3 처리(0.1초씩)를 기다리지 않음
+    assert dashboard[0] == "d0" and len(dashboard) == 21  # stop(drain=True)로 P3도 모두 처리
+
+    metrics = bus.get_metrics()
+    assert metrics["counters"]["events.P0.handled"] == 20
+    assert metrics["counters"]["events.P3.handled"] == 21
+    assert metrics["gauges"]["events.P0.latency_p99_ms"] < metrics["gauges"]["events.P3.latency_max_ms"]
+    assert bus.latency_snapshot()["P0"]["count"] == 20
+
+
+def test_async_handlers_and_p2_collapse_under_load():
+    bus = EventDispatcher(lanes={EventPriority.P2: LaneConfig(capacity=100, policy=OverflowPolicy.COLLAPSE, workers=1)})
+    seen = []
+    gate = threading.Event()
+
+    async def on_signal(event):
+        await asyncio.sleep(0)
+        gate.wait(1.0)
+        seen.append(event.payload)
+
+    bus.subscribe("SIGNAL_GENERATED", on_signal)
+    bus.start()
+    try:
+        bus.publish("SIGNAL_GENERATED", 0)
+        time.sleep(0.05)  # 0번이 처리 중(gate 대기)인 동안 나머지는 병합
+        for i in range(1, 50):
+            bus.publish("SIGNAL_GENERATED", i)
+        gate.set()
+    finally:
+        bus.stop()
+
+    assert seen == [0, 49]
+    assert bus.get_metrics()["counters"]["events.P2.collapsed"] == 48
+
+
+def test_publish_async_waits_off_loop_only_when_block_lane_is_full():
+    bus = EventDispatcher(lanes={EventPriority.P0: LaneConfig(capacity=1, policy=OverflowPolicy.BLOCK, workers=1)})
+    bus.subscribe("FILL_CONFIRMED", lambda e: None)
+    queue = bus._lanes[EventPriority.P0].queue
+
+    async def run():
+        assert await bus.publish_async("FILL_CONFIRMED", 0)  # 빈 큐: 대기 없이 적재
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, queue.get, 0)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        ok = await bus.publish_async("FILL_CONFIRMED", 1)  # 가득 참: 워커 스레드에서 대기
+        task.cancel()
+        return ok, ticks
+
+    ok, ticks = asyncio.run(run())
+    assert ok and ticks > 1  # 대기 중에도 루프는 돌았음
+    assert queue.rejected == 0 and queue.get(0).payload == 1
+
+
+def test_async_handlers_run_on_handler_loop():
+    async def run():
+        loop = asyncio.get_running_loop()
+        bus = EventDispatcher(handler_loop=loop)
+        seen = []
+        done = asyncio.Event()  # 이 루프에 묶인 객체
+
+        async def on_fill(event):
+            seen.append((event.payload, asyncio.get_running_loop() is loop))
+            done.set()
+
+        bus.subscribe("FILL_CONFIRMED", on_fill)
+        bus.start()
+        try:
+            await bus.publish_async("FILL_CONFIRMED", 7)
+            await asyncio.wait_for(done.wait(), 1.0)
+        finally:
+            await asyncio.to_thread(bus.stop)
+        return seen, bus.get_metrics()["counters"]["events.P0.errors"]
+
+    seen, errors = asyncio.run(run())
+    assert seen == [(7, True)] and errors == 0
+
+
+class _Engine(BaseEngine):
+    async def initialize(self) -> bool:
+        return True
+
+    async def start(self) -> bool:
+        return True
+
+    async def stop(self) -> bool:
+        return True
+
+    async def execute(self, data):
+        return {"success": True, "data": None, "execution_time": 0.0}
+
+
+def test_engine_emit_publishes_instead_of_awaiting_callbacks():
+    engine = _Engine(UnifiedConfig(config_map={}, metadata={}))
+    other = _Engine(UnifiedConfig(config_map={}, metadata={}))
+    received, other_received = [], []
+
+    async def slow_dashboard(data):
+        await asyncio.sleep(0.2)
+        received.append(data)
+
+    engine.register_event_callback("positions_updated", slow_dashboard)
+    other.register_event_callback("positions_updated", other_received.append)
+
+    bus = EventDispatcher()
+    engine.attach_event_bus(bus, priorities={"positions_updated": EventPriority.P3})
+    other.attach_event_bus(bus)
+    collector = MetricsCollector()
+    bus.register_metrics(collector)
+    bus.start()
+
+    async def run():
+        started = time.perf_counter()
+        await engine._emit_event("positions_updated", {"positions": 3})
+        return time.perf_counter() - started
+
+    try:
+        elapsed = asyncio.run(run())
+    finally:
+        bus.stop()
+
+    assert elapsed < 0.05
+    assert received == [{"positions": 3}]
+    assert other_received == []  # 다른 엔진 인스턴스 콜백에는 전달되지 않음
+    assert collector.snapshot().counters["events.P3.handled"] == 1
+
+    engine.unregister_event_callback("positions_updated", slow_dashboard)
+    assert bus.publish("positions_updated", {}, source=engine._event_source)
+    assert bus.unrouted == 1  # 해제 후 구독자 없음
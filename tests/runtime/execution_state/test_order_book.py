@@ -0,0 +1,175 @@
+"""
+OrderBook / OrderFillPoller 테스트 (주문별 생명주기, 보조 인덱스, 일괄 체결 조회, 체결 타임아웃).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from src.provider.clients.broker.order_base import OrderQuery
+from src.provider.models.intent import ExecutionIntent
+from src.provider.models.order_response import OrderResponse, OrderStatus
+from src.provider.models.response import ExecutionResponse
+from src.provider.state.order_book import OrderBook, OrderFillPoller, OrderRecord
+from src.provider.state.order_state import OrderState
+
+
+class FillingAdapter:
+    """조회할 때마다 주문별로 step주씩 체결되는 어댑터."""
+
+    broker_id = "fake"
+
+    def __init__(self, step=4, stuck=()):
+        self.step = step
+        self.stuck = set(stuck)
+        self.filled = {}
+        self.calls = 0
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def get_order_async(self, query: OrderQuery) -> OrderResponse:
+        self.calls += 1
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.inflight -= 1
+        boid = query.broker_order_id
+        if boid not in self.stuck:
+            self.filled[boid] = min(10, self.filled.get(boid, 0) + self.step)
+        filled = self.filled.get(boid, 0)
+        status = OrderStatus.FILLED if filled >= 10 else OrderStatus.ACCEPTED
+        return OrderResponse(status=status, broker_order_id=boid, filled_qty=filled, avg_fill_price=100.0)
+
+
+class BatchAdapter(FillingAdapter):
+    """get_orders_async(일괄 조회) 지원 어댑터."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batch_calls = 0
+
+    async def get_orders_async(self, queries):
+        self.batch_calls += 1
+        return [await self.get_order_async(q) for q in queries]
+
+
+def _book_with_orders(n, **kwargs):
+    book = OrderBook(**kwargs)
+    for i in range(n):
+        intent = ExecutionIntent(
+            intent_id=f"I-{i}", symbol=f"S{i % 3}", side="BUY", quantity=10, intent_type="LIMIT"
+        )
+        book.track(intent)
+        book.on_execution_response(ExecutionResponse(intent_id=intent.intent_id, accepted=True, broker="fake", message="ok"))
+        book.on_order_response(intent.intent_id, OrderResponse(status=OrderStatus.ACCEPTED, broker_order_id=f"B-{i}"))
+    return book
+
+
+def test_lifecycle_and_indexes():
+    book = _book_with_orders(6)
+    book.add("I-r", "S0", "SELL", 5)
+    book.on_execution_response(ExecutionResponse(intent_id="I-r", accepted=False, broker="fake", message="no"))
+
+    transitions = book.on_order_response(
+        "I-0", OrderResponse(status=OrderStatus.ACCEPTED, broker_order_id="B-0", filled_qty=4, avg_fill_price=101.0)
+    )
+    assert [(t.prev, t.next) for t in transitions] == [(OrderState.ACCEPTED, OrderState.PARTIALLY_FILLED)]
+    book.apply_by_broker_order_id("B-0", OrderResponse(status=OrderStatus.PARTIALLY_FILLED, filled_qty=10))
+    book.apply_by_broker_order_id("B-1", OrderResponse(status=OrderStatus.CANCELED))
+
+    record = book.by_broker_order_id("B-0")
+    assert record is book.get("I-0") and record.state is OrderState.FILLED and record.remaining_qty == 0
+    assert [t.next.value for t in record.history] == ["SUBMITTED", "ACCEPTED", "PARTIALLY_FILLED", "FILLED"]
+    assert not hasattr(record, "__dict__")  # __slots__
+    assert {r.intent_id for r in book.by_symbol("S0")} == {"I-0", "I-3", "I-r"}
+    assert {r.intent_id for r in book.open_orders("S0")} == {"I-3"}
+    assert len(book.open_orders()) == 4
+    assert book.by_state(OrderState.REJECTED)[0].intent_id == "I-r"
+    # 종료 주문은 이후 응답을 무시
+    assert book.apply_by_broker_order_id("B-1", OrderResponse(status=OrderStatus.FILLED, filled_qty=10)) == []
+
+    assert book.prune_closed() == 3
+    assert len(book) == 4 and book.by_broker_order_id("B-0") is None
+    assert book.stats()["ACCEPTED"] == 4
+
+
+def test_due_timeouts_only_pops_expired_open_orders():
+    now = [0.0]
+    book = OrderBook(fill_timeout=5.0, clock=lambda: now[0])
+    for i in range(300):
+        book.add(f"I-{i}", "S", "BUY", 10, broker_order_id=f"B-{i}", timeout=1.0 + i * 0.01)
+    book.apply_by_broker_order_id("B-0", OrderResponse(status=OrderStatus.FILLED, filled_qty=10))
+    book.set_deadline("I-1", 100.0)  # 연장 → 이전 힙 항목은 무시
+
+    now[0] = 1.05
+    due = book.due_timeouts()
+    assert [r.intent_id for r in due] == [f"I-{i}" for i in range(2, 6)]
+    assert book.due_timeouts() == []  # 같은 주문은 한 번만
+    assert book.next_deadline() == 1.0 + 6 * 0.01
+
+    book.mark("I-2", OrderState.EXPIRED, "fill timeout")
+    assert book.get("I-2").state is OrderState.EXPIRED and not book.get("I-2").is_open
+
+
+def test_poller_polls_all_open_orders_per_tick_until_filled():
+    book = _book_with_orders(40)
+    adapter = FillingAdapter(step=4)
+    updates = []
+    poller = OrderFillPoller(book, adapter, interval=0.01, max_concurrency=8, on_update=lambda r, t: updates.append(r.intent_id))
+
+    async def run():
+        ticks = 0
+        while book.open_orders():
+            assert await poller.poll_once() == 40
+            ticks += 1
+        return ticks
+
+    ticks = asyncio.run(run())
+
+    assert ticks == 3  # 4 → 8 → 10주
+    assert adapter.calls == 120 and adapter.max_inflight == 8
+    assert len(updates) == 120
+    assert all(r.state is OrderState.FILLED and r.avg_fill_price == 100.0 for r in book.by_symbol("S1"))
+
+
+def test_poller_uses_batch_query_and_reports_timeouts():
+    book = _book_with_orders(5, fill_timeout=0.05)
+    adapter = BatchAdapter(step=10, stuck={"B-2", "B-4"})
+    timed_out = []
+
+    async def on_timeout(record: OrderRecord):
+        timed_out.append(record.intent_id)
+        book.mark(record.intent_id, OrderState.EXPIRED, "fill timeout")
+
+    poller = OrderFillPoller(book, adapter, interval=0.02, on_timeout=on_timeout)
+
+    async def run():
+        await poller.start()
+        await asyncio.sleep(0.2)
+        await poller.stop()
+
+    asyncio.run(run())
+
+    assert sorted(timed_out) == ["I-2", "I-4"]
+    # 첫 조회(5건 일괄 1회) 중 타임아웃 경과 → 이후 틱은 미체결이 없어 조회하지 않음
+    assert adapter.batch_calls in (1, 2) and poller.polls >= 2 and not poller.running
+    assert not book.open_orders()
+    assert {r.intent_id for r in book.by_state(OrderState.FILLED)} == {"I-0", "I-1", "I-3"}
+    assert poller.stats()["timeouts"] == 2
+
+
+def test_poller_skips_orders_removed_during_query():
+    book = _book_with_orders(4)
+
+    class RemovingAdapter(BatchAdapter):
+        async def get_orders_async(self, queries):
+            book.remove("I-1")  # 조회 대기 중 다른 코루틴이 주문 정리
+            return await super().get_orders_async(queries)
+
+    updates = []
+    poller = OrderFillPoller(book, RemovingAdapter(step=10), on_update=lambda r, t: updates.append(r.intent_id))
+
+    assert asyncio.run(poller.poll_once()) == 3
+    assert sorted(updates) == ["I-0", "I-2", "I-3"] and "I-1" not in book
@@ -0,0 +1,153 @@
+"""
+ETEDARunner.run_batch — 다심볼 배치 사이클 테스트 (Mock 기반).
+
+검증:
+- 포지션 조회는 사이클당 1회
+- 승인된 Intent는 submit_batch 1회로 일괄 제출, 결과는 입력 순서
+- 데이터 없는 스냅샷은 skipped, 단계별 timings_ms 반환
+"""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.db.mock_sheets_client import MockSheetsClient
+from src.pipeline.eteda_runner import ETEDARunner
+from src.pipeline.mock_safety_hook import MockSafetyHook
+from src.provider.brokers.mock_broker import MockBroker
+from src.provider.models.intent import ExecutionIntent
+from src.qts.core.config.config_models import UnifiedConfig
+
+_ROOT = Path(__file__).resolve().parents[3]
+
+
+class BatchCapturingBroker(MockBroker):
+    NAME = "batch-capturing-broker"
+
+    def __init__(self):
+        self.batches: List[List[ExecutionIntent]] = []
+        self.single_calls = 0
+
+    def submit_intent(self, intent):
+        self.single_calls += 1
+        return super().submit_intent(intent)
+
+    def submit_batch(self, intents):
+        self.batches.append(list(intents))
+        return [MockBroker.submit_intent(self, intent) for intent in intents]
+
+
+class CountingPortfolioEngine:
+    def __init__(self, positions):
+        self.positions = positions
+        self.calls = 0
+        self.invalidations = 0
+
+    async def get_positions(self):
+        self.calls += 1
+        return self.positions
+
+    async def invalidate_positions(self):
+        self.invalidations += 1
+
+
+class _Pos:
+    def __init__(self, symbol, quantity):
+        self.symbol = symbol
+        self.quantity = quantity
+
+
+def _snapshot(symbol, close, prev_close):
+    return {
+        "meta": {"timestamp": "2024-01-01 09:00:00", "timestamp_ms": 1704067200000},
+        "context": {"symbol": symbol},
+        "observation": {"inputs": {"price": {"close": close}, "prev_close": prev_close}},
+    }
+
+
+@pytest.fixture
+def runner():
+    config = UnifiedConfig(config_map={"RUN_MODE": "PAPER", "KILLSWITCH_STATUS": "OFF"}, metadata={})
+    r = ETEDARunner(
+        config=config,
+        sheets_client=MockSheetsClient(),
+        project_root=_ROOT,
+        broker=BatchCapturingBroker(),
+        safety_hook=MockSafetyHook(initial_state="NORMAL"),
+    )
+    r._portfolio_engine = CountingPortfolioEngine([_Pos("000660", 3), _Pos("005930", 5)])
+    return r
+
+
+@pytest.mark.asyncio
+async def test_run_batch_fetches_positions_once_and_submits_one_batch(runner):
+    snapshots = [_snapshot(f"{i:06d}", 100.0 + i, 0.0) for i in range(50)]
+
+    result = await runner.run_batch(snapshots)
+
+    assert result["status"] == "ok"
+    assert runner._portfolio_engine.calls == 1
+    broker = runner._broker
+    assert len(broker.batches) == 1 and broker.single_calls == 0
+    assert [i.symbol for i in broker.batches[0]] == [s["context"]["symbol"] for s in snapshots]
+    assert [r["symbol"] for r in result["results"]] == [s["context"]["symbol"] for s in snapshots]
+    assert all(r["act_result"]["status"] == "executed" for r in result["results"])
+    assert result["submitted"] == 50
+    assert runner._portfolio_engine.invalidations == 1  # 접수된 배치 1회당 포지션 캐시 무효화 1회
+    assert set(result["timings_ms"]) == {"extract", "transform", "evaluate", "decide", "act", "total"}
+
+
+@pytest.mark.asyncio
+async def test_run_batch_skips_snapshots_without_market_data(runner):
+    snapshots = [
+        _snapshot("005930", 70100.0, 0.0),
+        {"context": {"symbol": "035720"}, "observation": {"inputs": {}}},
+    ]
+
+    result = await runner.run_batch(snapshots)
+
+    assert result["symbols"] == 1
+    assert result["results"][1] == {"status": "skipped", "reason": "no_market_data", "symbol": "035720"}
+    assert len(runner._broker.batches[0]) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_batch_hold_signals_are_not_submitted(runner):
+    result = await runner.run_batch([_snapshot("005930", 0.0, 0.0)])
+
+    assert result["results"][0]["act_result"] == {"status": "skipped", "action": "HOLD"}
+    assert runner._broker.batches == []
+    assert runner._portfolio_engine.invalidations == 0
+
+
+@pytest.mark.asyncio
+async def test_run_batch_respects_safety_hook(runner):
+    runner._safety_hook.set_should_run(False)
+
+    result = await runner.run_batch([_snapshot("005930", 1.0, 0.0)])
+
+    assert result["status"] == "skipped" and result["reason"] == "safety"
+    assert runner._portfolio_engine.calls == 0
+
+
+class ShortBatchBroker(BatchCapturingBroker):
+    """응답을 Intent 수보다 적게 돌려주는 broker."""
+
+    def submit_batch(self, intents):
+        return super().submit_batch(intents)[:-1]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_marks_missing_broker_responses_as_error(runner):
+    runner._broker = ShortBatchBroker()
+    snapshots = [_snapshot("005930", 0.0, 0.0)] + [_snapshot(f"{i:06d}", 100.0 + i, 0.0) for i in range(3)]
+
+    result = await runner.run_batch(snapshots)
+
+    act = [r["act_result"] for r in result["results"]]
+    assert len(act) == 4
+    assert act[0] == {"status": "skipped", "action": "HOLD"}
+    assert [a["status"] for a in act[1:]] == ["executed", "executed", "error"]
+    assert act[3]["error"] == "missing broker response"
+    assert act[3]["intent_id"] == runner._broker.batches[0][2].intent_id
@@ -0,0 +1,144 @@
+"""
+ETEDA 사이클 추적 테스트 (Mock 기반).
+
+검증:
+- run_once/run_batch 결과에 trace_id + 단계별 timings_ms
+- 예산 초과 사이클 집계 및 cProfile/tracemalloc 캡처
+- MetricsCollector 수집기 / CHECK_ETEDA_LOOP_LATENCY 헬스체크 연동
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from src.automation.health import CHECK_ETEDA_LOOP_LATENCY, HealthMonitor, eteda_loop_latency_check
+from src.db.mock_sheets_client import MockSheetsClient
+from src.monitoring.metrics_collector import MetricsCollector
+from src.pipeline.eteda_runner import ETEDARunner
+from src.pipeline.tracing import ETEDATracer, STAGES
+from src.provider.brokers.mock_broker import MockBroker
+from src.qts.core.config.config_models import UnifiedConfig
+
+_ROOT = Path(__file__).resolve().parents[3]
+
+
+class _Positions:
+    async def get_positions(self):
+        return []
+
+
+def _snapshot(symbol="005930", close=70100.0):
+    return {
+        "meta": {"timestamp": "2024-01-01 09:00:00", "timestamp_ms": 1704067200000},
+        "context": {"symbol": symbol},
+        "observation": {"inputs": {"price": {"close": close}, "prev_close": 0.0}},
+    }
+
+
+def _runner(tracer=None, config_map=None):
+    config = UnifiedConfig(config_map={"RUN_MODE": "PAPER", **(config_map or {})}, metadata={})
+    runner = ETEDARunner(
+        config=config,
+        sheets_client=MockSheetsClient(),
+        project_root=_ROOT,
+        broker=MockBroker(),
+        tracer=tracer,
+    )
+    runner._portfolio_engine = _Positions()
+    return runner
+
+
+def _slow_evaluate(runner, seconds):
+    original = runner._evaluate
+
+    def _evaluate(data):
+        time.sleep(seconds)
+        return original(data)
+
+    runner._evaluate = _evaluate
+
+
+@pytest.mark.asyncio
+async def test_run_once_returns_trace_id_and_stage_timings():
+    runner = _runner()
+    result = await runner.run_once(_snapshot())
+
+    assert len(result["trace_id"]) == 16
+    assert set(result["timings_ms"]) == set(STAGES) | {"total"}
+    assert result["timings_ms"]["total"] >= sum(result["timings_ms"][s] for s in STAGES) - 1e-6
+    assert runner.tracer.cycles == 1
+    assert runner.tracer.last_trace.trace_id == result["trace_id"]
+
+
+@pytest.mark.asyncio
+async def test_budget_from_config_and_breach_counted():
+    runner = _runner(config_map={"ETEDA_LATENCY_BUDGET_MS": "5"})
+    _slow_evaluate(runner, 0.02)
+
+    await runner.run_once(_snapshot())
+
+    assert runner.tracer.budget_ms == 5.0
+    assert runner.tracer.breaches == 1
+    assert runner.tracer.last_trace.breached
+    assert runner.tracer.get_profiles() == []  # 프로파일링 off
+
+
+@pytest.mark.asyncio
+async def test_cprofile_capture_kept_only_for_breaching_cycles():
+    tracer = ETEDATracer(budget_ms=5.0, profile_mode="cprofile", profile_sample_rate=1.0)
+    runner = _runner(tracer)
+
+    await runner.run_once(_snapshot())
+    assert tracer.get_profiles() == []
+
+    _slow_evaluate(runner, 0.02)
+    result = await runner.run_once(_snapshot())
+
+    profiles = tracer.get_profiles()
+    assert len(profiles) == 1
+    assert profiles[0]["trace_id"] == result["trace_id"]
+    assert profiles[0]["kind"] == "cprofile"
+    assert "_evaluate" in profiles[0]["report"]
+
+
+@pytest.mark.asyncio
+async def test_tracemalloc_capture_armed_after_breach():
+    tracer = ETEDATracer(budget_ms=5.0, profile_mode="tracemalloc", arm_on_breach=True)
+    runner = _runner(tracer)
+    _slow_evaluate(runner, 0.02)
+
+    await runner.run_once(_snapshot())  # 초과 → 다음 사이클 arm
+    assert tracer.get_profiles() == []
+    await runner.run_once(_snapshot())
+
+    profiles = tracer.get_profiles()
+    assert len(profiles) == 1 and profiles[0]["kind"] == "tracemalloc"
+    assert profiles[0]["report"]["peak_bytes"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_and_health_check_integration():
+    runner = _runner(config_map={"ETEDA_LATENCY_BUDGET_MS": "5"})
+    collector = MetricsCollector()
+    runner.register_metrics(collector)
+    monitor = HealthMonitor().add_check(
+        CHECK_ETEDA_LOOP_LATENCY, eteda_loop_latency_check(runner.tracer.latency_snapshot)
+    )
+
+    assert monitor.run_checks()[0].ok  # 사이클 없음
+    await runner.run_batch([_snapshot("005930"), _snapshot("000660")])
+    _slow_evaluate(runner, 0.02)
+    await runner.run_once(_snapshot())
+
+    snap = collector.snapshot()
+    assert snap.counters["eteda.cycles"] == 2
+    assert snap.counters["eteda.budget_breaches"] == 1
+    assert "eteda.stage.evaluate.p95_ms" in snap.gauges
+    assert "eteda.cycle.max_ms" in snap.gauges
+
+    result = monitor.run_checks()[0]
+    assert result.name == CHECK_ETEDA_LOOP_LATENCY
+    assert not result.ok
+    assert "slowest_stage=evaluate" in result.message
+    assert result.meta["last_trace_id"] == runner.tracer.last_trace.trace_id
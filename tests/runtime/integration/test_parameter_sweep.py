@@ -0,0 +1,108 @@
+"""
+Config_Scalp 파라미터 스윕 테스트 (그리드 전개, mmap 데이터셋, 프로세스 풀 평가/순위).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.pipeline.replay import ParameterGrid, SnapshotDataset, evaluate_candidate, load_scalp_parameters, run_sweep
+from src.strategy.interfaces.strategy import ExecutionContext, MarketContext
+from src.strategy.scalp_strategy import ScalpParameterStrategy
+
+
+def _write_day(path: Path, symbol: str, day: str, n: int, base: float, rng: random.Random) -> Path:
+    price = base
+    with path.open("a", encoding="utf-8") as f:
+        for i in range(n):
+            price *= 1 + rng.gauss(0, 0.003)
+            f.write(json.dumps({"symbol": symbol, "price": price, "timestamp": f"{day}T09:{i // 60:02d}:{i % 60:02d}"}) + "\n")
+    return path
+
+
+@pytest.fixture
+def dataset(tmp_path) -> SnapshotDataset:
+    rng = random.Random(7)
+    paths = []
+    for symbol, base in (("005930", 70000.0), ("000660", 150000.0)):
+        path = tmp_path / f"{symbol}.jsonl"
+        for day in ("2026-01-05", "2026-01-06", "2026-01-07"):
+            _write_day(path, symbol, day, 120, base, rng)
+        paths.append(path)
+    return SnapshotDataset.from_jsonl(paths)
+
+
+class _Repo:
+    async def get_golden_cross_parameters(self):
+        return {"scalp_gc_short_period": 3}
+
+    async def get_rsi_parameters(self):
+        return {"scalp_rsi_oversold": 25}
+
+    async def get_bollinger_bands_parameters(self):
+        return {}
+
+    async def get_execution_settings(self):
+        return {"scalp_max_qty_per_order": 2}
+
+
+def test_grid_expands_over_repository_parameters():
+    base = asyncio.run(load_scalp_parameters(_Repo()))
+    grid = ParameterGrid({"RSI.scalp_rsi_oversold": [20, 30], "GOLDEN_CROSS.scalp_gc_long_period": [10, 20, 40]}, base=base)
+    candidates = list(grid)
+    assert len(grid) == len(candidates) == 6
+    assert candidates[0]["RSI"]["scalp_rsi_oversold"] == 20 and candidates[0]["GOLDEN_CROSS"]["scalp_gc_short_period"] == 3
+    assert all(c["EXECUTION"]["scalp_max_qty_per_order"] == 2 for c in candidates)
+    with pytest.raises(ValueError):
+        ParameterGrid({"scalp_rsi_oversold": [20]})
+
+
+def test_dataset_roundtrip_is_readonly_mmap(dataset, tmp_path):
+    assert len(dataset) == 720 and dataset.symbols == ("005930", "000660")
+    assert np.all(np.diff(dataset.timestamp_ms) >= 0)
+    opened = SnapshotDataset.open(dataset.save(tmp_path / "ds"))
+    assert isinstance(opened.price, np.memmap) and not opened.price.flags.writeable
+    assert list(opened.ticks(chunk=7)) == list(dataset.ticks())
+
+
+def test_sweep_ranks_candidates_identically_in_process_pool(dataset):
+    grid = ParameterGrid({
+        "RSI.scalp_rsi_oversold": [20, 35],
+        "BOLLINGER_BANDS.scalp_bb_std": [1.0, 2.5],
+    })
+    sequential = run_sweep(grid, dataset, max_workers=1, initial_cash=1_000_000.0)
+    parallel = run_sweep(grid, dataset, max_workers=2, initial_cash=1_000_000.0)
+
+    assert [r.params for r in parallel.rows] == [r.params for r in sequential.rows]
+    sharpes = [r.metrics.sharpe_ratio for r in parallel.rows]
+    assert sharpes == sorted(sharpes, reverse=True) and [r.rank for r in parallel.rows] == [1, 2, 3, 4]
+    assert len({r.trades for r in parallel.rows}) > 1  # 파라미터가 실제로 결과를 바꿈
+
+    metrics, trades, equity = evaluate_candidate(dataset, grid.apply(parallel.best.params), initial_cash=1_000_000.0)
+    assert metrics == parallel.best.metrics and trades == parallel.best.trades
+    row = parallel.table()[0]
+    assert row["rank"] == 1 and "RSI.scalp_rsi_oversold" in row and "sharpe_ratio" in row
+
+    by_mdd = run_sweep(grid, dataset, max_workers=1, rank_by="mdd", ascending=True)
+    assert [r.metrics.mdd for r in by_mdd.rows] == sorted(r.metrics.mdd for r in by_mdd.rows)
+    with pytest.raises(ValueError):
+        run_sweep(grid, dataset, rank_by="nope")
+
+
+def test_scalp_strategy_exits_on_overbought():
+    strategy = ScalpParameterStrategy({"RSI": {"scalp_rsi_period": 3}, "GOLDEN_CROSS": {"scalp_gc_short_period": 0},
+                                       "BOLLINGER_BANDS": {"scalp_bb_period": 0}})
+    for price in (100, 99, 98):
+        strategy.generate_intents(MarketContext("A", price), ExecutionContext(position_qty=0, cash=0))
+    [buy] = strategy.generate_intents(MarketContext("A", 97), ExecutionContext(position_qty=0, cash=0))
+    assert (buy.side, buy.reason) == ("BUY", "scalp_rsi_oversold")
+    for price in (98, 99):
+        strategy.generate_intents(MarketContext("A", price), ExecutionContext(position_qty=1, cash=0))
+    [sell] = strategy.generate_intents(MarketContext("A", 100), ExecutionContext(position_qty=1, cash=0))
+    assert (sell.side, sell.qty, sell.reason) == ("SELL", 1, "scalp_rsi_overbought")
@@ -0,0 +1,132 @@
+"""
+리플레이 엔진 테스트 (심볼별 JSONL 힙 병합 + SimulatedClock, SimExecutor 체결 모델 장부, 일자 병렬 재생/PnL 집계).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from src.pipeline.replay import (
+    ReplayBroker,
+    ReplayEngine,
+    ReplayTickSource,
+    SimulatedClock,
+    timestamp_ms,
+)
+from src.provider.models.intent import ExecutionIntent
+
+_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _write_ticks(path: Path, symbol: str, day: str, prices, step_s: int = 60, offset_s: int = 0) -> Path:
+    with path.open("w", encoding="utf-8") as f:
+        for i, price in enumerate(prices):
+            s = offset_s + i * step_s
+            ts = f"{day}T09:{s // 60:02d}:{s % 60:02d}"
+            f.write(json.dumps({"symbol": symbol, "price": {"current": price}, "timestamp": ts}) + "\n")
+    return path
+
+
+def _intent(symbol: str, side: str, qty: float) -> ExecutionIntent:
+    return ExecutionIntent(intent_id=f"{side}-{qty}", symbol=symbol, side=side, quantity=qty, intent_type="MARKET")
+
+
+def test_source_merges_symbols_in_timestamp_order(tmp_path):
+    a = _write_ticks(tmp_path / "005930.jsonl", "005930", "2026-01-05", [100, 101, 102], offset_s=0)
+    b = _write_ticks(tmp_path / "000660.jsonl", "000660", "2026-01-05", [200, 201], offset_s=30)
+    clock = SimulatedClock()
+    source = ReplayTickSource([a, b], clock=clock)
+
+    async def drain():
+        out = []
+        while True:
+            try:
+                out.append(await source())
+            except StopAsyncIteration:
+                return out
+
+    snapshots = asyncio.run(drain())
+    assert [s["context"]["symbol"] for s in snapshots] == ["005930", "000660", "005930", "000660", "005930"]
+    stamps = [s["meta"]["timestamp_ms"] for s in snapshots]
+    assert stamps == sorted(stamps) and clock.now_ms == stamps[-1]
+    assert stamps[0] == timestamp_ms("2026-01-05T09:00:00+09:00")
+    assert (source.last_ms - source.first_ms) == 120_000
+
+
+def test_broker_fills_at_replayed_price_with_sim_slippage():
+    broker = ReplayBroker(SimulatedClock(), initial_cash=1_000.0, slippage_rate=0.01, max_fill_qty=3)
+    assert not broker.submit_intent(_intent("A", "BUY", 1)).accepted  # 기준가 없음
+
+    broker.on_tick({"context": {"symbol": "A"}, "observation": {"inputs": {"price": 100.0}}})
+    assert broker.submit_intent(_intent("A", "BUY", 5)).accepted
+    fill = broker.fills[-1]
+    assert (fill.qty, fill.result) == (3, "PARTIAL") and fill.price == pytest.approx(101.0)
+
+    broker.on_tick({"context": {"symbol": "A"}, "observation": {"inputs": {"price": 110.0}}})
+    assert broker.unrealized_pnl() == pytest.approx((110 - 101) * 3)
+    assert broker.submit_intent(_intent("A", "SELL", 2)).accepted
+    assert broker.realized_pnl == pytest.approx((108.9 - 101) * 2)
+    assert not broker.submit_intent(_intent("B", "SELL", 1)).accepted  # 공매도 없음
+    assert broker.pnl() == pytest.approx(broker.realized_pnl + broker.unrealized_pnl())
+
+
+def test_broker_buy_is_capped_by_cash():
+    broker = ReplayBroker(SimulatedClock(), initial_cash=1_000.0, slippage_rate=0.0, fee_rate=0.01)
+    broker.mark("A", 100.0)
+
+    assert broker.submit_intent(_intent("A", "BUY", 20)).accepted
+    fill = broker.fills[-1]
+    assert (fill.qty, fill.result) == (9, "PARTIAL")  # 1000 / (100 × 1.01) → 9주
+    assert broker.cash == pytest.approx(1_000.0 - 9 * 101.0)
+    resp = broker.submit_intent(_intent("A", "BUY", 1))
+    assert not resp.accepted and resp.message == "insufficient cash"
+    assert broker.cash >= 0
+
+
+class _FailingRunner:
+    async def run_once(self, snapshot):
+        raise RuntimeError("boom")
+
+
+def _failing_runner(config, project_root, broker, data_adapter):
+    return _FailingRunner()
+
+
+def test_replay_day_reports_abort_after_max_errors(tmp_path):
+    path = _write_ticks(tmp_path / "005930.jsonl", "005930", "2026-01-05", [100.0] * 40)
+    engine = ReplayEngine(_ROOT, runner_factory=_failing_runner)
+
+    report = engine.run_days({"2026-01-05": [path]}, max_workers=1)
+
+    [day] = report.days
+    assert day.aborted and day.errors == 21  # error_backoff_max_retries=20 초과
+    assert day.ticks == 21 and report.aborted_days == ("2026-01-05",)
+
+
+def test_replay_days_in_process_pool_matches_sequential(tmp_path):
+    days = {}
+    for day, drift in (("2026-01-05", 1.0), ("2026-01-06", -1.0)):
+        d = tmp_path / day
+        d.mkdir()
+        days[day] = [
+            _write_ticks(d / "005930.jsonl", "005930", day, [70000 + drift * i for i in range(30)]),
+            _write_ticks(d / "000660.jsonl", "000660", day, [150000 - drift * i for i in range(30)], offset_s=15),
+        ]
+    engine = ReplayEngine(_ROOT)
+
+    sequential = engine.run_days(days, max_workers=1)
+    parallel = engine.run_days(days, max_workers=2)
+
+    assert [d.day for d in parallel.days] == ["2026-01-05", "2026-01-06"]
+    assert parallel.by_day() == pytest.approx(sequential.by_day())
+    assert parallel.total_ticks == 120
+    first = parallel.days[0]
+    # BasicStrategy는 가격 변동 틱마다 BUY 1주 → 심볼별 첫 틱 이후 체결
+    assert first.fills > 0 and first.replayed_s == pytest.approx(29 * 60 + 15)
+    assert first.elapsed_s < first.replayed_s  # 실시간 대기 없음
+    assert parallel.total_pnl == pytest.approx(sum(d.pnl for d in parallel.days))
+    assert parallel.aborted_days == () and first.errors == 0
@@ -0,0 +1,67 @@
+"""
+LatencyHistogram tests (Phase 9 — Logging & Monitoring Core).
+
+- 고정 버킷 percentile 정확도 (상대 오차 한도), min/max 보정, merge/reset.
+- MetricsCollector.register_collector 다중 수집기 병합.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.monitoring.latency_histogram import LatencyHistogram
+from src.monitoring.metrics_collector import MetricsCollector
+
+
+def test_empty_histogram_snapshot_is_zero():
+    h = LatencyHistogram()
+    assert h.snapshot() == {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+
+def test_percentiles_within_bucket_resolution():
+    h = LatencyHistogram()
+    values = [i / 1000.0 for i in range(1, 1001)]  # 1ms .. 1s
+    for v in values:
+        h.record(v)
+
+    assert h.count == 1000
+    assert h.mean == pytest.approx(sum(values) / 1000)
+    for q, exact in ((50, 0.5), (95, 0.95), (99, 0.99)):
+        assert h.percentile(q) == pytest.approx(exact, rel=0.1)
+    assert h.percentile(100) == 1.0
+    assert h.snapshot(scale=1000.0)["max"] == 1000.0
+
+
+def test_percentile_clamped_to_observed_range_and_ignores_invalid():
+    h = LatencyHistogram()
+    h.record(0.0123)
+    h.record(-1.0)
+    h.record(float("nan"))
+    assert h.count == 1
+    assert h.percentile(50) == 0.0123
+    h.record(1e9)  # 상한 초과는 마지막 버킷
+    assert h.percentile(100) == 1e9
+
+
+def test_merge_and_reset():
+    a, b = LatencyHistogram(), LatencyHistogram()
+    a.record(0.001)
+    b.record(0.1)
+    a.merge(b)
+    assert a.count == 2 and a.min == 0.001 and a.max == 0.1
+    with pytest.raises(ValueError):
+        a.merge(LatencyHistogram(min_value=1e-3))
+    a.reset()
+    assert a.count == 0 and a.max is None
+
+
+def test_register_collector_merges_named_collectors():
+    c = MetricsCollector()
+    c.register_collector("a", lambda: {"counters": {"a.calls": 1}, "gauges": {"a.p95_ms": 2.0}})
+    c.register_collector("b", lambda: {"gauges": {"b.p95_ms": 3.0}})
+    c.register_collector("bad", lambda: (_ for _ in ()).throw(ValueError("bad")))
+    snap = c.snapshot()
+    assert snap.counters == {"a.calls": 1}
+    assert snap.gauges == {"a.p95_ms": 2.0, "b.p95_ms": 3.0}
+    c.unregister_collector("a")
+    assert "a.calls" not in c.snapshot().counters
@@ -0,0 +1,145 @@
+"""
+FileObserverClient follow(tail) 모드 테스트 (새 줄/부분 줄/회전/truncate, 오프셋 체크포인트 재개).
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.observer_client.file_client import FileObserverClient
+from src.observer_client.file_watch import OffsetCheckpoint, PollingWatcher, create_watcher
+
+
+def _tick(symbol, price):
+    return {"symbol": symbol, "price": {"current": price}}
+
+
+def _append(path, records, newline=True):
+    text = "\n".join(json.dumps(r) for r in records) + ("\n" if newline else "")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _price(snapshot):
+    return snapshot["observation"]["inputs"]["price"]
+
+
+async def _next(client, timeout=5.0):
+    return await asyncio.wait_for(client.get_next_snapshot(), timeout)
+
+
+def _client(tmp_path, use_inotify, **kwargs):
+    return FileObserverClient(
+        str(tmp_path),
+        scope="scalp",
+        follow=True,
+        poll_interval=0.01,
+        max_poll_interval=0.2,
+        use_inotify=use_inotify,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_follow_new_lines_partial_lines_and_new_files(tmp_path, use_inotify):
+    scope = tmp_path / "scalp"
+    scope.mkdir()
+    path = scope / "a.jsonl"
+    _append(path, [_tick("A", 1)])
+
+    async def run():
+        client = _client(tmp_path, use_inotify)
+        assert await client.connect()
+        assert _price(await _next(client)) == 1.0
+
+        # 개행 없는 줄은 완성될 때까지 보류
+        _append(path, [_tick("A", 2)], newline=False)
+        pending = asyncio.ensure_future(client.get_next_snapshot())
+        await asyncio.sleep(0.3)
+        assert not pending.done()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n")
+        assert _price(await asyncio.wait_for(pending, 5.0)) == 2.0
+
+        _append(scope / "b.jsonl", [_tick("B", 3)])
+        assert _price(await _next(client)) == 3.0
+        await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_follow_rename_rotation_and_truncate(tmp_path):
+    scope = tmp_path / "scalp"
+    scope.mkdir()
+    path = scope / "a.jsonl"
+    _append(path, [_tick("A", 1)])
+
+    async def run():
+        client = _client(tmp_path, use_inotify=False)
+        await client.connect()
+        assert _price(await _next(client)) == 1.0
+
+        # 기존 파일에 마지막 줄 기록 후 rename 회전 → 남은 줄을 읽고 새 파일을 처음부터
+        _append(path, [_tick("A", 2)])
+        path.rename(scope / "a.jsonl.1")
+        _append(path, [_tick("A", 10)])
+        assert [_price(await _next(client)) for _ in range(2)] == [2.0, 10.0]
+
+        # copytruncate: 크기 감소 → 처음부터
+        path.write_text(json.dumps(_tick("A", 7)) + "\n", encoding="utf-8")
+        assert _price(await _next(client)) == 7.0
+
+        # truncate 후 이전 오프셋보다 커진 재기록 → 첫 레코드 변경으로 감지, 처음부터
+        rewritten = [_tick("A", 20 + i) for i in range(3)]
+        path.write_text("".join(json.dumps(r) + "\n" for r in rewritten), encoding="utf-8")
+        assert [_price(await _next(client)) for _ in range(3)] == [20.0, 21.0, 22.0]
+        await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_checkpoint_resume_without_rescan(tmp_path):
+    scope = tmp_path / "scalp"
+    scope.mkdir()
+    path = scope / "a.jsonl"
+    checkpoint = tmp_path / "state" / "offsets.json"
+    _append(path, [_tick("A", p) for p in (1, 2, 3)])
+
+    async def consume(n):
+        client = _client(tmp_path, use_inotify=False, checkpoint_path=str(checkpoint))
+        await client.connect()
+        prices = [_price(await _next(client)) for _ in range(n)]
+        await client.disconnect()
+        return prices, client.get_offsets()
+
+    prices, offsets = asyncio.run(consume(2))
+    assert prices == [1.0, 2.0]
+    saved = OffsetCheckpoint(str(checkpoint)).load()
+    assert saved[str(path)]["offset"] == offsets[str(path)]
+    assert saved[str(path)]["inode"] == path.stat().st_ino
+
+    _append(path, [_tick("A", 4)])
+    prices, _ = asyncio.run(consume(2))
+    assert prices == [3.0, 4.0]
+
+    # 다른 파일로 교체되면(inode 불일치) 저장 오프셋을 버리고 처음부터
+    replacement = scope / "tmp.jsonl.new"
+    _append(replacement, [_tick("A", 100)])
+    replacement.replace(path)
+    prices, _ = asyncio.run(consume(1))
+    assert prices == [100.0]
+
+
+def test_polling_watcher_backoff():
+    watcher = PollingWatcher(poll_interval=0.001, max_poll_interval=0.004)
+
+    async def run():
+        for _ in range(4):
+            await watcher.wait()
+
+    asyncio.run(run())
+    assert watcher._current == 0.004
+    watcher.reset()
+    assert watcher._current == 0.001
+    assert create_watcher(".", use_inotify=False).kind == "polling"
@@ -0,0 +1,152 @@
+"""
+FileObserverClient 배치 리더 테스트 (JSONL 청크/mmap 읽기, 배치 디코딩, 오프셋 재개).
+"""
+
+import json
+import threading
+
+import pytest
+
+from src.observer_client import jsonl_reader
+from src.observer_client.file_client import FileObserverClient
+from src.observer_client.jsonl_reader import JsonlBatchReader
+
+
+def _tick(symbol, price):
+    return {"symbol": symbol, "price": {"current": price, "open": price, "high": price, "low": price}}
+
+
+def _write(path, records, trailing_newline=True):
+    text = "\n".join(json.dumps(r) for r in records)
+    path.write_text(text + ("\n" if trailing_newline else ""), encoding="utf-8")
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_reader_batches_and_offsets(tmp_path, use_mmap):
+    path = tmp_path / "a.jsonl"
+    _write(path, [{"i": i} for i in range(10)])
+
+    with JsonlBatchReader(str(path), chunk_size=1024, use_mmap=use_mmap) as reader:
+        first = reader.read_batch(4)
+        rest = reader.read_batch(100)
+
+    assert [r["i"] for r in first.items] == [0, 1, 2, 3]
+    assert [r["i"] for r in rest.items] == list(range(4, 10))
+    assert rest.eof and rest.end_offset == path.stat().st_size
+    # 오프셋에서 재개하면 정확히 다음 레코드부터
+    with JsonlBatchReader(str(path), offset=first.offsets[1]) as reader:
+        assert reader.read_batch(1).items == [{"i": 2}]
+
+
+def test_reader_skips_invalid_and_blank_lines(tmp_path):
+    path = tmp_path / "a.jsonl"
+    path.write_bytes(b'{"i": 1}\n\nnot-json\n{"i": 2}\n')
+
+    batch = JsonlBatchReader(str(path)).read_batch(100)
+
+    assert batch.items == [{"i": 1}, {"i": 2}]
+    assert batch.invalid == 1
+
+
+def test_reader_long_lines_exceed_chunk(tmp_path):
+    path = tmp_path / "a.jsonl"
+    _write(path, [{"pad": "x" * 5000, "i": i} for i in range(3)])
+
+    batch = JsonlBatchReader(str(path), chunk_size=1024).read_batch(100)
+
+    assert [r["i"] for r in batch.items] == [0, 1, 2]
+
+
+def test_reader_partial_last_line_only_when_final(tmp_path):
+    path = tmp_path / "a.jsonl"
+    path.write_bytes(b'{"i": 1}\n{"i": 2')
+
+    reader = JsonlBatchReader(str(path))
+    pending = reader.read_batch(100, final=False)
+    assert pending.items == [{"i": 1}] and pending.end_offset == 9
+
+    with open(path, "ab") as f:
+        f.write(b'}\n')
+    assert reader.read_batch(100, final=False).items == [{"i": 2}]
+    reader.close()
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_reader_detects_truncate_then_regrow(tmp_path, use_mmap):
+    path = tmp_path / "a.jsonl"
+    _write(path, [{"i": i} for i in range(3)])
+    reader = JsonlBatchReader(str(path), use_mmap=use_mmap)
+    assert len(reader.read_batch(100).items) == 3
+    old_offset = reader.offset
+
+    # 같은 inode를 truncate 후 이전 오프셋보다 크게 재기록
+    _write(path, [{"i": 100 + i, "pad": "y" * 20} for i in range(3)])
+    assert path.stat().st_size > old_offset
+    assert reader.rewritten()
+    reader.reset(0)
+    assert [r["i"] for r in reader.read_batch(100).items] == [100, 101, 102]
+    assert not reader.rewritten()
+
+    # 축소 후 이전 매핑/버퍼를 넘어서 읽지 않음
+    _write(path, [{"i": 7}])
+    assert reader.rewritten()
+    reader.reset(0)
+    assert reader.read_batch(100).items == [{"i": 7}]
+    reader.close()
+
+
+def test_stdlib_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr(jsonl_reader, "_orjson", None)
+    monkeypatch.setattr(jsonl_reader, "_DECODE_ERRORS", (ValueError,))
+    path = tmp_path / "a.jsonl"
+    path.write_bytes(b'{"i": 1}\nbad\n')
+
+    batch = JsonlBatchReader(str(path)).read_batch(100)
+
+    assert batch.items == [{"i": 1}] and batch.invalid == 1
+
+
+@pytest.mark.asyncio
+async def test_client_parses_off_loop_and_resumes_from_offsets(tmp_path):
+    scope_dir = tmp_path / "scalp"
+    scope_dir.mkdir()
+    _write(scope_dir / "2024-01-01.jsonl", [_tick("005930", 70000 + i) for i in range(5)])
+    _write(scope_dir / "2024-01-02.jsonl", [_tick("000660", 150000 + i) for i in range(3)])
+
+    loop_thread = threading.get_ident()
+    seen_threads = set()
+
+    client = FileObserverClient(str(tmp_path), batch_size=2)
+    original = client._map_to_snapshot
+
+    def _tracking_map(data):
+        seen_threads.add(threading.get_ident())
+        return original(data)
+
+    client._map_to_snapshot = _tracking_map
+    assert await client.connect()
+
+    first = [await client.get_next_snapshot() for _ in range(6)]
+    assert [s["observation"]["inputs"]["price"] for s in first] == [70000.0 + i for i in range(5)] + [150000.0]
+    assert loop_thread not in seen_threads
+    offsets = client.get_offsets()
+
+    resumed = FileObserverClient(str(tmp_path), offsets=offsets)
+    await resumed.connect()
+    rest = [await resumed.get_next_snapshot() for _ in range(2)]
+    assert [s["observation"]["inputs"]["price"] for s in rest] == [150001.0, 150002.0]
+    with pytest.raises(StopAsyncIteration):
+        await resumed.get_next_snapshot()
+
+
+@pytest.mark.asyncio
+async def test_iter_batches_yields_lists(tmp_path):
+    scope_dir = tmp_path / "scalp"
+    scope_dir.mkdir()
+    _write(scope_dir / "a.jsonl", [_tick("005930", 70000 + i) for i in range(5)])
+
+    client = FileObserverClient(str(tmp_path), batch_size=2)
+    sizes = [len(batch) async for batch in client.iter_batches()]
+
+    assert sizes == [2, 2, 1]
+    assert client.get_offsets()[str(scope_dir / "a.jsonl")] == (scope_dir / "a.jsonl").stat().st_size
@@ -0,0 +1,159 @@
+"""
+UDSObserverClient 테스트 (바이너리 프레이밍, PUSH 구독 큐, correlation id, 재연결/재구독).
+"""
+
+import asyncio
+import tempfile
+from datetime import datetime
+
+import pytest
+
+from src.shared.timezone_utils import KST
+from src.observer_client.interfaces import MarketSnapshot
+from src.observer_client.uds_client import UDSObserverClient
+from src.observer_client.uds_protocol import (
+    MSG_PUSH_SNAPSHOT,
+    MSG_SUBSCRIBE,
+    ProtocolError,
+    decode_snapshot,
+    encode_frame,
+    encode_json,
+    encode_snapshot,
+)
+from src.observer_client.uds_server import LocalObserverServer
+
+
+class RejectingServer(LocalObserverServer):
+    """"BAD" 종목 구독 요청은 ok=false, "NOOK" 요청은 ok 필드 없이 응답."""
+
+    def _dispatch(self, symbols, msg_type, payload):
+        if msg_type == MSG_SUBSCRIBE:
+            if b"BAD" in payload:
+                return encode_json({"ok": False, "error": "unknown symbol"})
+            if b"NOOK" in payload:
+                return encode_json({"symbols": []})
+        return super()._dispatch(symbols, msg_type, payload)
+
+
+def _snap(symbol, price, **kwargs):
+    return MarketSnapshot(
+        symbol=symbol,
+        price=price,
+        volume=100,
+        timestamp=datetime(2026, 1, 5, 9, 0, 0, 123000, tzinfo=KST),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX 경로 길이 제한(108) 회피를 위해 짧은 임시 디렉토리 사용
+    with tempfile.TemporaryDirectory(dir="/tmp") as d:
+        yield f"{d}/obs.sock"
+
+
+def test_snapshot_codec_roundtrip():
+    snap = _snap("005930", 71000.5, bid_price=70900.0, ask_volume=12)
+    decoded = decode_snapshot(encode_snapshot(snap))
+
+    assert decoded == snap
+    assert decoded.ask_price is None and decoded.bid_volume is None
+    with pytest.raises(ProtocolError):
+        decode_snapshot(encode_snapshot(snap)[:-1])
+    assert encode_frame(MSG_PUSH_SNAPSHOT, 0, b"xy")[:9] == b"\x00\x00\x00\x02\x20\x00\x00\x00\x00"
+
+
+def test_subscribe_push_and_request_response(socket_path):
+    async def run():
+        async with LocalObserverServer(socket_path) as server:
+            client = UDSObserverClient(socket_path)
+            assert await client.connect()
+            assert await client.subscribe(["005930", "000660"])
+            assert await client.get_snapshot("005930") is None
+
+            await server.publish(_snap("005930", 71000.0))
+            await server.publish(_snap("035720", 50000.0))  # 미구독
+            pushed = await client.next_snapshot(timeout=2.0)
+            assert pushed.symbol == "005930" and pushed.price == 71000.0
+
+            # 동시 요청: correlation id로 각자 응답 매칭
+            await server.publish(_snap("000660", 150000.0))
+            a, b = await asyncio.gather(client.get_snapshot("005930"), client.get_snapshot("000660"))
+            assert (a.price, b.price) == (71000.0, 150000.0)
+
+            assert await client.unsubscribe(["005930"])
+            await server.publish(_snap("005930", 71100.0))
+            assert (await client.next_snapshot(timeout=2.0)).symbol == "000660"
+            assert client.snapshots.empty()
+            await client.disconnect()
+            assert not await client.is_connected()
+
+    asyncio.run(run())
+
+
+def test_reconnect_resubscribes(socket_path):
+    async def run():
+        async with LocalObserverServer(socket_path) as server:
+            client = UDSObserverClient(socket_path, reconnect_initial_delay=0.01)
+            await client.connect()
+            await client.subscribe(["005930"])
+
+            await server.drop_connections()
+            for _ in range(200):
+                if client.reconnects and server.subscribers("005930"):
+                    break
+                await asyncio.sleep(0.01)
+            assert client.reconnects == 1 and server.subscribers("005930") == 1
+
+            await server.publish(_snap("005930", 72000.0))
+            assert (await client.next_snapshot(timeout=2.0)).price == 72000.0
+            await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_queue_overflow_drops_oldest(socket_path):
+    async def run():
+        async with LocalObserverServer(socket_path) as server:
+            client = UDSObserverClient(socket_path, queue_maxsize=2)
+            await client.connect()
+            await client.subscribe(["005930"])
+            for price in (1.0, 2.0, 3.0):
+                await server.publish(_snap("005930", price))
+            await client.get_snapshot("005930")  # 앞선 PUSH 수신 완료 보장
+            prices = [(await client.next_snapshot(timeout=1.0)).price for _ in range(2)]
+            assert prices == [2.0, 3.0] and client.dropped == 1
+            await client.disconnect()
+
+    asyncio.run(run())
+
+
+def test_requests_fail_fast_when_not_connected(socket_path):
+    async def run():
+        client = UDSObserverClient(socket_path)
+        assert not await client.connect()
+        assert not await client.subscribe(["005930"])
+        assert await client.get_snapshot("005930") is None
+
+    asyncio.run(run())
+
+
+def test_rejected_subscribe_is_not_recorded_and_bad_payload_is_an_error(socket_path):
+    async def run():
+        async with RejectingServer(socket_path) as server:
+            client = UDSObserverClient(socket_path)
+            assert await client.connect()
+            assert await client.subscribe(["005930"])
+            assert not await client.subscribe(["BAD"])
+            assert not await client.subscribe(["NOOK"])  # ok 필드 없음 → 실패
+            assert client._subscriptions == {"005930"}
+
+            # dict가 아닌 본문은 연결을 끊지 않고 ERROR 응답
+            with pytest.raises(ProtocolError, match="JSON object"):
+                await client._request(MSG_SUBSCRIBE, ["005930"])
+            with pytest.raises(ProtocolError, match="list of strings"):
+                await client._request(MSG_SUBSCRIBE, {"symbols": "005930"})
+            assert await client.subscribe(["000660"]) and server.subscribers("000660") == 1
+            await client.disconnect()
+
+    asyncio.run(run())
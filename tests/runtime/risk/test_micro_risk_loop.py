@@ -0,0 +1,214 @@
+"""
+NG-2 Micro Risk Loop 테스트 (PositionShadow copy-on-write, 4가지 규칙, 중복 억제, 주기 성능, P0 전달, ETEDA 연동).
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.db.mock_sheets_client import MockSheetsClient
+from src.pipeline.eteda_runner import ETEDARunner
+from src.pipeline.mock_safety_hook import MockSafetyHook
+from src.provider.brokers.mock_broker import MockBroker
+from src.qts.core.config.config_models import UnifiedConfig
+from src.runtime.events import EventDispatcher, EventPriority
+from src.runtime.risk import (
+    FULL_EXIT,
+    PARTIAL_EXIT,
+    RISK_WARNING,
+    ActionDispatcher,
+    MarketRiskState,
+    MicroRiskLoop,
+    RiskRuleEvaluator,
+    ShadowPublisher,
+)
+
+_ROOT = Path(__file__).resolve().parents[3]
+T0 = 1_700_000_000.0
+
+
+class _Clock:
+    def __init__(self, now=T0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _pos(symbol, qty, avg, price, strategy="SWING"):
+    return {"symbol": symbol, "quantity": qty, "avg_price": avg, "current_price": price, "strategy": strategy}
+
+
+def test_shadow_is_copy_on_write_and_carries_entry_state():
+    clock = _Clock()
+    pub = ShadowPublisher(clock=clock)
+    first = pub.publish_positions([_pos("A", 10, 100.0, 100.0), _pos("B", -5, 50.0, 50.0), _pos("Z", 0, 1.0, 1.0)])
+    assert len(first) == 2 and "Z" not in first
+    with pytest.raises(ValueError):
+        first.current_price[0] = 1.0  # 읽기 전용
+
+    clock.now = T0 + 10
+    second = pub.update_prices({"A": 110.0, "B": 45.0, "UNKNOWN": 1.0})
+    assert pub.snapshot is second and second is not first
+    assert first.get("A").current_price == 100.0  # 이전 스냅샷 불변
+    assert second.get("A").highest_price == 110.0 and second.get("B").lowest_price == 45.0
+
+    clock.now = T0 + 20
+    third = pub.publish_positions([_pos("A", 12, 101.0, 105.0), _pos("B", 5, 45.0, 46.0)])
+    a, b = third.get("A"), third.get("B")
+    assert a.entry_time == T0 and a.highest_price == 110.0  # 같은 방향 보유 → 승계
+    assert b.entry_time == T0 + 20 and b.highest_price == 46.0  # 숏 → 롱 전환 → 새 진입
+    assert third.version == 3
+
+
+def test_rules_fire_and_most_severe_action_wins():
+    clock = _Clock()
+    pub = ShadowPublisher(clock=clock)
+    pub.publish_positions([
+        _pos("TRAIL", 10, 100.0, 100.0),
+        _pos("MAE", 10, 100.0, 100.0),
+        _pos("PARTIAL", 10, 100.0, 100.0),
+        _pos("SHORT", -10, 100.0, 100.0),
+        _pos("SCALP_OLD", 10, 100.0, 100.0, "SCALP"),
+        _pos("SCALP_WARN", 10, 100.0, 100.0, "SCALP"),
+        _pos("SWING", 10, 100.0, 100.0, "SWING"),
+        _pos("QUIET", 10, 100.0, 100.0, "PORTFOLIO"),
+    ])
+    pub.update_prices({"TRAIL": 102.0, "MAE": 97.5, "PARTIAL": 98.4, "SHORT": 95.0})
+    # TRAIL: 고점 102 대비 0.5% 하락 스탑 101.49 하회 / SHORT: 저점 95 대비 반등
+    pub.publish(pub.snapshot.with_prices({"TRAIL": 101.4, "SHORT": 95.6, "SCALP_OLD": 99.9, "SCALP_WARN": 99.9}))
+    evaluator = RiskRuleEvaluator()
+
+    shadow = pub.snapshot
+    # SCALP_OLD는 진입 시각을 과거로 돌린 스냅샷으로 대체
+    entry = shadow.entry_time.copy()
+    entry[shadow.index("SCALP_OLD")] = T0 - 3700
+    entry[shadow.index("SCALP_WARN")] = T0 - 3000
+    shadow = type(shadow)(
+        shadow.symbols, shadow.qty, shadow.avg_price, shadow.current_price, entry,
+        shadow.highest, shadow.lowest, shadow.strategy,
+    )
+
+    actions = {a.symbol: a for a in evaluator.evaluate(shadow, MarketRiskState(vix=20.0), now=T0)}
+    assert (actions["TRAIL"].action_type, actions["TRAIL"].reason) == (FULL_EXIT, "TRAILING_STOP_HIT")
+    assert actions["TRAIL"].payload["stop_price"] == pytest.approx(101.49)
+    assert (actions["SHORT"].action_type, actions["SHORT"].payload["side"]) == (FULL_EXIT, "BUY")
+    assert (actions["MAE"].reason, actions["MAE"].qty) == ("MAE_THRESHOLD_EXCEEDED", 10.0)
+    assert (actions["PARTIAL"].action_type, actions["PARTIAL"].qty) == (PARTIAL_EXIT, 5.0)
+    assert actions["SCALP_OLD"].reason == "TIME_IN_TRADE_EXCEEDED"
+    assert actions["SCALP_WARN"].action_type == RISK_WARNING
+    assert "SWING" not in actions and "QUIET" not in actions
+
+    stressed = {a.symbol: a for a in evaluator.evaluate(shadow, MarketRiskState(vix=55.0), now=T0)}
+    assert stressed["SCALP_WARN"].reason == "VOLATILITY_KILL_SWITCH"  # 경고보다 청산 우선
+    assert stressed["SCALP_OLD"].reason == "TIME_IN_TRADE_EXCEEDED"  # 같은 심각도는 규칙 순서
+    assert (stressed["SWING"].reason, stressed["SWING"].qty) == ("VOLATILITY_REDUCE", 5.0)
+    assert "QUIET" not in stressed
+
+
+def test_loop_dedupes_and_repeats_full_exit():
+    clock = _Clock()
+    pub = ShadowPublisher(clock=clock)
+    pub.publish_positions([_pos("A", 10, 100.0, 97.0), _pos("B", 10, 100.0, 98.4)])
+    seen = []
+    loop = MicroRiskLoop(pub, dispatcher=ActionDispatcher(on_action=seen.append), repeat_after=5.0, clock=clock)
+
+    assert {(a.symbol, a.action_type) for a in loop.run_cycle()} == {("A", FULL_EXIT), ("B", PARTIAL_EXIT)}
+    clock.now += 1
+    assert loop.run_cycle() == []
+    clock.now += 5
+    assert [(a.symbol, a.action_type) for a in loop.run_cycle()] == [("A", FULL_EXIT)]  # 청산 재전달
+
+    pub.publish_positions([_pos("B", 10, 100.0, 98.4)])  # A 청산 완료
+    clock.now += 10
+    assert loop.run_cycle() == [] and len(seen) == 3
+    assert loop.get_metrics()["counters"]["micro_risk.actions"] == 3
+
+
+def test_cycle_over_500_positions_stays_well_under_interval():
+    rng = np.random.default_rng(7)
+    pub = ShadowPublisher(clock=_Clock())
+    prices = rng.uniform(10_000, 100_000, 500)
+    pub.publish_positions([_pos(f"{i:06d}", 10, p, p) for i, p in enumerate(prices)])
+    loop = MicroRiskLoop(pub, clock=_Clock())
+
+    for _ in range(200):
+        pub.update_prices({f"{i:06d}": p for i, p in enumerate(prices * rng.uniform(0.995, 1.005, 500))})
+        loop.run_cycle()
+
+    snap = loop.cycle_hist.snapshot(scale=1000.0)
+    assert snap["count"] == 200
+    assert snap["p99"] < 20.0, snap  # 목표 p99 < 150ms 대비 충분한 여유
+
+
+def test_threaded_loop_sends_p0_event_through_bus():
+    pub = ShadowPublisher()
+    bus = EventDispatcher()
+    received = []
+    got = threading.Event()
+
+    def on_liquidate(event):
+        received.append((event.priority, event.payload))
+        got.set()
+
+    bus.subscribe("EMERGENCY_LIQUIDATE", on_liquidate)
+    bus.start()
+    loop = MicroRiskLoop(pub, dispatcher=ActionDispatcher(bus), interval=0.01)
+    loop.start()
+    try:
+        assert loop.is_running()
+        pub.publish_positions([_pos("005930", 3, 70000.0, 70000.0)])
+        pub.update_prices({"005930": 68000.0})
+        assert got.wait(2.0)
+    finally:
+        loop.stop()
+        bus.stop()
+
+    assert not loop.is_running() and loop.errors == 0
+    priority, payload = received[0]
+    assert priority == EventPriority.P0
+    assert (payload["symbol"], payload["qty"], payload["side"]) == ("005930", 3.0, "SELL")
+
+
+class _Position:
+    def __init__(self, symbol, quantity, avg_price):
+        self.symbol = symbol
+        self.quantity = quantity
+        self.avg_price = avg_price
+
+
+class _PortfolioEngine:
+    async def get_positions(self):
+        return [_Position("005930", 5, 70000.0)]
+
+
+@pytest.mark.asyncio
+async def test_eteda_runner_publishes_position_shadow():
+    shadow = ShadowPublisher()
+    runner = ETEDARunner(
+        config=UnifiedConfig(config_map={"RUN_MODE": "PAPER", "KILLSWITCH_STATUS": "OFF"}, metadata={}),
+        sheets_client=MockSheetsClient(),
+        project_root=_ROOT,
+        broker=MockBroker(),
+        safety_hook=MockSafetyHook(initial_state="NORMAL"),
+        position_shadow=shadow,
+    )
+    runner._portfolio_engine = _PortfolioEngine()
+    snapshot = {
+        "meta": {"timestamp": "2024-01-01 09:00:00", "timestamp_ms": 1704067200000},
+        "context": {"symbol": "005930"},
+        "observation": {"inputs": {"price": {"close": 71000.0}, "prev_close": 0.0}},
+    }
+
+    await runner.run_batch([snapshot])
+    position = shadow.snapshot.get("005930")
+    assert position is not None and position.qty == 5 and position.avg_price == 70000.0
+
+    snapshot["observation"]["inputs"]["price"]["close"] = 72000.0
+    await runner.run_batch([snapshot])
+    position = shadow.snapshot.get("005930")
+    assert position.current_price == 72000.0 and position.highest_price == 72000.0
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.risk.calculators.strategy_risk_calculator import StrategyRiskCalculator
+from src.risk.gates.staged_risk_gate import StagedRiskGate
+from src.risk.policies.risk_policy import RiskPolicy, RiskStage
+from src.strategy.arbitration.intent_arbitrator import IntentArbitrator
+from src.strategy.interfaces.strategy import Intent
+from src.strategy.multiplexer.strategy_multiplexer import StrategyIntent
+
+
+def _si(sid, symbol, side, qty, reason="r"):
+    return StrategyIntent(sid, sid.upper(), Intent(symbol=symbol, side=side, qty=qty, reason=reason))
+
+
+def test_nets_opposing_and_merges_same_side_per_symbol():
+    arb = IntentArbitrator(priorities={"s3": 2.0, "s1": 1.0})
+    out = arb.arbitrate([
+        _si("s1", "005930", "BUY", 10, "gc"),
+        _si("s2", "005930", "SELL", 4, "rsi"),
+        _si("s1", "000660", "SELL", 3),
+        _si("s3", "005930", "BUY", 2, "bb"),
+        _si("s2", "000660", "BUY", 3),
+    ])
+
+    assert len(out) == 1
+    [si] = out
+    assert (si.intent.symbol, si.intent.side, si.intent.qty) == ("005930", "BUY", 8)
+    assert si.strategy_id == "s3" and si.intent.reason == "bb"  # 이긴 방향의 최고 점수 Intent
+    assert si.sources == ("s1", "s2", "s3")
+    stats = arb.last_stats
+    assert (stats.inputs, stats.outputs, stats.netted, stats.flattened) == (5, 1, 2, 1)
+
+
+def test_scorer_orders_output_and_min_score_drops():
+    arb = IntentArbitrator(scorer=lambda si: si.intent.qty, min_score=2)
+    out = arb.arbitrate([
+        _si("a", "A", "BUY", 2),
+        _si("b", "B", "SELL", 5),
+        _si("c", "C", "BUY", 1),
+    ])
+    assert [si.intent.symbol for si in out] == ["B", "A"]
+    assert out[1].intent is not None and out[1].intent.qty == 2
+    assert arb.last_stats.dropped == 1
+
+
+def test_dict_intents_and_unquantified_passthrough():
+    arb = IntentArbitrator()
+    out = arb.arbitrate([
+        StrategyIntent("s1", "S1", {"symbol": "A", "side": "buy", "quantity": 5.0}),
+        StrategyIntent("s2", "S2", {"symbol": "A", "side": "SELL", "quantity": 2.0}),
+        StrategyIntent("s1", "S1", ("INTENT", "s1")),
+        StrategyIntent("s2", "S2", ("INTENT", "s2")),
+    ])
+    assert len(out) == 2
+    assert out[0].intent == {"symbol": "A", "side": "buy", "quantity": 3.0}
+    assert out[1].intent == ("INTENT", "s1")  # (symbol, side) 키가 없으면 첫 번째만
+
+
+def test_float_cancellation_and_non_finite_qty():
+    arb = IntentArbitrator()
+    out = arb.arbitrate([
+        StrategyIntent("s1", "S1", {"symbol": "A", "side": "BUY", "qty": 0.1}),
+        StrategyIntent("s2", "S2", {"symbol": "A", "side": "BUY", "qty": 0.2}),
+        StrategyIntent("s3", "S3", {"symbol": "A", "side": "SELL", "qty": 0.3}),  # 0.1 + 0.2 - 0.3 != 0
+        StrategyIntent("s1", "S1", {"symbol": "B", "side": "BUY", "qty": float("nan")}),
+        StrategyIntent("s2", "S2", {"symbol": "B", "side": "SELL", "qty": float("inf")}),
+    ])
+    assert out == []
+    stats = arb.last_stats
+    assert (stats.flattened, stats.invalid, stats.outputs) == (1, 2, 0)
+
+
+@dataclass
+class _Order:
+    symbol: str
+    side: str
+    qty: int
+
+
+def test_risk_gate_keeps_sources_and_applies_strictest_source_policy():
+    arb = IntentArbitrator(priorities={"s1": 1.0})
+    [merged] = arb.arbitrate([
+        StrategyIntent("s1", "S1", _Order("A", "BUY", 6)),
+        StrategyIntent("s2", "S2", _Order("A", "BUY", 4)),
+    ])
+    calc = StrategyRiskCalculator()
+    calc.set_policy("s1", RiskPolicy(max_order_qty=100))
+    calc.set_policy("s2", RiskPolicy(max_order_qty=5, stage=RiskStage.REDUCE, reduce_to_qty=3))
+
+    allowed, events = StagedRiskGate(calc).filter([merged])
+
+    [si] = allowed
+    assert si.strategy_id == "s1" and si.sources == ("s1", "s2")
+    assert si.intent.qty == 3  # s2 정책(REDUCE)이 가장 제한적
+    assert [(e.strategy_id, e.stage) for e in events] == [("s2", RiskStage.REDUCE)]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 
-from runtime.strategy.registry.strategy_registry import StrategyRegistry
-from runtime.strategy.multiplexer.strategy_multiplexer import StrategyMultiplexer
+import pytest
+
+from src.strategy.registry.strategy_registry import StrategyRegistry
+from src.strategy.multiplexer.strategy_multiplexer import StrategyMultiplexer
 
 
 @dataclass
@@ -42,3 +45,90 @@ def test_multiplexer_isolates_strategy_failure():
 
     assert len(out) == 1
     assert out[0].strategy_id == "s1"
+
+
+@dataclass
+class SlowStrategy:
+    strategy_id: str
+    name: str
+    delay: float
+    enabled: bool = True
+
+    def is_enabled(self) -> bool:
+        return self.enabled
+
+    def generate(self, snapshot):
+        time.sleep(self.delay)
+        return [("INTENT", self.strategy_id)]
+
+
+def test_entry_point_is_bound_at_registration():
+    reg = StrategyRegistry()
+    strategy = OkStrategy("s1", "S1")
+    reg.register(strategy)
+    reg.register(SlowStrategy("s2", "S2", 0.0))
+    reg.register(OkStrategy("s3", "S3", enabled=False))
+
+    # 등록 이후 속성 탐색 없이 바인딩된 메서드 사용
+    strategy.generate_intents = None
+    with StrategyMultiplexer(reg) as mux:
+        out = mux.collect(snapshot={})
+    assert [si.strategy_id for si in out] == ["s1", "s2"]
+    assert [run.status for run in mux.last_runs] == ["ok", "ok"]
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_parallel_mode_drops_late_strategy(mode):
+    reg = StrategyRegistry()
+    reg.register(SlowStrategy("fast", "Fast", 0.0))
+    reg.register(SlowStrategy("slow", "Slow", 1.0))
+    reg.register(BadStrategy("bad", "Bad"))
+
+    with StrategyMultiplexer(reg, mode=mode, max_workers=3, time_budget_s=5.0, budgets={"slow": 0.3}) as mux:
+        mux.collect(snapshot={})  # 워커 기동 시간 제외
+        started = time.perf_counter()
+        out = mux.collect(snapshot={"x": 1})
+        elapsed = time.perf_counter() - started
+
+    assert [si.strategy_id for si in out] == ["fast"]
+    assert elapsed < 0.9
+    runs = {run.strategy_id: run for run in mux.last_runs}
+    assert (runs["fast"].status, runs["fast"].intents) == ("ok", 1)
+    assert runs["slow"].status == "busy" and runs["slow"].latency_s >= 0.3  # 1회차 작업이 아직 실행 중
+    assert runs["bad"].status == "failed"
+    metrics = mux.get_metrics()
+    assert metrics["counters"]["strategy.slow.timeouts"] == 1
+    assert metrics["counters"]["strategy.slow.busy"] == 1
+    assert metrics["counters"]["strategy.bad.failures"] == 2
+    assert metrics["gauges"]["strategy.fast.latency_max_ms"] < 300.0
+
+
+def test_sequential_mode_enforces_budget_after_the_fact():
+    reg = StrategyRegistry()
+    reg.register(SlowStrategy("slow", "Slow", 0.05))
+    reg.register(OkStrategy("ok", "Ok"))
+
+    mux = StrategyMultiplexer(reg, time_budget_s=0.01)
+    out = mux.collect(snapshot={})
+    assert [si.strategy_id for si in out] == ["ok"]
+    assert [run.status for run in mux.last_runs] == ["timeout", "ok"]
+    with pytest.raises(ValueError):
+        StrategyMultiplexer(reg, mode="async")
+
+
+def test_stuck_strategy_is_not_resubmitted_while_running():
+    reg = StrategyRegistry()
+    reg.register(SlowStrategy("slow", "Slow", 0.5))
+    reg.register(SlowStrategy("fast", "Fast", 0.0))
+    reg.register(OkStrategy("ok", "Ok"))
+
+    statuses = []
+    with StrategyMultiplexer(reg, mode="thread", max_workers=2, time_budget_s=0.1) as mux:
+        for _ in range(4):
+            out = mux.collect(snapshot={})
+            assert sorted(si.strategy_id for si in out) == ["fast", "ok"]
+            statuses.append({run.strategy_id: run.status for run in mux.last_runs})
+
+    assert all(st["fast"] == "ok" and st["ok"] == "ok" for st in statuses)
+    assert [st["slow"] for st in statuses] == ["timeout", "busy", "busy", "busy"]
+    assert mux.get_metrics()["counters"]["strategy.slow.busy"] == 3
@@ -0,0 +1,106 @@
+"""
+Streaming Indicator 단위 테스트
+
+- 틱 단위 update() == 창 전체 재계산(참조 구현)
+- warmup(과거 배열) 후 상태 == 같은 배열을 순차 update()한 상태
+- 심볼별 상태 분리
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.strategy.indicators import ATR, EMA, RSI, SMA, VWAP, BollingerBands
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(11)
+    return 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, 300))
+
+
+def _same(a, b):
+    return (a is None and b is None) or (a is not None and b is not None and np.allclose(a, b, rtol=1e-9))
+
+
+def _feed(indicator, symbol, *columns):
+    out = None
+    for row in zip(*(c.tolist() for c in columns)):
+        out = indicator.update(symbol, *row)
+    return out
+
+
+def test_sma_and_bollinger_match_window_recompute(prices):
+    sma, bb = SMA(20), BollingerBands(20, 2.0)
+    for i, p in enumerate(prices.tolist()):
+        avg, bands = sma.update("A", p), bb.update("A", p)
+        if i < 19:
+            assert avg is None and bands is None
+            continue
+        window = prices[i - 19:i + 1]
+        assert avg == pytest.approx(window.mean(), rel=1e-12)
+        lower, middle, upper = bands
+        assert middle == pytest.approx(window.mean(), rel=1e-12)
+        assert upper - middle == pytest.approx(2.0 * window.std(), rel=1e-8)
+        assert middle - lower == pytest.approx(upper - middle)
+
+
+def test_ema_rsi_atr_match_reference(prices):
+    ema, rsi, atr = EMA(10), RSI(14), ATR(14)
+    high, low = prices * 1.002, prices * 0.998
+
+    expected_ema = prices[:10].mean()
+    for p in prices[10:]:
+        expected_ema += 2.0 / 11 * (p - expected_ema)
+    assert _feed(ema, "A", prices) == pytest.approx(expected_ema, rel=1e-12)
+
+    changes = np.diff(prices)
+    gain, loss = np.maximum(changes, 0)[:14].mean(), np.maximum(-changes, 0)[:14].mean()
+    for c in changes[14:]:
+        gain = (gain * 13 + max(c, 0.0)) / 14
+        loss = (loss * 13 + max(-c, 0.0)) / 14
+    assert _feed(rsi, "A", prices) == pytest.approx(100.0 - 100.0 / (1.0 + gain / loss), rel=1e-10)
+
+    tr = [high[0] - low[0]] + [
+        max(h - l, abs(h - c), abs(l - c)) for h, l, c in zip(high[1:], low[1:], prices[:-1])
+    ]
+    expected_atr = float(np.mean(tr[:14]))
+    for t in tr[14:]:
+        expected_atr = (expected_atr * 13 + t) / 14
+    assert _feed(atr, "A", high, low, prices) == pytest.approx(expected_atr, rel=1e-10)
+
+
+@pytest.mark.parametrize("n", [0, 5, 20, 21, 300])
+def test_warmup_matches_sequential_updates(prices, n):
+    history, live = prices[:n], prices[n:n + 40]
+    volume = np.arange(1.0, n + 41.0)
+    cases = [
+        (lambda: SMA(20), (history,), (live,)),
+        (lambda: EMA(20), (history,), (live,)),
+        (lambda: RSI(14), (history,), (live,)),
+        (lambda: BollingerBands(20, 2.0), (history,), (live,)),
+        (lambda: VWAP(), (history, volume[:n]), (live, volume[n:])),
+        (lambda: ATR(14), (history * 1.01, history * 0.99, history), (live * 1.01, live * 0.99, live)),
+    ]
+    for factory, past, future in cases:
+        warmed, streamed = factory(), factory()
+        name = type(warmed).__name__
+        assert _same(warmed.warmup("A", *past), _feed(streamed, "A", *past)), name
+        assert _same(_feed(warmed, "A", *future), _feed(streamed, "A", *future)), name
+
+
+def test_state_is_per_symbol_and_resettable():
+    rsi, vwap = RSI(2), VWAP()
+    for a, b in zip([1.0, 2.0, 3.0], [3.0, 2.0, 1.0]):
+        rsi.update("A", a)
+        rsi.update("B", b)
+        vwap.update("A", a, 10.0)
+    assert (rsi.value("A"), rsi.value("B"), rsi.value("C")) == (100.0, 0.0, None)
+    assert rsi.symbols == ("A", "B") and "C" not in rsi
+    assert vwap.value("A") == pytest.approx(2.0)
+    vwap.reset("A")
+    assert vwap.value("A") is None
+    with pytest.raises(ValueError):
+        SMA(0)
+    assert math.isclose(vwap.update("A", 5.0, 1.0), 5.0)